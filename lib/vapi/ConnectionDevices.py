@@ -20,7 +20,6 @@
 
 import logging as logger
 import os
-import requests
 import json
 
 
@@ -89,15 +89,24 @@ class Datasets:
         uri = f"/datasets/{dsid}"
         return self.server.get(uri)
 
-    def import_dataset(self, file_path):
+    def import_dataset(self, file_path, progress=None, resumable=False, retries=5):
         """ Imports an exported dataset zip file into the server.
 
-        :param file_path -- path to zip file to upload"""
+        The file is streamed, so it does not have to fit in memory.
 
-        file = {'files': open(file_path, 'rb')}
+        :param file_path -- path to zip file to upload
+        :param progress  -- optional function called with '(bytesSent, totalBytes)'
+        :param resumable -- upload in resumable chunks if the server supports it,
+                            otherwise retry the whole file; the file's SHA-256 is
+                            verified either way (see 'vapi.resumable'). Raises
+                            'vapi.resumable.UploadError' if the upload fails.
+        :param retries   -- attempts after failures when 'resumable' is set"""
 
         uri = "/datasets/import"
-        return self.server.post(uri, files=file)
+        if resumable:
+            from vapi.resumable import ResumableUpload
+            return ResumableUpload(self.server, uri, field='files', retries=retries, progress=progress).run(file_path)
+        return self.server.upload(uri, files={'files': file_path}, progress=progress)
 
     def export(self, dsid, filename=None, status_callback=None, raw=False):
         """ exports the indicated dataset into the specified file
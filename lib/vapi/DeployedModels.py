@@ -17,6 +17,11 @@
 #
 #  IBM_PROLOG_END_TAG
 
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+from vapi.concurrency import boundedMap
+
 
 class DeployedModels:
 
@@ -78,5 +83,50 @@ class DeployedModels:
                           pass for the infernece"""
 
         uri = f"/dlapis/{model_id}"
-        file = {'files': open(filepath, 'rb')}
+        with open(filepath, 'rb') as handle:
+            file = {'files': handle}
+            return self.server.post(uri, files=file, data=kwargs)
+
+    def infer_image(self, model_id, data, filename="image.jpg", **kwargs):
+        """Do inference on an in-memory encoded image (e.g. a JPEG encoded video frame).
+
+        :param model_id  -- id of the deployed model for inferencing
+        :param data      -- bytes of the encoded image
+        :param filename  -- file name reported to the server. Its extension
+                            should match the encoding.
+        :param kwargs    -- named parameters to pass for the inference"""
+
+        uri = f"/dlapis/{model_id}"
+        file = {'files': (filename, data)}
         return self.server.post(uri, files=file, data=kwargs)
+
+    def infer_many(self, model_id, items, workers=4, **kwargs):
+        """Infers many files or in-memory images concurrently.
+
+        Results are yielded as they complete, so they may not be in input order.
+        At most '2 * workers' items are read ahead of the results, which keeps
+        memory bounded when 'items' is a generator of in-memory images.
+        Note that the per-request status (e.g. 'server.json()') is kept per
+        thread, so it does not reflect the worker requests.
+
+        :param model_id -- id of the deployed model for inferencing
+        :param items    -- iterable of file paths and/or '(filename, bytes)' tuples
+        :param workers  -- number of concurrent inference requests
+        :param kwargs   -- named parameters to pass for each inference
+
+        :return: generator of '(item, result)' tuples. 'result' is None if the
+                 inference failed."""
+
+        def inferOne(item):
+            if isinstance(item, tuple):
+                rsp = self.infer_image(model_id, item[1], item[0], **kwargs)
+            else:
+                rsp = self.infer(model_id, item, **kwargs)
+            if rsp is None:
+                name = item[0] if isinstance(item, tuple) else item
+                logger.warning(f"inference of '{name}' failed; status={self.server.status_code()}; "
+                               f"{self.server.last_failure or self.server.json()}")
+            return item, rsp
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from boundedMap(pool, inferOne, items, 2 * workers)
@@ -18,6 +18,17 @@
 #  IBM_PROLOG_END_TAG
 
 
+import queue
+import re
+import time
+import logging as logger
+
+# Training task status values after which the task no longer changes
+FINAL_STATUSES = {"completed", "trained", "failed", "aborted", "cancelled", "canceled", "error", "deleted"}
+
+_UUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
 class DlTasks:
     action_map = {
         "cic": "create-cic-task",
@@ -91,3 +102,141 @@ class DlTasks:
 
         uri = f"/dltasks/{task_id}/status"
         return self.server.get(uri)
+
+    def wait(self, task_ids, timeout=None, useEvents=True, pollInterval=2.0, maxPollInterval=60.0):
+        """ Waits for training tasks to finish, yielding each one as soon as it does.
+
+        Server sent events are used as wake-ups: any event mentioning a watched task
+        id causes that task to be checked at once. Polling backs this up; all
+        watched tasks are checked with a single list request, with the interval
+        doubling from 'pollInterval' up to 'maxPollInterval' while nothing changes.
+        If the event stream is not available, polling alone is used. When the stream
+        reconnects, all watched tasks are polled at once, as events may have been missed.
+
+        :param task_ids     -- id, or iterable of ids, of the training tasks to wait for.
+                               A set is watched as it changes: ids the caller adds to it
+                               between items are watched too, and finished ids are
+                               removed from it. This keeps one wait (and one event
+                               subscription) for tasks started over time.
+        :param timeout      -- optional number of seconds to wait overall
+        :param useEvents    -- use the '/events' stream (set False to only poll)
+        :param pollInterval -- initial seconds between polls
+        :param maxPollInterval -- maximum seconds between polls
+
+        :return: generator of '(task_id, task)' tuples in completion order. 'task' is
+                 the task's json; a task that no longer exists gets
+                 '{"_id": task_id, "status": "deleted"}'. When 'timeout' expires, the
+                 unfinished tasks are yielded with their last known json, or None if
+                 the task could never be retrieved, and the generator ends.
+                 'FINAL_STATUSES' holds the status values considered finished."""
+
+        if isinstance(task_ids, str):
+            pending = {task_ids}
+        else:
+            pending = task_ids if isinstance(task_ids, set) else set(task_ids)
+        latest = {}
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        wakeups = queue.Queue()
+        subscription = None
+        if useEvents and pending:
+            subscription = self._subscribe(pending, wakeups)
+
+        try:
+            interval = pollInterval
+            nextPoll = time.monotonic()
+            check = set(pending)
+            expired = False
+            while pending:
+                polling = check == pending
+                finished = self._check(check, pending, latest)
+                for task_id in finished:
+                    pending.discard(task_id)
+                    yield task_id, latest.get(task_id)
+                if not pending or expired:
+                    break
+                if polling:
+                    # Poll less often while nothing finishes
+                    interval = pollInterval if finished else min(interval * 2, maxPollInterval)
+                    nextPoll = time.monotonic() + interval
+
+                until = nextPoll if deadline is None else min(nextPoll, deadline)
+                check = self._nextCheck(wakeups, until - time.monotonic(), pending)
+                if deadline is not None and time.monotonic() >= deadline:
+                    # One last look at every task before giving up
+                    check = set(pending)
+                    expired = True
+        finally:
+            if subscription is not None:
+                subscription.stop(timeout=1.0)
+
+        for task_id in pending:
+            yield task_id, latest.get(task_id)
+
+    def _subscribe(self, pending, wakeups):
+        """ Starts an SSE subscription that queues the ids of watched tasks mentioned in events."""
+
+        from vapi.ssesubscription import SseSubscription
+
+        def onEvent(event):
+            for task_id in _UUID.findall(event.data):
+                if task_id in pending:
+                    wakeups.put(task_id)
+
+        def onConnect(connects):
+            if connects > 1:
+                # Events may have been missed while disconnected; poll everything
+                wakeups.put(None)
+
+        subscription = SseSubscription(self.server, initialDelay=2.0, onConnect=onConnect)
+        subscription.addHandler(onEvent, queueSize=10000, name="dltasks-wait")
+        return subscription.start()
+
+    @staticmethod
+    def _nextCheck(wakeups, wait, pending):
+        """ Waits up to 'wait' seconds for event wake-ups.
+
+        :return: returns the set of tasks to check; all pending tasks if the wait
+                 timed out or the event stream reconnected (a poll), otherwise only
+                 the tasks named by events"""
+
+        try:
+            woken = {wakeups.get(timeout=max(wait, 0))}
+        except queue.Empty:
+            return set(pending)
+        # Gather other wake-ups that arrived at the same time
+        while True:
+            try:
+                woken.add(wakeups.get_nowait())
+            except queue.Empty:
+                break
+        if None in woken:
+            return set(pending)
+        return woken & pending
+
+    def _check(self, task_ids, pending, latest):
+        """ Gets the current state of 'task_ids' and returns those that finished."""
+
+        task_ids = task_ids & pending
+        if not task_ids:
+            return []
+        tasks = {}
+        if len(task_ids) > 1:
+            rsp = self.report()
+            if self.server.rsp_ok() and isinstance(rsp, list):
+                tasks = {task.get("_id"): task for task in rsp if task.get("_id") in task_ids}
+        finished = []
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            if task is None:
+                task = self.show(task_id)
+                if not self.server.rsp_ok():
+                    if self.server.status_code() == 404:
+                        latest[task_id] = {"_id": task_id, "status": "deleted"}
+                        finished.append(task_id)
+                    else:
+                        logger.debug(f"could not get dltask '{task_id}'; status={self.server.status_code()}")
+                    continue
+            latest[task_id] = task
+            if str(task.get("status", "")).lower() in FINAL_STATUSES:
+                finished.append(task_id)
+        return finished
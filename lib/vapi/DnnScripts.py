@@ -20,7 +20,6 @@
 
 import logging as logger
 import os
-import requests
 
 
 class DnnScripts:
@@ -28,18 +27,19 @@ class DnnScripts:
     def __init__(self, server):
         self.server = server
 
-    def create(self, name, inputfile):
+    def create(self, name, inputfile, progress=None):
         """ Create a new Dnn script.
 
         :param name   -- name for the new dnn script
-        :param inputfile   -- input zip file for custom asset
-                        "POST /dnn-scripts" API documentation for details"""
+        :param inputfile   -- input zip file for custom asset (path or open binary file)
+                        "POST /dnn-scripts" API documentation for details
+        :param progress -- optional function called with '(bytesSent, totalBytes)'"""
 
         uri = "/dnn-scripts"
         payload = {'name': name}
         files = {'file': inputfile}
 
-        return self.server.post(uri, files=files, data=payload)
+        return self.server.upload(uri, files=files, data=payload, progress=progress)
 
     def report(self, **kwargs):
         """ Get a list of all dnn scripts
@@ -68,7 +68,8 @@ class DnnScripts:
             payload["name"] =  newname
         if description != "":
             payload["description"] =  description
-        return self.server.put(uri, files=files, data=payload)
+        return self.server.upload(uri, files=files, data=payload, progress=kwargs.get("progress"),
+                                  method="PUT")
 
     def delete(self, dnnid):
         """ Delete the indicated DNN script
@@ -17,6 +17,11 @@
 #
 #  IBM_PROLOG_END_TAG
 
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+from vapi.concurrency import boundedMap
+
 
 class FileUserMetadata:
     """
@@ -36,6 +41,32 @@ class FileUserMetadata:
         uri = f"/datasets/{dsid}/files/{fileid}/user-metadata"
         return self.server.post(uri, json=kvPairs)
 
+    def add_many(self, dsid, rows, workers=8):
+        """ Adds key/value metadata pairs to many files concurrently.
+
+        Results are yielded as they complete, so they may not be in input order.
+        At most '2 * workers' rows are read ahead of the results, so 'rows' can
+        be a generator over a large file.
+
+        :param dsid    -- UUID of the dataset containing the files
+        :param rows    -- iterable of '(fileid, kvPairs)' tuples
+        :param workers -- number of concurrent requests
+
+        :return: generator of '(fileid, kvPairs, error)' tuples. 'error' is None
+                 on success, otherwise a short description of the failure."""
+
+        def addOne(row):
+            fileid, kvPairs = row
+            self.add(dsid, fileid, kvPairs)
+            if self.server.rsp_ok():
+                return fileid, kvPairs, None
+            error = self.server.last_failure or f"status={self.server.status_code()}; {self.server.json()}"
+            logger.debug(f"adding metadata to file '{fileid}' failed; {error}")
+            return fileid, kvPairs, error
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from boundedMap(pool, addOne, rows, 2 * workers)
+
     def delete(self, dsid, fileid, keys):
         """ Deletes the named key/value pairs from the specified file's user metadata.
 
@@ -85,3 +116,31 @@ class FileUserMetadata:
         uri = f"/datasets/{dsid}/files/user-metadata"
         self.server.get(uri, params=qparms)
         return self.server.text()
+
+    def export_lines(self, dsid, fmt="pipe", keys=None, query=None):
+        """ Streams the user metadata export line by line instead of as one text blob.
+
+        Parameters are the same as for 'export'.
+
+        :return: generator of text lines (the first line is the header). Nothing is
+                 yielded if the request fails; check 'server.rsp_ok()'."""
+
+        qparms = {"format": fmt}
+        if keys is not None:
+            qparms["keys"] = keys
+        if query is not None:
+            qparms["query"] = query
+
+        uri = f"/datasets/{dsid}/files/user-metadata"
+        self.server.get(uri, params=qparms, stream=True)
+        if not self.server.rsp_ok():
+            return
+        rsp = self.server.raw_rsp()
+        if rsp.encoding is None:
+            rsp.encoding = "utf-8"
+        try:
+            for line in rsp.iter_lines(chunk_size=65536, decode_unicode=True):
+                if line:
+                    yield line
+        finally:
+            rsp.close()
@@ -18,7 +18,11 @@
 #  IBM_PROLOG_END_TAG
 
 import os
+import time
 import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+from vapi.concurrency import boundedMap
 
 class Files:
 
@@ -39,18 +43,38 @@ class Files:
         """ Uploads files to the indicated dataset.
 
         :param dsid -- UUID of target dataset
-        :param file_paths -- list of files to upload"""
+        :param file_paths -- list of files to upload. Items can also be
+                        '(filename, bytes)' tuples to upload in-memory data
+                        (e.g. JPEG encoded video frames).
+
+        Files are streamed from disk rather than loaded into memory."""
 
         files = []
         for key, value in kwargs.items():
             item = (key, value)
             logger.debug(f"item = {item}")
-            files.append(item)
-        for filepath in file_paths:
-            files.append(('files', open(filepath, 'rb')))
+            # Sent as named parts, the way 'requests' sends '(key, string)' file items
+            files.append((key, (key, str(value).encode("utf-8"))))
+        files.extend(('files', filepath) for filepath in file_paths)
 
         uri = f"/datasets/{dsid}/files"
-        return self.server.post(uri, files=files)
+        return self.server.upload(uri, files=files)
+
+    def upload_many(self, dsid, file_paths, batchSize=20, retries=3, progress=None, **kwargs):
+        """ Uploads many files in batches, retrying only the files that failed.
+
+        :param dsid       -- UUID of target dataset
+        :param file_paths -- list of files to upload (as for 'upload')
+        :param batchSize  -- number of files per request
+        :param retries    -- attempts for files that failed
+        :param progress   -- optional function called with '(filesDone, totalFiles)'
+        :param kwargs     -- additional form fields for every request
+
+        :return: returns '(succeeded, failed)' lists of the items of 'file_paths'"""
+
+        from vapi.resumable import uploadFiles
+        return uploadFiles(self, dsid, file_paths, batchSize=batchSize, retries=retries,
+                           progress=progress, **kwargs)
 
     def action(self, dsid, file_id, **kwargs):
         """ performs the requested action on the given file
@@ -75,6 +99,61 @@ class Files:
         uri = f"/datasets/{dsid}/files/{file_id}"
         return self.server.delete(uri)
 
+    def delete_many(self, dsid, file_ids, chunkSize=500, workers=4, retries=3):
+        """ Deletes many files with batched 'delete' actions, several chunks at a time.
+
+        Ids are sent in chunks of at most 'chunkSize', so no single request
+        holds the dataset for long. A chunk whose request fails (no response, a
+        server error, a timeout or throttling) is sent again up to 'retries'
+        times with an increasing delay. Results are yielded as chunks complete,
+        so they may not be in input order. At most '2 * workers' chunks are read
+        ahead, so 'file_ids' can be a generator.
+
+        :param dsid      -- UUID of the dataset containing the files
+        :param file_ids  -- iterable of file UUIDs
+        :param chunkSize -- maximum number of ids per request
+        :param workers   -- number of concurrent requests
+        :param retries   -- attempts for chunks whose request failed
+
+        :return: generator of dicts, one per chunk, with 'ids' (the chunk),
+                 'success_count', 'fail_count', 'attempts' and 'error' (None
+                 unless the whole request failed; then every id counts as failed)."""
+
+        def deleteChunk(ids):
+            uri = f"/datasets/{dsid}/files/action"
+            error = None
+            for attempt in range(retries + 1):
+                if attempt:
+                    delay = min(60, 2 ** attempt)
+                    logger.info(f"deleting {len(ids)} files failed ({error}); retry {attempt} in {delay}s")
+                    time.sleep(delay)
+                rsp = self.server.post(uri, json={"action": "delete", "id_list": ids})
+                status = self.server.status_code()
+                if self.server.rsp_ok():
+                    rsp = rsp if isinstance(rsp, dict) else {}
+                    failed = rsp.get("fail_count", 0)
+                    return {"ids": ids, "success_count": rsp.get("success_count", len(ids) - failed),
+                            "fail_count": failed, "attempts": attempt + 1, "error": None}
+                error = self.server.last_failure or f"status={status}; {self.server.json()}"
+                if status is not None and 400 <= status < 500 and status not in (408, 429):
+                    # The server rejected the request; sending it again will not help
+                    return {"ids": ids, "success_count": 0, "fail_count": len(ids),
+                            "attempts": attempt + 1, "error": error}
+            return {"ids": ids, "success_count": 0, "fail_count": len(ids), "attempts": retries + 1, "error": error}
+
+        def chunks():
+            chunk = []
+            for file_id in file_ids:
+                chunk.append(file_id)
+                if len(chunk) >= chunkSize:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from boundedMap(pool, deleteChunk, chunks(), 2 * workers)
+
     def show(self, dsid, file_id):
         """ Get details of the indicated file
 
@@ -120,6 +199,39 @@ class Files:
         else:
             return None
 
+    def download_file(self, dsid, file_id, fname):
+        """ Downloads a file to 'fname'.
+
+        The file is written to '<fname>.part' and renamed when complete, so an
+        interrupted download never leaves a partial file under its final name.
+
+        :return: returns the absolute path of the file, or None if the download failed"""
+
+        tmp = fname + ".part"
+        if self.download(dsid, file_id, False, fname=tmp) is None:
+            logger.warning(f"download of file '{file_id}' failed; status={self.server.status_code()}")
+            return None
+        os.replace(tmp, fname)
+        return os.path.abspath(fname)
+
+    def download_many(self, dsid, items, workers=8):
+        """ Downloads many files of a dataset concurrently with 'download_file'.
+        Files are yielded as they complete, so they may not be in input order.
+
+        :param dsid    -- UUID of the dataset containing the files
+        :param items   -- iterable of '(file_id, fname)' tuples
+        :param workers -- number of concurrent downloads
+
+        :return: generator of '(file_id, path)' tuples. 'path' is None if the
+                 download failed."""
+
+        def downloadOne(item):
+            file_id, fname = item
+            return file_id, self.download_file(dsid, file_id, fname)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            yield from boundedMap(pool, downloadOne, items, 2 * workers)
+
     def copymove(self, operation, fromDs, toDs, file_ids):
         """ Performs file copy/move of the indicated file ids.
 
@@ -2,6 +2,170 @@ import json
 import logging as logger
 
 
+class SseEvent:
+    """
+    A single Server Sent Event.
+
+    The data lines are kept as raw bytes until they are needed; 'data' decodes
+    them as text and 'json()' decodes (and caches) them as JSON.
+    """
+
+    __slots__ = ("event", "id", "retry", "_lines", "_json")
+
+    _unset = object()
+
+    def __init__(self, event, lines, id=None, retry=None):
+        self.event = event
+        self.id = id
+        self.retry = retry
+        self._lines = lines
+        self._json = SseEvent._unset
+
+    @property
+    def data(self):
+        """ The event data as text; multiple data lines are joined with new lines."""
+
+        return b"\n".join(self._lines).decode("utf-8", errors="replace")
+
+    def json(self):
+        """ The event data decoded as JSON, or the text if it is not valid JSON."""
+
+        if self._json is SseEvent._unset:
+            text = self.data
+            try:
+                self._json = json.loads(text)
+            except json.JSONDecodeError:
+                self._json = text
+        return self._json
+
+    def asDict(self):
+        """ Returns the event in the form yielded by 'SseMonitor.report'."""
+
+        sse = {"event": self.event, "data": self.json()}
+        if self.id is not None:
+            sse["id"] = self.id
+        return sse
+
+    def __repr__(self):
+        return f"SseEvent(event={self.event!r}, id={self.id!r}, data={self.data[:60]!r})"
+
+
+class SseParser:
+    """
+    Incremental parser for a 'text/event-stream' body (per the HTML living standard).
+
+    Network chunks are fed as they arrive, independent of line or event boundaries.
+    Only the trailing partial line is buffered, so the cost is linear in the
+    amount of data. Events can be filtered by name before their data is decoded.
+    """
+
+    def __init__(self, includeEvents=None, excludeEvents=None):
+        """
+        :param includeEvents -- optional collection of event names to return
+        :param excludeEvents -- optional collection of event names to drop"""
+
+        self.include = {e.encode("utf-8") for e in includeEvents} if includeEvents is not None else None
+        self.exclude = {e.encode("utf-8") for e in excludeEvents} if excludeEvents is not None else None
+        self.lastEventId = None
+        self.retry = None
+        self.skipped = 0
+        self._buffer = bytearray()
+        self._event = b""
+        self._data = []
+        self._start = True
+
+    def feed(self, chunk):
+        """ Parses a chunk of the stream.
+
+        :return: returns the list of complete events that pass the filters"""
+
+        buffer = self._buffer
+        pendingCr = buffer.endswith(b"\r")
+        buffer += chunk
+        if not pendingCr and b"\n" not in chunk and b"\r" not in chunk:
+            return []
+        if self._start:
+            # A leading byte order mark is ignored
+            if len(buffer) < 3 and b"\xef\xbb\xbf".startswith(bytes(buffer)):
+                return []
+            if buffer.startswith(b"\xef\xbb\xbf"):
+                del buffer[:3]
+            self._start = False
+
+        # A trailing CR may be the first half of a CRLF; keep it until more data arrives
+        end = len(buffer) - 1 if buffer.endswith(b"\r") else len(buffer)
+        if b"\r" in buffer:
+            text = bytes(buffer[:end]).replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        else:
+            text = bytes(buffer[:end])
+        last = text.rfind(b"\n")
+        if last < 0:
+            return []
+        del buffer[:end]
+        buffer[:0] = text[last + 1:]
+
+        events = []
+        for line in text[:last].split(b"\n"):
+            if not line:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+            elif line[0] != 58:             # lines starting with ':' are comments
+                self._field(line)
+        return events
+
+    def close(self):
+        """ Ends the stream. An incomplete final event is discarded, as the standard requires."""
+
+        self._buffer.clear()
+        self._event = b""
+        self._data = []
+
+    def _field(self, line):
+        colon = line.find(b":")
+        if colon < 0:
+            name, value = line, b""
+        else:
+            name = line[:colon]
+            value = line[colon + 2:] if line[colon + 1:colon + 2] == b" " else line[colon + 1:]
+
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value
+        elif name == b"id":
+            if b"\0" not in value:
+                self.lastEventId = value.decode("utf-8", errors="replace")
+        elif name == b"retry":
+            if value.isdigit():
+                self.retry = int(value)
+
+    def _dispatch(self):
+        name = self._event or b"message"
+        data = self._data
+        self._event = b""
+        self._data = []
+        if not data:
+            return None
+        if (self.exclude is not None and name in self.exclude) or \
+           (self.include is not None and name not in self.include):
+            self.skipped += 1
+            return None
+        return SseEvent(name.decode("utf-8", errors="replace"), data, self.lastEventId, self.retry)
+
+
+def iterChunks(rsp, blockSize=512):
+    """ Iterates over the body of a streamed response as the data arrives.
+
+    Chunked responses are read one transfer chunk at a time. Other responses are
+    read in blocks of 'blockSize' bytes; keep it small when latency matters,
+    because a large read would wait for the block to fill."""
+
+    if "chunked" in rsp.headers.get("Transfer-Encoding", "").lower():
+        return rsp.iter_content(chunk_size=None)
+    return rsp.iter_content(chunk_size=blockSize)
+
+
 class SseMonitor:
     """
     SseMonitor is different than other VAPI resources. It can only report SSEs.
@@ -21,59 +185,40 @@ class SseMonitor:
 
         :returns: returns a stream of dicts representing the SSE (note if data is json, it is loaded as a dictionary)
         """
-        uri = "/events"
-        self.server.get(uri, stream=True)
-
-        fieldSeparator = ":"
-        validFieldNames = ["event", "data"]
-
-        for sseString in self.readWholeEvent(self.server.raw_rsp()):
-            sse = {}
-            for line in sseString.splitlines():
-                line = line.decode("utf-8")
-
-                # skip blank lines and lines with no field name (aka key).
-                # This should never happen with MVI, but empty strings cause problems for 'split()'
-                if not line.strip() or line.startswith(fieldSeparator):
-                    continue
-
-                field, value = line.split(fieldSeparator, 1)
-
-                # log unknown fields, but otherwise ignore them
-                if field not in validFieldNames:
-                    logger.debug(f"Got field '{field}', but expected one of '{validFieldNames}'.")
-
-                value = value.strip()
-                # Try to return 'data' value as json if possible.
-                if field == "data":
-                    try:
-                        value = json.loads(value)
-                    except json.JSONDecodeError as exc:
-                        logger.debug(f"Could not decode SSE data as json -- {exc}")
-                sse[field] = value
-
-            # Dispatch the SSE
-            event = sse["event"]
-            if (excludeEvents is not None and event in excludeEvents) or \
-               (includeEvents is not None and event not in includeEvents):
-                logger.warning(f"""@@@ skipping SSE '{event}'; exclude={excludeEvents}, include={includeEvents}""")
-            else:
-                yield sse
-
-    def readWholeEvent(self, sseStream):
+        for event in self.events(includeEvents, excludeEvents):
+            yield event.asDict()
+
+    def subscribe(self, includeEvents: list = None, excludeEvents: list = None, **kwargs):
         """
-        Reads an entire SSE event using various combination of 2 newlines as the terminator.
+        Creates an auto-reconnecting subscription that dispatches events to several
+        handlers. See 'vapi.ssesubscription.SseSubscription' for the keyword arguments.
 
-        :returns: SSE as a string
+        :returns: returns an SseSubscription; register handlers, then call 'start()'
         """
-        sse = b''
-        for data in sseStream:
-            for line in data.splitlines(True):
-                sse += line
-                if sse.endswith((b'\r\r', b'\n\n', b'\r\n\r\n')):
-                    yield sse
-                    sse = b''
-        if sse:
-            yield sse
+        from vapi.ssesubscription import SseSubscription
+        return SseSubscription(self.server, includeEvents, excludeEvents, **kwargs)
 
+    def events(self, includeEvents: list = None, excludeEvents: list = None):
+        """
+        Streams events as SseEvent objects. Unlike 'report', the event data is
+        only decoded when the caller asks for it.
 
+        :param: includeEvents -- list of event names to include in the result stream.
+        :param: excludeEvents -- list of event names to specifically exclude from the result stream
+
+        :returns: returns a stream of SseEvent objects
+        """
+        uri = "/events"
+        self.server.get(uri, stream=True, headers={"Accept": "text/event-stream"})
+        if not self.server.rsp_ok():
+            return
+
+        parser = SseParser(includeEvents, excludeEvents)
+        rsp = self.server.raw_rsp()
+        try:
+            for chunk in iterChunks(rsp):
+                yield from parser.feed(chunk)
+        finally:
+            parser.close()
+            rsp.close()
+            logger.debug(f"SSE stream ended; {parser.skipped} events skipped by filters")
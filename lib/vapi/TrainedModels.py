@@ -74,16 +74,22 @@ class TrainedModels:
         uri = "/trained-models/" + model_id + "/action"
         return self.server.get(uri, json=kwargs)
 
-    def import_model(self, file_path):
+    def import_model(self, file_path, progress=None, resumable=False, retries=5):
         """ imports an AI Vision exported trained model zip file
 
-        :param file_path -- directory path to the zip file to import"""
+        The file is streamed, so it does not have to fit in memory.
 
-        uri = "/trained-models/import"
-
-        file = {'files': open(file_path, 'rb')}
+        :param file_path -- directory path to the zip file to import
+        :param progress  -- optional function called with '(bytesSent, totalBytes)'
+        :param resumable -- upload in resumable chunks if the server supports it,
+                            otherwise retry the whole file (see 'Datasets.import_dataset')
+        :param retries   -- attempts after failures when 'resumable' is set"""
 
-        return self.server.post(uri, files=file)
+        uri = "/trained-models/import"
+        if resumable:
+            from vapi.resumable import ResumableUpload
+            return ResumableUpload(self.server, uri, field='files', retries=retries, progress=progress).run(file_path)
+        return self.server.upload(uri, files={'files': file_path}, progress=progress)
 
     def download_asset(self, model_id, asset_type="unknown", filename=None):
         """ Downloads the indicated asset type from the specified model
@@ -0,0 +1,243 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Bulk export (backup) of datasets and trained models.
+
+Artifacts are exported concurrently, optionally within a shared bandwidth
+budget. Each export is streamed to disk with its SHA-256 computed on the fly,
+and a manifest ('manifest.json' in the output directory) records file sizes,
+digests and the server-side version of every artifact. On the next run,
+artifacts whose version did not change (and whose file is still present) are
+skipped.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+MANIFEST = "manifest.json"
+CHUNK_SIZE = 1024 * 1024
+
+# Record fields holding the server side modification time, in order of preference
+VERSION_FIELDS = ("updated_at", "updated", "modified_at", "modified", "last_modified")
+
+_KINDS = {
+    "dataset": {"dir": "datasets", "uri": "/datasets/{id}/export"},
+    "model": {"dir": "models", "uri": "/trained-models/{id}/export"}
+}
+
+
+class RateLimiter:
+    """ Token bucket shared by threads to keep total throughput under a budget."""
+
+    def __init__(self, bytesPerSecond):
+        self.rate = float(bytesPerSecond)
+        self.allowance = self.rate
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, count):
+        """ Blocks until 'count' bytes fit in the budget."""
+
+        with self.lock:
+            now = time.monotonic()
+            self.allowance = min(self.rate, self.allowance + (now - self.last) * self.rate)
+            self.last = now
+            self.allowance -= count
+            wait = -self.allowance / self.rate if self.allowance < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+def version(record):
+    """ Returns the server side version of a dataset or model record: its modification
+    time if the record has one, otherwise a digest of the whole record."""
+
+    for field in VERSION_FIELDS:
+        if record.get(field):
+            return str(record[field])
+    return "sha1:" + hashlib.sha1(json.dumps(record, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def loadManifest(directory):
+    """ Loads the manifest of a backup directory; an empty manifest if there is none."""
+
+    try:
+        with open(os.path.join(directory, MANIFEST)) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {"artifacts": {}}
+
+
+def verifyManifest(directory, manifest=None):
+    """ Re-computes the digests of the files in a backup directory.
+
+    :return: returns a list of '(key, problem)' tuples; empty if all files match"""
+
+    manifest = manifest if manifest is not None else loadManifest(directory)
+    problems = []
+    for key, entry in sorted(manifest.get("artifacts", {}).items()):
+        path = os.path.join(directory, entry["file"])
+        if not os.path.exists(path):
+            problems.append((key, "missing"))
+            continue
+        if os.path.getsize(path) != entry["bytes"]:
+            problems.append((key, f"size {os.path.getsize(path)} != {entry['bytes']}"))
+            continue
+        digest = hashlib.sha256()
+        with open(path, "rb") as handle:
+            for block in iter(lambda: handle.read(CHUNK_SIZE), b""):
+                digest.update(block)
+        if digest.hexdigest() != entry["sha256"]:
+            problems.append((key, "sha256 mismatch"))
+    return problems
+
+
+class BackupExporter:
+    """ Exports datasets and trained models into a directory with a manifest."""
+
+    def __init__(self, server, directory, workers=4, bytesPerSecond=None, force=False, rawDatasets=False):
+        """
+        :param server         -- vapi server connection
+        :param directory      -- output directory
+        :param workers        -- number of concurrent exports
+        :param bytesPerSecond -- optional total download budget
+        :param force          -- export even if the artifact did not change
+        :param rawDatasets    -- include raw metadata in dataset exports (see 'Datasets.export')"""
+
+        self.server = server
+        self.http = server.server
+        self.directory = directory
+        self.workers = workers
+        self.limiter = RateLimiter(bytesPerSecond) if bytesPerSecond else None
+        self.force = force
+        self.rawDatasets = rawDatasets
+        self.manifest = loadManifest(directory)
+        self.manifest.setdefault("artifacts", {})
+        self._lock = threading.Lock()
+
+    def run(self, records, progress=None):
+        """ Exports the artifacts.
+
+        :param records  -- list of '(kind, record)' tuples; 'kind' is 'dataset' or
+                           'model' and 'record' the json from the server's list or show
+        :param progress -- optional function called with each result dict
+
+        :return: returns a list of result dicts with 'key', 'status' ('exported',
+                 'unchanged' or 'failed'), 'bytes', 'seconds' and 'error'"""
+
+        os.makedirs(self.directory, exist_ok=True)
+        results = []
+        todo = []
+        for kind, record in records:
+            key = f"{kind}/{record['_id']}"
+            if not self.force and self._unchanged(key, record):
+                result = {"key": key, "status": "unchanged", "bytes": 0, "seconds": 0.0, "error": None}
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+            else:
+                todo.append((kind, record))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(self._export, kind, record) for kind, record in todo]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+        return results
+
+    def _unchanged(self, key, record):
+        entry = self.manifest["artifacts"].get(key)
+        if entry is None or entry.get("version") != version(record):
+            return False
+        path = os.path.join(self.directory, entry["file"])
+        return os.path.exists(path) and os.path.getsize(path) == entry["bytes"]
+
+    def _export(self, kind, record):
+        key = f"{kind}/{record['_id']}"
+        info = _KINDS[kind]
+        relative = os.path.join(info["dir"], f"{record['_id']}.zip")
+        path = os.path.join(self.directory, relative)
+        start = time.time()
+        try:
+            params = {"raw": self.rawDatasets} if kind == "dataset" else None
+            size, digest = self._download(info["uri"].format(id=record["_id"]), params, path)
+        except (OSError, ConnectionError) as e:
+            logger.debug(f"export of {key} failed; {e}")
+            return {"key": key, "status": "failed", "bytes": 0, "seconds": round(time.time() - start, 1),
+                    "error": str(e)}
+
+        entry = {"kind": kind, "id": record["_id"], "name": record.get("name"), "file": relative,
+                 "bytes": size, "sha256": digest, "version": version(record),
+                 "exported_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
+        with self._lock:
+            self.manifest["artifacts"][key] = entry
+            self._saveManifest()
+        return {"key": key, "status": "exported", "bytes": size, "seconds": round(time.time() - start, 1),
+                "error": None}
+
+    def _download(self, uri, params, path):
+        """ Streams 'uri' into 'path', hashing as it goes. The file is written under a
+        temporary name and renamed when complete.
+
+        :return: returns '(bytes, sha256)'"""
+
+        self.http.get(uri, params=params, stream=True)
+        rsp = self.http.raw_rsp()
+        if rsp is None or not rsp.ok:
+            failure = self.http.last_failure or f"status={self.http.status_code()}; {self.http.json()}"
+            raise ConnectionError(failure)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = path + ".part"
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            with open(tmp, "wb") as handle:
+                for block in rsp.iter_content(CHUNK_SIZE):
+                    if self.limiter is not None:
+                        self.limiter.consume(len(block))
+                    digest.update(block)
+                    handle.write(block)
+                    size += len(block)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        finally:
+            rsp.close()
+        return size, digest.hexdigest()
+
+    def _saveManifest(self):
+        self.manifest["server"] = self.http.baseurl
+        self.manifest["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        path = os.path.join(self.directory, MANIFEST)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as handle:
+            json.dump(self.manifest, handle, indent=2, sort_keys=True)
+        os.replace(tmp, path)
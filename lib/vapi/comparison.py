@@ -0,0 +1,197 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Comparison of two deployed models over the same set of files.
+
+Both models are driven concurrently (with cached results reused), and their
+results are compared image by image: top class agreement for classification,
+and IoU matching of boxes with class agreement and confidence deltas for
+object detection.
+"""
+
+import logging as logger
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from vapi import metrics
+from vapi.inferencecache import cachedInfer
+
+
+class ModelComparison:
+    """ Accumulates per-image comparisons of model A and model B results."""
+
+    def __init__(self, iouThreshold=0.5):
+        """
+        :param iouThreshold -- minimum IoU for boxes of the two models to be considered
+                               the same object"""
+
+        self.iouThreshold = iouThreshold
+        self.images = 0
+        self.agreeing = 0
+        self.failed = []
+        self.disagreements = []
+        self._ious = []
+        self._labelAgree = []
+        self._confDeltas = []
+        self._onlyA = 0
+        self._onlyB = 0
+
+    def add(self, filepath, resultA, resultB):
+        """ Compares the two results for one file and records any disagreement.
+
+        :return: returns the per-image comparison dict"""
+
+        if resultA is None or resultB is None:
+            self.failed.append(filepath)
+            return None
+
+        detectionsA = resultA.get("classified", []) or []
+        detectionsB = resultB.get("classified", []) or []
+        if _isDetection(detectionsA) or _isDetection(detectionsB):
+            comparison = self._compareDetections(detectionsA, detectionsB)
+        else:
+            comparison = self._compareClassification(detectionsA, detectionsB)
+
+        comparison["file"] = filepath
+        self.images += 1
+        if comparison["agree"]:
+            self.agreeing += 1
+        else:
+            self.disagreements.append(comparison)
+        return comparison
+
+    def summary(self):
+        """ Returns a dict summarizing all comparisons."""
+
+        ious = np.concatenate(self._ious) if self._ious else np.zeros(0)
+        labelAgree = np.concatenate(self._labelAgree) if self._labelAgree else np.zeros(0, dtype=bool)
+        deltas = np.concatenate(self._confDeltas) if self._confDeltas else np.zeros(0)
+        return {
+            "images": self.images,
+            "failed_images": len(self.failed),
+            "agreeing_images": self.agreeing,
+            "image_agreement": _ratio(self.agreeing, self.images),
+            "matched_objects": int(len(ious)),
+            "class_agreement": float(labelAgree.mean()) if len(labelAgree) else None,
+            "mean_iou": float(ious.mean()) if len(ious) else None,
+            "only_model_a": self._onlyA,
+            "only_model_b": self._onlyB,
+            "mean_confidence_delta": float(deltas.mean()) if len(deltas) else None,
+            "mean_abs_confidence_delta": float(np.abs(deltas).mean()) if len(deltas) else None,
+            "max_abs_confidence_delta": float(np.abs(deltas).max()) if len(deltas) else None,
+            "iou_threshold": self.iouThreshold
+        }
+
+    def _compareClassification(self, detectionsA, detectionsB):
+        # As in evaluation, no (labeled) top prediction means the background; label None
+        topA = metrics.topPrediction(detectionsA) or {}
+        topB = metrics.topPrediction(detectionsB) or {}
+        agree = topA.get("label") == topB.get("label")
+        comparison = {
+            "type": "classification",
+            "agree": agree,
+            "model_a": {"label": topA.get("label"), "confidence": topA.get("confidence")},
+            "model_b": {"label": topB.get("label"), "confidence": topB.get("confidence")}
+        }
+        self._labelAgree.append(np.array([agree]))
+        if agree and topA.get("confidence") is not None and topB.get("confidence") is not None:
+            delta = topB["confidence"] - topA["confidence"]
+            self._confDeltas.append(np.array([delta]))
+            comparison["confidence_delta"] = delta
+        return comparison
+
+    def _compareDetections(self, detectionsA, detectionsB):
+        detectionsA = [d for d in detectionsA if "xmin" in d]
+        detectionsB = [d for d in detectionsB if "xmin" in d]
+        confA = np.array([d.get("confidence", 0.0) for d in detectionsA], dtype=np.float64)
+        confB = np.array([d.get("confidence", 0.0) for d in detectionsB], dtype=np.float64)
+        labelsA = np.array([d.get("label") for d in detectionsA], dtype=object)
+        labelsB = np.array([d.get("label") for d in detectionsB], dtype=object)
+
+        iou = metrics.boxIouMatrix(metrics.boxes(detectionsA), metrics.boxes(detectionsB))
+        rowMatch, colMatch = metrics.greedyMatch(iou, self.iouThreshold, order=np.argsort(-confA))
+
+        rows = np.flatnonzero(rowMatch >= 0)
+        cols = rowMatch[rows]
+        pairIou = iou[rows, cols]
+        sameLabel = labelsA[rows] == labelsB[cols] if len(rows) else np.zeros(0, dtype=bool)
+        deltas = confB[cols] - confA[rows]
+        onlyA = np.flatnonzero(rowMatch < 0)
+        onlyB = np.flatnonzero(colMatch < 0)
+
+        self._ious.append(pairIou)
+        self._labelAgree.append(np.asarray(sameLabel, dtype=bool))
+        self._confDeltas.append(deltas)
+        self._onlyA += len(onlyA)
+        self._onlyB += len(onlyB)
+
+        mismatched = np.flatnonzero(~np.asarray(sameLabel, dtype=bool))
+        return {
+            "type": "detection",
+            "agree": len(onlyA) == 0 and len(onlyB) == 0 and len(mismatched) == 0,
+            "matched": int(len(rows)),
+            "mean_iou": float(pairIou.mean()) if len(rows) else None,
+            "label_mismatches": [{"model_a": detectionsA[rows[i]], "model_b": detectionsB[cols[i]],
+                                  "iou": float(pairIou[i])} for i in mismatched],
+            "only_model_a": [detectionsA[i] for i in onlyA],
+            "only_model_b": [detectionsB[i] for i in onlyB],
+            "max_abs_confidence_delta": float(np.abs(deltas).max()) if len(deltas) else None
+        }
+
+
+def compareModels(server, modelA, modelB, filepaths, cache=None, workers=4, iouThreshold=0.5, **kwargs):
+    """ Infers 'filepaths' with two deployed models concurrently and compares the results.
+
+    :param server    -- vapi server connection
+    :param modelA    -- id of the baseline deployed model
+    :param modelB    -- id of the candidate deployed model
+    :param filepaths -- list of local files (the golden set)
+    :param cache     -- optional InferenceCache so unchanged files are not re-inferred
+    :param workers   -- concurrent inference requests per model
+    :param iouThreshold -- minimum IoU for boxes to be the same object
+    :param kwargs    -- named inference parameters used for both models
+
+    :return: returns a ModelComparison"""
+
+    filepaths = list(filepaths)
+
+    def run(model_id):
+        return dict(cachedInfer(server, model_id, filepaths, cache=cache, workers=workers, **kwargs))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futureA = pool.submit(run, modelA)
+        futureB = pool.submit(run, modelB)
+        resultsA = futureA.result()
+        resultsB = futureB.result()
+
+    comparison = ModelComparison(iouThreshold)
+    for filepath in filepaths:
+        comparison.add(filepath, resultsA.get(filepath), resultsB.get(filepath))
+    logger.info(f"compared {comparison.images} images; {len(comparison.disagreements)} disagreements")
+    return comparison
+
+
+def _isDetection(detections):
+    return len(detections) > 0 and "xmin" in detections[0]
+
+
+def _ratio(part, whole):
+    return part / whole if whole else None
@@ -0,0 +1,68 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Helpers for bounded producer/consumer work.
+
+'boundedMap' runs a function over an iterable in a thread pool while reading
+at most 'window' items ahead of the results, so the iterable can be a
+generator over a large file or STDIN. 'putUnlessStopped' feeds a bounded
+queue from a background thread that must give up when its consumer stops.
+"""
+
+import queue
+from concurrent.futures import FIRST_COMPLETED, as_completed, wait
+
+
+def boundedMap(pool, fn, iterable, window):
+    """ Generator yielding 'fn(item)' for every item, as the calls complete.
+
+    Results may not be in input order. Exceptions raised by 'fn' are raised
+    when their result is reached.
+
+    :param pool     -- concurrent.futures executor running the calls
+    :param fn       -- function called with each item
+    :param iterable -- items to process; read lazily
+    :param window   -- maximum number of submitted calls without a yielded result"""
+
+    window = max(int(window), 1)
+    pending = set()
+    for item in iterable:
+        pending.add(pool.submit(fn, item))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    for future in as_completed(pending):
+        yield future.result()
+
+
+def putUnlessStopped(q, item, stop):
+    """ Puts 'item' into the bounded queue 'q' unless the 'stop' event is set.
+
+    :return: returns False if 'stop' was set before the item could be queued"""
+
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.2)
+            return True
+        except queue.Full:
+            continue
+    return False
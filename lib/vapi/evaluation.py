@@ -0,0 +1,320 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Client side evaluation of a deployed model against the labels of a dataset.
+
+Ground truth comes from the dataset's object labels (object detection) or file
+categories (classification). Dataset images are downloaded once into a local
+image directory and inferred through the inference cache, so scoring again at
+different IoU or confidence thresholds does not infer anything again.
+
+Example:
+    evaluation = evaluateModel(server, model_id, dsid, cache=InferenceCache())
+    print(evaluation.score(iouThresholds=[0.5, 0.75])["mAP"])
+"""
+
+import os
+import logging as logger
+from collections import defaultdict
+
+import numpy as np
+
+from vapi import metrics
+from vapi import paging
+from vapi.inferencecache import cachedInfer, cacheRoot
+
+# COCO style IoU thresholds 0.50:0.05:0.95
+DEFAULT_IOU_THRESHOLDS = tuple(np.round(np.arange(0.5, 0.951, 0.05), 2))
+# Class name used for missed objects and false detections in confusion matrices
+BACKGROUND = "(background)"
+
+
+def defaultImageDir():
+    """ Returns the directory in which dataset images are kept for evaluation."""
+
+    return os.path.join(cacheRoot(), "images")
+
+
+def loadGroundTruth(server, dsid, pageSize=1000):
+    """ Gets the ground truth of every file in a dataset.
+
+    :param server   -- vapi server connection
+    :param dsid     -- UUID of the dataset
+    :param pageSize -- number of files or labels retrieved per request
+
+    :return: returns a dict keyed by file id of
+             '{"file": <file info>, "category": <name or None>, "objects": [<labels>]}'"""
+
+    truth = {}
+    for info in paging.iterate(server.files.report, dsid, pageSize=pageSize):
+        truth[info["_id"]] = {"file": info, "category": info.get("category_name"), "objects": []}
+
+    count = 0
+    for label in paging.iterate(server.object_labels.report, dsid, None, pageSize=pageSize):
+        entry = truth.get(label.get("file_id"))
+        if entry is not None and "bnd_box" in label:
+            entry["objects"].append(label)
+            count += 1
+    logger.info(f"loaded ground truth for {len(truth)} files with {count} object labels")
+    return truth
+
+
+def fetchImages(server, dsid, files, directory=None, workers=8):
+    """ Downloads dataset files that are not yet in the local image directory.
+
+    :param server    -- vapi server connection
+    :param dsid      -- UUID of the dataset
+    :param files     -- list of file info dicts (as returned by 'Files.report')
+    :param directory -- local image directory. Defaults to 'defaultImageDir()'.
+    :param workers   -- number of concurrent downloads
+
+    :return: returns a dict of file id to local path; the path is None if the download failed"""
+
+    directory = os.path.join(directory or defaultImageDir(), dsid)
+    os.makedirs(directory, exist_ok=True)
+
+    paths = {}
+    missing = []
+    for info in files:
+        ext = os.path.splitext(info.get("original_file_name", ""))[1] or ".jpg"
+        path = os.path.join(directory, info["_id"] + ext)
+        paths[info["_id"]] = path
+        if not os.path.exists(path):
+            missing.append((info["_id"], path))
+
+    if missing:
+        logger.info(f"downloading {len(missing)} of {len(paths)} dataset files")
+        for fileId, path in server.files.download_many(dsid, missing, workers=workers):
+            if path is None:
+                paths[fileId] = None
+    return paths
+
+
+class Evaluation:
+    """ Ground truth and predictions of every image, scored on demand.
+
+    Predictions are kept unfiltered, so 'score' can be called repeatedly with
+    different thresholds."""
+
+    def __init__(self):
+        self.images = []
+        self.failed = []
+
+    def add(self, fileId, truth, result):
+        """ Adds one image.
+
+        :param fileId -- id of the file
+        :param truth  -- ground truth entry (see 'loadGroundTruth')
+        :param result -- inference result, or None if inference failed"""
+
+        if result is None:
+            self.failed.append(fileId)
+            return
+        self.images.append((fileId, truth, result.get("classified", []) or []))
+
+    def isDetection(self):
+        """ True if the dataset has object labels, i.e. object detection is evaluated."""
+
+        return any(len(truth["objects"]) > 0 for _, truth, _ in self.images)
+
+    def score(self, iouThresholds=DEFAULT_IOU_THRESHOLDS, minConfidence=0.0, confusionIou=0.5):
+        """ Scores the predictions.
+
+        :param iouThresholds -- IoU thresholds at which AP is computed (detection only)
+        :param minConfidence -- predictions below this confidence are ignored
+        :param confusionIou  -- IoU used to pair objects for the confusion matrix
+
+        :return: returns a dict of metrics"""
+
+        if self.isDetection():
+            return self._scoreDetection(list(iouThresholds), minConfidence, confusionIou)
+        return self._scoreClassification(minConfidence)
+
+    def _scoreDetection(self, thresholds, minConfidence, confusionIou):
+        classes = _Classes()
+        scores, labels, matched = [], [], []
+        actual, predicted = [], []
+        gtCounts = defaultdict(int)
+
+        for _, truth, predictions in self.images:
+            predictions = [p for p in predictions if "xmin" in p and p.get("confidence", 0.0) >= minConfidence]
+            objects = truth["objects"]
+            conf = np.array([p.get("confidence", 0.0) for p in predictions], dtype=np.float64)
+            predLabels = classes.encode(p.get("label") for p in predictions)
+            gtLabels = classes.encode(o.get("name") for o in objects)
+            for label in gtLabels:
+                gtCounts[label] += 1
+
+            iou = metrics.boxIouMatrix(metrics.boxes(predictions), metrics.boxes(objects))
+            order = np.argsort(-conf, kind="stable")
+            sameClass = predLabels[:, None] == gtLabels[None, :]
+            matches = metrics.greedyMatchThresholds(iou, thresholds, order=order, allowed=sameClass)
+            scores.append(conf)
+            labels.append(predLabels)
+            matched.append(matches >= 0)
+
+            # Class agnostic pairing for the confusion matrix; -1 stands for the background
+            # (the last entry of the confusion labels)
+            rowMatch, colMatch = metrics.greedyMatch(iou, confusionIou, order=order)
+            rows = np.flatnonzero(rowMatch >= 0)
+            actual.extend(gtLabels[rowMatch[rows]])
+            predicted.extend(predLabels[rows])
+            actual.extend([-1] * int(np.count_nonzero(rowMatch < 0)))
+            predicted.extend(predLabels[rowMatch < 0])
+            actual.extend(gtLabels[colMatch < 0])
+            predicted.extend([-1] * int(np.count_nonzero(colMatch < 0)))
+
+        scores = np.concatenate(scores) if scores else np.zeros(0)
+        labels = np.concatenate(labels) if labels else np.zeros(0, dtype=np.int64)
+        matched = np.concatenate(matched, axis=1) if matched else np.zeros((len(thresholds), 0), dtype=bool)
+
+        perClass = {}
+        apTable = []
+        for label, name in enumerate(classes.names):
+            mask = labels == label
+            ap, precision, recall = metrics.averagePrecision(scores[mask], matched[:, mask], gtCounts[label])
+            tp = int(matched[0, mask].sum())
+            detections = int(mask.sum())
+            perClass[name] = {
+                "ground_truth": gtCounts[label],
+                "detections": detections,
+                "ap": dict(zip(_keys(thresholds), ap.tolist())),
+                "precision": tp / detections if detections else None,
+                "recall": tp / gtCounts[label] if gtCounts[label] else None,
+                "pr_curve": _sampleCurve(precision[0], recall[0])
+            }
+            if gtCounts[label] > 0:
+                apTable.append(ap)
+
+        mapPerThreshold = np.mean(apTable, axis=0) if apTable else np.zeros(len(thresholds))
+        names = classes.names + [BACKGROUND]
+        confusion = metrics.confusionMatrix([names[i] for i in actual], [names[i] for i in predicted], names)
+        return {
+            "type": "detection",
+            "images": len(self.images),
+            "failed_images": len(self.failed),
+            "iou_thresholds": list(thresholds),
+            "min_confidence": minConfidence,
+            "mAP": float(mapPerThreshold.mean()) if len(thresholds) else None,
+            "mAP_per_iou": dict(zip(_keys(thresholds), mapPerThreshold.tolist())),
+            "classes": perClass,
+            "confusion": {"labels": names, "iou": confusionIou, "matrix": confusion.tolist()}
+        }
+
+    def _scoreClassification(self, minConfidence):
+        actual, predicted = [], []
+        for _, truth, predictions in self.images:
+            if truth["category"] is None:
+                continue
+            top = metrics.topPrediction(predictions, minConfidence)
+            predicted.append(BACKGROUND if top is None else top["label"])
+            actual.append(truth["category"])
+
+        names = sorted((set(actual) | set(predicted)) - {BACKGROUND}) + [BACKGROUND]
+        confusion = metrics.confusionMatrix(actual, predicted, names)
+        correct = np.diag(confusion)
+        predictedCounts = confusion.sum(axis=0)
+        actualCounts = confusion.sum(axis=1)
+        perClass = {}
+        for i, name in enumerate(names[:-1]):
+            perClass[name] = {
+                "ground_truth": int(actualCounts[i]),
+                "predictions": int(predictedCounts[i]),
+                "precision": float(correct[i] / predictedCounts[i]) if predictedCounts[i] else None,
+                "recall": float(correct[i] / actualCounts[i]) if actualCounts[i] else None
+            }
+        return {
+            "type": "classification",
+            "images": len(actual),
+            "failed_images": len(self.failed),
+            "min_confidence": minConfidence,
+            "accuracy": float(correct.sum() / len(actual)) if actual else None,
+            "classes": perClass,
+            "confusion": {"labels": names, "matrix": confusion.tolist()}
+        }
+
+
+def evaluateModel(server, model_id, dsid, cache=None, imageDir=None, workers=4, **kwargs):
+    """ Infers every labeled file of a dataset and collects it for scoring.
+
+    :param server   -- vapi server connection
+    :param model_id -- id of the deployed model
+    :param dsid     -- UUID of the dataset holding the ground truth
+    :param cache    -- optional InferenceCache so files are only inferred once
+    :param imageDir -- local image directory (see 'fetchImages')
+    :param workers  -- number of concurrent downloads and inference requests
+    :param kwargs   -- named inference parameters. Detections are requested down to
+                       confidence 0 unless 'confthre' is given, so scoring can apply
+                       any confidence threshold later.
+
+    :return: returns an Evaluation"""
+
+    kwargs.setdefault("confthre", 0.0)
+    truth = loadGroundTruth(server, dsid)
+    labeled = [t["file"] for t in truth.values() if t["objects"] or t["category"] is not None]
+    paths = fetchImages(server, dsid, labeled, imageDir, workers=max(workers, 8))
+
+    evaluation = Evaluation()
+    byPath = {}
+    for fileId, path in paths.items():
+        if path is None:
+            evaluation.failed.append(fileId)
+        else:
+            byPath[path] = fileId
+
+    for path, result in cachedInfer(server, model_id, list(byPath), cache=cache, workers=workers, **kwargs):
+        fileId = byPath[path]
+        evaluation.add(fileId, truth[fileId], result)
+    return evaluation
+
+
+class _Classes:
+    """ Maps class names to consecutive integers."""
+
+    def __init__(self):
+        self.index = {}
+        self.names = []
+
+    def encode(self, names):
+        codes = []
+        for name in names:
+            code = self.index.get(name)
+            if code is None:
+                code = self.index[name] = len(self.names)
+                self.names.append(name)
+            codes.append(code)
+        return np.array(codes, dtype=np.int64)
+
+
+def _keys(thresholds):
+    return [f"{t:.2f}" for t in thresholds]
+
+
+def _sampleCurve(precision, recall, points=21):
+    """ Samples a precision/recall curve at evenly spaced recall values."""
+
+    if len(recall) == 0:
+        return []
+    envelope = np.maximum.accumulate(precision[::-1])[::-1]
+    curve = []
+    for r in np.linspace(0.0, 1.0, points):
+        idx = np.searchsorted(recall, r, side="left")
+        curve.append([float(r), float(envelope[idx]) if idx < len(recall) else 0.0])
+    return curve
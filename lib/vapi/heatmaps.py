@@ -0,0 +1,164 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Decoding and display of classification heatmaps.
+
+Classification inference with 'containHeatMap=true' returns a 'heatmap' field.
+The payload is either a base64 encoded image (optionally as a 'data:' URI) or a
+2D list of intensities. 'decode' turns it into a NumPy array and
+'HeatmapOverlay' colorizes and alpha blends it over the inferred image with a
+lookup table, reusing its working buffers from one image to the next.
+"""
+
+import base64
+import binascii
+import logging as logger
+
+import cv2 as cv
+import numpy as np
+
+_lutCache = {}
+
+
+def decode(payload):
+    """ Decodes a heatmap payload.
+
+    :param payload -- value of the 'heatmap' field of a classification result
+
+    :return: returns a 2D uint8 intensity array, or a 3D BGR array if the server sent
+             an already colorized heatmap. None is returned if the payload cannot be decoded."""
+
+    if payload is None:
+        return None
+
+    if isinstance(payload, (list, tuple)):
+        heat = np.asarray(payload, dtype=np.float32)
+        if heat.ndim != 2 or heat.size == 0:
+            logger.debug(f"heatmap list has unexpected shape {heat.shape}")
+            return None
+        return _normalize(heat)
+
+    if isinstance(payload, str):
+        if payload.startswith("data:"):
+            payload = payload.split(",", 1)[-1]
+        try:
+            payload = base64.b64decode(payload)
+        except (binascii.Error, ValueError) as e:
+            logger.debug(f"heatmap is not valid base64; {e}")
+            return None
+
+    data = np.frombuffer(payload, dtype=np.uint8)
+    heat = cv.imdecode(data, cv.IMREAD_UNCHANGED)
+    if heat is None:
+        logger.debug("heatmap payload is not a decodable image")
+        return None
+    if heat.ndim == 3:
+        if heat.shape[2] == 4:
+            heat = heat[:, :, :3]
+        # Gray images stored as color collapse to one channel
+        if np.array_equal(heat[:, :, 0], heat[:, :, 1]) and np.array_equal(heat[:, :, 1], heat[:, :, 2]):
+            heat = heat[:, :, 0]
+    if heat.dtype != np.uint8:
+        heat = _normalize(heat.astype(np.float32))
+    return np.ascontiguousarray(heat)
+
+
+def colormapLut(name="jet"):
+    """ Gets the 256x3 BGR lookup table for an OpenCV colormap name (e.g. 'jet', 'inferno')."""
+
+    name = name.lower()
+    lut = _lutCache.get(name)
+    if lut is None:
+        cmap = getattr(cv, "COLORMAP_" + name.upper(), None)
+        if cmap is None:
+            raise ValueError(f"Unknown colormap '{name}'")
+        lut = cv.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), cmap).reshape(256, 3)
+        _lutCache[name] = lut
+    return lut
+
+
+class HeatmapOverlay:
+    """ Blends heatmaps over images.
+
+    Working buffers are kept between calls and reallocated only when the image
+    size changes, so overlaying a batch of same size images does not allocate
+    per image. An instance is not thread safe; use one per thread or process."""
+
+    def __init__(self, colormap="jet", alpha=0.5):
+        """
+        :param colormap -- OpenCV colormap name used for intensity heatmaps
+        :param alpha    -- opacity of the heatmap (0.0 to 1.0)"""
+
+        self.lut = colormapLut(colormap)
+        self.alpha = min(max(float(alpha), 0.0), 1.0)
+        self._shape = None
+        self._heat = None
+        self._colored = None
+        self._blended = None
+
+    def colorize(self, heat, shape):
+        """ Resizes 'heat' to 'shape' ((height, width)) and maps it through the colormap.
+        The returned array is an internal buffer that is overwritten by the next call."""
+
+        height, width = shape
+        self._allocate((height, width))
+        if heat.ndim == 3:
+            cv.resize(heat, (width, height), dst=self._colored, interpolation=cv.INTER_LINEAR)
+        else:
+            cv.resize(heat, (width, height), dst=self._heat, interpolation=cv.INTER_LINEAR)
+            np.take(self.lut, self._heat, axis=0, out=self._colored)
+        return self._colored
+
+    def overlay(self, image, heat, out=None):
+        """ Blends the heatmap over a BGR image.
+
+        :param image -- BGR image (not modified unless it is also 'out')
+        :param heat  -- decoded heatmap (see 'decode')
+        :param out   -- optional destination array. If not provided, an internal buffer
+                        is returned that is overwritten by the next call.
+
+        :return: returns the blended image"""
+
+        colored = self.colorize(heat, image.shape[:2])
+        if out is None:
+            out = self._blended
+        cv.addWeighted(image, 1.0 - self.alpha, colored, self.alpha, 0.0, dst=out)
+        return out
+
+    def _allocate(self, shape):
+        if self._shape != shape:
+            self._shape = shape
+            self._heat = np.empty(shape, dtype=np.uint8)
+            self._colored = np.empty(shape + (3,), dtype=np.uint8)
+            self._blended = np.empty(shape + (3,), dtype=np.uint8)
+
+
+def _normalize(heat):
+    """ Scales a float heatmap into 0-255. Values already in [0, 1] are scaled directly."""
+
+    lo = float(heat.min())
+    hi = float(heat.max())
+    if lo >= 0.0 and hi <= 1.0:
+        scaled = heat * 255.0
+    elif hi > lo:
+        scaled = (heat - lo) * (255.0 / (hi - lo))
+    else:
+        scaled = np.zeros_like(heat)
+    return np.clip(np.rint(scaled), 0, 255).astype(np.uint8)
@@ -0,0 +1,118 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Local cache of inference results.
+
+Results are stored as one JSON file per (model, file, inference parameters)
+key, so re-running a comparison or evaluation only infers files that changed.
+Files are identified by absolute path, size and modification time, which
+avoids reading every file just to check the cache.
+"""
+
+import hashlib
+import json
+import os
+import logging as logger
+
+
+def cacheRoot():
+    """ Returns the local cache root from '$VAPI_CACHE_DIR' or '~/.cache/vision-tools'."""
+
+    cacheDir = os.getenv("VAPI_CACHE_DIR")
+    if cacheDir is None:
+        cacheDir = os.path.join(os.path.expanduser("~"), ".cache", "vision-tools")
+    return cacheDir
+
+
+def defaultCacheDir():
+    """ Returns the inference cache directory under 'cacheRoot()'."""
+
+    return os.path.join(cacheRoot(), "inference")
+
+
+class InferenceCache:
+    """ On-disk cache of inference results, one directory per model."""
+
+    def __init__(self, directory=None):
+        """
+        :param directory -- root directory of the cache. Defaults to 'defaultCacheDir()'."""
+
+        self.directory = directory if directory is not None else defaultCacheDir()
+
+    def key(self, model_id, filepath, params=None):
+        """ Builds the cache key for inferring 'filepath' with 'model_id' and 'params'."""
+
+        stat = os.stat(filepath)
+        ident = json.dumps([os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, params or {}],
+                           sort_keys=True)
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def get(self, model_id, filepath, params=None):
+        """ Returns the cached result, or None if there is none."""
+
+        try:
+            with open(self._path(model_id, self.key(model_id, filepath, params))) as handle:
+                return json.load(handle)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def put(self, model_id, filepath, result, params=None):
+        """ Saves a result. The write is atomic so concurrent readers never see partial files."""
+
+        path = self._path(model_id, self.key(model_id, filepath, params))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as handle:
+            json.dump(result, handle, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def _path(self, model_id, key):
+        return os.path.join(self.directory, model_id, key[:2], key + ".json")
+
+
+def cachedInfer(server, model_id, filepaths, cache=None, workers=4, **kwargs):
+    """ Infers files, using cached results where possible.
+
+    Cache hits are yielded first; the remaining files are inferred concurrently
+    with 'DeployedModels.infer_many' and successful results are cached.
+
+    :param server    -- vapi server connection
+    :param model_id  -- id of the deployed model
+    :param filepaths -- iterable of local file paths
+    :param cache     -- InferenceCache to use. If None, nothing is cached.
+    :param workers   -- number of concurrent inference requests
+    :param kwargs    -- named inference parameters (part of the cache key)
+
+    :return: generator of '(filepath, result)' tuples; 'result' is None on failure"""
+
+    misses = []
+    for filepath in filepaths:
+        result = cache.get(model_id, filepath, kwargs) if cache is not None else None
+        if result is not None:
+            yield filepath, result
+        else:
+            misses.append(filepath)
+
+    if cache is not None:
+        logger.info(f"inference cache: {len(misses)} misses for model {model_id}")
+    for filepath, result in server.deployed_models.infer_many(model_id, misses, workers=workers, **kwargs):
+        if result is not None and cache is not None:
+            cache.put(model_id, filepath, result, kwargs)
+        yield filepath, result
@@ -0,0 +1,146 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Incremental decoding of JSON list responses.
+
+List APIs return one JSON array. 'iterItems' decodes the items of the array
+as the response body arrives, so a caller can process (or print) each item
+without holding the whole list in memory. Only the item being decoded and
+the current network chunk are buffered.
+"""
+
+import codecs
+import json
+
+from vapi.SseMonitor import iterChunks
+
+
+class JsonStreamError(ValueError):
+    """ Raised when a streamed body is not a complete JSON value."""
+    pass
+
+
+def iterItems(chunks):
+    """ Generator yielding the items of a JSON array from an iterable of byte chunks.
+
+    Chunks may split the body anywhere, including inside an item or a multi-byte
+    character. If the body is not an array, the whole value is yielded as the
+    only item.
+
+    Raises JsonStreamError if the body is not valid JSON or ends early."""
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    inArray = None
+    done = False
+    chunks = iter(chunks)
+
+    while not done:
+        chunk = next(chunks, None)
+        final = chunk is None
+        text = utf8.decode(b"" if final else chunk, final=final)
+        buffer = buffer[pos:] + text if pos < len(buffer) else text
+        pos = 0
+
+        if inArray is None:
+            stripped = buffer.lstrip("\ufeff \t\r\n")
+            if not stripped:
+                if final:
+                    raise JsonStreamError("empty response body")
+                continue
+            inArray = stripped[0] == "["
+            buffer = stripped[1:] if inArray else stripped
+        if not inArray:
+            # Not a list; the value is yielded whole once the body is complete
+            if final:
+                yield _decodeAll(decoder, buffer)
+                return
+            continue
+
+        while True:
+            pos = _skipSeparators(buffer, pos)
+            if pos < len(buffer) and buffer[pos] == "]":
+                done = True
+                break
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                if final:
+                    raise JsonStreamError(f"invalid or truncated JSON list; {e}") from None
+                break
+            # A bare number is only complete once a delimiter follows it; "0." or "1e"
+            # decodes as a shorter number that continues in the next chunk
+            if not isinstance(item, (str, list, dict)):
+                if end >= len(buffer):
+                    if not final:
+                        break
+                elif buffer[end] not in _DELIMITERS:
+                    if final:
+                        raise JsonStreamError(f"invalid JSON list; unexpected {buffer[end]!r} at {end}")
+                    break
+            yield item
+            pos = end
+        if final and not done:
+            raise JsonStreamError("JSON list ended without ']'")
+
+
+def streamItems(server, report, *args, **kwargs):
+    """ Calls a resource 'report' method with a streamed response and yields its items.
+
+    :param server -- vapi Server used by the resource
+    :param report -- bound report method (e.g. 'server.files.report')
+    :param args   -- positional arguments for 'report' (e.g. the dataset id)
+    :param kwargs -- query parameters for 'report'
+
+    :return: generator of the listed items. Nothing is yielded if the request
+             fails; check 'server.rsp_ok()'. Raises JsonStreamError if the
+             body is not a valid JSON list."""
+
+    with server.streaming():
+        report(*args, **kwargs)
+    if not server.rsp_ok():
+        return
+    rsp = server.raw_rsp()
+    try:
+        yield from iterItems(iterChunks(rsp, blockSize=65536))
+    finally:
+        rsp.close()
+
+
+_DELIMITERS = " \t\r\n,]"
+
+
+def _skipSeparators(buffer, pos):
+    end = len(buffer)
+    while pos < end and buffer[pos] in " \t\r\n,":
+        pos += 1
+    return pos
+
+
+def _decodeAll(decoder, text):
+    try:
+        value, end = decoder.raw_decode(text)
+    except json.JSONDecodeError as e:
+        raise JsonStreamError(f"invalid JSON response; {e}") from None
+    if text[end:].strip():
+        raise JsonStreamError("unexpected data after the JSON value")
+    return value
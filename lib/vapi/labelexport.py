@@ -0,0 +1,306 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Streaming export of a dataset's object labels to COCO or YOLO.
+
+Object labels are read page by page (with the next pages prefetched) and
+written to the output as they arrive, so memory does not grow with the number
+of labels. Labels are joined with the file names and sizes of one file
+listing. Images can be downloaded in parallel while the labels are written.
+
+Example:
+    with CocoWriter("instances.json") as writer:
+        stats = exportLabels(server, dsid, writer, imageDir="images")
+"""
+
+import os
+import json
+import logging as logger
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from vapi import paging
+from vapi import rle
+
+FORMATS = ("coco", "yolo")
+
+
+class CocoWriter:
+    """ Writes a COCO instances file incrementally.
+
+    Annotations are written as they are added; images and categories, which are
+    small, are written when the writer is closed."""
+
+    def __init__(self, path):
+        self.path = path
+        self.categories = OrderedDict()
+        self._handle = open(path, "w")
+        self._handle.write('{"annotations":[')
+        self._count = 0
+
+    def add(self, label, image):
+        """ Writes one object label of 'image' (see 'exportLabels' for its fields)."""
+
+        box = label["bnd_box"]
+        x, y = box["xmin"], box["ymin"]
+        w, h = box["xmax"] - x, box["ymax"] - y
+        annotation = {
+            "id": self._count + 1,
+            "image_id": image["index"],
+            "category_id": self._category(label.get("name")),
+            "bbox": [x, y, w, h],
+            "area": w * h,
+            "iscrowd": 0
+        }
+        polygons = rle.pointArrays(label.get("segment_polygons"))
+        if polygons:
+            annotation["segmentation"] = [p.reshape(-1).tolist() for p in polygons]
+        self._handle.write(("," if self._count else "") + json.dumps(annotation, separators=(",", ":")))
+        self._count += 1
+        return True
+
+    def close(self, images=()):
+        """ Writes the images and categories and closes the file.
+
+        :param images -- image dicts with 'index', 'name', 'width' and 'height'.
+                         'width' and 'height' are left out of the entry of an image
+                         whose size is unknown, rather than written as 0."""
+
+        if self._handle is None:
+            return
+        self._handle.write('],"images":[')
+        first = True
+        for image in images:
+            entry = {"id": image["index"], "file_name": image["name"]}
+            if image.get("width") and image.get("height"):
+                entry["width"], entry["height"] = image["width"], image["height"]
+            self._handle.write(("" if first else ",") + json.dumps(entry, separators=(",", ":")))
+            first = False
+        categories = [{"id": i, "name": name} for name, i in self.categories.items()]
+        self._handle.write('],"categories":' + json.dumps(categories, separators=(",", ":")) + "}\n")
+        self._handle.close()
+        self._handle = None
+
+    def abort(self):
+        """ Closes and removes the partial file, so an incomplete export is never left behind."""
+
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _category(self, name):
+        index = self.categories.get(name)
+        if index is None:
+            index = self.categories[name] = len(self.categories) + 1
+        return index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+class YoloWriter:
+    """ Writes YOLO label files ('<image>.txt') and a 'classes.txt' file.
+
+    Labels of a file may arrive at any time, so lines are appended. A small
+    number of label files is kept open at once."""
+
+    needsSize = True
+
+    def __init__(self, directory, maxOpen=64):
+        self.directory = directory
+        self.categories = OrderedDict()
+        self.maxOpen = maxOpen
+        self._open = OrderedDict()
+        self._started = set()
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, label, image):
+        """ Appends one object label of 'image'. Returns False if the image size is unknown."""
+
+        width, height = image.get("width"), image.get("height")
+        if not width or not height:
+            return False
+        box = label["bnd_box"]
+        cx = (box["xmin"] + box["xmax"]) / 2.0 / width
+        cy = (box["ymin"] + box["ymax"]) / 2.0 / height
+        w = (box["xmax"] - box["xmin"]) / width
+        h = (box["ymax"] - box["ymin"]) / height
+        self._handle(image["name"]).write(f"{self._category(label.get('name'))} {cx:.6f} {cy:.6f} {w:.6f} {h:.6f}\n")
+        return True
+
+    def close(self, images=()):
+        """ Closes the label files and writes 'classes.txt'."""
+
+        for handle in self._open.values():
+            handle.close()
+        self._open.clear()
+        with open(os.path.join(self.directory, "classes.txt"), "w") as handle:
+            for name in self.categories:
+                handle.write(f"{name}\n")
+
+    def abort(self):
+        """ Closes and removes the label files written so far; 'classes.txt' is not written."""
+
+        for handle in self._open.values():
+            handle.close()
+        self._open.clear()
+        for imageName in self._started:
+            path = os.path.join(self.directory, os.path.splitext(imageName)[0] + ".txt")
+            if os.path.exists(path):
+                os.remove(path)
+        self._started.clear()
+
+    def _handle(self, imageName):
+        handle = self._open.get(imageName)
+        if handle is not None:
+            self._open.move_to_end(imageName)
+            return handle
+        if len(self._open) >= self.maxOpen:
+            self._open.popitem(last=False)[1].close()
+        path = os.path.join(self.directory, os.path.splitext(imageName)[0] + ".txt")
+        # Truncate a label file left by an earlier export the first time it is touched
+        handle = open(path, "a" if imageName in self._started else "w")
+        self._started.add(imageName)
+        self._open[imageName] = handle
+        return handle
+
+    def _category(self, name):
+        index = self.categories.get(name)
+        if index is None:
+            index = self.categories[name] = len(self.categories)
+        return index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for handle in self._open.values():
+            handle.close()
+        self._open.clear()
+
+
+def listImages(server, dsid, pageSize=1000):
+    """ Gets the files of a dataset as export image dicts keyed by file id.
+
+    Each dict has 'index' (1-based), 'name' (unique output file name), 'width'
+    and 'height' (None when the listing does not carry the size)."""
+
+    images = {}
+    names = set()
+    for info in paging.iterate(server.files.report, dsid, pageSize=pageSize, prefetch=1):
+        name = info.get("original_file_name") or info["_id"]
+        if name in names:
+            stem, ext = os.path.splitext(name)
+            name = f"{stem}_{info['_id']}{ext}"
+        names.add(name)
+        images[info["_id"]] = {"index": len(images) + 1, "name": name,
+                               "width": info.get("width"), "height": info.get("height")}
+    return images
+
+
+def exportLabels(server, dsid, writer, imageDir=None, workers=8, pageSize=1000, prefetch=2):
+    """ Exports the object labels of a dataset.
+
+    :param server   -- vapi server connection
+    :param dsid     -- UUID of the dataset
+    :param writer   -- CocoWriter or YoloWriter. It is closed by this function, or
+                       aborted (the partial output removed) if the export fails.
+    :param imageDir -- optional directory into which the images are downloaded
+    :param workers  -- number of concurrent image downloads
+    :param pageSize -- number of labels requested per page
+    :param prefetch -- number of label pages fetched ahead
+
+    :return: returns a dict of counts ('images', 'labels', 'skipped_labels',
+             'unsized_images', 'downloaded_images' and 'failed_images').
+             'unsized_images' counts images whose size is unknown; YOLO labels of
+             these images are skipped, and their COCO entries have no size."""
+
+    downloads = {}
+    pool = None
+    try:
+        images = listImages(server, dsid, pageSize=pageSize)
+        stats = {"images": len(images), "labels": 0, "skipped_labels": 0,
+                 "downloaded_images": 0, "failed_images": 0}
+
+        if imageDir is not None:
+            os.makedirs(imageDir, exist_ok=True)
+            pool = ThreadPoolExecutor(max_workers=workers)
+            for fileId, image in images.items():
+                downloads[fileId] = pool.submit(server.files.download_file, dsid, fileId,
+                                                os.path.join(imageDir, image["name"]))
+
+        for label in paging.iterate(server.object_labels.report, dsid, None, pageSize=pageSize, prefetch=prefetch):
+            image = images.get(label.get("file_id"))
+            if image is None or "bnd_box" not in label:
+                stats["skipped_labels"] += 1
+                continue
+            if getattr(writer, "needsSize", False) and not image["width"]:
+                _sizeFromDownload(image, downloads.get(label["file_id"]))
+            if writer.add(label, image):
+                stats["labels"] += 1
+            else:
+                stats["skipped_labels"] += 1
+
+        for fileId, future in downloads.items():
+            ok = future.result() is not None
+            stats["downloaded_images" if ok else "failed_images"] += 1
+            if ok and not images[fileId]["width"]:
+                _sizeFromDownload(images[fileId], future)
+    except BaseException:
+        # An incomplete export must not look valid; queued downloads are dropped
+        for future in downloads.values():
+            future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=True)
+        writer.abort()
+        raise
+
+    if pool is not None:
+        pool.shutdown(wait=True)
+    writer.close(images.values())
+
+    stats["unsized_images"] = sum(1 for image in images.values() if not image["width"] or not image["height"])
+    if stats["skipped_labels"] > 0:
+        logger.warning(f"{stats['skipped_labels']} labels were skipped (no box, unknown file or unknown image size)")
+    if stats["unsized_images"] > 0:
+        logger.warning(f"{stats['unsized_images']} images have no known size; download the images to get it")
+    return stats
+
+
+def _sizeFromDownload(image, future):
+    """ Reads the size of 'image' from its downloaded file, waiting for the download."""
+
+    if future is None:
+        return
+    path = future.result()
+    if path is None:
+        return
+    import cv2 as cv
+
+    data = cv.imread(path, cv.IMREAD_UNCHANGED)
+    if data is not None:
+        image["height"], image["width"] = data.shape[:2]
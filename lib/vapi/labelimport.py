@@ -0,0 +1,287 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Bulk import of object labels from COCO, Pascal VOC and YOLO annotations.
+
+Annotations are read one image at a time and all boxes of an image are saved
+with a single 'savelabels' call, with many images saved concurrently. Dataset
+file ids are resolved from one file listing and tags are looked up (or
+created) once per name. Completed file names are appended to an optional
+checkpoint file so an interrupted import can be resumed.
+
+Example:
+    importer = LabelImporter(server, dsid, workers=8, checkpoint="import.ckpt")
+    stats = importer.run(readVoc("annotations/"))
+"""
+
+import os
+import json
+import threading
+import logging as logger
+import xml.etree.ElementTree as ElementTree
+from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from vapi import paging
+from vapi.concurrency import boundedMap
+
+# Annotations of one image. 'objects' is a list of '(name, xmin, ymin, xmax, ymax)'
+# tuples. If 'normalized' is True the coordinates are fractions of the image size
+# and 'imagePath' identifies the local image from which the size is read.
+LabeledFile = namedtuple("LabeledFile", ["name", "objects", "normalized", "imagePath"])
+
+FORMATS = ("coco", "voc", "yolo")
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff")
+
+
+def readCoco(path):
+    """ Generator yielding a LabeledFile for each image of a COCO annotation file.
+
+    The JSON document is read once and then reduced to compact per image box
+    lists before the images are yielded."""
+
+    with open(path) as handle:
+        doc = json.load(handle)
+    categories = {c["id"]: c["name"] for c in doc.get("categories", [])}
+    boxes = defaultdict(list)
+    for ann in doc.get("annotations", []):
+        x, y, w, h = ann["bbox"]
+        boxes[ann["image_id"]].append((categories.get(ann["category_id"], str(ann["category_id"])),
+                                       x, y, x + w, y + h))
+    images = [(img["id"], os.path.basename(img["file_name"])) for img in doc.get("images", [])]
+    del doc
+
+    for imageId, name in images:
+        yield LabeledFile(name, boxes.pop(imageId, []), False, None)
+
+
+def readVoc(directory):
+    """ Generator yielding a LabeledFile for each Pascal VOC XML file in 'directory'."""
+
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+        if not entry.name.lower().endswith(".xml"):
+            continue
+        try:
+            root = ElementTree.parse(entry.path).getroot()
+        except ElementTree.ParseError as e:
+            logger.warning(f"skipping '{entry.path}'; {e}")
+            continue
+        name = root.findtext("filename") or os.path.splitext(entry.name)[0] + ".jpg"
+        objects = []
+        for obj in root.iter("object"):
+            box = obj.find("bndbox")
+            if box is None:
+                continue
+            objects.append((obj.findtext("name"),
+                            float(box.findtext("xmin")), float(box.findtext("ymin")),
+                            float(box.findtext("xmax")), float(box.findtext("ymax"))))
+        yield LabeledFile(os.path.basename(name), objects, False, None)
+
+
+def readYolo(labelDir, imageDir, classes=None):
+    """ Generator yielding a LabeledFile for each YOLO label file in 'labelDir'.
+
+    :param labelDir -- directory of '<image-name>.txt' files with one
+                       'class cx cy width height' line (normalized) per box
+    :param imageDir -- directory of the images; needed for names and sizes
+    :param classes  -- optional list of class names indexed by class number"""
+
+    images = {}
+    for entry in os.scandir(imageDir):
+        stem, ext = os.path.splitext(entry.name)
+        if ext.lower() in IMAGE_EXTENSIONS:
+            images[stem] = entry.path
+
+    for entry in sorted(os.scandir(labelDir), key=lambda e: e.name):
+        stem, ext = os.path.splitext(entry.name)
+        if ext.lower() != ".txt":
+            continue
+        imagePath = images.get(stem)
+        if imagePath is None:
+            logger.warning(f"no image found for '{entry.path}'")
+            continue
+        objects = []
+        with open(entry.path) as handle:
+            for line in handle:
+                fields = line.split()
+                if len(fields) < 5:
+                    continue
+                cls = int(fields[0])
+                cx, cy, w, h = (float(v) for v in fields[1:5])
+                name = classes[cls] if classes is not None and cls < len(classes) else str(cls)
+                objects.append((name, cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2))
+        yield LabeledFile(os.path.basename(imagePath), objects, True, imagePath)
+
+
+def readClasses(path):
+    """ Reads a class names file (one name per line, as used by YOLO)."""
+
+    with open(path) as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
+class LabelImporter:
+    """ Saves LabeledFiles as object labels of the files of one dataset."""
+
+    def __init__(self, server, dsid, workers=8, checkpoint=None, createTags=True):
+        """
+        :param server     -- vapi server connection
+        :param dsid       -- UUID of the target dataset
+        :param workers    -- number of files saved concurrently
+        :param checkpoint -- optional file recording the names of files already saved
+        :param createTags -- create tags that do not exist in the dataset"""
+
+        self.server = server
+        self.dsid = dsid
+        self.workers = max(int(workers), 1)
+        self.checkpoint = checkpoint
+        self.createTags = createTags
+        self.stats = {"saved_files": 0, "saved_labels": 0, "skipped_files": 0,
+                      "unknown_files": 0, "failed_files": 0}
+        self._fileIds = None
+        self._tags = None
+        self._tagLock = threading.Lock()
+
+    def run(self, labeledFiles):
+        """ Saves the labels of every LabeledFile.
+
+        :return: returns a dict of counts ('saved_files', 'saved_labels',
+                 'skipped_files', 'unknown_files' and 'failed_files')"""
+
+        fileIds = self._loadFileIds()
+        self._loadTags()
+        done = self._loadCheckpoint()
+
+        def toSave():
+            for labeled in labeledFiles:
+                if labeled.name in done:
+                    self.stats["skipped_files"] += 1
+                    continue
+                fileId = fileIds.get(labeled.name)
+                if fileId is None:
+                    logger.warning(f"file '{labeled.name}' is not in dataset {self.dsid}")
+                    self.stats["unknown_files"] += 1
+                    continue
+                yield fileId, labeled
+
+        ckpt = open(self.checkpoint, "a") if self.checkpoint is not None else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # Bound the number of parsed files waiting to be saved
+                for labeled, count in boundedMap(pool, lambda item: self._save(*item), toSave(), 2 * self.workers):
+                    self._collect(labeled, count, ckpt)
+        finally:
+            if ckpt is not None:
+                ckpt.close()
+        return self.stats
+
+    def _save(self, fileId, labeled):
+        """ Saves the labels of one file. Failures of a single file (malformed objects,
+        unreadable images or connection errors) are logged and counted, so they never
+        stop the rest of the import."""
+
+        try:
+            labels = [self._label(obj, labeled) for obj in self._absolute(labeled)]
+        except Exception as e:
+            logger.warning(f"failed to prepare labels of '{labeled.name}'; {e}")
+            return labeled, None
+        try:
+            self.server.object_labels.savelabels(self.dsid, fileId, labels)
+        except Exception as e:
+            logger.warning(f"failed to save labels of '{labeled.name}'; {e}")
+            return labeled, None
+        if not self.server.rsp_ok():
+            logger.warning(f"failed to save labels of '{labeled.name}'; status={self.server.status_code()}")
+            return labeled, None
+        return labeled, len(labels)
+
+    def _collect(self, labeled, count, ckpt):
+        if count is None:
+            self.stats["failed_files"] += 1
+            return
+        self.stats["saved_files"] += 1
+        self.stats["saved_labels"] += count
+        if ckpt is not None:
+            ckpt.write(labeled.name + "\n")
+            ckpt.flush()
+
+    def _label(self, obj, labeled):
+        name, xmin, ymin, xmax, ymax = obj
+        return {
+            "name": name,
+            "tag_id": self._tagId(name),
+            "bndbox": {"xmin": int(round(xmin)), "ymin": int(round(ymin)),
+                       "xmax": int(round(xmax)), "ymax": int(round(ymax))}
+        }
+
+    def _absolute(self, labeled):
+        """ Converts normalized boxes to pixels using the local image size."""
+
+        if not labeled.normalized or not labeled.objects:
+            return labeled.objects
+        import cv2 as cv
+
+        image = cv.imread(labeled.imagePath, cv.IMREAD_UNCHANGED)
+        if image is None:
+            raise ValueError(f"cannot read image '{labeled.imagePath}'")
+        height, width = image.shape[:2]
+        return [(name, x1 * width, y1 * height, x2 * width, y2 * height)
+                for name, x1, y1, x2, y2 in labeled.objects]
+
+    def _tagId(self, name):
+        with self._tagLock:
+            tagId = self._tags.get(name)
+            if tagId is None and self.createTags:
+                rsp = self.server.object_tags.create(self.dsid, name)
+                if rsp is None:
+                    raise ValueError(f"failed to create tag '{name}'; status={self.server.status_code()}")
+                tagId = rsp.get("dataset_tag_id")
+                self._tags[name] = tagId
+                logger.info(f"created tag '{name}' ({tagId})")
+            elif tagId is None:
+                raise ValueError(f"tag '{name}' does not exist in dataset {self.dsid}")
+            return tagId
+
+    def _loadFileIds(self):
+        if self._fileIds is None:
+            self._fileIds = {}
+            for info in paging.iterate(self.server.files.report, self.dsid):
+                name = info.get("original_file_name")
+                if name in self._fileIds:
+                    logger.warning(f"dataset has more than one file named '{name}'; using the first")
+                    continue
+                self._fileIds[name] = info["_id"]
+        return self._fileIds
+
+    def _loadTags(self):
+        if self._tags is None:
+            tags = self.server.object_tags.report(self.dsid)
+            if tags is None:
+                raise paging.PagingError(f"failed to get the tags of dataset {self.dsid}")
+            self._tags = {tag["name"]: tag["_id"] for tag in tags}
+        return self._tags
+
+    def _loadCheckpoint(self):
+        if self.checkpoint is None or not os.path.exists(self.checkpoint):
+            return set()
+        with open(self.checkpoint) as handle:
+            done = {line.rstrip("\n") for line in handle if line.strip()}
+        logger.info(f"resuming import; {len(done)} files already saved")
+        return done
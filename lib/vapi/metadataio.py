@@ -0,0 +1,365 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Bulk import and columnar export of file user metadata.
+
+Import files are CSV or pipe separated. The first row names the columns. One
+column identifies the file, either by id ('_id', 'file_id' or 'id') or by name
+('original_file_name' or 'file_name'); every other column is a metadata key.
+Rows are streamed from the file and written concurrently with
+'FileUserMetadata.add_many'.
+
+Exports are parsed as they stream from the server into typed columns
+(see 'readColumns'), which can be saved as '.npz', Parquet or Feather.
+"""
+
+import csv
+import os
+import re
+import time
+import logging as logger
+
+import numpy as np
+
+from vapi import paging
+
+ID_COLUMNS = ("_id", "file_id", "id")
+NAME_COLUMNS = ("original_file_name", "file_name")
+
+
+def detectDelimiter(header):
+    """ Returns '|' if the header line is pipe separated, otherwise ','."""
+
+    return "|" if header.count("|") > header.count(",") else ","
+
+
+def openRows(handle, delimiter=None):
+    """ Starts reading a metadata file.
+
+    :param handle    -- open text file
+    :param delimiter -- column delimiter. Detected from the header line if None.
+
+    :return: returns '(columns, delimiter, rows)' where 'rows' is a generator of
+             '(lineNumber, values)' tuples"""
+
+    header = handle.readline()
+    if delimiter is None:
+        delimiter = detectDelimiter(header)
+    columns = [c.strip() for c in next(csv.reader([header], delimiter=delimiter), [])]
+
+    def rows():
+        for number, values in enumerate(csv.reader(handle, delimiter=delimiter), start=2):
+            if values:
+                yield number, values
+
+    return columns, delimiter, rows()
+
+
+class MetadataImporter:
+    """ Writes metadata rows to the files of one dataset."""
+
+    def __init__(self, server, dsid, workers=8, skipUnknownKeys=False):
+        """
+        :param server  -- vapi server connection
+        :param dsid    -- UUID of the target dataset
+        :param workers -- number of concurrent requests
+        :param skipUnknownKeys -- drop columns that are not user metadata keys of the
+                          dataset instead of failing"""
+
+        self.server = server
+        self.dsid = dsid
+        self.workers = max(int(workers), 1)
+        self.skipUnknownKeys = skipUnknownKeys
+
+    def run(self, handle, delimiter=None, manifest=None, progress=None):
+        """ Imports a metadata file.
+
+        :param handle    -- open text file (see 'openRows')
+        :param delimiter -- column delimiter. Detected if None.
+        :param manifest  -- optional open text file into which failed rows are written
+                            (same columns plus 'line' and 'error')
+        :param progress  -- optional callback called with the stats dict about once a second
+
+        :return: returns a dict of counts and throughput. Raises ValueError if the
+                 columns cannot be used and paging.PagingError if the dataset keys or
+                 files cannot be read."""
+
+        columns, delimiter, rows = openRows(handle, delimiter)
+        fileColumn, keyColumns = self._columns(columns)
+        fileIds = self._fileIds() if columns[fileColumn].lower() in NAME_COLUMNS else None
+
+        failures = None
+        if manifest is not None:
+            failures = csv.writer(manifest, delimiter=delimiter)
+            failures.writerow(columns + ["line", "error"])
+
+        stats = {"rows": 0, "written": 0, "failed": 0, "seconds": 0.0, "rows_per_second": 0.0}
+        lines = {}
+        start = lastReport = time.time()
+
+        def pairs():
+            for number, values in rows:
+                stats["rows"] += 1
+                fileid = values[fileColumn].strip() if fileColumn < len(values) else ""
+                if fileIds is not None:
+                    fileid = fileIds.get(fileid)
+                if not fileid:
+                    self._fail(stats, failures, values, number, "unknown file")
+                    continue
+                kvPairs = {key: values[i] for i, key in keyColumns if i < len(values) and values[i] != ""}
+                if not kvPairs:
+                    continue
+                lines[id(kvPairs)] = (number, values)
+                yield fileid, kvPairs
+
+        for fileid, kvPairs, error in self.server.file_metadata.add_many(self.dsid, pairs(), workers=self.workers):
+            number, values = lines.pop(id(kvPairs))
+            if error is None:
+                stats["written"] += 1
+            else:
+                self._fail(stats, failures, values, number, error)
+            now = time.time()
+            if progress is not None and now - lastReport >= 1.0:
+                lastReport = now
+                progress(self._rate(stats, start))
+        return self._rate(stats, start)
+
+    def _columns(self, columns):
+        lowered = [c.lower() for c in columns]
+        fileColumn = next((lowered.index(c) for c in ID_COLUMNS + NAME_COLUMNS if c in lowered), None)
+        if fileColumn is None:
+            raise ValueError(f"no file column; one of {', '.join(ID_COLUMNS + NAME_COLUMNS)} is required")
+
+        keys = self.server.file_keys.report(self.dsid)
+        if keys is None:
+            raise paging.PagingError(f"failed to get the user metadata keys of dataset {self.dsid}")
+        known = {key.get("name") for key in keys}
+        keyColumns = [(i, c) for i, c in enumerate(columns) if i != fileColumn and c]
+        unknown = [c for _, c in keyColumns if c not in known]
+        if unknown and not self.skipUnknownKeys:
+            raise ValueError(f"columns are not user metadata keys of the dataset: {', '.join(unknown)}")
+        if unknown:
+            logger.warning(f"skipping columns that are not metadata keys: {', '.join(unknown)}")
+        return fileColumn, [(i, c) for i, c in keyColumns if c in known]
+
+    def _fileIds(self):
+        fileIds = {}
+        for info in paging.iterate(self.server.files.report, self.dsid, prefetch=1):
+            fileIds.setdefault(info.get("original_file_name"), info["_id"])
+        return fileIds
+
+    @staticmethod
+    def _fail(stats, failures, values, number, error):
+        stats["failed"] += 1
+        if failures is not None:
+            failures.writerow(list(values) + [number, error])
+
+    @staticmethod
+    def _rate(stats, start):
+        stats["seconds"] = round(time.time() - start, 3)
+        stats["rows_per_second"] = round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] > 0 else 0.0
+        return stats
+
+
+# ---  Columnar export  -------------------------------------------------
+class MetadataTable:
+    """ Typed columns of a user metadata export.
+
+    Columns are NumPy arrays of equal length keyed by column name. Integer
+    columns with missing values are stored as float64 with NaN, timestamps as
+    datetime64 with NaT and text as fixed width unicode arrays."""
+
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def names(self):
+        return list(self.columns)
+
+    def save(self, path):
+        """ Saves the table. The format is chosen by the file extension:
+        '.npz' (NumPy), '.parquet' or '.feather' (both require 'pyarrow')."""
+
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".npz":
+            np.savez_compressed(path, **self.columns)
+            return path
+        if ext not in (".parquet", ".feather"):
+            raise ValueError(f"unsupported table format '{ext}'; use .npz, .parquet or .feather")
+        try:
+            import pyarrow
+        except ImportError:
+            raise ValueError(f"writing '{ext}' files requires the 'pyarrow' package")
+        table = pyarrow.table({name: pyarrow.array(values) for name, values in self.columns.items()})
+        if ext == ".parquet":
+            import pyarrow.parquet as parquet
+            parquet.write_table(table, path)
+        else:
+            import pyarrow.feather as feather
+            feather.write_feather(table, path)
+        return path
+
+
+def readColumns(lines, delimiter="|", keys=None, chunkRows=65536):
+    """ Parses a user metadata export into a MetadataTable.
+
+    Rows are collected in chunks of 'chunkRows' which are turned into per column
+    string arrays, so memory holds columns rather than a dict per file. Column
+    types are inferred chunk by chunk and applied once at the end.
+
+    :param lines     -- iterable of export lines; the first line is the header
+                        (e.g. 'FileUserMetadata.export_lines')
+    :param delimiter -- column delimiter
+    :param keys      -- optional list of metadata keys to keep. File id and name
+                        columns are always kept.
+    :param chunkRows -- number of rows parsed before they are converted to arrays
+
+    :return: returns a MetadataTable"""
+
+    reader = csv.reader(iter(lines), delimiter=delimiter)
+    header = [h.strip() for h in next(reader, [])]
+    if keys is not None:
+        wanted = set(keys) | set(ID_COLUMNS) | set(NAME_COLUMNS)
+        selected = [i for i, name in enumerate(header) if name in wanted]
+    else:
+        selected = [i for i, name in enumerate(header) if name]
+    names = [header[i] for i in selected]
+    chunks = [[] for _ in selected]
+    kinds = [None] * len(selected)
+
+    rows = []
+
+    def flush():
+        for c, i in enumerate(selected):
+            values = np.array([row[i].strip() if i < len(row) else "" for row in rows], dtype=np.str_)
+            chunks[c].append(values)
+            kinds[c] = _combine(kinds[c], _kind(values))
+        rows.clear()
+
+    for row in reader:
+        if row:
+            rows.append(row)
+            if len(rows) >= chunkRows:
+                flush()
+    if rows:
+        flush()
+
+    columns = {}
+    for c, name in enumerate(names):
+        values = np.concatenate(chunks[c]) if chunks[c] else np.zeros(0, dtype=np.str_)
+        chunks[c] = None
+        columns[name] = _convert(values, kinds[c])
+    logger.info(f"read {len(next(iter(columns.values()), []))} rows of {len(columns)} columns")
+    return MetadataTable(columns)
+
+
+_NUMERIC = ("int", "float", "timestamp14")
+
+
+def _kind(values):
+    """ Narrowest type that fits all non-empty values of a string array."""
+
+    values = values[values != ""]
+    if len(values) == 0:
+        return None
+    try:
+        ints = values.astype(np.int64)
+        if np.all(np.char.str_len(values) == 14) and _validCompact(ints):
+            return "timestamp14"
+        return "int"
+    except (ValueError, OverflowError):
+        pass
+    try:
+        values.astype(np.float64)
+        return "float"
+    except ValueError:
+        pass
+    if np.all(np.char.find(values, "-") > 0):
+        try:
+            _isoTimes(values)
+            return "iso"
+        except ValueError:
+            pass
+    return "str"
+
+
+def _combine(a, b):
+    if a is None or a == b:
+        return b
+    if b is None:
+        return a
+    if a in _NUMERIC and b in _NUMERIC:
+        return "float" if "float" in (a, b) else "int"
+    return "str"
+
+
+def _convert(values, kind):
+    missing = values == ""
+    if kind == "int" and not missing.any():
+        return values.astype(np.int64)
+    if kind in ("int", "float"):
+        out = np.full(len(values), np.nan)
+        out[~missing] = values[~missing].astype(np.float64)
+        return out
+    if kind == "timestamp14":
+        out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[s]")
+        out[~missing] = _compactTimes(values[~missing].astype(np.int64))
+        return out
+    if kind == "iso":
+        out = np.full(len(values), np.datetime64("NaT"), dtype="datetime64[ms]")
+        out[~missing] = _isoTimes(values[~missing])
+        return out
+    return values
+
+
+def _compactParts(ints):
+    """ Splits 'YYYYMMDDhhmmss' integers into their parts."""
+
+    return (ints // 10 ** 10, ints // 10 ** 8 % 100, ints // 10 ** 6 % 100,
+            ints // 10 ** 4 % 100, ints // 100 % 100, ints % 100)
+
+
+def _validCompact(ints):
+    year, month, day, hour, minute, second = _compactParts(ints)
+    return bool(np.all((year >= 1970) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= 31) &
+                       (hour < 24) & (minute < 60) & (second < 60)))
+
+
+def _compactTimes(ints):
+    """ Converts 'YYYYMMDDhhmmss' integers (as written by Visual Inspector) to datetime64[s]."""
+
+    year, month, day, hour, minute, second = _compactParts(ints)
+    months = (year - 1970) * 12 + (month - 1)
+    days = months.astype("datetime64[M]").astype("datetime64[D]") + (day - 1)
+    return days.astype("datetime64[s]") + (hour * 3600 + minute * 60 + second)
+
+
+_ZULU = re.compile(r"Z$")
+
+
+def _isoTimes(values):
+    """ Parses ISO 8601 strings (optionally ending in 'Z') to datetime64[ms]."""
+
+    return np.array([_ZULU.sub("", v) for v in values], dtype="datetime64[ms]")
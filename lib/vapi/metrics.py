@@ -0,0 +1,212 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Vectorized helpers for comparing and scoring detections and classifications.
+
+Boxes are Nx4 arrays of '(xmin, ymin, xmax, ymax)'.
+"""
+
+import numpy as np
+
+
+def boxes(detections):
+    """ Gets the Nx4 float array of boxes from a list of detections.
+
+    Inference detections carry 'xmin'..'ymax' directly; object labels carry them
+    in a 'bnd_box' field. Both are accepted."""
+
+    if not detections:
+        return np.zeros((0, 4), dtype=np.float64)
+    rows = []
+    for detection in detections:
+        box = detection.get("bnd_box", detection)
+        rows.append((box["xmin"], box["ymin"], box["xmax"], box["ymax"]))
+    return np.asarray(rows, dtype=np.float64)
+
+
+def boxIouMatrix(boxesA, boxesB):
+    """ Computes pairwise IoU between two sets of boxes with broadcasting.
+
+    :return: returns a len(boxesA) x len(boxesB) float array"""
+
+    boxesA = np.asarray(boxesA, dtype=np.float64).reshape(-1, 4)
+    boxesB = np.asarray(boxesB, dtype=np.float64).reshape(-1, 4)
+    if len(boxesA) == 0 or len(boxesB) == 0:
+        return np.zeros((len(boxesA), len(boxesB)), dtype=np.float64)
+
+    xmin = np.maximum(boxesA[:, None, 0], boxesB[None, :, 0])
+    ymin = np.maximum(boxesA[:, None, 1], boxesB[None, :, 1])
+    xmax = np.minimum(boxesA[:, None, 2], boxesB[None, :, 2])
+    ymax = np.minimum(boxesA[:, None, 3], boxesB[None, :, 3])
+    inter = np.clip(xmax - xmin, 0, None) * np.clip(ymax - ymin, 0, None)
+
+    areaA = (boxesA[:, 2] - boxesA[:, 0]) * (boxesA[:, 3] - boxesA[:, 1])
+    areaB = (boxesB[:, 2] - boxesB[:, 0]) * (boxesB[:, 3] - boxesB[:, 1])
+    union = areaA[:, None] + areaB[None, :] - inter
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, inter / union, 0.0)
+
+
+def greedyMatch(iou, threshold=0.5, order=None, allowed=None):
+    """ Greedily matches rows to columns of an IoU matrix.
+
+    Rows are visited in 'order' (for example by descending confidence); each row
+    takes the unmatched column with the highest IoU that is at least 'threshold'.
+
+    :param iou       -- NxM IoU matrix
+    :param threshold -- minimum IoU for a match
+    :param order     -- optional row visiting order. Defaults to row order.
+    :param allowed   -- optional NxM boolean matrix of pairs that may match
+                        (e.g. same class only)
+
+    :return: returns '(rowMatch, colMatch)' int arrays; -1 marks unmatched entries"""
+
+    iou = np.asarray(iou, dtype=np.float64)
+    rows, cols = iou.shape
+    rowMatch = np.full(rows, -1, dtype=np.int64)
+    colMatch = np.full(cols, -1, dtype=np.int64)
+    if rows == 0 or cols == 0:
+        return rowMatch, colMatch
+
+    candidates = np.where(iou >= threshold, iou, -1.0)
+    if allowed is not None:
+        candidates = np.where(allowed, candidates, -1.0)
+    if order is None:
+        order = range(rows)
+
+    for row in order:
+        scores = candidates[row]
+        col = int(np.argmax(scores))
+        if scores[col] < 0:
+            continue
+        rowMatch[row] = col
+        colMatch[col] = row
+        # The column is taken; no later row may match it
+        candidates[:, col] = -1.0
+    return rowMatch, colMatch
+
+
+def greedyMatchThresholds(iou, thresholds, order=None, allowed=None):
+    """ Greedy matching at several IoU thresholds at once.
+
+    Equivalent to calling 'greedyMatch' once per threshold, but the rows are
+    visited only once and each step is vectorized over the thresholds.
+
+    :param iou        -- NxM IoU matrix
+    :param thresholds -- sequence of T IoU thresholds
+    :param order      -- optional row visiting order. Defaults to row order.
+    :param allowed    -- optional NxM boolean matrix of pairs that may match
+
+    :return: returns a TxN int array of matched columns; -1 marks unmatched rows"""
+
+    iou = np.asarray(iou, dtype=np.float64)
+    thresholds = np.asarray(thresholds, dtype=np.float64).reshape(-1)
+    rows, cols = iou.shape
+    rowMatch = np.full((len(thresholds), rows), -1, dtype=np.int64)
+    if rows == 0 or cols == 0:
+        return rowMatch
+
+    # candidates[t, row, col] is the IoU if the pair may match at threshold t, else -1
+    candidates = np.where(iou[None, :, :] >= thresholds[:, None, None], iou[None, :, :], -1.0)
+    if allowed is not None:
+        candidates = np.where(allowed[None, :, :], candidates, -1.0)
+    if order is None:
+        order = range(rows)
+
+    levels = np.arange(len(thresholds))
+    for row in order:
+        scores = candidates[:, row, :]
+        best = np.argmax(scores, axis=1)
+        hit = scores[levels, best] >= 0
+        rowMatch[hit, row] = best[hit]
+        candidates[levels[hit], :, best[hit]] = -1.0
+    return rowMatch
+
+
+def averagePrecision(scores, truePositives, groundTruths, points=101):
+    """ Computes interpolated average precision and the precision/recall curve.
+
+    :param scores        -- N detection confidences
+    :param truePositives -- N boolean array, or TxN for T IoU thresholds
+    :param groundTruths  -- number of ground truth objects
+    :param points        -- number of recall points to interpolate (101 as in COCO)
+
+    :return: returns '(ap, precision, recall)'. 'ap' has one value per threshold;
+             'precision' and 'recall' are the raw curves (TxN) in descending score order."""
+
+    scores = np.asarray(scores, dtype=np.float64)
+    tp = np.atleast_2d(np.asarray(truePositives, dtype=bool))
+    order = np.argsort(-scores, kind="stable")
+    tp = tp[:, order]
+
+    tpSum = np.cumsum(tp, axis=1, dtype=np.float64)
+    fpSum = np.cumsum(~tp, axis=1, dtype=np.float64)
+    recall = tpSum / groundTruths if groundTruths > 0 else np.zeros_like(tpSum)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = np.where(tpSum + fpSum > 0, tpSum / (tpSum + fpSum), 0.0)
+
+    if groundTruths == 0 or tp.shape[1] == 0:
+        return np.zeros(tp.shape[0]), precision, recall
+
+    # Precision envelope: maximum precision at any recall >= r
+    envelope = np.flip(np.maximum.accumulate(np.flip(precision, axis=1), axis=1), axis=1)
+    samples = np.linspace(0.0, 1.0, points)
+    ap = np.empty(tp.shape[0])
+    for t in range(tp.shape[0]):
+        idx = np.searchsorted(recall[t], samples, side="left")
+        valid = idx < len(recall[t])
+        ap[t] = envelope[t, idx[valid]].sum() / points
+    return ap, precision, recall
+
+
+def confusionMatrix(actual, predicted, classes):
+    """ Counts (actual, predicted) class pairs.
+
+    :param actual    -- sequence of actual class names
+    :param predicted -- sequence of predicted class names (same length as 'actual')
+    :param classes   -- ordered list of class names; rows and columns of the matrix
+
+    :return: returns a len(classes) x len(classes) int array; rows are actual classes"""
+
+    index = {name: i for i, name in enumerate(classes)}
+    rows = np.fromiter((index[name] for name in actual), dtype=np.int64, count=len(actual))
+    cols = np.fromiter((index[name] for name in predicted), dtype=np.int64, count=len(predicted))
+    matrix = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    np.add.at(matrix, (rows, cols), 1)
+    return matrix
+
+
+def topPrediction(predictions, minConfidence=0.0):
+    """ Gets the class an image is classified as from its 'classified' predictions.
+
+    Predictions are not assumed to be sorted; the most confident one is taken.
+
+    :param predictions   -- list of inference predictions
+    :param minConfidence -- a top prediction below this confidence does not count
+
+    :return: returns the top prediction, or None for the background (no prediction,
+             too low a confidence, or an unlabeled top prediction)"""
+
+    if not predictions:
+        return None
+    top = max(predictions, key=lambda p: p.get("confidence") or 0.0)
+    if (top.get("confidence") or 0.0) < minConfidence or top.get("label") is None:
+        return None
+    return top
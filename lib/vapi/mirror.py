@@ -0,0 +1,402 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Local SQLite mirror of dataset metadata.
+
+Datasets, files, categories, object tags, object labels and file user metadata
+are copied into an indexed SQLite database. Later syncs are incremental: every
+dataset is listed again, but only rows whose content hash changed are
+rewritten. (Labels, tags and user metadata can change without the dataset
+record changing, so datasets are never skipped.) The mirror answers file
+queries written in the same '--query' / '--sort' syntax as 'vision files list'
+without contacting the server.
+
+Example:
+    mirror = Mirror()
+    mirror.sync(server)
+    files = mirror.files(dsid, query="category_name == 'scratch'", sort="original_file_name DESC")
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import time
+import logging as logger
+
+from vapi import paging
+from vapi.inferencecache import cacheRoot
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datasets (
+    id TEXT PRIMARY KEY, name TEXT, hash TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id TEXT PRIMARY KEY, dataset_id TEXT, original_file_name TEXT, category_id TEXT,
+    category_name TEXT, parent_id TEXT, file_type TEXT, hash TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS files_dataset ON files (dataset_id);
+CREATE INDEX IF NOT EXISTS files_name ON files (dataset_id, original_file_name);
+CREATE INDEX IF NOT EXISTS files_category ON files (dataset_id, category_name);
+CREATE TABLE IF NOT EXISTS categories (
+    id TEXT PRIMARY KEY, dataset_id TEXT, name TEXT, hash TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS categories_dataset ON categories (dataset_id);
+CREATE TABLE IF NOT EXISTS tags (
+    id TEXT PRIMARY KEY, dataset_id TEXT, name TEXT, hash TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS tags_dataset ON tags (dataset_id);
+CREATE TABLE IF NOT EXISTS object_labels (
+    id TEXT PRIMARY KEY, dataset_id TEXT, file_id TEXT, tag_id TEXT, name TEXT, hash TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS labels_dataset ON object_labels (dataset_id);
+CREATE INDEX IF NOT EXISTS labels_file ON object_labels (file_id);
+CREATE INDEX IF NOT EXISTS labels_name ON object_labels (dataset_id, name);
+CREATE TABLE IF NOT EXISTS user_metadata (
+    dataset_id TEXT, file_id TEXT, key TEXT, value, PRIMARY KEY (file_id, key));
+CREATE INDEX IF NOT EXISTS metadata_dataset ON user_metadata (dataset_id);
+CREATE INDEX IF NOT EXISTS metadata_key ON user_metadata (dataset_id, key, value);
+CREATE TABLE IF NOT EXISTS sync_state (
+    dataset_id TEXT PRIMARY KEY, hash TEXT, synced_at REAL);
+"""
+
+# Files fields stored in their own (indexed) columns; other fields are read from the JSON
+_FILE_COLUMNS = {
+    "_id": "id",
+    "dataset_id": "dataset_id",
+    "original_file_name": "original_file_name",
+    "category_id": "category_id",
+    "category_name": "category_name",
+    "parent_id": "parent_id",
+    "file_type": "file_type"
+}
+
+_OPERATORS = {"==": "=", "!=": "!=", ">": ">", "<": "<", ">=": ">=", "<=": "<="}
+_QUERY_TERM = re.compile(r"""\s*([A-Za-z0-9_.\-]+)\s*(==|!=|>=|<=|>|<)\s*("(?:[^"\\]|\\.)*"|'[^']*'|[^,]*?)\s*(?:,|$)""")
+_FIELD = re.compile(r"^[A-Za-z0-9_.\-]+$")
+
+
+class QueryError(ValueError):
+    """ Raised for malformed '--query' or '--sort' strings."""
+    pass
+
+
+def defaultMirrorPath():
+    """ Returns the mirror database path under the local cache root."""
+
+    return os.path.join(cacheRoot(), "mirror.db")
+
+
+def parseQuery(query):
+    """ Parses a 'files list --query' string.
+
+    The query is a comma separated list of 'field op value' terms where 'op' is
+    one of '==', '!=', '>', '<', '>=' or '<=' and values are quoted strings or
+    unquoted numbers.
+
+    :return: returns a list of '(field, op, value)' tuples"""
+
+    terms = []
+    pos = 0
+    query = (query or "").strip()
+    while pos < len(query):
+        match = _QUERY_TERM.match(query, pos)
+        if match is None or match.end() == pos:
+            raise QueryError(f"invalid query term at '{query[pos:]}'")
+        field, op, value = match.groups()
+        terms.append((field, op, _value(value)))
+        pos = match.end()
+    return terms
+
+
+def parseSort(sort):
+    """ Parses a '--sort' string ('field[ DESC], ...').
+
+    :return: returns a list of '(field, descending)' tuples"""
+
+    fields = []
+    for part in (sort or "").split(","):
+        words = part.split()
+        if not words:
+            continue
+        if len(words) > 2 or (len(words) == 2 and words[1].upper() not in ("ASC", "DESC")) \
+           or not _FIELD.match(words[0]):
+            raise QueryError(f"invalid sort field '{part.strip()}'")
+        fields.append((words[0], len(words) == 2 and words[1].upper() == "DESC"))
+    return fields
+
+
+class Mirror:
+    """ Local SQLite copy of dataset metadata."""
+
+    def __init__(self, path=None):
+        """
+        :param path -- database file. Defaults to 'defaultMirrorPath()'."""
+
+        self.path = path if path is not None else defaultMirrorPath()
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(_SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---  Sync  ----------------------------------------------------------
+    def sync(self, server, dsids=None, full=False, labels=True, metadata=True, pageSize=1000):
+        """ Brings the mirror up to date with the server.
+
+        :param server   -- vapi server connection
+        :param dsids    -- optional list of dataset ids to sync. Defaults to all datasets.
+        :param full     -- rewrite every row, even if its content hash did not change
+        :param labels   -- include object labels
+        :param metadata -- include file user metadata
+        :param pageSize -- number of items requested per page
+
+        :return: returns a dict of per dataset change counts keyed by dataset id.
+                 Raises paging.PagingError if the server cannot be read."""
+
+        datasets = server.datasets.report()
+        if datasets is None:
+            raise paging.PagingError("failed to get the list of datasets")
+        if dsids is not None:
+            wanted = set(dsids)
+            datasets = [ds for ds in datasets if ds["_id"] in wanted]
+            missing = wanted - {ds["_id"] for ds in datasets}
+            if missing:
+                logger.warning(f"datasets not found on the server: {', '.join(sorted(missing))}")
+        else:
+            # Datasets deleted on the server are removed from the mirror
+            current = {ds["_id"] for ds in datasets}
+            for row in self.db.execute("SELECT id FROM datasets").fetchall():
+                if row["id"] not in current:
+                    self.remove(row["id"])
+
+        results = {}
+        for ds in datasets:
+            results[ds["_id"]] = self._syncDataset(server, ds, full, labels, metadata, pageSize)
+        return results
+
+    def remove(self, dsid):
+        """ Removes a dataset and everything in it from the mirror."""
+
+        with self.db:
+            for table in ("files", "categories", "tags", "object_labels", "user_metadata"):
+                self.db.execute(f"DELETE FROM {table} WHERE dataset_id = ?", (dsid,))
+            self.db.execute("DELETE FROM datasets WHERE id = ?", (dsid,))
+            self.db.execute("DELETE FROM sync_state WHERE dataset_id = ?", (dsid,))
+
+    def _syncDataset(self, server, ds, full, labels, metadata, pageSize):
+        dsid = ds["_id"]
+        dsHash = _hash(ds)
+        start = time.time()
+        counts = {}
+        with self.db:
+            self._upsert("datasets", [(dsid, ds.get("name"), dsHash, _json(ds))], ("id", "name", "hash", "data"))
+            counts["files"] = self._syncTable(
+                "files", dsid, paging.iterate(server.files.report, dsid, pageSize=pageSize, prefetch=1),
+                ("id", "dataset_id", "original_file_name", "category_id", "category_name", "parent_id",
+                 "file_type", "hash", "data"),
+                lambda f, h: (f["_id"], dsid, f.get("original_file_name"), f.get("category_id"),
+                              f.get("category_name"), f.get("parent_id"), f.get("file_type"), h, _json(f)), full=full)
+            counts["categories"] = self._syncTable(
+                "categories", dsid, _checked(server.categories.report(dsid), "categories"),
+                ("id", "dataset_id", "name", "hash", "data"),
+                lambda c, h: (c["_id"], dsid, c.get("name"), h, _json(c)), full=full)
+            counts["tags"] = self._syncTable(
+                "tags", dsid, _checked(server.object_tags.report(dsid), "tags"),
+                ("id", "dataset_id", "name", "hash", "data"),
+                lambda t, h: (t["_id"], dsid, t.get("name"), h, _json(t)), full=full)
+            if labels:
+                counts["object_labels"] = self._syncTable(
+                    "object_labels", dsid,
+                    paging.iterate(server.object_labels.report, dsid, None, pageSize=pageSize, prefetch=1),
+                    ("id", "dataset_id", "file_id", "tag_id", "name", "hash", "data"),
+                    lambda l, h: (l["_id"], dsid, l.get("file_id"), l.get("tag_id"), l.get("name"), h, _json(l)), full=full)
+            if metadata:
+                counts["user_metadata"] = self._syncMetadata(server, dsid)
+            self._upsert("sync_state", [(dsid, dsHash, time.time())], ("dataset_id", "hash", "synced_at"))
+        logger.info(f"synced dataset {dsid} in {time.time() - start:.1f}s; {counts}")
+        return counts
+
+    def _syncTable(self, table, dsid, records, columns, toRow, full=False, batchSize=500):
+        """ Upserts changed records (all records if 'full') and deletes rows no longer on the server.
+
+        :return: returns '{"changed": n, "deleted": n, "total": n}'"""
+
+        known = dict(self.db.execute(f"SELECT id, hash FROM {table} WHERE dataset_id = ?", (dsid,)).fetchall())
+        seen = set()
+        batch = []
+        changed = 0
+        for record in records:
+            h = _hash(record)
+            seen.add(record["_id"])
+            if not full and known.get(record["_id"]) == h:
+                continue
+            batch.append(toRow(record, h))
+            if len(batch) >= batchSize:
+                self._upsert(table, batch, columns)
+                changed += len(batch)
+                batch = []
+        self._upsert(table, batch, columns)
+        changed += len(batch)
+
+        gone = [(key,) for key in known if key not in seen]
+        self.db.executemany(f"DELETE FROM {table} WHERE id = ?", gone)
+        return {"changed": changed, "deleted": len(gone), "total": len(seen)}
+
+    def _syncMetadata(self, server, dsid):
+        text = server.file_metadata.export(dsid, fmt="pipe")
+        if not server.rsp_ok():
+            raise paging.PagingError(f"failed to export user metadata of dataset {dsid}")
+        rows = [(dsid, fileId, key, value) for fileId, key, value in metadataRows(text, delimiter="|")]
+        self.db.execute("DELETE FROM user_metadata WHERE dataset_id = ?", (dsid,))
+        self.db.executemany("INSERT OR REPLACE INTO user_metadata (dataset_id, file_id, key, value) "
+                            "VALUES (?, ?, ?, ?)", rows)
+        return {"total": len(rows)}
+
+    def _upsert(self, table, rows, columns):
+        marks = ", ".join("?" * len(columns))
+        self.db.executemany(f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({marks})", rows)
+
+    # ---  Queries  -------------------------------------------------------
+    def files(self, dsid=None, query=None, sort=None, limit=None, skip=None, categoryId=None, parentId=None):
+        """ Gets mirrored files matching the same criteria as 'vision files list'.
+
+        Query fields are file fields or user metadata keys. Raises QueryError
+        for malformed query or sort strings.
+
+        :return: returns a list of file dicts as returned by 'Files.report'"""
+
+        where = []
+        args = []
+        if dsid is not None:
+            where.append("f.dataset_id = ?")
+            args.append(dsid)
+        if categoryId is not None:
+            where.append("f.category_id = ?")
+            args.append(categoryId)
+        if parentId is not None:
+            where.append("f.parent_id = ?")
+            args.append(parentId)
+        for field, op, value in parseQuery(query):
+            expr, exprArgs = _fieldExpression(field)
+            where.append(f"{expr} {_OPERATORS[op]} ?")
+            args.extend(exprArgs + [value])
+
+        sql = "SELECT f.data FROM files f"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        order = []
+        for field, descending in parseSort(sort):
+            expr, exprArgs = _fieldExpression(field)
+            order.append(expr + (" DESC" if descending else ""))
+            args.extend(exprArgs)
+        if order:
+            sql += " ORDER BY " + ", ".join(order)
+        if limit is not None or skip is not None:
+            sql += " LIMIT ? OFFSET ?"
+            args.extend([int(limit) if limit is not None else -1, int(skip or 0)])
+
+        return [json.loads(row["data"]) for row in self.db.execute(sql, args)]
+
+    def status(self):
+        """ Gets the mirrored datasets with their item counts and last sync time."""
+
+        rows = self.db.execute("""
+            SELECT d.id, d.name, s.synced_at,
+                   (SELECT COUNT(*) FROM files f WHERE f.dataset_id = d.id) AS files,
+                   (SELECT COUNT(*) FROM object_labels l WHERE l.dataset_id = d.id) AS object_labels,
+                   (SELECT COUNT(*) FROM user_metadata m WHERE m.dataset_id = d.id) AS user_metadata
+            FROM datasets d LEFT JOIN sync_state s ON s.dataset_id = d.id ORDER BY d.name""")
+        return [dict(row) for row in rows]
+
+
+def metadataRows(text, delimiter=","):
+    """ Parses a user metadata export into '(file_id, key, value)' tuples.
+
+    The first row holds the column names. The file id column is the one named
+    '_id', 'file_id' or 'id' (the first column otherwise); every other non-empty
+    column is a metadata key. Numeric values are converted to numbers."""
+
+    reader = csv.reader(io.StringIO(text or ""), delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        return
+    header = [h.strip() for h in header]
+    idColumn = next((i for i, h in enumerate(header) if h.lower() in ("_id", "file_id", "id")), 0)
+    keys = [(i, h) for i, h in enumerate(header) if i != idColumn and h]
+    for row in reader:
+        if len(row) <= idColumn:
+            continue
+        for i, key in keys:
+            if i < len(row) and row[i] != "":
+                yield row[idColumn], key, _number(row[i])
+
+
+def _fieldExpression(field):
+    """ SQL expression for a file field or, failing that, a user metadata key."""
+
+    if not _FIELD.match(field):
+        raise QueryError(f"invalid field name '{field}'")
+    column = _FILE_COLUMNS.get(field)
+    if column is not None:
+        return f"f.{column}", []
+    return ("COALESCE(json_extract(f.data, ?), "
+            "(SELECT m.value FROM user_metadata m WHERE m.file_id = f.id AND m.key = ?))",
+            [f'$."{field}"', field])
+
+
+def _value(text):
+    """ Converts a query value; quoted values are strings, others numbers if possible."""
+
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]
+    return _number(text)
+
+
+def _number(text):
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+def _checked(items, what):
+    if items is None:
+        raise paging.PagingError(f"failed to get {what}")
+    return items
+
+
+def _hash(record):
+    return hashlib.sha1(_json(record).encode("utf-8")).hexdigest()
+
+
+def _json(record):
+    return json.dumps(record, sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,198 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Streaming 'multipart/form-data' request bodies.
+
+'requests' builds a whole multipart body in memory when 'files=' is used. The
+MultipartEncoder here is a file-like body that reads each file in chunks as
+the request is sent, so memory use stays at about one chunk however large the
+upload. Its length is known up front, so a Content-Length is sent as usual.
+"""
+
+import hashlib
+import io
+import mimetypes
+import os
+import uuid
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class MultipartEncoder:
+    """ File-like multipart body streamed from fields and files.
+
+    Use as a context manager (or call 'close()') so files opened by path are closed.
+    """
+
+    def __init__(self, fields=None, files=None, progress=None, chunkSize=CHUNK_SIZE, hashAlgorithm=None):
+        """
+        :param fields    -- optional dict or list of '(name, value)' form fields
+        :param files     -- dict or list of '(name, file)' parts. 'file' is a path, an
+                            open binary file, or a '(filename, content)' tuple where
+                            'content' is bytes, a path or an open binary file. An
+                            optional third tuple item is the content type.
+        :param progress  -- optional function called with '(bytesSent, totalBytes)'
+                            after each chunk
+        :param chunkSize -- bytes read from a file at a time
+        :param hashAlgorithm -- optional 'hashlib' algorithm name. If given, the digest
+                            of every file part is computed as it is sent and is
+                            available in 'digests' (keyed by file name) afterwards."""
+
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress = progress
+        self.chunkSize = chunkSize
+        self.hashAlgorithm = hashAlgorithm
+        self.digests = {}
+        self._opened = []
+        self._parts = []
+        for name, value in _items(fields):
+            self._parts.append(self._header(name) + str(value).encode("utf-8") + b"\r\n")
+        try:
+            for name, value in _items(files):
+                self._addFile(name, value)
+        except Exception:
+            self.close()
+            raise
+        self._parts.append(f"--{self.boundary}--\r\n".encode("ascii"))
+
+        self.len = sum(len(p) if isinstance(p, bytes) else p[1] for p in self._parts)
+        self.sent = 0
+        self._index = 0
+        self._pending = memoryview(b"")
+
+    def __len__(self):
+        return self.len
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ Closes the files opened by this encoder."""
+
+        for handle in self._opened:
+            handle.close()
+        self._opened = []
+
+    def read(self, size=-1):
+        """ Reads up to 'size' bytes of the body (all remaining bytes if 'size' < 0)."""
+
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(self.chunkSize), b""))
+        out = bytearray()
+        while len(out) < size:
+            if not self._pending:
+                if not self._next():
+                    break
+                continue
+            take = self._pending[:size - len(out)]
+            out += take
+            self._pending = self._pending[len(take):]
+        if out:
+            self.sent += len(out)
+            if self.progress is not None:
+                self.progress(self.sent, self.len)
+        return bytes(out)
+
+    def _next(self):
+        """ Loads the next chunk of the body into '_pending'; returns False at the end."""
+
+        while self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                self._index += 1
+                self._pending = memoryview(part)
+                return True
+            handle, size, remaining, filename, digest = part
+            if remaining > 0:
+                data = handle.read(min(self.chunkSize, remaining))
+                if not data:
+                    raise IOError(f"file '{getattr(handle, 'name', '?')}' shrank while being uploaded")
+                if digest is not None:
+                    digest.update(data)
+                self._parts[self._index] = (handle, size, remaining - len(data), filename, digest)
+                self._pending = memoryview(data)
+                return True
+            if digest is not None:
+                self.digests[filename] = digest.hexdigest()
+            self._index += 1
+            self._pending = memoryview(b"\r\n")
+            return True
+        return False
+
+    def _header(self, name, filename=None, contentType=None):
+        disposition = f'form-data; name="{_quote(name)}"'
+        if filename is not None:
+            disposition += f'; filename="{_quote(filename)}"'
+        header = f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        if contentType is not None:
+            header += f"Content-Type: {contentType}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    def _addFile(self, name, value):
+        contentType = None
+        if isinstance(value, tuple):
+            filename, content = value[0], value[1]
+            if len(value) > 2:
+                contentType = value[2]
+        else:
+            content = value
+            filename = os.path.basename(value if isinstance(value, str) else getattr(value, "name", name))
+        if contentType is None:
+            contentType = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+        self._parts.append(self._header(name, filename, contentType))
+        if isinstance(content, (bytes, bytearray)):
+            if self.hashAlgorithm is not None:
+                self.digests[filename] = hashlib.new(self.hashAlgorithm, content).hexdigest()
+            self._parts.append(bytes(content) + b"\r\n")
+            return
+        if isinstance(content, str):
+            content = open(content, "rb")
+            self._opened.append(content)
+        start = content.tell()
+        size = os.fstat(content.fileno()).st_size - start if _hasFileno(content) else \
+            content.seek(0, io.SEEK_END) - start
+        content.seek(start)
+        # Files are read lazily; the trailing CRLF is added after the last chunk
+        digest = hashlib.new(self.hashAlgorithm) if self.hashAlgorithm is not None else None
+        self._parts.append((content, size + 2, size, filename, digest))
+
+
+def _items(values):
+    if values is None:
+        return []
+    return values.items() if isinstance(values, dict) else values
+
+
+def _quote(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\r", " ").replace("\n", " ")
+
+
+def _hasFileno(handle):
+    try:
+        handle.fileno()
+        return True
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
@@ -0,0 +1,101 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Paged retrieval of long resource lists.
+
+List APIs accept 'limit' and 'skip' query parameters. 'iterate' walks a list
+page by page so large datasets are never requested in a single response.
+Pages can be prefetched by a background thread while the caller processes the
+current page.
+"""
+
+import queue
+import threading
+import logging as logger
+
+from vapi.concurrency import putUnlessStopped
+
+
+class PagingError(Exception):
+    """ Raised when a page cannot be retrieved."""
+    pass
+
+
+def iterate(report, *args, pageSize=1000, prefetch=0, **kwargs):
+    """ Generator yielding every item of a paged list.
+
+    :param report   -- bound report method (e.g. 'server.files.report')
+    :param args     -- positional arguments for 'report' (e.g. the dataset id)
+    :param pageSize -- number of items requested per call
+    :param prefetch -- number of pages fetched ahead by a background thread.
+                       0 fetches each page when the previous one is consumed.
+    :param kwargs   -- additional query parameters for 'report'
+
+    Raises PagingError if a page cannot be retrieved."""
+
+    pages = _pages(report, args, pageSize, kwargs)
+    if prefetch > 0:
+        pages = _prefetched(pages, prefetch)
+    for page in pages:
+        yield from page
+
+
+def _pages(report, args, pageSize, kwargs):
+    skip = 0
+    while True:
+        page = report(*args, limit=pageSize, skip=skip, **kwargs)
+        if page is None:
+            raise PagingError(f"failed to retrieve items {skip} to {skip + pageSize}")
+        logger.debug(f"page at {skip} returned {len(page)} items")
+        yield page
+        if len(page) < pageSize:
+            return
+        skip += len(page)
+
+
+def _prefetched(pages, depth):
+    """ Runs the 'pages' generator in a thread, keeping at most 'depth' pages ahead."""
+
+    ready = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def fetch():
+        try:
+            for page in pages:
+                if not putUnlessStopped(ready, page, stop):
+                    return
+            putUnlessStopped(ready, done, stop)
+        except Exception as e:
+            putUnlessStopped(ready, e, stop)
+
+    thread = threading.Thread(target=fetch, daemon=True)
+    thread.start()
+    try:
+        while True:
+            page = ready.get()
+            if page is done:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,332 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Annotation rendering for inference results.
+
+Draws bounding boxes, segmentation polygons, alpha blended segmentation
+masks and classification heatmaps onto the images that were inferred. Batches of results can be rendered
+in a process pool. Results can come directly from 'DeployedModels.infer' or
+from a JSONL results file written by 'writeResult' (one
+'{"file": <path>, "result": <inference json>}' object per line).
+"""
+
+import json
+import os
+import logging as logger
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2 as cv
+import numpy as np
+
+from vapi import rle as rlecodec
+from vapi import heatmaps
+
+
+class MarkStyle:
+    """ Describes how annotation marks are drawn. Values are clamped to their
+    supported ranges and the color name is resolved once at construction."""
+
+    # Color definitions for annotation marks (BGR as used by OpenCV)
+    colors = {
+        "red": (0, 0, 255),
+        "green": (0, 255, 0),
+        "blue": (255, 0, 0),
+        "magenta": (255, 0, 255),
+        "yellow": (0, 255, 255),
+        "cyan": (255, 255, 0),
+        "brightgreen": (0, 255, 127),
+        "gold": (0, 215, 255),
+        "white": (255, 255, 255),
+        "black": (0, 0, 0)
+    }
+
+    def __init__(self, width=4, fontscale=2.0, color="red", alpha=0.4, labels=True, colormap="jet"):
+        """
+        :param width  -- width of box and polygon marks in pixels (1 to 8)
+        :param fontscale -- scale of the label text (0.5 to 4.0)
+        :param color  -- name of the mark color. Unknown names fall back to red.
+        :param alpha  -- opacity of segmentation masks and heatmaps (0.0 to 1.0)
+        :param labels -- draw the label name and confidence with each box
+        :param colormap -- OpenCV colormap name used for classification heatmaps"""
+
+        self.width = min(max(int(width), 1), 8)
+        self.fontscale = min(max(float(fontscale), 0.5), 4.0)
+        self.color = self.colors.get(str(color).lower(), self.colors["red"])
+        self.alpha = min(max(float(alpha), 0.0), 1.0)
+        self.labels = labels
+        self.colormap = colormap
+        # Fail early on a bad colormap name rather than in a worker process
+        heatmaps.colormapLut(colormap)
+        # Fixed point alpha so mask blending can stay in integer math
+        self.alpha8 = int(round(self.alpha * 256))
+
+
+def readResults(filename):
+    """ Generator yielding '(file_path, inference_result)' tuples from a JSONL results file.
+
+    :param filename -- path of the JSONL file. Blank lines are ignored."""
+
+    with open(filename) as handle:
+        for lineno, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                yield entry["file"], entry["result"]
+            except (json.JSONDecodeError, KeyError) as e:
+                logger.warning(f"skipping invalid results entry at {filename}:{lineno}; {e}")
+
+
+def writeResult(handle, filepath, result):
+    """ Appends one inference result to an open JSONL results file.
+
+    :param handle   -- file object opened for writing
+    :param filepath -- path to the file that was inferred
+    :param result   -- inference json returned by the server"""
+
+    handle.write(json.dumps({"file": filepath, "result": result}, separators=(",", ":")))
+    handle.write("\n")
+
+
+def hasAnnotations(result):
+    """ Returns True if the inference result contains anything that can be drawn."""
+
+    if not result:
+        return False
+    if result.get("heatmap"):
+        return True
+    detections = result.get("classified", [])
+    return isinstance(detections, list) and len(detections) > 0 and "xmin" in detections[0]
+
+
+def drawDetections(image, detections, style):
+    """ Draws all detections onto 'image' in place.
+
+    Masks are composited in a single vectorized blend, polygons are drawn with
+    one 'polylines' call, and boxes and labels are drawn last so they stay on top.
+
+    :param image  -- BGR image (numpy array) to draw on
+    :param detections -- list of detections from the 'classified' field of an inference result
+    :param style  -- MarkStyle describing the marks"""
+
+    height, width = image.shape[:2]
+    coverage = None
+    polygons = []
+
+    for detection in detections:
+        if detection.get("rle") and style.alpha8 > 0:
+            mask = rlecodec.detectionMask(detection, (height, width))
+            if mask is not None:
+                coverage = mask if coverage is None else (coverage | mask)
+        polygons.extend(rlecodec.pointArrays(detection.get("polygons")))
+
+    if coverage is not None and coverage.any():
+        pixels = image[coverage].astype(np.uint16)
+        color = np.array(style.color, dtype=np.uint16)
+        image[coverage] = ((pixels * (256 - style.alpha8) + color * style.alpha8) >> 8).astype(np.uint8)
+
+    if polygons:
+        cv.polylines(image, polygons, True, style.color, style.width)
+
+    for detection in detections:
+        drawBoundingBox(image, style, detection.get("label"), detection.get("confidence"),
+                        detection["xmin"], detection["ymin"], detection["xmax"], detection["ymax"])
+    return image
+
+
+def drawBoundingBox(image, style, name, confidence, xmin, ymin, xmax, ymax):
+    """ Draws one bounding box, with its label if the style asks for labels."""
+
+    xmin, ymin, xmax, ymax = int(xmin), int(ymin), int(xmax), int(ymax)
+    cv.rectangle(image, (xmin, ymin), (xmax, ymax), style.color, style.width)
+
+    if style.labels and name is not None:
+        if confidence is not None:
+            label = "{}: {:.2f}%".format(name, confidence * 100)
+        else:
+            label = "{}".format(name)
+        y = ymin - 15 if ymin - 15 > 15 else ymin + 15
+        cv.putText(image, label, (xmin, y), cv.FONT_HERSHEY_SIMPLEX, style.fontscale, style.color, style.width)
+
+
+def drawHeatmap(image, result, style):
+    """ Blends the classification heatmap of 'result' over 'image' and labels it with
+    the top classification. 'image' is not modified.
+
+    :return: returns the annotated image, or a copy of 'image' if the heatmap cannot be
+             decoded. The annotated image is a reused buffer that is only valid until
+             the next call."""
+
+    heat = heatmaps.decode(result.get("heatmap"))
+    if heat is None:
+        return image.copy()
+
+    key = (style.colormap, style.alpha)
+    overlay = _overlays.get(key)
+    if overlay is None:
+        overlay = heatmaps.HeatmapOverlay(style.colormap, style.alpha)
+        _overlays[key] = overlay
+    annotated = overlay.overlay(image, heat)
+
+    classified = result.get("classified")
+    if style.labels and isinstance(classified, list) and len(classified) > 0:
+        top = classified[0]
+        label = "{}: {:.2f}%".format(top.get("label", top.get("name", "")), top.get("confidence", 0) * 100)
+        cv.putText(annotated, label, (10, 15 + int(20 * style.fontscale)), cv.FONT_HERSHEY_SIMPLEX,
+                   style.fontscale, style.color, style.width)
+    return annotated
+
+
+def renderFile(filepath, result, outputFile, style, image=None):
+    """ Annotates one image with one inference result and saves it.
+
+    :param filepath   -- path to the original image
+    :param result     -- inference json for the image
+    :param outputFile -- path where the annotated image is written
+    :param style      -- MarkStyle describing the marks
+    :param image      -- optional already decoded image. It is not modified.
+
+    :return: returns 'outputFile' if an image was written; otherwise None"""
+
+    if not hasAnnotations(result):
+        return None
+    if image is None:
+        image = cv.imread(filepath)
+        if image is None:
+            logger.warning(f"could not read image '{filepath}'")
+            return None
+
+    if result.get("heatmap"):
+        annotated = drawHeatmap(image, result, style)
+    else:
+        annotated = drawDetections(image.copy(), result["classified"], style)
+    if not cv.imwrite(outputFile, annotated):
+        logger.warning(f"could not write annotated image '{outputFile}'")
+        return None
+    return outputFile
+
+
+class _ImageCache:
+    """ Small LRU cache of decoded images so that several results for the same
+    file only decode the file once."""
+
+    def __init__(self, size=8):
+        self.size = size
+        self.images = OrderedDict()
+
+    def get(self, filepath):
+        image = self.images.get(filepath)
+        if image is not None:
+            self.images.move_to_end(filepath)
+            return image
+        image = cv.imread(filepath)
+        if image is not None:
+            self.images[filepath] = image
+            if len(self.images) > self.size:
+                self.images.popitem(last=False)
+        return image
+
+
+# Per-process rendering state. Set up once per worker by '_initWorker'
+_workerStyle = None
+_workerCache = None
+_overlays = {}
+
+
+def _initWorker(style):
+    global _workerStyle
+    global _workerCache
+    _workerStyle = style
+    _workerCache = _ImageCache()
+
+
+def _renderJobs(jobs):
+    """ Renders a chunk of '(filepath, result, outputFile)' jobs in the current process."""
+
+    written = []
+    for filepath, result, outputFile in jobs:
+        if not hasAnnotations(result):
+            continue
+        image = _workerCache.get(filepath)
+        if image is None:
+            logger.warning(f"could not read image '{filepath}'")
+            continue
+        if renderFile(filepath, result, outputFile, _workerStyle, image=image) is not None:
+            written.append(outputFile)
+    return written
+
+
+def renderBatch(results, outputDir, style, workers=None, chunksize=16):
+    """ Annotates a batch of inference results, using a process pool.
+
+    Results for the same file are kept in the same chunk so a worker decodes
+    each image only once.
+
+    :param results   -- iterable of '(filepath, result)' tuples (see 'readResults')
+    :param outputDir -- directory into which annotated images are written. It is
+                        created if necessary. Output files are named after the
+                        original file; repeated files get a numeric suffix.
+    :param style     -- MarkStyle describing the marks
+    :param workers   -- number of worker processes. Defaults to the number of CPUs.
+                        1 renders in the calling process.
+    :param chunksize -- number of images handed to a worker at a time
+
+    :return: returns the list of annotated files written"""
+
+    os.makedirs(outputDir, exist_ok=True)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Group by file (preserving order) and assign unique output names
+    grouped = OrderedDict()
+    for filepath, result in results:
+        grouped.setdefault(filepath, []).append(result)
+
+    chunks = []
+    chunk = []
+    used = set()
+    for filepath, fileResults in grouped.items():
+        base, ext = os.path.splitext(os.path.basename(filepath))
+        for result in fileResults:
+            name = base + ext
+            cnt = 1
+            while name in used:
+                name = f"{base}_{cnt}{ext}"
+                cnt += 1
+            used.add(name)
+            chunk.append((filepath, result, os.path.join(outputDir, name)))
+        if len(chunk) >= chunksize:
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+
+    logger.debug(f"rendering {len(used)} results in {len(chunks)} chunks with {workers} workers")
+    written = []
+    if workers <= 1 or len(chunks) <= 1:
+        _initWorker(style)
+        for chunk in chunks:
+            written.extend(_renderJobs(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(style,)) as pool:
+            for files in pool.map(_renderJobs, chunks):
+                written.extend(files)
+    return written
@@ -0,0 +1,204 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Server to server replication of datasets and trained models.
+
+The source's export response is piped into a streaming multipart import on the
+target, so nothing is written to local disk. A reader thread fills a bounded
+queue of chunks from the export while the upload drains it; memory use is at
+most 'bufferChunks' chunks however large the export. The copy is verified on
+both ends: the bytes received must match the source's Content-Length, the
+SHA-256 of what was sent is reported, and the imported record on the target is
+compared with the source record.
+
+Example:
+    source = Base(base_uri="https://dev/api")
+    target = Base(base_uri="https://prod/api")
+    result = replicate(source, target, "dataset", dsid)
+"""
+
+import hashlib
+import queue
+import re
+import threading
+import time
+import uuid
+import logging as logger
+
+from vapi.multipart import _quote
+
+CHUNK_SIZE = 1024 * 1024
+
+_KINDS = {
+    "dataset": {"export": "/datasets/{id}/export", "import": "/datasets/import", "idKey": "dataset_id",
+                "resource": "datasets", "compare": ("name", "total_file_count")},
+    "model": {"export": "/trained-models/{id}/export", "import": "/trained-models/import",
+              "idKey": "trained_model_id", "resource": "trained_models", "compare": ("name", "usage", "nn_arch")}
+}
+
+_END = object()
+
+
+class ReplicationError(Exception):
+    """ Raised when an artifact could not be copied or the copy did not verify."""
+
+
+class _PipeBody:
+    """ File-like multipart body whose file part is read from a bounded queue.
+
+    'requests' sends a Content-Length when the body has a 'len'; otherwise
+    'iterator()' is used and the body is sent with chunked transfer encoding."""
+
+    def __init__(self, chunks, filename, size=None, progress=None):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.head = (f'--{boundary}\r\nContent-Disposition: form-data; name="files"; '
+                     f'filename="{_quote(filename)}"\r\nContent-Type: application/zip\r\n\r\n').encode("utf-8")
+        self.tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        self.size = size
+        if size is not None:
+            self.len = len(self.head) + size + len(self.tail)
+        self.chunks = chunks
+        self.progress = progress
+        self.sent = 0
+        self.digest = hashlib.sha256()
+        self._pieces = self.iterator()
+        self._pending = memoryview(b"")
+
+    def iterator(self):
+        yield self.head
+        while True:
+            chunk = self.chunks.get()
+            if chunk is _END:
+                break
+            if isinstance(chunk, BaseException):
+                raise ReplicationError(f"export stream failed; {chunk}") from chunk
+            self.digest.update(chunk)
+            self.sent += len(chunk)
+            if self.progress is not None:
+                self.progress(self.sent, self.size)
+            yield chunk
+        if self.size is not None and self.sent != self.size:
+            raise ReplicationError(f"export ended after {self.sent} of {self.size} bytes")
+        yield self.tail
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b"".join(self._pieces)
+        while not self._pending:
+            piece = next(self._pieces, None)
+            if piece is None:
+                return b""
+            self._pending = memoryview(piece)
+        out = bytes(self._pending[:size])
+        self._pending = self._pending[len(out):]
+        return out
+
+
+def replicate(source, target, kind, id, progress=None, bufferChunks=8, chunkSize=CHUNK_SIZE, raw=False):
+    """ Copies a dataset or trained model from one server to another.
+
+    :param source       -- vapi server connection to copy from
+    :param target       -- vapi server connection to copy to
+    :param kind         -- "dataset" or "model"
+    :param id           -- UUID of the dataset or model on the source
+    :param progress     -- optional function called with '(bytesCopied, totalBytes)';
+                           'totalBytes' is None if the source does not send a length
+    :param bufferChunks -- maximum number of chunks held between the download and upload
+    :param chunkSize    -- bytes per chunk
+    :param raw          -- include raw metadata in a dataset export
+
+    :return: returns a dict with 'source_id', 'target_id', 'bytes', 'sha256',
+             'seconds' and 'mismatches' (record fields that differ on the target).
+             Raises ReplicationError if the copy fails."""
+
+    info = _KINDS[kind]
+    record = getattr(source, info["resource"]).show(id)
+    if record is None:
+        raise ReplicationError(f"cannot get {kind} '{id}' from the source; {_failure(source.server)}")
+
+    start = time.time()
+    http = source.server
+    http.get(info["export"].format(id=id), params={"raw": raw} if kind == "dataset" else None, stream=True)
+    exportRsp = http.raw_rsp()
+    if exportRsp is None or not exportRsp.ok:
+        raise ReplicationError(f"export of {kind} '{id}' failed; {_failure(http)}")
+
+    # A length is only meaningful if the bytes are passed on exactly as received
+    size = exportRsp.headers.get("Content-Length")
+    size = int(size) if size is not None and "Content-Encoding" not in exportRsp.headers else None
+    match = re.search(r'filename="?([^";]+)"?', exportRsp.headers.get("Content-Disposition", ""))
+    filename = match.group(1) if match else f"{id}.zip"
+
+    chunks = queue.Queue(maxsize=bufferChunks)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def pump():
+        try:
+            for block in exportRsp.iter_content(chunkSize):
+                if not put(block):
+                    return
+            put(_END)
+        except Exception as e:
+            logger.debug(f"replicate: export stream of {kind} '{id}' failed; {e}")
+            put(e)
+        finally:
+            exportRsp.close()
+
+    reader = threading.Thread(target=pump, name="replicate-export", daemon=True)
+    reader.start()
+    body = _PipeBody(chunks, filename, size, progress)
+    try:
+        headers = {"Content-Type": body.content_type}
+        data = body if size is not None else body.iterator()
+        rsp = target.server.post(info["import"], headers=headers, data=data)
+    finally:
+        # The reader notices 'stop' once its current read returns
+        stop.set()
+    if rsp is None:
+        raise ReplicationError(f"import of {kind} '{id}' failed; {_failure(target.server)}")
+    if body.sent == 0 or (size is not None and body.sent != size):
+        raise ReplicationError(f"import of {kind} '{id}' ended after {body.sent} bytes")
+
+    result = {"kind": kind, "source_id": id, "target_id": rsp.get(info["idKey"]) if isinstance(rsp, dict) else None,
+              "bytes": body.sent, "sha256": body.digest.hexdigest(), "seconds": round(time.time() - start, 1),
+              "mismatches": []}
+    if result["target_id"] is not None:
+        copy = getattr(target, info["resource"]).show(result["target_id"])
+        if copy is None:
+            raise ReplicationError(f"imported {kind} '{result['target_id']}' not found on the target")
+        result["mismatches"] = [{"field": field, "source": record[field], "target": copy.get(field)}
+                                for field in info["compare"] if field in record and copy.get(field) != record[field]]
+    else:
+        logger.info(f"replicate: target did not return the id of the imported {kind}; record not verified")
+    return result
+
+
+def _failure(http):
+    return http.last_failure or f"status={http.status_code()}; {http.json()}"
@@ -0,0 +1,359 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Resumable uploads of large files.
+
+When the server accepts resumable uploads (the tus 1.0 protocol, detected
+with an OPTIONS request), a file is sent in chunks with a checksum per chunk.
+After a network failure the upload continues from the offset the server
+acknowledged, even from a new process: upload URLs are remembered under
+'cacheRoot()/uploads'.
+
+Otherwise the file is sent as one streamed multipart request, retried with
+backoff if it fails. In both modes the SHA-256 digest of the data sent is
+compared with the digest of the file, so a file changed during the upload is
+reported rather than silently imported.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import time
+import logging as logger
+
+from vapi.inferencecache import cacheRoot
+
+TUS_VERSION = "1.0.0"
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class UploadError(Exception):
+    """ Raised when a resumable upload cannot be completed."""
+
+
+def fileDigest(path, algorithm="sha256", chunkSize=CHUNK_SIZE):
+    """ Returns the hex digest of a file, read in chunks."""
+
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunkSize), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResumableUpload:
+    """ Uploads one file to 'uri', resuming where possible."""
+
+    def __init__(self, server, uri, field="files", chunkSize=CHUNK_SIZE, retries=5, progress=None,
+                 stateDir=None):
+        """
+        :param server    -- vapi server connection
+        :param uri       -- upload URI (e.g. '/datasets/import')
+        :param field     -- multipart field name used by the whole-file fallback
+        :param chunkSize -- bytes per chunk in resumable mode
+        :param retries   -- attempts after a failure before giving up. In resumable
+                            mode they are per chunk; in fallback mode per file.
+        :param progress  -- optional function called with '(bytesSent, totalBytes)'
+        :param stateDir  -- directory remembering unfinished uploads. Defaults to
+                            'cacheRoot()/uploads'."""
+
+        self.server = server
+        self.uri = uri
+        self.field = field
+        self.chunkSize = chunkSize
+        self.retries = retries
+        self.progress = progress
+        self.stateDir = stateDir if stateDir is not None else os.path.join(cacheRoot(), "uploads")
+        self.mode = None
+
+    def run(self, path):
+        """ Uploads 'path'.
+
+        :return: returns the json of the final response (as 'server.post' would)
+        :raises: UploadError if the upload failed after all retries or the file
+                 changed during the upload"""
+
+        digest = fileDigest(path)
+        extensions = self._tusExtensions()
+        if extensions is not None and "creation" in extensions:
+            self.mode = "resumable"
+            return self._tusUpload(path, digest, "checksum" in extensions)
+        self.mode = "whole-file"
+        return self._wholeFile(path, digest)
+
+    # ---  Fallback: whole file with retries  ---------------------------
+    def _wholeFile(self, path, digest):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                delay = min(60, 2 ** attempt)
+                logger.info(f"upload of '{path}' failed ({self._failure()}); retry {attempt} in {delay}s")
+                time.sleep(delay)
+            from vapi.multipart import MultipartEncoder
+            with MultipartEncoder(files={self.field: path}, progress=self.progress,
+                                  hashAlgorithm="sha256") as body:
+                rsp = self.server.post(self.uri, headers={"Content-Type": body.content_type}, data=body)
+                sent = body.digests.get(os.path.basename(path))
+            if sent is not None and sent != digest:
+                raise UploadError(f"'{path}' changed during the upload (sha256 {sent} != {digest})")
+            if self.server.rsp_ok():
+                return rsp
+            status = self.server.status_code()
+            if status is not None and 400 <= status < 500 and status not in (408, 429):
+                # The server rejected the file; sending it again will not help
+                break
+        raise UploadError(f"upload of '{path}' failed; {self._failure()}")
+
+    # ---  tus resumable protocol  ---------------------------------------
+    def _tusExtensions(self):
+        """ Returns the tus extensions the server supports, or None if it does not speak tus."""
+
+        self.server.request("OPTIONS", self.uri, headers={"Tus-Resumable": TUS_VERSION})
+        rsp = self.server.raw_rsp()
+        if rsp is None or not rsp.ok or "Tus-Version" not in rsp.headers and "Tus-Resumable" not in rsp.headers:
+            return None
+        return {e.strip() for e in rsp.headers.get("Tus-Extension", "").split(",") if e.strip()}
+
+    def _tusUpload(self, path, digest, checksums):
+        size = os.path.getsize(path)
+        statePath = self._statePath(path, digest)
+        location = self._loadState(statePath)
+        offset = self._tusOffset(location) if location is not None else None
+        if offset is None:
+            location = self._tusCreate(path, size, digest)
+            offset = 0
+            self._saveState(statePath, location)
+        else:
+            logger.info(f"resuming upload of '{path}' at {offset} of {size} bytes")
+
+        with open(path, "rb") as handle:
+            streamed = self._hashPrefix(handle, offset)
+            while True:
+                handle.seek(offset)
+                chunk = handle.read(self.chunkSize)
+                newOffset, final = self._tusPatch(location, offset, chunk, checksums)
+                if newOffset < offset:
+                    # The server lost data it had acknowledged; the digest restarts from its offset
+                    logger.debug(f"server went back from {offset} to {newOffset}")
+                    streamed = self._hashPrefix(handle, newOffset)
+                else:
+                    if newOffset != offset + len(chunk):
+                        # The server kept a different amount than was sent; continue from its offset
+                        logger.debug(f"server acknowledged {newOffset} instead of {offset + len(chunk)}")
+                        handle.seek(offset)
+                        chunk = handle.read(newOffset - offset)
+                    streamed.update(chunk)
+                offset = newOffset
+                if self.progress is not None:
+                    self.progress(offset, size)
+                if offset >= size:
+                    break
+
+        if streamed.hexdigest() != digest:
+            raise UploadError(f"'{path}' changed during the upload (sha256 {streamed.hexdigest()} != {digest})")
+        self._removeState(statePath)
+        return final if final is not None else {}
+
+    def _hashPrefix(self, handle, offset):
+        """ Returns the SHA-256 of the first 'offset' bytes of the file, the part the
+        server has, so that the final digest covers the whole file."""
+
+        digest = hashlib.sha256()
+        handle.seek(0)
+        for block in iter(lambda: handle.read(min(self.chunkSize, offset - handle.tell())), b""):
+            digest.update(block)
+        return digest
+
+    def _tusCreate(self, path, size, digest):
+        metadata = {"filename": os.path.basename(path), "sha256": digest, "field": self.field}
+        headers = {
+            "Tus-Resumable": TUS_VERSION,
+            "Upload-Length": str(size),
+            "Upload-Metadata": ",".join(f"{k} {base64.b64encode(v.encode('utf-8')).decode('ascii')}"
+                                        for k, v in metadata.items())
+        }
+        self.server.request("POST", self.uri, headers=headers)
+        rsp = self.server.raw_rsp()
+        if rsp is None or rsp.status_code not in (200, 201) or "Location" not in rsp.headers:
+            raise UploadError(f"could not start a resumable upload of '{path}'; {self._failure()}")
+        location = rsp.headers["Location"]
+        if not location.startswith(("http://", "https://")):
+            base = self.server.baseurl.split("/", 3)
+            location = "/".join(base[:3]) + location if location.startswith("/") else \
+                self.server.baseurl + self.uri.rstrip("/") + "/" + location
+        return location
+
+    def _tusOffset(self, location):
+        """ Returns the offset the server has for an upload, or None if it is unknown."""
+
+        self.server.request("HEAD", location, headers={"Tus-Resumable": TUS_VERSION})
+        rsp = self.server.raw_rsp()
+        if rsp is None or not rsp.ok or "Upload-Offset" not in rsp.headers:
+            return None
+        return int(rsp.headers["Upload-Offset"])
+
+    def _tusPatch(self, location, offset, chunk, checksums):
+        """ Sends one chunk, retrying on failures.
+
+        :return: returns '(newOffset, finalJson)'"""
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(min(30, 2 ** (attempt - 1)))
+                # Ask where the server is; an earlier attempt may have been stored
+                known = self._tusOffset(location)
+                if known is not None and known != offset:
+                    return known, None
+            headers = {"Tus-Resumable": TUS_VERSION, "Upload-Offset": str(offset),
+                       "Content-Type": "application/offset+octet-stream"}
+            if checksums:
+                headers["Upload-Checksum"] = "sha1 " + base64.b64encode(hashlib.sha1(chunk).digest()).decode()
+            result = self.server.request("PATCH", location, headers=headers, data=chunk)
+            rsp = self.server.raw_rsp()
+            if rsp is not None and rsp.ok and "Upload-Offset" in rsp.headers:
+                return int(rsp.headers["Upload-Offset"]), result if result is not None else {}
+            if rsp is not None and rsp.status_code in (404, 410):
+                raise UploadError(f"the server no longer has the upload at {location}")
+            logger.debug(f"chunk at {offset} failed; {self._failure()}")
+        raise UploadError(f"upload failed at offset {offset}; {self._failure()}")
+
+    # ---  State of unfinished uploads  ----------------------------------
+    def _statePath(self, path, digest):
+        key = hashlib.sha1(json.dumps([self.server.baseurl, self.uri, os.path.abspath(path), digest])
+                           .encode("utf-8")).hexdigest()
+        return os.path.join(self.stateDir, key + ".json")
+
+    @staticmethod
+    def _loadState(statePath):
+        try:
+            with open(statePath) as handle:
+                return json.load(handle).get("location")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _saveState(statePath, location):
+        os.makedirs(os.path.dirname(statePath), exist_ok=True)
+        with open(statePath, "w") as handle:
+            json.dump({"location": location, "created": time.time()}, handle)
+
+    @staticmethod
+    def _removeState(statePath):
+        try:
+            os.remove(statePath)
+        except OSError:
+            pass
+
+    def _failure(self):
+        if self.server.last_failure:
+            return self.server.last_failure
+        return f"status={self.server.status_code()}; {self.server.json()}"
+
+
+def uploadFiles(files, dsid, file_paths, batchSize=20, retries=3, progress=None, **kwargs):
+    """ Uploads files to a dataset in batches, retrying only the files that failed.
+
+    :param files      -- the Files resource (e.g. 'server.files')
+    :param dsid       -- id of the target dataset
+    :param file_paths -- list of file paths (or '(filename, bytes)' tuples)
+    :param batchSize  -- files per request
+    :param retries    -- attempts for files that failed
+    :param progress   -- optional function called with '(filesDone, totalFiles)'
+    :param kwargs     -- additional fields for every upload request
+
+    :return: returns '(succeeded, failed)' lists of the input items"""
+
+    total = len(file_paths)
+    # Files that cannot be read are failed up front rather than failing their batches
+    missing = [p for p in file_paths if not isinstance(p, tuple) and not os.path.isfile(p)]
+    if missing:
+        logger.warning(f"{len(missing)} files cannot be read; e.g. '{missing[0]}'")
+    todo = [p for p in file_paths if isinstance(p, tuple) or os.path.isfile(p)]
+    succeeded = []
+    for attempt in range(retries + 1):
+        if not todo:
+            break
+        if attempt:
+            delay = min(60, 2 ** attempt)
+            logger.info(f"retrying {len(todo)} files in {delay}s")
+            time.sleep(delay)
+        failed = []
+        queue = list(todo)
+        while queue:
+            batch, queue = queue[:batchSize], queue[batchSize:]
+            try:
+                files.upload(dsid, batch, **kwargs)
+            except OSError as e:
+                # A file that cannot be read will not be readable on a retry either, so only
+                # the unreadable files fail for good; the rest of the batch goes back in the queue
+                logger.warning(f"upload batch failed; {e}")
+                unreadable = [p for p in batch if not _readable(p)]
+                if not unreadable:
+                    failed.extend(batch)
+                    continue
+                missing.extend(unreadable)
+                queue = [p for p in batch if p not in unreadable] + queue
+                continue
+            ok, bad = _batchResults(files.server, batch)
+            succeeded.extend(ok)
+            failed.extend(bad)
+            if progress is not None:
+                progress(len(succeeded), total)
+        todo = failed
+    return succeeded, todo + missing
+
+
+def _readable(item):
+    """ Returns whether an upload item ('path' or '(filename, bytes)') can be read."""
+
+    if isinstance(item, tuple):
+        return True
+    try:
+        with open(item, "rb"):
+            return True
+    except OSError:
+        return False
+
+
+def _batchResults(server, batch):
+    """ Splits a batch into succeeded and failed items using the response's 'resultList'."""
+
+    try:
+        results = server.json()["resultList"]
+    except (TypeError, KeyError):
+        return (list(batch), []) if server.rsp_ok() else ([], list(batch))
+
+    byName = {}
+    for item in results:
+        name = item.get("original_file_name") or item.get("file_name") or item.get("name")
+        if name is not None:
+            byName[name] = item.get("result") == "success"
+    ok, bad = [], []
+    for i, item in enumerate(batch):
+        name = item[0] if isinstance(item, tuple) else os.path.basename(item)
+        if name in byName:
+            success = byName[name]
+        elif len(results) == len(batch):
+            success = results[i].get("result") == "success"
+        else:
+            success = server.rsp_ok()
+        (ok if success else bad).append(item)
+    return ok, bad
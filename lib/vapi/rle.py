@@ -0,0 +1,278 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Run length encoding (RLE) of segmentation masks.
+
+RLE follows the COCO convention used by MVI segmentation results: the mask is
+flattened in column-major order and 'counts' alternates between runs of
+background and foreground pixels, starting with background. Counts may be a
+list of integers or a COCO compressed string. All conversions are vectorized
+with NumPy so that high resolution masks never go through per-pixel Python.
+"""
+
+import logging as logger
+
+import cv2 as cv
+import numpy as np
+
+
+def decode(rle, shape=None):
+    """ Decodes RLE into a boolean mask.
+
+    :param rle   -- either a dict with 'counts' and 'size' ([height, width]) fields
+                    or a bare 'counts' list/string
+    :param shape -- (height, width) of the mask. Required if 'rle' has no 'size'.
+
+    :return: returns a 2D boolean numpy array.
+    :raises ValueError if the counts do not cover the mask size."""
+
+    counts, shape = _split(rle, shape)
+    total = int(counts.sum())
+    if total != shape[0] * shape[1]:
+        raise ValueError(f"RLE counts cover {total} pixels; expected {shape[0]} x {shape[1]}")
+    values = (np.arange(len(counts)) & 1).astype(bool)
+    return np.repeat(values, counts).reshape(shape, order="F")
+
+
+def encode(mask, compress=False):
+    """ Encodes a 2D mask into RLE.
+
+    :param mask     -- 2D numpy array. Non-zero values are foreground.
+    :param compress -- if True, 'counts' is a COCO compressed string instead of a list.
+
+    :return: returns a dict with 'size' and 'counts' fields."""
+
+    mask = np.asarray(mask)
+    flat = mask.ravel(order="F").astype(bool)
+    if flat.size == 0:
+        counts = np.zeros(0, dtype=np.int64)
+    else:
+        changes = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+        counts = np.diff(np.concatenate(([0], changes, [flat.size])))
+        if flat[0]:
+            counts = np.concatenate(([0], counts))
+
+    counts = counts.tolist()
+    return {
+        "size": [int(mask.shape[0]), int(mask.shape[1])],
+        "counts": countsToString(counts) if compress else counts
+    }
+
+
+def area(rle, shape=None):
+    """ Returns the number of foreground pixels of an RLE mask without decoding it."""
+
+    counts, _ = _split(rle, shape, requireShape=False)
+    return int(counts[1::2].sum())
+
+
+def bbox(rle, shape=None):
+    """ Returns the '(xmin, ymin, xmax, ymax)' bounds of an RLE mask, or None if it is empty.
+    Bounds are inclusive pixel coordinates."""
+
+    counts, shape = _split(rle, shape)
+    ends = np.cumsum(counts)
+    starts = ends - counts
+    fg = np.arange(len(counts)) & 1 == 1
+    fg &= counts > 0
+    if not fg.any():
+        return None
+    height = shape[0]
+    first = starts[fg]
+    last = ends[fg] - 1
+    # Runs are column-major. A run that wraps into the next column covers both the
+    # bottom and the top row.
+    if np.any(first // height != last // height):
+        ymin, ymax = 0, height - 1
+    else:
+        ymin, ymax = int(np.min(first % height)), int(np.max(last % height))
+    return int(first.min() // height), ymin, int(last.max() // height), ymax
+
+
+def fromPolygons(polygons, shape):
+    """ Rasterizes polygons into a boolean mask.
+
+    :param polygons -- list of polygons. Each polygon is a list of [x, y] points or
+                       a flat [x1, y1, x2, y2, ...] list. A single polygon is also accepted.
+    :param shape    -- (height, width) of the mask"""
+
+    mask = np.zeros(shape, dtype=np.uint8)
+    points = pointArrays(polygons)
+    if points:
+        cv.fillPoly(mask, points, 1)
+    return mask.astype(bool)
+
+
+def toPolygons(mask, minPoints=3):
+    """ Traces the outer contours of a mask.
+
+    :param mask      -- 2D numpy array. Non-zero values are foreground.
+    :param minPoints -- contours with fewer points are dropped
+
+    :return: returns a list of polygons, each a list of [x, y] points."""
+
+    contours, _ = cv.findContours(np.ascontiguousarray(mask, dtype=np.uint8),
+                                  cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+    return [contour.reshape(-1, 2).tolist() for contour in contours if len(contour) >= minPoints]
+
+
+def pointArrays(polygons):
+    """ Converts polygons into a list of Nx2 int32 point arrays as expected by OpenCV.
+    Both '[[x, y], ...]' point lists and flat '[x1, y1, x2, y2, ...]' lists are accepted."""
+
+    if not polygons:
+        return []
+    # A single polygon given as a list of points or as a flat coordinate list
+    if isinstance(polygons[0], (int, float)) or \
+       (isinstance(polygons[0], (list, tuple)) and len(polygons[0]) == 2 and
+            isinstance(polygons[0][0], (int, float))):
+        polygons = [polygons]
+
+    arrays = []
+    for polygon in polygons:
+        points = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+        if len(points) >= 2:
+            arrays.append(np.rint(points).astype(np.int32))
+    return arrays
+
+
+def detectionMask(detection, shape):
+    """ Gets the full image mask of an inference detection or object label.
+
+    The detection's 'rle' field is used if present; otherwise its 'polygons' (inference
+    results) or 'segment_polygons' (object labels) are rasterized. RLE masks that are the
+    size of the detection's bounding box are placed at the box.
+
+    :param detection -- detection or object label dict
+    :param shape     -- (height, width) of the image
+
+    :return: returns a boolean mask, or None if the detection has no segmentation."""
+
+    shape = tuple(shape)
+    rle = detection.get("rle")
+    if rle:
+        try:
+            mask = decode(rle, shape if not isinstance(rle, dict) or "size" not in rle else None)
+        except ValueError as e:
+            logger.debug(f"could not decode detection RLE; {e}")
+            return None
+        if mask.shape == shape:
+            return mask
+        box = detection.get("bnd_box", detection)
+        xmin, ymin = int(box.get("xmin", 0)), int(box.get("ymin", 0))
+        full = np.zeros(shape, dtype=bool)
+        region = full[ymin:ymin + mask.shape[0], xmin:xmin + mask.shape[1]]
+        region |= mask[:region.shape[0], :region.shape[1]]
+        return full
+
+    polygons = detection.get("polygons") or detection.get("segment_polygons")
+    if polygons:
+        return fromPolygons(polygons, shape)
+    return None
+
+
+def iou(maskA, maskB):
+    """ Returns the intersection over union of two masks of the same shape."""
+
+    maskA = np.asarray(maskA, dtype=bool)
+    maskB = np.asarray(maskB, dtype=bool)
+    union = np.count_nonzero(maskA | maskB)
+    if union == 0:
+        return 0.0
+    return np.count_nonzero(maskA & maskB) / union
+
+
+def iouMatrix(masksA, masksB):
+    """ Computes pairwise IoU between two lists of same-shape masks.
+
+    Intersections for all pairs are computed with a single matrix product.
+
+    :return: returns a len(masksA) x len(masksB) float array"""
+
+    if len(masksA) == 0 or len(masksB) == 0:
+        return np.zeros((len(masksA), len(masksB)), dtype=np.float64)
+    a = np.stack([np.asarray(m, dtype=bool).ravel() for m in masksA]).astype(np.float32)
+    b = np.stack([np.asarray(m, dtype=bool).ravel() for m in masksB]).astype(np.float32)
+    inter = a @ b.T
+    union = a.sum(axis=1)[:, None] + b.sum(axis=1)[None, :] - inter
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, inter / union, 0.0)
+
+
+def countsToString(counts):
+    """ Compresses a counts list into the COCO string format."""
+
+    chars = []
+    for i, x in enumerate(counts):
+        x = int(x)
+        if i > 2:
+            x -= int(counts[i - 2])
+        more = True
+        while more:
+            c = x & 0x1f
+            x >>= 5
+            more = (x != -1) if (c & 0x10) else (x != 0)
+            if more:
+                c |= 0x20
+            chars.append(chr(c + 48))
+    return "".join(chars)
+
+
+def stringToCounts(string):
+    """ Expands a COCO compressed counts string into a list of counts."""
+
+    counts = []
+    p = 0
+    data = string.encode("ascii") if isinstance(string, str) else string
+    while p < len(data):
+        x = 0
+        k = 0
+        more = True
+        while more:
+            c = data[p] - 48
+            x |= (c & 0x1f) << (5 * k)
+            more = c & 0x20
+            p += 1
+            k += 1
+            if not more and (c & 0x10):
+                x |= -1 << (5 * k)
+        if len(counts) > 2:
+            x += counts[-2]
+        counts.append(x)
+    return counts
+
+
+def _split(rle, shape, requireShape=True):
+    """ Returns '(counts array, shape)' from any of the supported RLE forms."""
+
+    if isinstance(rle, dict):
+        counts = rle.get("counts", [])
+        if "size" in rle:
+            shape = rle["size"]
+    else:
+        counts = rle
+    if isinstance(counts, (str, bytes)):
+        counts = stringToCounts(counts)
+    if requireShape and shape is None:
+        raise ValueError("RLE has no 'size' and no shape was given")
+    counts = np.asarray(counts, dtype=np.int64)
+    if np.any(counts < 0):
+        raise ValueError("RLE counts cannot be negative")
+    return counts, (tuple(int(v) for v in shape) if shape is not None else None)
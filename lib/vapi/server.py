@@ -19,11 +19,27 @@
 import json
 import os
 import re
-import requests
+import threading
+from contextlib import contextmanager
 import logging as logger
 
-from urllib3.exceptions import InsecureRequestWarning
-from urllib3 import disable_warnings
+_requests = None
+
+
+def requestsModule():
+    """ Imports 'requests' on first use.
+
+    'requests' (with urllib3) is the most expensive import of the package; loading
+    it only when the first request is sent keeps 'import vapi' (and so CLI help
+    and usage errors) fast. Certificate warnings are disabled once, here."""
+
+    global _requests
+    if _requests is None:
+        import requests
+        from urllib3 import disable_warnings
+        disable_warnings()
+        _requests = requests
+    return _requests
 
 
 class Server(object):
@@ -33,12 +49,84 @@ class Server(object):
         self.token = auth_token
         self.baseurl = server_uri
         self.language = language
+        # Last response info is kept per thread so that resources can be used
+        # from worker threads without clobbering each other's results.
+        self._local = threading.local()
         self.last_rsp = None
         self.last_failure = None
         self.log_http_traffic = log_http_traffic
+        self._poolSize = 16
+        self._session = None
+        self._sessionLock = threading.Lock()
+
+    def session(self):
+        """ Returns the HTTP session used for all requests, creating it on first use.
+
+        Requests through the same Server reuse pooled connections (and TLS sessions)
+        instead of connecting for every request. Up to 'poolSize' connections are
+        kept per host. Cookies are not kept, as before connections were pooled."""
+
+        if self._session is None:
+            with self._sessionLock:
+                if self._session is None:
+                    requests = requestsModule()
+                    from http.cookiejar import DefaultCookiePolicy
+                    session = requests.Session()
+                    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                    self._mount(session)
+                    self._session = session
+        return self._session
+
+    @property
+    def poolSize(self):
+        return self._poolSize
+
+    @poolSize.setter
+    def poolSize(self, size):
+        """ Sets the number of pooled connections per host. Growing the pool of a
+        session already in use mounts a new adapter of that size; connections in
+        use finish on the old one, and new requests open connections as needed."""
+
+        with self._sessionLock:
+            grow = size > self._poolSize
+            self._poolSize = size
+            if grow and self._session is not None:
+                self._mount(self._session)
+
+    def _mount(self, session):
+        adapter = requestsModule().adapters.HTTPAdapter(pool_maxsize=self._poolSize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    @contextmanager
+    def streaming(self):
+        """ Streams the responses of 'get' requests sent by this thread within the block.
+
+        Resource methods then return None instead of the decoded json, and the body
+        is read from 'raw_rsp()' (e.g. with 'vapi.jsonstream.iterItems')."""
+
+        previous = getattr(self._local, "streaming", False)
+        self._local.streaming = True
+        try:
+            yield self
+        finally:
+            self._local.streaming = previous
 
-        # Disable warning messages about SSL certs
-        requests.packages.urllib3.disable_warnings()
+    @property
+    def last_rsp(self):
+        return getattr(self._local, "last_rsp", None)
+
+    @last_rsp.setter
+    def last_rsp(self, rsp):
+        self._local.last_rsp = rsp
+
+    @property
+    def last_failure(self):
+        return getattr(self._local, "last_failure", None)
+
+    @last_failure.setter
+    def last_failure(self, failure):
+        self._local.last_failure = failure
 
     def raw_http_req(self):
         """ Gets the raw HTTP request for the last request that was sent"""
@@ -115,18 +203,20 @@ class Server(object):
 
             bytes_saved = 0
             cnt = 0
-            chunk = 1024
-            interval = 512 * chunk
+            chunk = 1024 * 1024
+            # Callbacks every 50 MB, as before the chunk size was raised
+            interval = 50 * chunk
+            next_callback = interval
             with open(filename, 'wb') as handle:
                 for block in rsp.iter_content(chunk):
                     handle.write(block)
-                    bytes_saved += chunk
-                    if bytes_saved % interval == 0:
+                    bytes_saved += len(block)
+                    if bytes_saved >= next_callback:
+                        next_callback += interval
                         logger.debug(F"saved {bytes_saved} bytes")
                         if status_callback is not None:
-                            if bytes_saved % (interval * 100) == 0:
-                                cnt += 1
-                                status_callback(filename, cnt, bytes_saved)
+                            cnt += 1
+                            status_callback(filename, cnt, bytes_saved)
         else:
             logger.warning(F"Bad response status: status = {self.status_code()}; msg = {self.json()}")
             raise ConnectionError(F"Failed to save HTTP file {filename}")
@@ -146,10 +236,12 @@ class Server(object):
         else:
             url = f"https://{self.baseurl}/{uri}"
 
-        try:
-            disable_warnings(InsecureRequestWarning)
+        if getattr(self._local, "streaming", False):
+            kwargs["stream"] = True
 
-            self.last_rsp = requests.get(url, verify=False, headers=headers, **kwargs)
+        requests = requestsModule()
+        try:
+            self.last_rsp = self.session().get(url, verify=False, headers=headers, **kwargs)
             self.last_failure = None
         except requests.exceptions.ConnectionError as e:
             self.last_rsp = None
@@ -173,10 +265,9 @@ class Server(object):
         headers['X-Auth-Token'] = u'%s' % self.token
         url = self.baseurl + uri
 
+        requests = requestsModule()
         try:
-            disable_warnings(InsecureRequestWarning)
-
-            self.last_rsp = requests.post(url, verify=False, headers=headers, **kwargs)
+            self.last_rsp = self.session().post(url, verify=False, headers=headers, **kwargs)
             self.last_failure = None
         except requests.exceptions.ConnectionError as e:
             self.last_rsp = None
@@ -189,6 +280,56 @@ class Server(object):
             jsonData = self.json()
         return jsonData
 
+    def request(self, method, uri, headers=None, **kwargs):
+        """ Sends a request with any HTTP method (e.g. HEAD, OPTIONS or PATCH).
+
+        Last response information is kept as for the other verbs.
+
+        :return: returns the json of the response if it was successful and has json"""
+
+        if headers is None:
+            headers = {}
+        headers['accept-language'] = self.language
+        headers['X-Auth-Token'] = u'%s' % self.token
+        url = uri if uri.startswith(("http://", "https://")) else self.baseurl + uri
+
+        requests = requestsModule()
+        try:
+            self.last_rsp = self.session().request(method, url, verify=False, headers=headers, **kwargs)
+            self.last_failure = None
+        except requests.exceptions.ConnectionError as e:
+            self.last_rsp = None
+            self.last_failure = f"Could not connect to server ({self.baseurl})."
+            logger.debug(e)
+
+        self.__log_http_messages()
+        jsonData = None
+        if self.rsp_ok() and self.last_rsp.content:
+            jsonData = self.json()
+        return jsonData
+
+    def upload(self, uri, files, data=None, progress=None, method="POST"):
+        """ Sends a multipart request with files, streaming them from disk.
+
+        Unlike 'post(files=...)', the body is never built in memory, so files of
+        any size can be sent.
+
+        :param uri      -- URI of the request
+        :param files    -- files to send; see 'vapi.multipart.MultipartEncoder'
+        :param data     -- optional dict of form fields
+        :param progress -- optional function called with '(bytesSent, totalBytes)'
+        :param method   -- "POST" or "PUT"
+
+        :return: returns the json of the response as 'post' and 'put' do"""
+
+        from vapi.multipart import MultipartEncoder
+
+        with MultipartEncoder(fields=data, files=files, progress=progress) as body:
+            headers = {"Content-Type": body.content_type}
+            if method.upper() == "PUT":
+                return self.put(uri, headers=headers, data=body)
+            return self.post(uri, headers=headers, data=body)
+
     def delete(self, uri, headers=None, **kwargs):
         if headers is None:
             headers = {}
@@ -196,10 +337,9 @@ class Server(object):
         headers['X-Auth-Token'] = u'%s' % self.token
         url = self.baseurl + uri
 
+        requests = requestsModule()
         try:
-            disable_warnings(InsecureRequestWarning)
-
-            self.last_rsp = requests.delete(url, verify=False, headers=headers, **kwargs)
+            self.last_rsp = self.session().delete(url, verify=False, headers=headers, **kwargs)
             self.last_failure = None
         except requests.exceptions.ConnectionError:
             self.last_rsp = None
@@ -218,10 +358,9 @@ class Server(object):
         headers['X-Auth-Token'] = u'%s' % self.token
         url = self.baseurl + uri
 
+        requests = requestsModule()
         try:
-            disable_warnings(InsecureRequestWarning)
-
-            self.last_rsp = requests.put(url, verify=False, headers=headers, **kwargs)
+            self.last_rsp = self.session().put(url, verify=False, headers=headers, **kwargs)
             self.last_failure = None
         except requests.exceptions.ConnectionError:
             self.last_rsp = None
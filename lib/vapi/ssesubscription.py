@@ -0,0 +1,413 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Resilient subscription to the server's '/events' SSE stream.
+
+A single reader thread keeps the stream open, reconnecting with exponential
+backoff (or the server's 'retry:' hint) and sending 'Last-Event-ID' so no
+events are missed. Each event is offered to every registered handler through
+the handler's own bounded queue. Handlers run in worker threads or on an
+asyncio loop, so a slow handler only fills its own queue; the reader never
+waits. Events that do not fit are dropped and counted.
+"""
+
+import asyncio
+import queue
+import random
+import socket
+import threading
+import time
+import logging as logger
+
+from vapi.SseMonitor import SseParser, iterChunks
+from vapi.server import requestsModule
+
+_FULL = (queue.Full, asyncio.QueueFull)
+_EMPTY = (queue.Empty, asyncio.QueueEmpty)
+
+
+class _Handler:
+    """ A handler running in worker threads, fed through a bounded queue."""
+
+    def __init__(self, name, callback, queueSize, workers, dropOldest):
+        self.name = name
+        self.callback = callback
+        self.dropOldest = dropOldest
+        self.queue = queue.Queue(maxsize=queueSize)
+        self.workers = workers
+        self.threads = []
+        self.lock = threading.Lock()
+        self.handled = 0
+        self.dropped = 0
+        self.errors = 0
+        self.maxDepth = 0
+        self.maxLagSeconds = 0.0
+
+    def start(self):
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"sse-{self.name}-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def offer(self, event):
+        item = (time.monotonic(), event)
+        try:
+            self.queue.put_nowait(item)
+        except _FULL:
+            with self.lock:
+                self.dropped += 1
+            if not self.dropOldest:
+                return
+            try:
+                self.queue.get_nowait()
+            except _EMPTY:
+                pass
+            try:
+                self.queue.put_nowait(item)
+            except _FULL:
+                return
+        depth = self.queue.qsize()
+        if depth > self.maxDepth:
+            self.maxDepth = depth
+
+    def stop(self, timeout):
+        for _ in self.threads:
+            # Make room for the stop marker, if needed
+            while True:
+                try:
+                    self.queue.put_nowait(None)
+                    break
+                except queue.Full:
+                    try:
+                        self.queue.get_nowait()
+                    except queue.Empty:
+                        pass
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def metrics(self):
+        with self.lock:
+            return {"queued": self.queue.qsize(), "handled": self.handled, "dropped": self.dropped,
+                    "errors": self.errors, "max_queued": self.maxDepth,
+                    "max_lag_seconds": round(self.maxLagSeconds, 3)}
+
+    def _work(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            queuedAt, event = item
+            try:
+                self.callback(event)
+                ok = True
+            except Exception as e:
+                logger.debug(f"SSE handler '{self.name}' failed; {e}")
+                ok = False
+            self._done(queuedAt, ok)
+
+    def _done(self, queuedAt, ok):
+        lag = time.monotonic() - queuedAt
+        with self.lock:
+            self.handled += 1
+            if not ok:
+                self.errors += 1
+            if lag > self.maxLagSeconds:
+                self.maxLagSeconds = lag
+
+
+class _AsyncHandler(_Handler):
+    """ A handler running as a task on an asyncio event loop.
+
+    The queue is an 'asyncio.Queue' owned by the loop; the reader thread hands
+    events over with 'call_soon_threadsafe'."""
+
+    def __init__(self, name, callback, queueSize, loop, dropOldest):
+        super().__init__(name, callback, queueSize, 0, dropOldest)
+        self.loop = loop
+        self.queueSize = queueSize
+        self.task = None
+
+    def start(self):
+        async def setup():
+            self.queue = asyncio.Queue(maxsize=self.queueSize)
+            self.task = asyncio.ensure_future(self._work())
+        asyncio.run_coroutine_threadsafe(setup(), self.loop).result()
+
+    def offer(self, event):
+        self.loop.call_soon_threadsafe(super().offer, event)
+
+    def stop(self, timeout):
+        if self.task is None or self.loop.is_closed():
+            return
+
+        async def shutdown():
+            deadline = time.monotonic() + timeout
+            while not self.queue.empty() and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            self.task.cancel()
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self.loop).result(timeout + 1)
+        except Exception as e:
+            logger.debug(f"stopping SSE handler '{self.name}' failed; {e}")
+
+    async def _work(self):
+        while True:
+            queuedAt, event = await self.queue.get()
+            try:
+                await self.callback(event)
+                ok = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"SSE handler '{self.name}' failed; {e}")
+                ok = False
+            self._done(queuedAt, ok)
+
+
+class SseSubscription:
+    """
+    Auto-reconnecting SSE subscription that fans events out to handlers.
+
+    Typical use:
+
+        subscription = server.sseMonitor.subscribe(includeEvents=["dataset-updated"])
+        subscription.addHandler(onEvent, queueSize=100)
+        subscription.start()
+        ...
+        subscription.stop()
+
+    Handlers receive 'SseEvent' objects (see vapi.SseMonitor).
+    """
+
+    def __init__(self, server, includeEvents=None, excludeEvents=None, lastEventId=None,
+                 initialDelay=1.0, maxDelay=60.0, readTimeout=None, onConnect=None):
+        """
+        :param server        -- vapi server connection
+        :param includeEvents -- optional list of event names to deliver
+        :param excludeEvents -- optional list of event names to drop
+        :param lastEventId   -- optional id of the last event already seen, to resume from
+        :param initialDelay  -- seconds to wait before the first reconnection attempt
+        :param maxDelay      -- upper bound in seconds of the exponential backoff
+        :param readTimeout   -- optional seconds without data after which the stream is
+                                considered dead and reopened
+        :param onConnect     -- optional function called in the reader thread each time
+                                the stream is opened, with the number of connections
+                                so far (more than 1 means a reconnection)"""
+
+        self.server = server
+        self.includeEvents = includeEvents
+        self.excludeEvents = excludeEvents
+        self.lastEventId = lastEventId
+        self.initialDelay = initialDelay
+        self.maxDelay = maxDelay
+        self.readTimeout = readTimeout
+        self.retryHint = None
+        self.onConnect = onConnect
+        self.handlers = []
+        self._stopping = threading.Event()
+        self._thread = None
+        self._rsp = None
+        self._connected = False
+        self._connects = 0
+        self._reconnects = 0
+        self._received = 0
+        self._skipped = 0
+        self._lastError = None
+
+    def addHandler(self, callback, queueSize=1000, workers=1, name=None, dropOldest=True):
+        """ Registers a function called with each event, in its own worker threads.
+
+        :param callback   -- function taking an SseEvent
+        :param queueSize  -- maximum number of events waiting for this handler
+        :param workers    -- number of threads calling 'callback'. With more than one
+                             thread events may be handled out of order.
+        :param name       -- optional name used in metrics. Defaults to the function name.
+        :param dropOldest -- when the queue is full, drop the oldest queued event (the
+                             default) rather than the new one"""
+
+        handler = _Handler(name or getattr(callback, "__name__", f"handler{len(self.handlers)}"),
+                           callback, queueSize, workers, dropOldest)
+        return self._add(handler)
+
+    def addAsyncHandler(self, coroutine, loop, queueSize=1000, name=None, dropOldest=True):
+        """ Registers a coroutine function awaited with each event on 'loop'.
+
+        :param coroutine -- 'async def' function taking an SseEvent
+        :param loop      -- running asyncio event loop (in another thread) to run it on
+        Other parameters are as for 'addHandler'."""
+
+        handler = _AsyncHandler(name or getattr(coroutine, "__name__", f"handler{len(self.handlers)}"),
+                                coroutine, queueSize, loop, dropOldest)
+        return self._add(handler)
+
+    def start(self):
+        """ Starts the reader thread (and the handlers). Returns self."""
+
+        if self._thread is not None:
+            raise RuntimeError("SSE subscription already started")
+        for handler in self.handlers:
+            handler.start()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="sse-reader", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        """ Stops reading and waits up to 'timeout' seconds for handlers to finish
+        the events already queued."""
+
+        self._stopping.set()
+        rsp = self._rsp
+        if rsp is not None:
+            _shutdown(rsp)
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        for handler in self.handlers:
+            handler.stop(timeout)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def metrics(self):
+        """ Returns a dict of reader and per handler counters.
+
+        'dropped' counts events lost because a handler's queue was full; 'max_queued'
+        and 'max_lag_seconds' show how far a handler fell behind."""
+
+        return {
+            "connected": self._connected,
+            "connects": self._connects,
+            "reconnects": self._reconnects,
+            "received": self._received,
+            "skipped": self._skipped,
+            "last_event_id": self.lastEventId,
+            "last_error": self._lastError,
+            "handlers": {handler.name: handler.metrics() for handler in self.handlers}
+        }
+
+    def _add(self, handler):
+        if self._thread is not None:
+            raise RuntimeError("handlers must be added before the subscription is started")
+        self.handlers.append(handler)
+        return handler
+
+    def _run(self):
+        failures = 0
+        while not self._stopping.is_set():
+            gotEvents, finished = self._readStream()
+            if finished or self._stopping.is_set():
+                break
+            failures = 0 if gotEvents else failures + 1
+            self._reconnects += 1
+            delay = self._delay(failures)
+            logger.info(f"SSE stream closed ({self._lastError}); reconnecting in {delay:.1f}s")
+            self._stopping.wait(delay)
+        self._connected = False
+
+    def _readStream(self):
+        """ Reads one connection until it ends.
+
+        :return: returns '(gotEvents, finished)'; 'finished' is True when the
+                 server asked not to reconnect"""
+
+        headers = {"Accept": "text/event-stream", "Cache-Control": "no-cache"}
+        if self.lastEventId is not None:
+            headers["Last-Event-ID"] = self.lastEventId
+        kwargs = {"timeout": (30, self.readTimeout)} if self.readTimeout is not None else {}
+
+        self.server.get("/events", stream=True, headers=headers, **kwargs)
+        rsp = self.server.raw_rsp()
+        if rsp is None:
+            self._lastError = self.server.last_failure
+            return False, False
+        if rsp.status_code == 204:
+            # The event-stream standard uses 204 to tell clients to stop reconnecting
+            self._lastError = "server ended the stream (204)"
+            rsp.close()
+            return False, True
+        if not rsp.ok:
+            self._lastError = f"status={rsp.status_code}"
+            rsp.close()
+            return False, False
+
+        self._rsp = rsp
+        self._connected = True
+        self._connects += 1
+        if self.onConnect is not None:
+            self.onConnect(self._connects)
+        parser = SseParser(self.includeEvents, self.excludeEvents)
+        parser.lastEventId = self.lastEventId
+        gotEvents = False
+        try:
+            for chunk in iterChunks(rsp):
+                for event in parser.feed(chunk):
+                    gotEvents = True
+                    self._received += 1
+                    for handler in self.handlers:
+                        handler.offer(event)
+                self.lastEventId = parser.lastEventId
+                self.retryHint = parser.retry
+            self._lastError = "stream ended"
+        except (requestsModule().exceptions.RequestException, OSError, AttributeError, ValueError) as e:
+            # A response closed by 'stop()' can surface as any of these
+            self._lastError = str(e) or type(e).__name__
+        finally:
+            self._skipped += parser.skipped
+            self.lastEventId = parser.lastEventId
+            self.retryHint = parser.retry if parser.retry is not None else self.retryHint
+            self._connected = False
+            self._rsp = None
+            rsp.close()
+        return gotEvents, False
+
+    def _delay(self, failures):
+        """ Seconds to wait before reconnecting: the server's 'retry:' hint if it sent
+        one, then exponential backoff with jitter while connections keep failing."""
+
+        base = self.retryHint / 1000 if self.retryHint is not None else self.initialDelay
+        if failures <= 1:
+            return base
+        delay = min(self.maxDelay, base * 2 ** (failures - 1))
+        return delay * random.uniform(0.5, 1.0)
+
+
+def _shutdown(rsp):
+    """ Unblocks a thread reading 'rsp' by shutting down its socket.
+
+    'rsp.close()' cannot be used from another thread; it waits for the lock
+    held by the blocked read. The reader closes the response itself."""
+
+    connection = getattr(rsp.raw, "_connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is None:
+        # urllib3 may have released the connection object; use the socket of the file
+        fp = getattr(getattr(rsp.raw, "_fp", None), "fp", None)
+        sock = getattr(getattr(fp, "raw", None), "_sock", None)
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
@@ -0,0 +1,323 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+"""
+Hyperparameter sweeps over training tasks.
+
+A search space maps parameter names to the values to try. A list is a set of
+choices; a dict '{"min": a, "max": b}' is a range for random sampling
+(optionally with '"log": true' and '"type": "int"'). 'nn_arch' is passed as a
+task property; all other parameters go into the training 'strategy', as with
+'datasets train --hyper'.
+
+The scheduler keeps a bounded number of training tasks running, submitting the
+next trial as soon as one finishes. Each started task and every result are
+appended to a JSON lines file, so an interrupted sweep can be resumed: trials
+that finished are not run again, and tasks that were still running are waited
+for instead of being submitted a second time.
+"""
+
+import itertools
+import json
+import math
+import random
+import time
+import logging as logger
+
+# Task properties; every other search space parameter is a strategy value
+TASK_PARAMS = ("nn_arch",)
+
+# Fields of a trained model reported as metrics when they are numeric
+METRIC_FIELDS = ("accuracy", "precision", "recall", "mAP", "map", "iou", "f1", "loss")
+
+_SUCCEEDED = {"completed", "trained"}
+
+_ACTIONS = {"cod": "create-cod-task", "act": "create-act-task"}
+
+
+def gridTrials(space):
+    """ Expands a search space of choice lists into every combination.
+
+    :return: returns a list of parameter dicts"""
+
+    names = sorted(space)
+    for name in names:
+        if not isinstance(space[name], list):
+            raise ValueError(f"grid search needs a list of values for '{name}'")
+    return [dict(zip(names, values)) for values in itertools.product(*(space[n] for n in names))]
+
+
+def randomTrials(space, count, seed=None):
+    """ Samples 'count' parameter dicts from a search space.
+
+    Lists are sampled uniformly; ranges uniformly, or log-uniformly when 'log' is set.
+    Duplicate samples are dropped, so fewer than 'count' trials may be returned for
+    small discrete spaces."""
+
+    rng = random.Random(seed)
+    trials = []
+    seen = set()
+    for _ in range(count * 10):
+        if len(trials) >= count:
+            break
+        trial = {name: _sample(rng, name, space[name]) for name in sorted(space)}
+        key = json.dumps(trial, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            trials.append(trial)
+    return trials
+
+
+def _sample(rng, name, values):
+    if isinstance(values, list):
+        return rng.choice(values)
+    if not isinstance(values, dict) or "min" not in values or "max" not in values:
+        raise ValueError(f"'{name}' must be a list of values or a {{\"min\", \"max\"}} range")
+    low, high = values["min"], values["max"]
+    if values.get("log"):
+        value = math.exp(rng.uniform(math.log(low), math.log(high)))
+    else:
+        value = rng.uniform(low, high)
+    if values.get("type") == "int":
+        return int(round(value))
+    return round(value, 6)
+
+
+def gpuCapacity(info):
+    """ Gets the number of GPUs from 'System.info' output, or None if it is not reported.
+
+    Both a list of GPUs ('gpus' or 'gpu') and a count field are recognized."""
+
+    if not isinstance(info, dict):
+        return None
+    for key in ("gpus", "gpu", "GPUs"):
+        gpus = info.get(key)
+        if isinstance(gpus, list):
+            return len(gpus)
+        if isinstance(gpus, dict):
+            return gpuCapacity(gpus)
+    for key in ("gpu_count", "num_gpus", "total_gpus", "total"):
+        if isinstance(info.get(key), int):
+            return info[key]
+    return None
+
+
+def leaderboard(results, metric="accuracy"):
+    """ Orders finished trials by 'metric', best first. Losses are ordered lowest first.
+
+    :param results -- list of result dicts (as produced by SweepScheduler)
+    :param metric  -- name of the metric to rank by
+
+    :return: returns the ranked list; trials without the metric come last"""
+
+    sign = 1 if metric == "loss" else -1
+    scored = [r for r in results if isinstance(r.get("metrics", {}).get(metric), (int, float))]
+    unscored = [r for r in results if r not in scored]
+    scored.sort(key=lambda r: sign * r["metrics"][metric])
+    return scored + unscored
+
+
+class SweepScheduler:
+    """ Runs the trials of a sweep, keeping at most 'maxRunning' training tasks active."""
+
+    def __init__(self, server, dsid, usage, namePrefix, maxRunning=None, baseParams=None,
+                 resultsFile=None, useEvents=True, pollInterval=30.0):
+        """
+        :param server     -- vapi server connection
+        :param dsid       -- id of the dataset to train
+        :param usage      -- type of model ('cic', 'cod' or 'act')
+        :param namePrefix -- trained model names are '<namePrefix>-<trial number>'
+        :param maxRunning -- maximum concurrent training tasks. Defaults to the number
+                             of GPUs reported by 'System.info' (or 1 if not reported),
+                             and is never more than that number.
+        :param baseParams -- optional parameters common to all trials (same form as a trial)
+        :param resultsFile -- optional JSON lines file of submitted tasks and results.
+                             Trials already in the file are not run again.
+        :param useEvents  -- use server sent events to notice finished tasks sooner
+        :param pollInterval -- maximum seconds between status polls"""
+
+        self.server = server
+        self.dsid = dsid
+        self.usage = usage
+        self.namePrefix = namePrefix
+        self.baseParams = baseParams or {}
+        self.resultsFile = resultsFile
+        self.useEvents = useEvents
+        self.pollInterval = pollInterval
+        self.maxRunning = self._capacity(maxRunning)
+
+    def run(self, trials, progress=None):
+        """ Runs the trials and returns the results of all of them (including earlier runs).
+
+        :param trials   -- list of parameter dicts
+        :param progress -- optional function called with each new result dict
+
+        :return: returns a list of result dicts with 'name', 'params', 'task_id',
+                 'status', 'model_id', 'metrics' and 'seconds'"""
+
+        done, submitted = self._loadResults()
+        todo = [(f"{self.namePrefix}-{i:03d}", trial) for i, trial in enumerate(trials, 1)]
+        for name, trial in todo:
+            earlier = done.get(name) or submitted.get(name)
+            if earlier is not None and earlier.get("params") != trial:
+                raise ValueError(f"'{self.resultsFile}' has different parameters for trial '{name}'; "
+                                 f"use a new results file or name prefix for a different sweep")
+        results = list(done.values())
+
+        # Tasks started by an earlier run are waited for, not submitted again
+        running = {}
+        for name, trial in todo:
+            if name not in done and name in submitted:
+                record = submitted[name]
+                running[record["task_id"]] = (name, trial, record.get("started", time.time()))
+        todo = [(name, trial) for name, trial in todo if name not in done and name not in submitted]
+        logger.info(f"sweep: {len(todo)} trials to run, {len(done)} already done, "
+                    f"{len(running)} still running, {self.maxRunning} at a time")
+
+        # One wait, and so one event subscription, serves the whole sweep; tasks are
+        # added to 'watched' as they start and removed from it by the wait as they finish
+        watched = set(running)
+        waiter = None
+        try:
+            while todo or running:
+                while todo and len(running) < self.maxRunning:
+                    name, trial = todo[0]
+                    taskId = self._submit(name, trial)
+                    if taskId is None:
+                        if running:
+                            # Most likely out of resources; retry when a task finishes
+                            break
+                        result = self._result(name, trial, None, "submit_failed", None, time.time())
+                        result["error"] = (self.server.server.last_failure
+                                           or f"status={self.server.status_code()}; {self.server.json()}")
+                        self._record(result, results, progress)
+                        todo.pop(0)
+                        continue
+                    todo.pop(0)
+                    started = time.time()
+                    running[taskId] = (name, trial, started)
+                    watched.add(taskId)
+                    self._write({"name": name, "params": trial, "task_id": taskId, "status": "submitted",
+                                 "started": started})
+
+                if not running:
+                    continue
+                if waiter is None:
+                    waiter = self.server.dl_tasks.wait(watched, useEvents=self.useEvents,
+                                                       pollInterval=min(5.0, self.pollInterval),
+                                                       maxPollInterval=self.pollInterval)
+                # Take one finished task at a time, so its slot is filled right away
+                taskId, task = next(waiter)
+                name, trial, started = running.pop(taskId)
+                status = task.get("status", "unknown") if task is not None else "unknown"
+                self._record(self._result(name, trial, taskId, status, task, started), results, progress)
+        finally:
+            if waiter is not None:
+                waiter.close()
+        return results
+
+    def _capacity(self, maxRunning):
+        gpus = None
+        info = self.server.system.info()
+        if self.server.rsp_ok():
+            gpus = gpuCapacity(info)
+        if gpus is None:
+            logger.info("sweep: number of GPUs not reported by the server")
+            return max(1, maxRunning or 1)
+        if gpus == 0:
+            logger.warning("sweep: the server reports no GPUs; running one trial at a time")
+            gpus = 1
+        return max(1, min(gpus, maxRunning) if maxRunning else gpus)
+
+    def _submit(self, name, trial):
+        params = dict(self.baseParams)
+        params.update(trial)
+        kwargs = {key: params.pop(key) for key in TASK_PARAMS if key in params}
+        kwargs["strategy"] = params
+        kwargs["action"] = _ACTIONS.get(self.usage, "create")
+        if self.usage == "cod" and kwargs.get("nn_arch") is None:
+            kwargs["nn_arch"] = "frcnn"
+
+        self.server.dl_tasks.create(name, self.dsid, self.usage, **kwargs)
+        if not self.server.rsp_ok():
+            logger.debug(f"sweep: failed to start '{name}'; status={self.server.status_code()}")
+            return None
+        rsp = self.server.json() or {}
+        return rsp.get("task_id") or rsp.get("_id")
+
+    def _result(self, name, trial, taskId, status, task, started):
+        result = {"name": name, "params": trial, "task_id": taskId, "status": status,
+                  "model_id": None, "metrics": {}, "seconds": round(time.time() - started, 1)}
+        if str(status).lower() in _SUCCEEDED:
+            model = self._trainedModel(name, task)
+            if model is not None:
+                result["model_id"] = model.get("_id")
+                result["metrics"] = {key: model[key] for key in METRIC_FIELDS
+                                     if isinstance(model.get(key), (int, float))}
+        return result
+
+    def _trainedModel(self, name, task):
+        """ Finds the trained model produced by a task, by id if the task has one, else by name."""
+
+        for key in ("trained_model_id", "model_id"):
+            if task and task.get(key):
+                model = self.server.trained_models.show(task[key])
+                if self.server.rsp_ok():
+                    return model
+        models = self.server.trained_models.report()
+        if self.server.rsp_ok() and isinstance(models, list):
+            for model in models:
+                if model.get("name") == name and model.get("dataset_id", self.dsid) == self.dsid:
+                    return model
+        return None
+
+    def _record(self, result, results, progress):
+        results.append(result)
+        self._write(result)
+        if progress is not None:
+            progress(result)
+
+    def _write(self, record):
+        if self.resultsFile is not None:
+            with open(self.resultsFile, "a") as handle:
+                handle.write(json.dumps(record) + "\n")
+
+    def _loadResults(self):
+        """ Reads the results file.
+
+        :return: returns '(done, submitted)' dicts keyed by trial name; 'submitted'
+                 holds the tasks that were started but have no result yet"""
+
+        done = {}
+        submitted = {}
+        if self.resultsFile is None:
+            return done, submitted
+        try:
+            with open(self.resultsFile) as handle:
+                for line in handle:
+                    if line.strip():
+                        result = json.loads(line)
+                        if result.get("status") == "submitted":
+                            submitted[result["name"]] = result
+                        elif result.get("status") != "submit_failed":
+                            done[result["name"]] = result
+        except FileNotFoundError:
+            pass
+        return done, {name: record for name, record in submitted.items() if name not in done}
@@ -0,0 +1,251 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Local video pre-processing.
+
+Long videos are decoded locally, sampled down to the frames of interest and
+JPEG encoded in memory. The sampled frames can then be inferred or uploaded
+without sending the whole video to the server and without temporary files.
+
+Example:
+    sampler = FrameSampler(interval=0.5, sceneThreshold=12)
+    frames = FramePipeline(["line1.mp4", "line2.mp4"], sampler)
+    for frame, result in inferFrames(server, model_id, frames):
+        ...
+"""
+
+import os
+import queue
+import threading
+import logging as logger
+from collections import namedtuple
+
+import cv2 as cv
+import numpy as np
+
+from vapi.concurrency import putUnlessStopped
+
+# One sampled frame. 'data' holds the JPEG encoded frame and 'name' is a file
+# name for it derived from the video name and frame index.
+Frame = namedtuple("Frame", ["video", "index", "timestamp", "name", "data"])
+
+
+class VideoError(Exception):
+    """ Raised by a FramePipeline when a video cannot be decoded."""
+
+
+class FrameSampler:
+    """ Selects which frames of a video are kept.
+
+    Frames are first thinned by 'stride' and/or 'interval' (skipped frames are
+    grabbed but not decoded). If 'sceneThreshold' is set, a candidate is only
+    kept when it differs enough from the last kept frame."""
+
+    def __init__(self, stride=1, interval=None, sceneThreshold=None, jpegQuality=90, maxFrames=None):
+        """
+        :param stride   -- keep every 'stride'-th frame
+        :param interval -- minimum number of seconds between kept frames
+        :param sceneThreshold -- minimum mean absolute difference (0-255) of a
+                        downscaled grayscale frame from the last kept frame
+        :param jpegQuality -- JPEG quality (1-100) of the encoded frames
+        :param maxFrames -- optional limit on the number of frames kept per video"""
+
+        self.stride = max(int(stride), 1)
+        self.interval = float(interval) if interval is not None else None
+        self.sceneThreshold = float(sceneThreshold) if sceneThreshold is not None else None
+        self.jpegQuality = min(max(int(jpegQuality), 1), 100)
+        self.maxFrames = maxFrames
+
+    def frames(self, videoPath):
+        """ Generator yielding the sampled frames of one video as 'Frame' tuples."""
+
+        cap = cv.VideoCapture(videoPath)
+        if not cap.isOpened():
+            logger.warning(f"could not open video '{videoPath}'")
+            return
+        try:
+            fps = cap.get(cv.CAP_PROP_FPS) or 0.0
+            step = self.stride
+            if self.interval is not None and fps > 0:
+                step = max(step, int(round(self.interval * fps)))
+            base = os.path.splitext(os.path.basename(videoPath))[0]
+            encodeParams = [int(cv.IMWRITE_JPEG_QUALITY), self.jpegQuality]
+
+            lastSignature = None
+            kept = 0
+            index = -1
+            while self.maxFrames is None or kept < self.maxFrames:
+                # Grab without decoding up to the next candidate frame
+                if not cap.grab():
+                    break
+                index += 1
+                if index % step != 0:
+                    continue
+                ok, image = cap.retrieve()
+                if not ok:
+                    break
+
+                if self.sceneThreshold is not None:
+                    signature = _signature(image)
+                    if lastSignature is not None and \
+                       cv.norm(signature, lastSignature, cv.NORM_L1) / signature.size < self.sceneThreshold:
+                        continue
+                    lastSignature = signature
+
+                ok, jpeg = cv.imencode(".jpg", image, encodeParams)
+                if not ok:
+                    logger.warning(f"could not encode frame {index} of '{videoPath}'")
+                    continue
+                timestamp = index / fps if fps > 0 else None
+                kept += 1
+                yield Frame(videoPath, index, timestamp, f"{base}_f{index:07d}.jpg", jpeg.tobytes())
+        finally:
+            cap.release()
+
+
+class FramePipeline:
+    """ Iterable of sampled frames from many videos.
+
+    Videos are decoded by a pool of threads (OpenCV releases the GIL while
+    decoding and encoding). Frames are handed to the consumer through a bounded
+    queue, so at most 'queueSize' encoded frames are held in memory no matter
+    how far the decoders are ahead. Frames of different videos are interleaved.
+    If decoding fails, VideoError is raised to the consumer and the decoders stop."""
+
+    _done = object()
+
+    def __init__(self, videos, sampler=None, workers=2, queueSize=64):
+        """
+        :param videos  -- list of video file paths
+        :param sampler -- FrameSampler selecting the frames. Default keeps every frame.
+        :param workers -- number of videos decoded concurrently
+        :param queueSize -- maximum number of encoded frames waiting to be consumed"""
+
+        self.videos = list(videos)
+        self.sampler = sampler if sampler is not None else FrameSampler()
+        self.workers = max(1, min(int(workers), len(self.videos) or 1))
+        self.queueSize = queueSize
+
+    def __iter__(self):
+        frames = queue.Queue(maxsize=self.queueSize)
+        videos = queue.Queue()
+        for video in self.videos:
+            videos.put(video)
+        stop = threading.Event()
+
+        def decode():
+            video = None
+            try:
+                while not stop.is_set():
+                    try:
+                        video = videos.get_nowait()
+                    except queue.Empty:
+                        break
+                    for frame in self.sampler.frames(video):
+                        if not putUnlessStopped(frames, frame, stop):
+                            return
+            except Exception as e:
+                # Handed to the consumer, which raises it
+                error = VideoError(f"failed to decode '{video}'; {e}")
+                error.__cause__ = e
+                putUnlessStopped(frames, error, stop)
+            finally:
+                putUnlessStopped(frames, self._done, stop)
+
+        threads = [threading.Thread(target=decode, daemon=True) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            running = len(threads)
+            while running > 0:
+                frame = frames.get()
+                if frame is self._done:
+                    running -= 1
+                elif isinstance(frame, VideoError):
+                    raise frame
+                else:
+                    yield frame
+        finally:
+            # Unblock decoders if the consumer stops early
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+
+def inferFrames(server, model_id, frames, workers=4, **kwargs):
+    """ Infers sampled frames concurrently with 'DeployedModels.infer_many'.
+
+    :param server   -- vapi server connection (see 'vapi.connect_to_server')
+    :param model_id -- id of the deployed model
+    :param frames   -- iterable of 'Frame' tuples (e.g. a FramePipeline)
+    :param workers  -- number of concurrent inference requests
+    :param kwargs   -- named inference parameters (see 'DeployedModels.infer')
+
+    :return: generator of '(frame, result)' tuples; 'result' is None on failure"""
+
+    inFlight = {}
+
+    def items():
+        for frame in frames:
+            item = (frame.name, frame.data)
+            inFlight[id(item)] = (item, frame)
+            yield item
+
+    for item, result in server.deployed_models.infer_many(model_id, items(), workers=workers, **kwargs):
+        yield inFlight.pop(id(item))[1], result
+
+
+def uploadFrames(server, dsid, frames, batchSize=20):
+    """ Uploads sampled frames to a dataset in batches of 'batchSize' frames.
+
+    :return: returns '(uploaded, failed)' frame counts"""
+
+    uploaded = 0
+    failed = 0
+    batch = []
+    for frame in frames:
+        batch.append((frame.name, frame.data))
+        if len(batch) >= batchSize:
+            ok = _uploadBatch(server, dsid, batch)
+            uploaded += ok
+            failed += len(batch) - ok
+            batch = []
+    if batch:
+        ok = _uploadBatch(server, dsid, batch)
+        uploaded += ok
+        failed += len(batch) - ok
+    return uploaded, failed
+
+
+def _uploadBatch(server, dsid, batch):
+    rsp = server.files.upload(dsid, batch)
+    try:
+        results = server.json()["resultList"]
+        return sum(1 for x in results if x.get("result") == "success")
+    except (TypeError, KeyError):
+        logger.warning(f"upload of {len(batch)} frames failed; status={server.status_code()}")
+        return len(batch) if rsp is not None else 0
+
+
+def _signature(image):
+    """ Small grayscale thumbnail used for scene change detection."""
+
+    gray = cv.cvtColor(image, cv.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    return cv.resize(gray, (64, 36), interpolation=cv.INTER_AREA).astype(np.int16)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+import json
+import logging as logger
+import os
+import sys
+import vapi_cli.cli_utils as cli_utils
+from vapi_cli.cli_utils import reportApiError
+from vapi.backup import MANIFEST, BackupExporter, loadManifest, verifyManifest
+
+# All of Vision Tools requires python 3.6 due to format string
+# Make the check in a common location
+if sys.hexversion < 0x03060000:
+    sys.exit("Python 3.6 or newer is required to run this program.")
+
+server = None
+
+
+# ---  Export Operation  ---------------------------------------------
+export_usage = """
+Usage:  backup export --output=<directory> [--dsid=<dataset_id>...] [--modelid=<model_id>...]
+             [--alldatasets] [--allmodels] [--workers=<n>] [--bandwidth=<mb_per_second>]
+             [--force] [--raw]
+
+Where:
+   --output    Required directory into which the exports and 'manifest.json'
+               are written.
+   --dsid      Optional dataset to export. Can be given more than once.
+   --modelid   Optional trained model to export. Can be given more than once.
+   --alldatasets  Optional flag to export every dataset.
+   --allmodels    Optional flag to export every trained model.
+   --workers   Optional number of concurrent exports. The default is 4.
+   --bandwidth Optional limit of the total download rate in megabytes per second.
+   --force     Optional flag to export artifacts even if they did not change.
+   --raw       Optional flag to include raw metadata in dataset exports.
+
+Exports datasets and trained models concurrently. The SHA-256 of each export
+is computed while it is saved and recorded, with its size, in the manifest.
+Artifacts whose server side modification time did not change since they were
+last exported into the directory are skipped. At least one of the dataset or
+model options is required."""
+
+
+def export(params):
+    """Handles the 'export' operation to back up datasets and trained models"""
+
+    records = []
+    if params.get("--alldatasets"):
+        records += [("dataset", ds) for ds in _list(server.datasets.report(), "datasets")]
+    else:
+        records += [("dataset", _show(server.datasets.show, dsid, "dataset")) for dsid in params.get("--dsid") or []]
+    if params.get("--allmodels"):
+        records += [("model", m) for m in _list(server.trained_models.report(), "trained models")]
+    else:
+        records += [("model", _show(server.trained_models.show, mid, "trained model"))
+                    for mid in params.get("--modelid") or []]
+    if not records and not (params.get("--alldatasets") or params.get("--allmodels")):
+        print("ERROR: no datasets or trained models to export.", file=sys.stderr)
+        print(export_usage, file=sys.stderr)
+        exit(1)
+
+    bandwidth = params.get("--bandwidth")
+    exporter = BackupExporter(server, params["--output"], workers=int(params.get("--workers") or 4),
+                              bytesPerSecond=float(bandwidth) * 1e6 if bandwidth else None,
+                              force=params.get("--force"), rawDatasets=params.get("--raw"))
+
+    def progress(result):
+        if not cli_utils.json_only:
+            if result["status"] == "exported":
+                detail = f"{result['bytes'] / 1e6:.1f} MB in {result['seconds']}s"
+            else:
+                detail = result["error"] or ""
+            print(f"{result['key']}\t{result['status']}\t{detail}", flush=True)
+
+    results = exporter.run(records, progress=progress)
+    failed = [r for r in results if r["status"] == "failed"]
+    if cli_utils.json_only:
+        print(json.dumps(results, indent=2))
+    else:
+        exported = [r for r in results if r["status"] == "exported"]
+        print(f"{len(exported)} exported ({sum(r['bytes'] for r in exported) / 1e6:.1f} MB), "
+              f"{len(results) - len(exported) - len(failed)} unchanged, {len(failed)} failed")
+    if failed:
+        exit(2)
+
+
+def _list(items, what):
+    if items is None:
+        reportApiError(server, f"Failure attempting to list {what}")
+    return items
+
+
+def _show(showFn, id, what):
+    record = showFn(id)
+    if record is None:
+        reportApiError(server, f"Failure attempting to get {what} '{id}'")
+    return record
+
+
+# ---  Verify Operation  ---------------------------------------------
+verify_usage = """
+Usage:  backup verify --output=<directory>
+
+Where:
+   --output    Required backup directory containing 'manifest.json'.
+
+Re-computes the SHA-256 of every file in the manifest and reports files that
+are missing or do not match. Does not access the server."""
+
+
+def verify(params):
+    """Handles the 'verify' operation to check a backup directory against its manifest"""
+
+    directory = params["--output"]
+    if not os.path.exists(os.path.join(directory, MANIFEST)):
+        print(f"ERROR: '{directory}' does not contain a backup manifest.", file=sys.stderr)
+        exit(1)
+    manifest = loadManifest(directory)
+    problems = verifyManifest(directory, manifest)
+    if cli_utils.json_only:
+        print(json.dumps([{"key": key, "problem": problem} for key, problem in problems], indent=2))
+    else:
+        for key, problem in problems:
+            print(f"{key}\t{problem}")
+        print(f"{len(manifest['artifacts']) - len(problems)} of {len(manifest['artifacts'])} artifacts verified")
+    if problems:
+        exit(2)
+
+
+cmd_usage = f"""
+Usage:  backup {cli_utils.common_cmd_flags} <operation> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+
+   <operation> is required and must be one of:
+      export  -- export datasets and trained models with a manifest of digests
+      verify  -- check the files of a backup against its manifest
+
+Use 'backup <operation> --help' for more information on a specific command."""
+
+usage_stmt = {
+    "usage": cmd_usage,
+    "export": export_usage,
+    "verify": verify_usage
+}
+
+operation_map = {
+    "export": export,
+    "verify": verify
+}
+
+
+def main(params, cmd_flags=None):
+    global server
+
+    args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags,
+                                     requireServer=("export",))
+    if args is not None:
+        # Only 'export' talks to the server
+        if args.operation is export:
+            try:
+                server = cli_utils.connect_to_server()
+            except Exception as e:
+                print("Error: Failed to setup server.", file=sys.stderr)
+                logger.debug(e)
+                return 1
+
+        args.operation(args.op_params)
+
+
+if __name__ == "__main__":
+    main(None)
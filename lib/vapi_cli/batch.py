@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+import importlib
+import io
+import json
+import logging as logger
+import shlex
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import vapi_cli.cli_utils as cli_utils
+
+# All of Vision Tools requires python 3.6 due to format string
+# Make the check in a common location
+if sys.hexversion < 0x03060000:
+    sys.exit("Python 3.6 or newer is required to run this program.")
+
+# Flags of the 'batch' command, passed on to every command it runs
+batch_flags = {}
+
+# ---  Run Operation  ------------------------------------------------
+run_usage = """
+Usage:  batch run [--file=<path>] [--workers=<n>] [--stoponerror]
+
+Where:
+   --file        Optional file of commands. Commands are read from STDIN if
+                 the file is not given or is '-'.
+   --workers     Optional number of commands run concurrently. The default is 1.
+   --stoponerror Optional flag to stop starting commands after one fails.
+
+Runs many 'vision' commands in one process over one pooled server connection,
+avoiding the interpreter start, imports and new TLS connection of each
+separate 'vision' call. Each input line is either a command line without the
+leading 'vision' (e.g. 'files show --dsid=X --fileid=Y') or a JSON object
+such as '{"id": "any", "args": ["files", "show", "--dsid=X", "--fileid=Y"]}'.
+'args' may also be a command line string. Blank lines and lines starting with
+'#' are skipped. The global flags (server, token, log level) of the 'batch'
+command apply to every command, and every command produces JSON output.
+
+One JSON object is printed per command, in input order, with the input 'line'
+number, the 'id' (if given), the 'command', its 'exit_code', its 'output'
+(parsed as JSON when possible), any 'error' text and the elapsed 'seconds'.
+The exit code is 2 if any command failed."""
+
+
+class ThreadOutput(io.TextIOBase):
+    """ Text stream that sends writes to a per-thread capture buffer, if the
+    thread has one, and otherwise to the original stream."""
+
+    def __init__(self, default):
+        self.default = default
+        self.local = threading.local()
+
+    def capture(self, buffer):
+        self.local.buffer = buffer
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer if buffer is not None else self.default).write(text)
+
+    def flush(self):
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is None:
+            self.default.flush()
+
+    def writable(self):
+        return True
+
+
+def run(params):
+    """Handles the 'run' operation to execute a batch of commands"""
+
+    workers = int(params.get("--workers") or 1)
+    path = params.get("--file")
+    try:
+        source = sys.stdin if path in (None, "-") else open(path)
+    except OSError as e:
+        print(f"ERROR: cannot read '{path}'; {e}", file=sys.stderr)
+        exit(1)
+
+    try:
+        cli_utils.shared_server = cli_utils.connect_to_server()
+    except Exception as e:
+        print("Error: Failed to setup server.", file=sys.stderr)
+        logger.debug(e)
+        exit(1)
+    cli_utils.shared_server.server.poolSize = max(cli_utils.shared_server.server.poolSize, workers)
+
+    # The builtin 'exit()' used by the operations closes 'sys.stdin'; they get a
+    # stand-in so that the commands can still be read from STDIN
+    stdin, stdout, stderr = sys.stdin, sys.stdout, sys.stderr
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(), ThreadOutput(stdout), ThreadOutput(stderr)
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            stop = False
+            # Stopping on errors is only prompt if few commands are queued ahead
+            window = workers if params.get("--stoponerror") else 2 * workers
+            for number, line in enumerate(source, start=1):
+                if stop:
+                    break
+                command = parse_command(line)
+                if command is None:
+                    continue
+                pending.append(pool.submit(run_command, number, *command))
+                # Results are printed in input order with a bounded number in flight
+                while pending and (pending[0].done() or len(pending) >= window):
+                    result = pending.popleft().result()
+                    failed += result["exit_code"] != 0
+                    stop = stop or (failed and params.get("--stoponerror"))
+                    print(json.dumps(result), file=stdout, flush=True)
+            while pending:
+                result = pending.popleft().result()
+                failed += result["exit_code"] != 0
+                print(json.dumps(result), file=stdout, flush=True)
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = stdin, stdout, stderr
+        if source is not stdin:
+            source.close()
+    if failed:
+        exit(2)
+
+
+def parse_command(line):
+    """ Parses one input line.
+
+    :returns '(id, args, error)', or None for blank and comment lines. 'error' is
+             None unless the line cannot be parsed"""
+
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    id = None
+    try:
+        if line.startswith("{"):
+            op = json.loads(line)
+            id = op.get("id")
+            args = op["args"]
+            args = shlex.split(args) if isinstance(args, str) else [str(a) for a in args]
+        else:
+            args = shlex.split(line)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        return id, line, f"cannot parse command; {e!r}"
+    if args and args[0] == "vision":
+        args = args[1:]
+    return id, args, None
+
+
+def run_command(number, id, args, error=None):
+    """ Runs one command with its output captured.
+
+    :returns the result dict printed for the command"""
+
+    out, err = io.StringIO(), io.StringIO()
+    sys.stdout.capture(out)
+    sys.stderr.capture(err)
+    start = time.time()
+    try:
+        code = execute(args) if error is None else 1
+        if error is not None:
+            print(f"ERROR: {error}", file=sys.stderr)
+    finally:
+        sys.stdout.capture(None)
+        sys.stderr.capture(None)
+
+    result = {"line": number}
+    if id is not None:
+        result["id"] = id
+    text = out.getvalue()
+    try:
+        output = json.loads(text) if text.strip() else None
+    except json.JSONDecodeError:
+        output = text
+    result.update({"command": args, "exit_code": code, "output": output, "error": err.getvalue() or None,
+                   "seconds": round(time.time() - start, 3)})
+    return result
+
+
+def execute(args):
+    """ Runs the 'vision' command in 'args' (without 'vision') in this process.
+
+    :returns the exit code of the command"""
+
+    matches = cli_utils.resolve_resource(args[0]) if args else []
+    if len(matches) != 1 or matches[0] in ("batch", "help"):
+        print(f"ERROR: Unknown resource -- {args[0] if args else ''}", file=sys.stderr)
+        return 1
+
+    # The operation's parser expects the flags of the 'vision' command it was called from
+    flags = dict(batch_flags)
+    flags["<resource>"] = args[0]
+    flags["<args>"] = list(args[1:]) or ["--help"]
+    try:
+        module = importlib.import_module(f"vapi_cli.{matches[0]}")
+        code = module.main(list(args[1:]) or ["--help"], cmd_flags=flags)
+    except SystemExit as e:
+        if isinstance(e.code, str):
+            print(e.code, file=sys.stderr)
+            return 1
+        return e.code or 0
+    except Exception as e:
+        logger.debug(f"batch: command {args} failed", exc_info=True)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    return code if isinstance(code, int) else 0
+
+
+cmd_usage = f"""
+Usage:  batch {cli_utils.common_cmd_flags} <operation> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+
+   <operation> is required and must be one of:
+      run  -- run the commands from a file or STDIN
+
+Use 'batch <operation> --help' for more information on a specific command."""
+
+usage_stmt = {
+    "usage": cmd_usage,
+    "run": run_usage
+}
+
+operation_map = {
+    "run": run
+}
+
+def main(params, cmd_flags=None):
+    global batch_flags
+
+    args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags)
+    if args is not None:
+        batch_flags = dict(cmd_flags or {})
+        batch_flags["--jsonoutput"] = True
+        args.operation(args.op_params)
+
+
+if __name__ == "__main__":
+    main(None)
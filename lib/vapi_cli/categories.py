@@ -20,7 +20,6 @@
 
 import logging as logger
 import sys
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -117,6 +116,7 @@ def delete(params):
 # ---  List/Report Operation  ----------------------------------------
 list_usage = f"""
 Usage:  categories list --dsid=<dataset_id> [--sort=<sort-string>] [--summary]
+                        {cli_utils.list_format_flags}
 
 Where:
    --dsid   Required parameter that identifies the dataset to which the
@@ -125,6 +125,7 @@ Where:
              Add " DESC" after a field name to change to a descending sort.
              If adding " DESC", the field list must be enclosed in quotes.
     --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 
 Generates a JSON list of categories matching the input criteria.
@@ -143,6 +144,11 @@ def report(params):
     expectedArgs = {'--sort': 'sortby'}
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.categories.report(dsid, **kwargs),
+                               "Failure attempting to list categories", summaryFields)
+        return
+
     rsp = server.categories.report(dsid, **kwargs)
 
     if rsp is None:
@@ -244,7 +250,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--catid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
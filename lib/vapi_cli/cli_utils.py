@@ -61,14 +61,102 @@ limit_skip_flag_descriptions = """   --limit        Optional parameter to limit
                   returning results. Limit and Skip can be used to page
                   through results"""
 
+list_format_flags = "[--format=<fmt>] [--fields=<field-list>]"
+list_format_flag_descriptions = """   --format       Optional output format; 'jsonl' (one JSON object per line),
+                  'csv' or 'tsv'. Items are written as they arrive from the
+                  server, so very long lists are not held in memory.
+   --fields       Optional comma separated list of fields to output with
+                  '--format'. Nested fields are named with dots (e.g.
+                  'bnd_box.xmin'). The default is the '--summary' fields if
+                  requested, else all fields of the first item."""
+
+bulk_flags = "--ids-from=<path> [--workers=<n>]"
+bulk_flag_descriptions = """   --ids-from     Path of a file of ids to process, one per line, or '-' to read
+                  them from STDIN. Lines can also be JSON objects (e.g. from
+                  'list --format jsonl'); the id is taken from '_id' or 'id'.
+   --workers      Optional number of concurrent requests with '--ids-from'.
+                  The default is 8."""
+
+frame_sampling_flags = "[--stride=<nmbr>] [--interval=<seconds>] [--scene=<threshold>] [--maxframes=<nmbr>] [--quality=<jpeg-quality>]"
+frame_sampling_flag_descriptions = """   --stride       Optional parameter to keep only every Nth frame of each video.
+                  The default is 1 (every frame).
+   --interval     Optional parameter giving the minimum number of seconds
+                  between kept frames.
+   --scene        Optional scene change threshold (0-255). A frame is only kept
+                  if its mean difference from the last kept frame is at least
+                  this large. Useful to skip frames where nothing changes.
+   --maxframes    Optional limit on the number of frames kept from each video.
+   --quality      Optional JPEG quality (1-100) of the sampled frames.
+                  The default is 90."""
+
 show_status_code = False
 show_httpdetail = False
 json_only = False
 host_name = None
 token = None
 
-
-def get_valid_input(usage, operation_map, id=None, argv=None, cmd_flags=None):
+# Server shared by all the operations of a 'vision batch' run; see 'connect_to_server'
+shared_server = None
+# Servers kept across commands by the 'vision daemon', keyed by server and token
+server_cache = None
+
+resource_map = {
+    "backup": "backup",
+    "batch": "batch",
+    "daemon": "daemon",
+    "categories": "categories",
+    "datasets": "datasets",
+    "deployed-models": "deployed-models",
+    "dltasks": "dltasks",
+    "files": "files",
+    "fkeys": "fkeys",
+    "fmetadata": "fmetadata",
+    "help": "help",
+    "mirror": "mirror",
+    "obj-labels": "object-labels",
+    "obj-tags": "object-tags",
+    "object-labels": "object-labels",
+    "object-tags": "object-tags",
+    "system": "system",
+    "trained-models": "trained-models",
+    "projects": "projects",
+    "replicate": "replicate",
+    "users": "users"
+}
+
+
+def resolve_resource(resource):
+    """ Gets the CLI module names matching a resource name or abbreviation.
+
+    :returns list of module names; exactly one if the resource is known or its
+             abbreviation is unique"""
+
+    if resource in resource_map:
+        return [resource_map[resource]]
+    return [resource_map[i] for i in resource_map.keys() if i.startswith(resource)]
+
+
+def connect_to_server():
+    """ Connects to the server given by the command flags or environment.
+
+    During a 'vision batch' run the batch's server is returned instead, so all
+    of its operations share one session and its pooled connections. In the
+    'vision daemon', servers are reused by later commands for the same server
+    and token."""
+
+    if shared_server is not None:
+        return shared_server
+    import vapi
+    if server_cache is None:
+        return vapi.connect_to_server(host_name, token)
+    key = (host_name, token) + tuple(os.getenv(v) for v in ("VAPI_BASE_URI", "VAPI_HOST", "VAPI_INSTANCE",
+                                                             "VAPI_TOKEN", "VAPI_LANGUAGE"))
+    if key not in server_cache:
+        server_cache[key] = vapi.connect_to_server(host_name, token)
+    return server_cache[key]
+
+
+def get_valid_input(usage, operation_map, id=None, argv=None, cmd_flags=None, requireServer=True):
     """ Processes input parameters and creates namespace for returned results.
 
     This function can be used with Vision Tools commands that have an 'operation'
@@ -87,6 +175,9 @@ def get_valid_input(usage, operation_map, id=None, argv=None, cmd_flags=None):
     :param  id -- optional parameter identifying the args flag to equate with id
     :param  argv -- argument array to process. If none, uses sys.argv
     :param  cmd_flags -- flags passed at the higher level command level (e.g. passed to 'vision')
+    :param  requireServer -- False if no operation talks to the default server, or the
+                   collection of operation names that do. The base URI is only
+                   required for those operations.
 
     :returns result object
                    """
@@ -150,7 +241,9 @@ def get_valid_input(usage, operation_map, id=None, argv=None, cmd_flags=None):
                 base_uri = os.getenv("VAPI_BASE_URI")
             if host_name is None:
                 host_name = os.getenv("VAPI_HOST")
-            if base_uri is None and host_name is None:
+            needsServer = requireServer is True or (bool(requireServer) and
+                                                    cmd_results["<operation>"] in requireServer)
+            if needsServer and base_uri is None and host_name is None:
                 print("ERROR: Missing 'Base URI' information.", file=sys.stderr)
                 print("       Either use '--uri' flag or export 'VAPI_BASE_URI' environment variable.\n",
                       file=sys.stderr)
@@ -240,6 +333,231 @@ def reportSuccess(server, msg=None, summaryFields=None):
         pass
 
 
+def reportItems(items, summaryFields=None):
+    """ Shows a list of items produced locally (i.e. not the json of the last server call).
+
+    Output follows 'reportSuccess'; tab separated 'summaryFields' and a count unless
+    in "scripting mode" or no summary fields are given, in which case the json is shown.
+
+    :param items  -- list of json objects
+    :param summaryFields -- list of fields to pull from the json objects."""
+    try:
+        if summaryFields is not None and not json_only:
+            for item in items:
+                print("\t".join(str(item.get(field, "")) for field in summaryFields))
+            print(f"{len(items)} items")
+        else:
+            print(json.dumps(items, indent=2))
+    except BrokenPipeError:
+        pass
+
+
+def reportStream(server, params, report, errorMsg, summaryFields=None):
+    """ Writes a list in the '--format' requested in 'params', item by item.
+
+    The response of 'report' is streamed; each item is written as soon as it is
+    decoded. CSV and TSV output starts with a header line.
+
+    :param server  -- the server object used to make the api call
+    :param params  -- operation flags containing '--format' and '--fields'
+    :param report  -- function without arguments that calls the resource's report method
+    :param errorMsg -- message shown if the request fails
+    :param summaryFields -- default fields if '--fields' is not given"""
+
+    from vapi.jsonstream import iterItems, JsonStreamError
+    from vapi.SseMonitor import iterChunks
+
+    fmt = params["--format"].lower()
+    if fmt not in ("jsonl", "csv", "tsv"):
+        print(f"ERROR: unsupported format '{params['--format']}'; use 'jsonl', 'csv' or 'tsv'", file=sys.stderr)
+        exit(1)
+    fields = params.get("--fields")
+    fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else summaryFields
+
+    with server.server.streaming():
+        report()
+    if not server.rsp_ok():
+        reportApiError(server, errorMsg)
+
+    if show_status_code:
+        print(f'{{"status_code": {server.status_code()}}}', file=sys.stderr)
+    rsp = server.server.raw_rsp()
+    try:
+        writeItems(iterItems(iterChunks(rsp, blockSize=65536)), fmt, fields, sys.stdout)
+    except JsonStreamError as e:
+        print(f"ERROR: {errorMsg}; {e}", file=sys.stderr)
+        exit(2)
+    except BrokenPipeError:
+        pass
+    finally:
+        rsp.close()
+    if show_httpdetail:
+        print_http_detail(server)
+
+
+def writeItems(items, fmt, fields, output):
+    """ Writes json objects to 'output' as 'jsonl', 'csv' or 'tsv'.
+
+    :param items  -- iterable of json objects
+    :param fmt    -- output format
+    :param fields -- list of (dotted) field names to write. If None, 'jsonl' writes
+                     whole items and 'csv'/'tsv' use the fields of the first item.
+    :param output -- text file to write to
+
+    :return: returns the number of items written"""
+
+    import csv
+
+    writer = None
+    count = 0
+    for item in items:
+        if not isinstance(item, dict):
+            item = {"value": item}
+        if fmt == "jsonl":
+            row = item if fields is None else {field: _fieldValue(item, field) for field in fields}
+            output.write(json.dumps(row, separators=(",", ":")) + "\n")
+        else:
+            if writer is None:
+                fields = fields if fields is not None else list(item.keys())
+                writer = csv.writer(output, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n")
+                writer.writerow(fields)
+            writer.writerow([_cellText(_fieldValue(item, field)) for field in fields])
+        count += 1
+    if writer is None and fmt != "jsonl" and fields is not None:
+        csv.writer(output, delimiter="\t" if fmt == "tsv" else ",", lineterminator="\n").writerow(fields)
+    output.flush()
+    return count
+
+
+def _fieldValue(item, field):
+    value = item
+    for name in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(name)
+    return value
+
+
+def _cellText(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"))
+    return str(value)
+
+
+def readRecords(path, idFields=("_id", "id")):
+    """ Generator reading ids from a file, or STDIN if 'path' is '-'.
+
+    Each non-empty line is either an id or a JSON object, as written by
+    'list --format jsonl'. Lines are read as they are needed, so the input
+    can be arbitrarily long.
+
+    :param path     -- path of the file or '-'
+    :param idFields -- fields of a JSON object that hold the id, in order of preference
+
+    :return: generator of '(id, record)' tuples; 'record' is the JSON object or None"""
+
+    try:
+        source = sys.stdin if path == "-" else open(path)
+    except OSError as e:
+        print(f"ERROR: cannot read ids from '{path}'; {e}", file=sys.stderr)
+        exit(1)
+    try:
+        for lineNumber, line in enumerate(source, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith("{"):
+                yield line, None
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                print(f"ERROR: line {lineNumber} of '{path}' is not valid JSON; {e}", file=sys.stderr)
+                exit(1)
+            ident = next((record[f] for f in idFields if record.get(f)), None)
+            if ident is None:
+                print(f"ERROR: line {lineNumber} of '{path}' has no {' or '.join(idFields)} field", file=sys.stderr)
+                exit(1)
+            yield str(ident), record
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def runBulk(server, records, operation, workers, description):
+    """ Runs 'operation' for every record concurrently and reports the results in aggregate.
+
+    Failures are listed on STDERR as they happen. At most '2 * workers' records
+    are read ahead, so 'records' can be a generator over STDIN. The requests share
+    the server's pooled connections. Exits with 2 if any operation failed.
+
+    :param server    -- the server object used for the api calls
+    :param records   -- iterable of '(id, record)' tuples (see 'readRecords')
+    :param operation -- function called with '(id, record)'; it returns True if the
+                        api call succeeded
+    :param workers   -- number of concurrent requests
+    :param description -- past tense description of the operation (e.g. "Deleted files")"""
+
+    from concurrent.futures import ThreadPoolExecutor
+    from vapi.concurrency import boundedMap
+
+    # Each worker should get its own pooled connection
+    server.server.poolSize = max(server.server.poolSize, workers)
+    counts = {"succeeded": 0, "failed": 0}
+    failures = []
+
+    def runOne(ident, record):
+        try:
+            if operation(ident, record):
+                return ident, None
+            error = server.server.last_failure or f"status={server.status_code()}; {server.json()}"
+        except Exception as e:
+            error = str(e)
+        logger.debug(f"operation on '{ident}' failed; {error}")
+        return ident, error
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for ident, error in boundedMap(pool, lambda item: runOne(*item), records, 2 * workers):
+            if error is None:
+                counts["succeeded"] += 1
+            else:
+                counts["failed"] += 1
+                failures.append({"id": ident, "error": error})
+                if not json_only:
+                    print(f"ERROR: {ident}: {error}", file=sys.stderr)
+
+    try:
+        if json_only:
+            print(json.dumps(dict(counts, failures=failures), indent=2))
+        else:
+            total = counts["succeeded"] + counts["failed"]
+            print(f"{description}: {counts['succeeded']} of {total} succeeded, {counts['failed']} failed")
+    except BrokenPipeError:
+        pass
+    if counts["failed"] > 0:
+        exit(2)
+
+
+def uploadProgress(label):
+    """ Returns a progress callback for 'server.upload' that shows the percentage sent
+    on STDERR, or None in "scripting mode". The line is only redrawn when the
+    percentage changes."""
+
+    if json_only:
+        return None
+    shown = [-1]
+
+    def progress(sent, total):
+        percent = sent * 100 // total if total else 100
+        if percent != shown[0]:
+            shown[0] = percent
+            print(f"\r{label}: {percent}% of {total / 1e6:.1f} MB", end="\n" if sent >= total else "",
+                  file=sys.stderr, flush=True)
+    return progress
+
+
 def translate_flags(argmap, args):
     """ Translates flags in 'args' using 'argmap' for the new value.
     If 'args' key is not found in 'argmap', it is ignored.
@@ -291,6 +609,19 @@ def set_output_controls(params):
     show_status_code = "VAPI_SHOW_STATUS_CODE" in os.environ
 
 
+def getFrameSampler(params):
+    """ Builds a video FrameSampler from the 'frame_sampling_flags' in 'params'."""
+
+    from vapi.video import FrameSampler
+
+    maxframes = params.get("--maxframes")
+    return FrameSampler(stride=params.get("--stride") or 1,
+                        interval=params.get("--interval"),
+                        sceneThreshold=params.get("--scene"),
+                        jpegQuality=params.get("--quality") or 90,
+                        maxFrames=int(maxframes) if maxframes is not None else None)
+
+
 def print_http_detail(server):
     httpstatus = server.status_code()
     httpreq = server.http_request_str()
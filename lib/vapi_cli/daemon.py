@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+import importlib
+import io
+import json
+import logging as logger
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+import traceback
+import vapi_cli.cli_utils as cli_utils
+from vapi_cli import daemonclient
+
+# All of Vision Tools requires python 3.6 due to format string
+# Make the check in a common location
+if sys.hexversion < 0x03060000:
+    sys.exit("Python 3.6 or newer is required to run this program.")
+
+
+daemon_description = """
+While a daemon is running, 'vision' forwards each command to it over a Unix
+socket ('$VAPI_DAEMON_SOCKET', or 'daemon.sock' in the cache directory) and
+streams the output back. The daemon has the CLI modules imported and keeps
+pooled connections per server and token, so a command costs little more
+than its HTTP requests. Commands run one at a time, in the caller's working
+directory and with the caller's 'VAPI_*' environment. 'batch' commands and
+commands reading STDIN ('-') always run in the calling process, as do all
+commands when the daemon is not running or 'VAPI_NO_DAEMON' is set.
+Responses are not cached; every command sees the server's current state."""
+
+
+# ---  Start Operation  ----------------------------------------------
+start_usage = f"""
+Usage:  daemon start [--idle=<seconds>]
+
+Where:
+   --idle   Optional number of idle seconds after which the daemon exits.
+            The default is 3600. Use 0 to never exit.
+
+Starts a daemon in the background.
+{daemon_description}"""
+
+
+def start(params):
+    """Handles the 'start' operation to run a daemon in the background"""
+
+    status = daemonclient.request({"control": "status"})
+    if status is not None:
+        report_status(status, "A daemon is already running")
+        return
+
+    path = daemonclient.socket_path()
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [daemonclient.LIB_DIR, env.get("PYTHONPATH")]))
+    command = [sys.executable, "-c", "import sys; from vapi_cli.vision import main; main(sys.argv[1:])",
+               "daemon", "serve", f"--idle={params.get('--idle') or 3600}"]
+    with open(path + ".log", "ab") as log:
+        subprocess.Popen(command, env=env, stdin=subprocess.DEVNULL, stdout=log, stderr=log,
+                         start_new_session=True, close_fds=True)
+
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        status = daemonclient.request({"control": "status"})
+        if status is not None:
+            report_status(status, "Started daemon")
+            return
+        time.sleep(0.1)
+    print(f"ERROR: the daemon did not start; see '{path}.log'.", file=sys.stderr)
+    exit(2)
+
+
+# ---  Serve Operation  ----------------------------------------------
+serve_usage = f"""
+Usage:  daemon serve [--idle=<seconds>]
+
+Where:
+   --idle   Optional number of idle seconds after which the daemon exits.
+            The default is 3600. Use 0 to never exit.
+
+Runs a daemon in the foreground (e.g. under a service manager).
+{daemon_description}"""
+
+
+def serve(params):
+    """Handles the 'serve' operation to run a daemon in the foreground"""
+
+    try:
+        Daemon(daemonclient.socket_path(), float(params.get("--idle") or 3600)).serve()
+    except OSError as e:
+        print(f"ERROR: cannot run the daemon; {e}", file=sys.stderr)
+        exit(2)
+
+
+# ---  Stop Operation  -----------------------------------------------
+stop_usage = """
+Usage:  daemon stop
+
+Stops the running daemon after its current command."""
+
+
+def stop(params):
+    """Handles the 'stop' operation"""
+
+    status = daemonclient.request({"control": "stop"})
+    if status is None:
+        print("ERROR: no daemon is running.", file=sys.stderr)
+        exit(1)
+    report_status(status, "Stopped daemon")
+
+
+# ---  Status Operation  ---------------------------------------------
+status_usage = """
+Usage:  daemon status
+
+Shows whether a daemon is running and how many commands it has run."""
+
+
+def status(params):
+    """Handles the 'status' operation"""
+
+    status = daemonclient.request({"control": "status"})
+    if status is None:
+        print("ERROR: no daemon is running.", file=sys.stderr)
+        exit(1)
+    report_status(status, "Daemon is running")
+
+
+def report_status(status, msg):
+    if cli_utils.json_only:
+        print(json.dumps(status, indent=2))
+    else:
+        print(f"{msg}; pid {status['pid']}, up {status['uptime']:.0f}s, {status['commands']} commands run, "
+              f"{status['servers']} servers connected, socket '{status['socket']}'")
+
+
+class SocketOutput(io.TextIOBase):
+    """ Text stream that sends each write to the client as a JSON line."""
+
+    def __init__(self, conn, kind):
+        self.conn = conn
+        self.kind = kind
+        self.broken = False
+
+    def write(self, text):
+        if text and not self.broken:
+            try:
+                self.conn.sendall(json.dumps({self.kind: text}).encode("utf-8") + b"\n")
+            except OSError:
+                # The client went away; the command still runs to completion
+                self.broken = True
+        return len(text)
+
+    def writable(self):
+        return True
+
+
+class Daemon:
+    """ Accepts commands on a Unix socket and runs them one at a time."""
+
+    def __init__(self, path, idle=3600):
+        """
+        :param path -- path of the Unix socket
+        :param idle -- seconds without commands after which the daemon exits; 0 for never"""
+
+        self.path = path
+        self.idle = idle
+        self.started = time.time()
+        self.lastActive = time.time()
+        self.commands = 0
+        self.stopping = threading.Event()
+        # CLI modules keep their state in globals (and use the process's working
+        # directory and environment), so commands cannot run concurrently
+        self.commandLock = threading.Lock()
+
+    def serve(self):
+        """ Runs until stopped or idle."""
+
+        if daemonclient.connect(self.path) is not None:
+            raise OSError(f"a daemon is already listening on '{self.path}'")
+        os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+        self.warmUp()
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        umask = os.umask(0o177)
+        try:
+            listener.bind(self.path)
+        finally:
+            os.umask(umask)
+        listener.listen(16)
+        listener.settimeout(1.0)
+        logger.info(f"vision daemon listening on '{self.path}'")
+        try:
+            while not self.stopping.is_set():
+                try:
+                    conn, _ = listener.accept()
+                except socket.timeout:
+                    if self.idle and not self.commandLock.locked() and time.time() - self.lastActive > self.idle:
+                        logger.info("vision daemon exiting after being idle")
+                        break
+                    continue
+                threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+            os.remove(self.path)
+
+    def warmUp(self):
+        """ Imports the CLI modules and 'requests' so that no command pays for them."""
+
+        cli_utils.server_cache = {}
+        for module in sorted(set(cli_utils.resource_map.values()) - {"help"}):
+            importlib.import_module(f"vapi_cli.{module}")
+        from vapi.server import requestsModule
+        requestsModule()
+
+    def handle(self, conn):
+        with conn:
+            try:
+                line = conn.makefile("rb").readline()
+                message = json.loads(line)
+            except (OSError, ValueError):
+                return
+            if "control" in message:
+                if message["control"] == "stop":
+                    self.stopping.set()
+                self.reply(conn, self.status())
+            elif message.get("lib") != daemonclient.LIB_DIR or self.isLocal(message.get("argv") or []):
+                self.reply(conn, {"fallback": True})
+            else:
+                with self.commandLock:
+                    code = self.run(conn, message)
+                    self.commands += 1
+                    self.lastActive = time.time()
+                self.reply(conn, {"exit": code})
+
+    def status(self):
+        return {"pid": os.getpid(), "uptime": time.time() - self.started, "commands": self.commands,
+                "servers": len(cli_utils.server_cache or {}), "socket": self.path, "lib": daemonclient.LIB_DIR}
+
+    def isLocal(self, argv):
+        """ True for commands that must run in the client (see 'daemonclient.forward')."""
+
+        from vapi_cli.docopt import docopt
+        from vapi_cli.vision import usage_stmt
+        try:
+            args = docopt(usage_stmt, options_first=True, argv=argv, default_help=False)
+        except SystemExit:
+            return False
+        resource = args["<resource>"] or ""
+        return daemonclient._isLocal(argv) or \
+            any(m in daemonclient.LOCAL_RESOURCES for m in cli_utils.resolve_resource(resource))
+
+    def run(self, conn, message):
+        """ Runs one command line the way 'cli/vision' would in the client's process.
+
+        :returns the exit code"""
+
+        from vapi_cli.vision import main
+
+        environ = dict(os.environ)
+        cwd = os.getcwd()
+        streams = sys.stdin, sys.stdout, sys.stderr
+        for key in [k for k in os.environ if k.startswith("VAPI_")]:
+            del os.environ[key]
+        os.environ.update(message["env"])
+        # Logging is configured by the command's '--log' flag, on the client's stream
+        root = logger.getLogger()
+        handlers, level = root.handlers, root.level
+        root.handlers = []
+        sys.stdin, sys.stdout, sys.stderr = io.StringIO(), SocketOutput(conn, "out"), SocketOutput(conn, "err")
+        code = 0
+        try:
+            os.chdir(message["cwd"])
+            main(message["argv"])
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=sys.stderr)
+                code = 1
+            else:
+                code = e.code or 0
+        except Exception:
+            traceback.print_exc(file=sys.stderr)
+            code = 1
+        finally:
+            sys.stdin, sys.stdout, sys.stderr = streams
+            root.handlers = handlers
+            root.setLevel(level)
+            os.chdir(cwd)
+            os.environ.clear()
+            os.environ.update(environ)
+        return code
+
+    @staticmethod
+    def reply(conn, message):
+        try:
+            conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+
+
+cmd_usage = f"""
+Usage:  daemon {cli_utils.common_cmd_flags} <operation> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+
+   <operation> is required and must be one of:
+      start   -- start a daemon in the background
+      serve   -- run a daemon in the foreground
+      status  -- show the state of the running daemon
+      stop    -- stop the running daemon
+
+Use 'daemon <operation> --help' for more information on a specific command."""
+
+usage_stmt = {
+    "usage": cmd_usage,
+    "start": start_usage,
+    "serve": serve_usage,
+    "status": status_usage,
+    "stop": stop_usage
+}
+
+operation_map = {
+    "start": start,
+    "serve": serve,
+    "status": status,
+    "stop": stop
+}
+
+
+def main(params, cmd_flags=None):
+    # Commands bring their own server information; the daemon itself needs none
+    args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags,
+                                     requireServer=False)
+    if args is not None:
+        args.operation(args.op_params)
+
+
+if __name__ == "__main__":
+    main(None)
@@ -0,0 +1,158 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Thin client of the 'vision daemon'.
+
+Kept to a few standard library imports: it runs before anything else in
+every 'vision' call and must cost next to nothing when no daemon is running.
+"""
+import json
+import os
+import socket
+import sys
+
+# Identifies this installation; a daemon started from other code refuses its commands
+LIB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands that read STDIN or manage the daemon always run in the calling process
+LOCAL_RESOURCES = ("batch", "daemon")
+
+# Global options of 'vision' (see 'cli_utils.common_cmd_flags', not imported to keep
+# this module cheap). A value of the first ones may be given as the next argument.
+VALUE_OPTIONS = ("--host", "--uri", "--token", "--log")
+FLAG_OPTIONS = ("--httpdetail", "--jsonoutput")
+
+
+def socket_path():
+    """ Returns the daemon socket path from '$VAPI_DAEMON_SOCKET', or 'daemon.sock'
+    in the cache root. (The cache root is computed as in 'vapi.inferencecache.cacheRoot',
+    which is not imported to keep this module cheap.)"""
+
+    path = os.getenv("VAPI_DAEMON_SOCKET")
+    if path is None:
+        cacheDir = os.getenv("VAPI_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "vision-tools")
+        path = os.path.join(cacheDir, "daemon.sock")
+    return path
+
+
+def connect(path=None, timeout=None):
+    """ Connects to the daemon.
+
+    :returns the connected socket, or None if no daemon is listening"""
+
+    path = path or socket_path()
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def request(message, path=None, timeout=5):
+    """ Sends a control message ('status' or 'stop') to the daemon.
+
+    :returns the daemon's reply, or None if no daemon is listening"""
+
+    sock = connect(path, timeout)
+    if sock is None:
+        return None
+    with sock:
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        line = sock.makefile("rb").readline()
+    return json.loads(line) if line else None
+
+
+def forward(argv):
+    """ Runs a 'vision' command line in the daemon, with this process's working
+    directory and 'VAPI_*' environment. Output is written as it arrives.
+
+    :returns the exit code, or None if the command must run in this process
+             (no daemon, daemon of another installation, or a local-only command)"""
+
+    if os.getenv("VAPI_NO_DAEMON") or not argv or _isLocal(argv):
+        return None
+    sock = connect()
+    if sock is None:
+        return None
+
+    message = {"argv": argv, "cwd": os.getcwd(), "lib": LIB_DIR,
+               "env": {k: v for k, v in os.environ.items() if k.startswith("VAPI_")}}
+    started = False
+    with sock:
+        for reply in _replies(sock, message):
+            if "fallback" in reply:
+                return None
+            started = True
+            if "out" in reply:
+                try:
+                    sys.stdout.write(reply["out"])
+                except BrokenPipeError:
+                    # The reader went away (e.g. '| head'); drop the rest of the output
+                    os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            elif "err" in reply:
+                sys.stderr.write(reply["err"])
+            elif "exit" in reply:
+                sys.stdout.flush()
+                return reply["exit"]
+    if not started:
+        return None
+    # The command may have had side effects, so it is not run again here
+    print("ERROR: the vision daemon stopped while running the command.", file=sys.stderr)
+    return 1
+
+
+def _replies(sock, message):
+    """ Sends the command and yields the daemon's replies until it closes the connection."""
+
+    try:
+        sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        for line in sock.makefile("rb"):
+            yield json.loads(line)
+    except (OSError, ValueError):
+        return
+
+
+def _resourceArg(argv):
+    """ Returns the resource of a 'vision' command line: the first argument that is
+    neither a global option nor the value of one. None if there is none."""
+
+    args = iter(argv)
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg
+        if "=" not in arg:
+            # docopt accepts unambiguous prefixes of long options
+            matches = [o for o in VALUE_OPTIONS + FLAG_OPTIONS if o.startswith(arg)]
+            if matches and all(m in VALUE_OPTIONS for m in matches):
+                next(args, None)
+    return None
+
+
+def _isLocal(argv):
+    resource = _resourceArg(argv)
+    if resource is not None and any(r.startswith(resource) for r in LOCAL_RESOURCES):
+        return True
+    # '-' (or '--flag=-') means STDIN, which is not forwarded
+    return any(a == "-" or a.endswith("=-") for a in argv)
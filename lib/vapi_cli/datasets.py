@@ -21,7 +21,6 @@
 import json
 import sys
 import logging as logger
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -132,9 +131,10 @@ def delete(params):
 
 
 # ---  List Operation  -----------------------------------------------
-list_usage = """
+list_usage = f"""
 Usage:
   datasets list [--pgid=<project-group-id>...] [--sort=<sort-string>] [--summary]
+                {cli_utils.list_format_flags}
 
 Where:
   --pgid   An optional parameter that identifies 1 or more project groups
@@ -144,6 +144,7 @@ Where:
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of datasets matching the input criteria."""
 
@@ -162,6 +163,11 @@ def report(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.datasets.report(**kwargs),
+                               "Failure attempting to list datasets", summaryFields)
+        return
+
     rsp = server.datasets.report(**kwargs)
 
     if rsp is None:
@@ -196,12 +202,15 @@ def show(params):
 # ---  Import Operation  ---------------------------------------------
 import_usage = """
 Usage:
-  datasets import <file-path>
+  datasets import [--resumable] <file-path>
 
 Where:
   <file-path> Required parameter identifying the path to the zip file to import.
               The file must be an IBM Visual Insights (PowerAI Vision) Dataset
               export zip file.
+  --resumable Optional flag to upload in resumable chunks when the server supports
+              it; otherwise the whole file is retried after a failure. The file's
+              SHA-256 digest is verified at the end either way.
 
 Import an exported dataset zip file to create the dataset in the server.
 Importing a dataset creates a new dataset."""
@@ -212,7 +221,16 @@ def import_dataset(params):
 
     filename = params.get("<file-path>", None)
 
-    rsp = server.datasets.import_dataset(filename)
+    from vapi.resumable import UploadError
+
+    try:
+        rsp = server.datasets.import_dataset(filename, progress=cli_utils.uploadProgress("Uploading"),
+                                             resumable=params.get("--resumable"))
+    except OSError as e:
+        print(f"ERROR: cannot read '{filename}'; {e}", file=sys.stderr)
+        exit(1)
+    except UploadError as e:
+        reportApiError(server, f"Failure while importing a dataset; {e}")
     if rsp is None:
         reportApiError(server, "Failure while importing a dataset.")
     else:
@@ -404,6 +422,103 @@ def train(params):
         reportSuccess(server, f"Started training task with id {taskid}")
 
 
+# ---  Sweep Operation  ----------------------------------------------
+sweep_usage = """
+Usage:
+  datasets sweep (--dsid=<dataset-id> | --id=<dataset_id>) --type=<usage_type>
+                 --name=<name_prefix> --space=<json_string>
+                 [--random=<count>] [--seed=<seed>] [--hyper=<json_string>]
+                 [--maxrunning=<count>] [--results=<file_path>]
+                 [--metric=<metric>] [--nosse]
+
+Where:
+  --dsid | --id    Either '--dsid' or '--id' is required and identifies the
+              dataset to be trained
+   --type     Required parameter identifying the type model to train.
+              Possible values are 'cic', 'cod' or 'act'
+   --name     Required prefix of the trained model names. Trials are named
+              '<name_prefix>-001', '<name_prefix>-002', ...
+   --space    Required search space; JSON text, or '@' followed by the path of
+              a JSON file. Each property lists the values to try, for example
+              '{"learningrate": [0.001, 0.01], "nn_arch": ["frcnn", "ssd"]}'.
+              For '--random', a property may also be a range such as
+              '{"min": 0.0001, "max": 0.01, "log": true}' (add '"type": "int"'
+              for whole numbers).
+   --random   Optional number of random trials to sample. By default every
+              combination of the space is trained (grid search).
+   --seed     Optional random seed, so a sweep can be repeated or resumed.
+   --hyper    Optional JSON of hyper-parameters common to every trial.
+   --maxrunning Optional maximum number of concurrent training tasks. It is
+              always limited to the number of GPUs reported by the server.
+   --results  Optional JSON lines file where each started task and each
+              trial's result is appended. Trials already in the file are not
+              run again, and tasks still running are waited for, which allows
+              an interrupted sweep to be resumed.
+   --metric   Optional metric used to rank the leaderboard. The default is
+              'accuracy'.
+   --nosse    Optional flag to only poll training status rather than also
+              listening to server sent events.
+
+Trains a model for every trial of a hyper-parameter search space, keeping the
+GPUs busy by starting the next trial as soon as a training task ends. A
+leaderboard of the trained models is shown at the end."""
+
+
+def sweep(params):
+    """Handles the 'sweep' operation to train models over a hyper-parameter search space"""
+
+    from vapi.sweep import SweepScheduler, gridTrials, randomTrials, leaderboard
+
+    dsid = params.get("--dsid", "missing_id")
+    metric = params.get("--metric") or "accuracy"
+    try:
+        space = _jsonParam(params["--space"])
+        baseParams = _jsonParam(params["--hyper"]) if params.get("--hyper") else {}
+        if params.get("--random") is not None:
+            seed = int(params["--seed"]) if params.get("--seed") is not None else None
+            trials = randomTrials(space, int(params["--random"]), seed=seed)
+        else:
+            trials = gridTrials(space)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: invalid sweep parameters; {e}", file=sys.stderr)
+        exit(1)
+
+    def progress(result):
+        if not cli_utils.json_only:
+            print(f"{result['name']}\t{result['status']}\t{result['model_id']}\t"
+                  f"{result['metrics'].get(metric, '')}\t{json.dumps(result['params'])}", flush=True)
+
+    maxRunning = int(params["--maxrunning"]) if params.get("--maxrunning") is not None else None
+    scheduler = SweepScheduler(server, dsid, params["--type"], params["--name"], maxRunning=maxRunning,
+                               baseParams=baseParams, resultsFile=params.get("--results"),
+                               useEvents=not params.get("--nosse"))
+    if not cli_utils.json_only:
+        print(f"Running {len(trials)} trials, {scheduler.maxRunning} at a time", file=sys.stderr)
+    try:
+        results = scheduler.run(trials, progress=progress)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        exit(1)
+
+    ranked = leaderboard(results, metric)
+    if cli_utils.json_only:
+        print(json.dumps(ranked, indent=2))
+    else:
+        print(f"\nLeaderboard by {metric}:")
+        for rank, result in enumerate(ranked, 1):
+            print(f"{rank}\t{result['name']}\t{result['model_id']}\t{result['metrics'].get(metric, '')}\t"
+                  f"{json.dumps(result['params'])}")
+
+
+def _jsonParam(value):
+    """ Loads a JSON parameter given as text or as '@<file_path>'."""
+
+    if value.startswith("@"):
+        with open(value[1:]) as handle:
+            return json.load(handle)
+    return json.loads(value)
+
+
 cmd_usage = f"""
 Usage:  datatsets {cli_utils.common_cmd_flags} <operation> [<args>...]
 
@@ -419,6 +534,7 @@ Where:
       export  -- export a dataset
       import  -- import an exported dataset
       train   -- train a model based upon a dataset
+      sweep   -- train models over a hyper-parameter search space
       clone   -- copy the indicated dataset into a new dataset of the given name
 
 Use 'datasets <operation> --help' for more information on a specific command."""
@@ -431,6 +547,7 @@ usage_stmt = {
     "delete": delete_usage,
     "show": show_usage,
     "train": train_usage,
+    "sweep": sweep_usage,
     "export": export_usage,
     "import": import_usage,
     "clone": clone_usage
@@ -443,6 +560,7 @@ operation_map = {
     "delete": delete,
     "show": show,
     "train": train,
+    "sweep": sweep,
     "export": export,
     "import": import_dataset,
     "clone": clone
@@ -455,7 +573,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--dsid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(dict(e))
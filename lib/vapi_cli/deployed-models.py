@@ -18,10 +18,9 @@
 #
 #  IBM_PROLOG_END_TAG
 
+import json
 import logging as logger
 import sys
-import cv2 as cv
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -57,15 +56,17 @@ def delete(params):
 
 
 # ---  List Operation  -----------------------------------------------
-list_usage = """
+list_usage = f"""
 Usage:
   deployed-models list [--sort=<sort_string>] [--summary]
+                       {cli_utils.list_format_flags}
 
 Where:
   --sort   Comma separated string of field names on which to sort.
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of deployed-models."""
 
@@ -83,6 +84,11 @@ def report(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.deployed_models.report(**kwargs),
+                               "Failure attempting to list deployed-models", summaryFields)
+        return
+
     rsp = server.deployed_models.report(**kwargs)
 
     if rsp is None:
@@ -122,9 +128,11 @@ Usage:
                         [--rle=<true_or_false>]  [--polygons=<true_or_false>]
                         [--maxclasses=<integer>] [--caption=<true_or_false>]
                         [--wait=<true_or_false>] [--annotatefile=<output_file_path>]
-                        [--markwidth=<integer>]  [--fontscale=<number>]
-                        [--color=<annotation-mark-color>] [--minanomaly=<min-score>]
-                        <path-to-file>
+                        [--annotatedir=<output_dir>] [--results=<jsonl_file>]
+                        [--workers=<integer>] [--markwidth=<integer>]  [--fontscale=<number>]
+                        [--color=<annotation-mark-color>] [--alpha=<number>]
+                        [--colormap=<colormap-name>] [--minanomaly=<min-score>]
+                        <path-to-file>...
 
 Where:
   --id | --modelid  Either '--id' or '--modelid' is required to identify the deployed
@@ -135,7 +143,8 @@ Where:
              is applied to each object/action detected.
   --heatmap  Optional True/False flag requesting that the heatmap be included in the
              returned result. The default is False.
-             This flag is only relevant when doing classification.
+             This flag is only relevant when doing classification. When annotated
+             images are requested, the heatmap is blended over the image.
   --rle      Optional True/False flag indicating whether RLE segmentation should be 
              included in the results or not. The default is False.
              This flag is only relevant with a model capable of returning segmenation
@@ -156,36 +165,67 @@ Where:
              detection or object detection).
   --annotatefile Optional flag identifying the path where an annotated file should
              be stored. If not supplied, annotated images will not be generated.
-             This flag only applies to object detection models.
-             At this time, only bounding box annotations are done.
-  --markwidth  Optional flag that is only relevant if the '--annotatefile' flag has been 
-             specified. This flag specifies the width of the annotation marks (in pixels)
+             This flag applies to object detection models, and to classification
+             models when '--heatmap=true' is used. It can only be used when
+             inferring a single file.
+             Bounding boxes, polygons, RLE masks and heatmaps are drawn if present
+             in the inference results.
+  --annotatedir Optional flag identifying a directory into which annotated images
+             are stored for all inferred files. Annotated files have the same name
+             as the original file. Like '--annotatefile', this flag applies to object
+             detection results and classification results with heatmaps.
+  --results  Optional flag identifying a JSONL file into which the inference results
+             are written (one '{"file": ..., "result": ...}' object per line).
+             Saved results can be annotated later with the 'annotate' operation.
+  --workers  Optional flag that is only relevant if the '--annotatedir' flag has been
+             specified. Number of processes used to draw annotations. The default is
+             the number of CPUs.
+  --markwidth  Optional flag that is only relevant if annotated images are requested.
+             This flag specifies the width of the annotation marks (in pixels)
              drawn on the annotated image. Values can range from 1 to 8.
              The default is 4.
-  --fontscale  Optional flag that is only relevant if the '--annotatefile' flag has been
-             specified. This flag specifies the font scale. Values can range from 0.5 to 4.0.
+  --fontscale  Optional flag that is only relevant if annotated images are requested.
+             This flag specifies the font scale. Values can range from 0.5 to 4.0.
              The default is 2.0
-  --color    Optional flag that is only relevant if the '--annotatefile' flag has been 
-             specified. This flag specifies the color to use for the annotation marks
+  --color    Optional flag that is only relevant if annotated images are requested.
+             This flag specifies the color to use for the annotation marks
              drawn on the annotated image. Possible values are 'red', 'blue', 'green',
-             'yellow', 'magenta', 'cyan', and 'brightgreen'.
+             'yellow', 'magenta', 'cyan', 'brightgreen', 'gold', 'white' and 'black'.
              The default is red.
+  --alpha    Optional flag that is only relevant if annotated images are requested.
+             Opacity of segmentation masks and heatmaps, from 0.0 (not drawn) to 1.0.
+             The default is 0.4
+  --colormap Optional flag that is only relevant if annotated images of heatmaps are
+             requested. Name of the OpenCV colormap used to colorize the heatmap
+             (e.g. 'jet', 'inferno', 'turbo', 'hot'). The default is jet.
   --minanomaly Optional parameter indicating the minimum anomaly score required for an
              inference to mark a region in an object as being anomalous. This flag applies
              only to anomaly models.
-  <path-to-file>     Required parameter to identify the path to the file on which inference
-             is to be performed.
+  <path-to-file>     Required parameter to identify the path to the file(s) on which
+             inference is to be performed. Multiple files can be given.
 
-Performs inference on the given file. This command will do classification, object
-detection, or action detection depending upon the model being used. """
+Performs inference on the given file(s). This command will do classification, object
+detection, or action detection depending upon the model being used.
+When more than one file is given, each result is written as a line of JSON
+(unless '--results' is used) and inference continues past failed files."""
 
 
 def infer(params):
     """Handles the 'infer' operation to a deployed model"""
 
+    import vapi.rendering as rendering
+
     modelid = params.get("--modelid", "missing_id")
-    filepath = params.get("<path-to-file>", None)
+    filepaths = params.get("<path-to-file>", [])
     annotateFile = params.get("--annotatefile")
+    annotateDir = params.get("--annotatedir")
+    resultsFile = params.get("--results")
+
+    if annotateFile is not None and len(filepaths) > 1:
+        print("ERROR: '--annotatefile' can only be used with a single file; use '--annotatedir'.",
+              file=sys.stderr)
+        print(infer_usage, file=sys.stderr)
+        exit(1)
 
     expectedArgs = {
         '--minconfidence': 'confthre',
@@ -199,113 +239,379 @@ def infer(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
-    rsp = server.deployed_models.infer(modelid, filepath, **kwargs)
-    if rsp is None:
-        reportApiError(server, f"Failure inferring to model id '{modelid}'")
-    else:
-        if annotateFile is not None:
-            drawAnnotationsOnFile(params, filepath, server.json(), annotateFile)
-        reportSuccess(server)
+    if len(filepaths) == 1 and resultsFile is None:
+        filepath = filepaths[0]
+        rsp = server.deployed_models.infer(modelid, filepath, **kwargs)
+        if rsp is None:
+            reportApiError(server, f"Failure inferring to model id '{modelid}'")
+        else:
+            if annotateFile is not None:
+                rendering.renderFile(filepath, server.json(), annotateFile, determineMarkInfo(params))
+            elif annotateDir is not None:
+                rendering.renderBatch([(filepath, server.json())], annotateDir, determineMarkInfo(params), workers=1)
+            reportSuccess(server)
+        return
+
+    # Batch inference -- keep going past failures and report them at the end
+    results = []
+    failures = []
+    output = open(resultsFile, "w") if resultsFile is not None else None
+    try:
+        for filepath in filepaths:
+            rsp = server.deployed_models.infer(modelid, filepath, **kwargs)
+            if rsp is None:
+                failures.append(filepath)
+                print(f"ERROR: Failure inferring file '{filepath}' to model id '{modelid}'; "
+                      f"status={server.status_code()}", file=sys.stderr)
+                continue
+            if annotateDir is not None or annotateFile is not None:
+                results.append((filepath, rsp))
+            if output is not None:
+                rendering.writeResult(output, filepath, rsp)
+            else:
+                print(json.dumps({"file": filepath, "result": rsp}))
+    finally:
+        if output is not None:
+            output.close()
+
+    if annotateFile is not None and len(results) > 0:
+        rendering.renderFile(results[0][0], results[0][1], annotateFile, determineMarkInfo(params))
+    elif annotateDir is not None and len(results) > 0:
+        rendering.renderBatch(results, annotateDir, determineMarkInfo(params), workers=getWorkers(params))
+
+    if output is not None and not cli_utils.json_only:
+        print(f"Inferred {len(filepaths) - len(failures)} of {len(filepaths)} files; results saved in '{resultsFile}'")
+    if len(failures) > 0:
+        exit(2)
+
+
+# ---  Infer Frames Operation   --------------------------------------
+infer_frames_usage = f"""
+Usage:
+  deployed-models infer-frames (--modelid=<model-id> | --id=<mode-id>)
+                        [--minconfidence=<min-confidence] [--heatmap=<true_or_false>]
+                        [--rle=<true_or_false>]  [--polygons=<true_or_false>]
+                        {cli_utils.frame_sampling_flags}
+                        [--workers=<integer>] [--results=<jsonl_file>]
+                        <path-to-video>...
+
+Where:
+  --id | --modelid  Either '--id' or '--modelid' is required to identify the deployed
+             model to use for inferencing
+  --minconfidence, --heatmap, --rle, --polygons
+             Optional inference flags. See 'deployed-models infer --help' for details.
+{cli_utils.frame_sampling_flag_descriptions}
+  --workers  Optional number of concurrent inference requests. The default is 4.
+  --results  Optional flag identifying a JSONL file into which the inference results
+             are written. By default results are written to STDOUT.
+  <path-to-video>  Required parameter identifying one or more local video files.
 
+Decodes the videos locally, samples frames from them and infers each sampled frame
+as an image. Only the sampled frames are sent to the server. Each result is written
+as one line of JSON with the video name, frame index and timestamp (in seconds)."""
 
-markInfo = {}
 
+def infer_frames(params):
+    """Handles the 'infer-frames' operation to infer sampled video frames"""
 
-def drawAnnotationsOnFile(params, originalFile, inferResults, outputFile):
+    from vapi.video import FramePipeline, VideoError, inferFrames
 
-    detections = inferResults.get("classified", [])
-    if len(detections) > 0 and "xmin" in detections[0]:
-        determineMarkInfo(params)
-        image = cv.imread(originalFile)
+    modelid = params.get("--modelid", "missing_id")
+    resultsFile = params.get("--results")
+    workers = int(params.get("--workers") or 4)
+
+    expectedArgs = {
+        '--minconfidence': 'confthre',
+        '--heatmap': 'containHeatMap',
+        '--rle': 'containrle',
+        '--polygons': 'containPolygon'
+    }
+    kwargs = translate_flags(expectedArgs, params)
 
-        for detection in detections:
-            drawBoundingBox(image, detection["label"], detection["confidence"],
-                            detection["xmin"], detection["ymin"],
-                            detection["xmax"], detection["ymax"])
-        # Save the modified image
-        cv.imwrite(outputFile, image)
+    pipeline = FramePipeline(params["<path-to-video>"], cli_utils.getFrameSampler(params))
+    output = open(resultsFile, "w") if resultsFile is not None else sys.stdout
+    total = 0
+    failures = 0
+    try:
+        for frame, result in inferFrames(server, modelid, pipeline, workers=workers, **kwargs):
+            total += 1
+            if result is None:
+                failures += 1
+                continue
+            entry = {
+                "file": frame.name,
+                "video": frame.video,
+                "frame": frame.index,
+                "timestamp": frame.timestamp,
+                "result": result
+            }
+            output.write(json.dumps(entry, separators=(",", ":")) + "\n")
+    except VideoError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if resultsFile is not None and not cli_utils.json_only:
+        print(f"Inferred {total - failures} of {total} sampled frames; results saved in '{resultsFile}'")
+    if failures > 0:
+        print(f"ERROR: inference failed for {failures} of {total} sampled frames", file=sys.stderr)
+        exit(2)
+
+
+# ---  Compare Operation   -------------------------------------------
+compare_usage = """
+Usage:
+  deployed-models compare --modela=<model-id> --modelb=<model-id>
+                        [--minconfidence=<min-confidence] [--iou=<threshold>]
+                        [--workers=<integer>] [--cachedir=<dir>] [--nocache]
+                        [--disagreements=<jsonl_file>]
+                        <path-to-file>...
 
+Where:
+  --modela   Required parameter identifying the baseline deployed model.
+  --modelb   Required parameter identifying the candidate deployed model.
+  --minconfidence Optional parameter indicating the minimum confidence that an
+             inference must meet to be included in the results of both models.
+  --iou      Optional minimum intersection over union for a box from each model
+             to be considered the same object. The default is 0.5.
+  --workers  Optional number of concurrent inference requests per model.
+             The default is 4.
+  --cachedir Optional directory in which inference results are cached. The
+             default is '$VAPI_CACHE_DIR/inference' or '~/.cache/vision-tools/inference'.
+  --nocache  Optional flag to infer every file without using the cache.
+  --disagreements Optional flag identifying a JSONL file into which every image on
+             which the models disagree is written, with the mismatched objects.
+  <path-to-file>  Required parameter identifying the local files (golden set) to
+             infer with both models.
+
+Infers the files with both models concurrently and reports how well the models agree.
+For classification, the top classes are compared. For object detection, boxes are
+matched by IoU and the class agreement, mean IoU, confidence deltas and unmatched
+boxes of each model are reported. Results are cached locally, so comparing again
+only infers files that changed."""
+
+
+def compare(params):
+    """Handles the 'compare' operation to compare two deployed models"""
+
+    from vapi.comparison import compareModels
+    from vapi.inferencecache import InferenceCache
+
+    disagreementsFile = params.get("--disagreements")
+    cache = None if params.get("--nocache") else InferenceCache(params.get("--cachedir"))
+    try:
+        iou = float(params.get("--iou") or 0.5)
+    except ValueError:
+        print("ERROR: '--iou' must be a number between 0 and 1.", file=sys.stderr)
+        exit(1)
 
-def determineMarkInfo(params):
-    # Color definitions for annotation marks
-    CV_RED = (0, 0, 255)
-    CV_GREEN = (0, 255, 0)
-    CV_BLUE = (255, 0, 0)
-    CV_MAGENTA = (255, 0, 255)
-    CV_YELLOW = (0, 255, 255)
-    CV_CYAN = (255, 255, 0)
-    CV_BRIGHTGREEN = (0, 255, 127)
-    CV_GOLD = (0, 215, 255)
-    CV_WHITE = (255, 255, 255)
-    CV_BLACK = (0, 0, 0)
-
-    global markInfo
-
-    width = params.get("--markwidth")
-    if width is None:
-        width = 4
+    expectedArgs = {
+        '--minconfidence': 'confthre'
+    }
+    kwargs = translate_flags(expectedArgs, params)
+
+    comparison = compareModels(server, params["--modela"], params["--modelb"], params["<path-to-file>"],
+                               cache=cache, workers=int(params.get("--workers") or 4),
+                               iouThreshold=iou, **kwargs)
+
+    if disagreementsFile is not None:
+        with open(disagreementsFile, "w") as output:
+            for entry in comparison.disagreements:
+                output.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    summary = comparison.summary()
+    if cli_utils.json_only:
+        print(json.dumps(summary, indent=2))
     else:
-        width = int(width)
-        if width < 1:
-            width = 1
-        if width > 8:
-            width = 8
-
-    fscale = params.get("--fontscale")
-    if fscale is None:
-        fscale = 2
+        print(f"Compared {summary['images']} images; {summary['agreeing_images']} agree "
+              f"({_percent(summary['image_agreement'])})")
+        if summary["matched_objects"] > 0 or summary["only_model_a"] > 0 or summary["only_model_b"] > 0:
+            print(f"  matched objects:     {summary['matched_objects']}  (mean IoU {_number(summary['mean_iou'])})")
+            print(f"  only in model A:     {summary['only_model_a']}")
+            print(f"  only in model B:     {summary['only_model_b']}")
+        print(f"  class agreement:     {_percent(summary['class_agreement'])}")
+        print(f"  confidence delta:    mean {_number(summary['mean_confidence_delta'])}, "
+              f"max abs {_number(summary['max_abs_confidence_delta'])}")
+        if disagreementsFile is not None:
+            print(f"Disagreements saved in '{disagreementsFile}'")
+
+    if summary["failed_images"] > 0:
+        print(f"ERROR: inference failed for {summary['failed_images']} images", file=sys.stderr)
+        exit(2)
+
+
+# ---  Evaluate Operation   ------------------------------------------
+evaluate_usage = """
+Usage:
+  deployed-models evaluate (--modelid=<model-id> | --id=<mode-id>) --dsid=<dataset-id>
+                        [--iou=<thresholds>] [--minconfidence=<min-confidence>]
+                        [--workers=<integer>] [--imagedir=<dir>] [--cachedir=<dir>]
+                        [--nocache] [--report=<json_file>]
+
+Where:
+  --id | --modelid  Either '--id' or '--modelid' is required to identify the deployed
+             model to evaluate.
+  --dsid     Required parameter identifying the dataset holding the ground truth.
+             Object labels are used for object detection models and file
+             categories for classification models.
+  --iou      Optional comma separated list of IoU thresholds at which average
+             precision is computed. The default is 0.5 to 0.95 in steps of 0.05.
+  --minconfidence Optional minimum confidence of predictions that are scored.
+             The default is 0.0 (all predictions).
+  --workers  Optional number of concurrent inference requests. The default is 4.
+  --imagedir Optional directory in which dataset images are kept between runs.
+             The default is the 'images' directory next to the inference cache.
+  --cachedir Optional directory in which inference results are cached. The
+             default is '$VAPI_CACHE_DIR/inference' or '~/.cache/vision-tools/inference'.
+  --nocache  Optional flag to infer every file without using the cache.
+  --report   Optional flag identifying a file into which the full evaluation
+             (per class precision/recall curves and confusion matrix) is written
+             as JSON.
+
+Evaluates a deployed model against the labels of a dataset. Dataset images are
+downloaded and inferred once; results are cached so evaluating again with other
+thresholds does not infer the images again. Object detection models are scored with
+mean average precision (mAP) over the IoU thresholds; classification models with
+accuracy. Per class precision and recall are reported for both."""
+
+
+def evaluate(params):
+    """Handles the 'evaluate' operation to score a deployed model against a dataset"""
+
+    from vapi.evaluation import evaluateModel, DEFAULT_IOU_THRESHOLDS
+    from vapi.inferencecache import InferenceCache
+    from vapi.paging import PagingError
+
+    modelid = params.get("--modelid", "missing_id")
+    dsid = params.get("--dsid")
+    reportFile = params.get("--report")
+    cache = None if params.get("--nocache") else InferenceCache(params.get("--cachedir"))
+    try:
+        thresholds = DEFAULT_IOU_THRESHOLDS
+        if params.get("--iou") is not None:
+            thresholds = [float(t) for t in params["--iou"].split(",")]
+        minConfidence = float(params.get("--minconfidence") or 0.0)
+    except ValueError:
+        print("ERROR: '--iou' and '--minconfidence' must be numbers between 0 and 1.", file=sys.stderr)
+        exit(1)
+
+    try:
+        evaluation = evaluateModel(server, modelid, dsid, cache=cache, imageDir=params.get("--imagedir"),
+                                   workers=int(params.get("--workers") or 4))
+    except PagingError as e:
+        reportApiError(server, f"Failure attempting to get the labels of dataset '{dsid}'; {e}")
+    scores = evaluation.score(iouThresholds=thresholds, minConfidence=minConfidence)
+
+    if reportFile is not None:
+        with open(reportFile, "w") as output:
+            json.dump(scores, output, indent=2)
+
+    if cli_utils.json_only:
+        for entry in scores["classes"].values():
+            entry.pop("pr_curve", None)
+        print(json.dumps(scores, indent=2))
     else:
-        fscale = float(fscale)
-        if fscale < 0.5:
-            fscale = 0.5
-        if fscale > 4.0:
-            fscale = 4.0
-
-    incolor = params.get("--color", "red").lower()
-    if incolor == "green":
-        color = CV_GREEN
-    elif incolor == "blue":
-        color = CV_BLUE
-    elif incolor == "magenta":
-        color = CV_MAGENTA
-    elif incolor == "yellow":
-        color = CV_YELLOW
-    elif incolor == "cyan":
-        color = CV_CYAN
-    elif incolor == "white":
-        color = CV_WHITE
-    elif incolor == "black":
-        color = CV_BLACK
+        print(f"Evaluated {scores['images']} images of dataset '{dsid}'")
+        if scores["type"] == "detection":
+            print(f"  mAP@[{_thresholdRange(thresholds)}]: {_number(scores['mAP'])}")
+            for name, entry in sorted(scores["classes"].items(), key=lambda x: str(x[0])):
+                ap = next(iter(entry["ap"].values()), None)
+                print(f"  {str(name):24s} AP@{thresholds[0]:.2f} {_number(ap)}  precision "
+                      f"{_percent(entry['precision'])}  recall {_percent(entry['recall'])}  "
+                      f"({entry['ground_truth']} labels)")
+        else:
+            print(f"  accuracy: {_percent(scores['accuracy'])}")
+            for name, entry in sorted(scores["classes"].items(), key=lambda x: str(x[0])):
+                print(f"  {str(name):24s} precision {_percent(entry['precision'])}  "
+                      f"recall {_percent(entry['recall'])}  ({entry['ground_truth']} files)")
+        if reportFile is not None:
+            print(f"Evaluation report saved in '{reportFile}'")
+
+    if scores["failed_images"] > 0:
+        print(f"ERROR: {scores['failed_images']} images could not be downloaded or inferred", file=sys.stderr)
+        exit(2)
+
+
+def _thresholdRange(thresholds):
+    if len(thresholds) > 2:
+        return f"{thresholds[0]:.2f}:{thresholds[-1]:.2f}"
+    return ",".join(f"{t:.2f}" for t in thresholds)
+
+
+def _percent(value):
+    return "n/a" if value is None else f"{value * 100:.1f}%"
+
+
+def _number(value):
+    return "n/a" if value is None else f"{value:.3f}"
+
+
+# ---  Annotate Operation   ------------------------------------------
+annotate_usage = """
+Usage:
+  deployed-models annotate --results=<jsonl_file> --annotatedir=<output_dir>
+                        [--workers=<integer>] [--markwidth=<integer>]  [--fontscale=<number>]
+                        [--color=<annotation-mark-color>] [--alpha=<number>]
+                        [--colormap=<colormap-name>]
+
+Where:
+  --results  Required parameter identifying a JSONL results file saved with
+             'deployed-models infer --results'.
+  --annotatedir Required parameter identifying the directory into which annotated
+             images are stored.
+  --workers  Optional number of processes used to draw annotations. The default is
+             the number of CPUs.
+  --markwidth, --fontscale, --color, --alpha, --colormap
+             Optional flags controlling the annotation marks. See
+             'deployed-models infer --help' for details.
+
+Draws the bounding boxes, polygons, segmentation masks and heatmaps of saved inference
+results onto the original images. Object detection results and classification results
+with heatmaps are annotated."""
+
+
+def annotate(params):
+    """Handles the 'annotate' operation to render saved inference results"""
+
+    import vapi.rendering as rendering
+
+    resultsFile = params.get("--results")
+    annotateDir = params.get("--annotatedir")
+
+    try:
+        written = rendering.renderBatch(rendering.readResults(resultsFile), annotateDir,
+                                        determineMarkInfo(params), workers=getWorkers(params))
+    except OSError as e:
+        print(f"ERROR: failed to annotate results from '{resultsFile}'; {e}", file=sys.stderr)
+        exit(2)
+
+    if cli_utils.json_only:
+        print(json.dumps(written, indent=2))
     else:
-        color = CV_RED
+        print(f"Wrote {len(written)} annotated images to '{annotateDir}'")
 
-    markInfo = {
-        "width": width,
-        "fscale": fscale,
-        "color": color
-    }
 
+def determineMarkInfo(params):
+    """ Builds the annotation mark style from the mark flags in 'params'"""
 
-def drawBoundingBox(image, name, confidence, xmin, ymin, xmax, ymax):
-    width = markInfo["width"]
-    fontscale = markInfo["fscale"]
-    color = markInfo["color"]
-    print(f"width={width}, fscale={fontscale}, color={color}")
+    import vapi.rendering as rendering
 
-    # construct the rectangle
-    cv.rectangle(image, (xmin, ymin), (xmax, ymax), color, width)
+    try:
+        return rendering.MarkStyle(width=params.get("--markwidth") or 4,
+                                   fontscale=params.get("--fontscale") or 2.0,
+                                   color=params.get("--color") or "red",
+                                   alpha=params.get("--alpha") or 0.4,
+                                   colormap=params.get("--colormap") or "jet")
+    except ValueError as e:
+        print(f"ERROR: invalid annotation flag; {e}", file=sys.stderr)
+        exit(1)
 
-    # construct the label contents (if the pieces are present)
-    if name is not None:
-        if confidence is not None:
-            label = "{}: {:.2f}%".format(name, confidence * 100)
-        else:
-            label = "{}".format(name)
-        if ymin - 15 > 15:
-            y = ymin - 15
-        else:
-            y = ymin + 15
-        cv.putText(image, label, (xmin, y), cv.FONT_HERSHEY_SIMPLEX, fontscale, color, width)
+
+def getWorkers(params):
+    workers = params.get("--workers")
+    return int(workers) if workers is not None else None
 
 
 cmd_usage = f"""
@@ -319,6 +625,10 @@ Where:
       delete  -- delete one or more deployed models
       show    -- show a specific deployed model
       infer   -- get an inference from a deployed model
+      infer-frames -- infer frames sampled from local videos
+      annotate -- draw saved inference results onto their images
+      compare -- compare the results of two deployed models on local files
+      evaluate -- score a deployed model against the labels of a dataset
 
 Use 'trained-models <operation> --help' for more information on a specific command."""
 
@@ -327,14 +637,22 @@ usage_stmt = {
     "list": list_usage,
     "delete": delete_usage,
     "show": show_usage,
-    "infer": infer_usage
+    "infer": infer_usage,
+    "infer-frames": infer_frames_usage,
+    "annotate": annotate_usage,
+    "compare": compare_usage,
+    "evaluate": evaluate_usage
 }
 
 operation_map = {
     "list": report,
     "delete": delete,
     "show": show,
-    "infer": infer
+    "infer": infer,
+    "infer-frames": infer_frames,
+    "annotate": annotate,
+    "compare": compare,
+    "evaluate": evaluate
 }
 
 
@@ -344,7 +662,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--modelid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
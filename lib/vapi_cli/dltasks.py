@@ -18,9 +18,9 @@
 #
 #  IBM_PROLOG_END_TAG
 
+import json
 import logging as logger
 import sys
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -72,9 +72,10 @@ def delete(params):
 
 
 # ---  List Operation  -----------------------------------------------
-list_usage = """
+list_usage = f"""
 Usage:
   dltasks list [--pgid=<project-group-id>...] [--status=<status>] [--sort=<sort-string>]  [--summary]
+               {cli_utils.list_format_flags}
 
 Where:
   --pgid   An optional parameter that identifies 1 or more project groups
@@ -86,6 +87,7 @@ Where:
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each dltask returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of dltasks matching the input criteria."""
 
@@ -105,6 +107,11 @@ def report(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.dl_tasks.report(**kwargs),
+                               "Failure attempting to list dltasks", summaryFields)
+        return
+
     rsp = server.dl_tasks.report(**kwargs)
 
     if rsp is None:
@@ -159,6 +166,52 @@ def status(params):
         reportSuccess(server)
 
 
+# ---  Wait Operation  -----------------------------------------------
+wait_usage = """
+Usage:
+  dltasks wait --taskid=<dltask-id>... [--timeout=<seconds>] [--nosse]
+
+Where:
+  --taskid   Required parameter identifying a dltask to wait for. It can be
+             repeated to wait for many dltasks at once.
+  --timeout  Optional number of seconds to wait. By default, waits until all
+             dltasks have finished.
+  --nosse    Optional flag to only poll the dltask status rather than also
+             listening to server sent events.
+
+Waits for dltasks to finish. Each dltask is shown with its final status as
+soon as it finishes. The exit code is 1 if the timeout expired first."""
+
+
+def wait(params):
+    """Handles the 'wait' operation to wait for dltasks to finish"""
+
+    taskids = params.get("--taskid") or []
+    timeout = params.get("--timeout")
+    timeout = float(timeout) if timeout is not None else None
+
+    from vapi.Dltasks import FINAL_STATUSES
+
+    results = []
+    unfinished = 0
+    for taskid, task in server.dl_tasks.wait(taskids, timeout=timeout, useEvents=not params.get("--nosse")):
+        # None means the dltask could not be retrieved before the timeout
+        status = task.get("status") if task is not None else "unknown"
+        if task is None or str(status).lower() not in FINAL_STATUSES:
+            unfinished += 1
+        if cli_utils.json_only:
+            results.append({"_id": taskid, "status": status, "task": task})
+        else:
+            print(f"{taskid}\t{status}", flush=True)
+
+    if cli_utils.json_only:
+        print(json.dumps(results, indent=2))
+    if unfinished:
+        within = f" within {timeout:g} seconds" if timeout is not None else ""
+        print(f"ERROR: {unfinished} dltasks did not finish{within}", file=sys.stderr)
+        exit(1)
+
+
 cmd_usage = f"""
 Usage:  dltasks {cli_utils.common_cmd_flags} <operation> [<args>...]
 
@@ -171,6 +224,7 @@ Where:
       delete  -- delete one or more dltasks
       show    -- show a specific dltask
       status  -- show training status messages for a dltask
+      wait    -- wait for dltasks to finish
 
 Use 'dltasks <operation> --help' for more information on a specific command."""
 
@@ -180,7 +234,8 @@ usage_stmt = {
     "list": list_usage,
     "delete": delete_usage,
     "show": show_usage,
-    "status": status_usage
+    "status": status_usage,
+    "wait": wait_usage
 }
 
 operation_map = {
@@ -188,7 +243,8 @@ operation_map = {
     "list": report,
     "delete": delete,
     "show": show,
-    "status": status
+    "status": status,
+    "wait": wait
 }
 
 
@@ -198,7 +254,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--taskid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
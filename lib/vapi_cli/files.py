@@ -21,7 +21,6 @@
 import logging as logger
 import sys
 import json
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -40,7 +39,8 @@ ds_file_description = """   --dsid     Required parameter identifying the datase
 
 #---  Upload Operation  ---------------------------------------------
 upload_usage = """
-Usage:   files upload --dsid=<dataset_id>  [--metadata=<String>] [--labels=<String>] <file_paths>...
+Usage:   files upload --dsid=<dataset_id>  [--metadata=<String>] [--labels=<String>]
+              [--batchsize=<nmbr>] [--retries=<nmbr>] <file_paths>...
 
 Where:
    --dsid   Required parameter that identifies the dataset into which the
@@ -50,6 +50,11 @@ Where:
    --labels    Optional parameter that contains a Json Array of label
             annotations to associate with the uploaded file. NOTE that
             labels cannot be applied to multiple files.
+   --batchsize Optional number of files sent per request. When given (or with
+            '--retries'), files are uploaded in batches and only the files that
+            failed are sent again.
+   --retries   Optional number of retries for files that failed to upload in
+            batch mode. The default is 3.
    <file_paths>   Space separated list of file paths to upload
 
 Uploads one or more files to a dataset.
@@ -69,6 +74,10 @@ def upload(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--batchsize") is not None or params.get("--retries") is not None:
+        upload_batches(dsid, params, kwargs)
+        return
+
     rsp = server.files.upload(dsid, params["<file_paths>"], **kwargs)
     if rsp is None:
         try:
@@ -92,19 +101,81 @@ def upload(params):
         reportSuccess(server, f"Successfully uploaded {total} files to dataset {dsid}")
 
 
+def upload_batches(dsid, params, kwargs):
+    """Uploads files in batches, retrying failed files"""
+
+    def progress(done, total):
+        print(f"\r{done} of {total} files uploaded", end="", file=sys.stderr, flush=True)
+
+    paths = params["<file_paths>"]
+    succeeded, failed = server.files.upload_many(dsid, paths, batchSize=int(params.get("--batchsize") or 20),
+                                                 retries=int(params.get("--retries") or 3),
+                                                 progress=None if cli_utils.json_only else progress, **kwargs)
+    if not cli_utils.json_only:
+        print(file=sys.stderr)
+    if cli_utils.json_only:
+        print(json.dumps({"uploaded": len(succeeded), "failed": failed}, indent=2))
+    else:
+        for path in failed:
+            print(f"failed\t{path}")
+        print(f"Uploaded {len(succeeded)} of {len(paths)} files to dataset {dsid}")
+    if failed:
+        exit(2)
+
+
+#---  Upload Frames Operation  --------------------------------------
+upload_frames_usage = f"""
+Usage:   files upload-frames --dsid=<dataset_id> {cli_utils.frame_sampling_flags}
+              [--batchsize=<nmbr>] <video_paths>...
+
+Where:
+   --dsid   Required parameter that identifies the dataset into which the
+            frames are to be loaded
+{cli_utils.frame_sampling_flag_descriptions}
+   --batchsize  Optional number of frames uploaded per request. The default is 20.
+   <video_paths>   Space separated list of local video files
+
+Samples frames from local videos and uploads them to a dataset as JPEG images.
+Frames are named after the video and frame index (e.g. 'line1_f0000120.jpg').
+No temporary files are written."""
+
+
+def upload_frames(params):
+    """Handles the 'upload-frames' operation for loading sampled video frames into a dataset."""
+
+    from vapi.video import FramePipeline, VideoError, uploadFrames
+
+    dsid = params.get("--dsid", "missing_id")
+    batchSize = int(params.get("--batchsize") or 20)
+
+    pipeline = FramePipeline(params["<video_paths>"], cli_utils.getFrameSampler(params))
+    try:
+        uploaded, failed = uploadFrames(server, dsid, pipeline, batchSize=batchSize)
+    except VideoError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        exit(1)
+    if failed > 0:
+        reportApiError(server, f"Failure uploading frames to dataset {dsid}; successes={uploaded}, fails={failed}")
+    else:
+        reportSuccess(server, f"Successfully uploaded {uploaded} frames to dataset {dsid}")
+
+
 #---  Change/Update Operation  --------------------------------------
 change_usage = f"""
-Usage:  files change {ds_file_flags} [--catid=<category_id>]
+Usage:  files change --dsid=<dataset-id> (--fileid=<file-id> | --id=<file-id> | {cli_utils.bulk_flags})
+                     [--catid=<category_id>]
 
 Where:
 {ds_file_description}
+{cli_utils.bulk_flag_descriptions}
    --catid    Optional parameter to change the category with which the file
               is associated. The category must already exist. An
               empty string ("") for category id will disassociate the file
               from its current category
 
-Modifies metadata for a file. Currently the only modification available
-through this operation is the category association."""
+Modifies metadata for a file, or for every file listed by '--ids-from'.
+Currently the only modification available through this operation is the
+category association."""
 
 
 def update(params):
@@ -119,6 +190,15 @@ def update(params):
     kwargs = translate_flags(expectedArgs, params)
     kwargs["action"] = "change_category"
 
+    if params.get("--ids-from") is not None:
+        def changeOne(fileid, record):
+            server.files.action(dsid, fileid, **kwargs)
+            return server.rsp_ok()
+
+        cli_utils.runBulk(server, cli_utils.readRecords(params["--ids-from"]), changeOne,
+                          int(params.get("--workers") or 8), f"Changed files in dataset '{dsid}'")
+        return
+
     rsp = server.files.action(dsid, fileid, **kwargs)
     if rsp is None:
         reportApiError(server, f"Failure attempting to change file id '{fileid}' in dataset '{dsid}'")
@@ -128,24 +208,34 @@ def update(params):
 
 #---  Delete Operation  ---------------------------------------------
 delete_usage = f"""
-Usage:  files delete {ds_file_flags}
+Usage:  files delete --dsid=<dataset-id> (--fileid=<file-id> | --id=<file-id> | {cli_utils.bulk_flags})
 
 Where:
 {ds_file_description}
+{cli_utils.bulk_flag_descriptions}
 
-Deletes the indicated file. At this time, only 1 file can be 
-deleted at a time.
+Deletes the indicated file, or every file listed by '--ids-from'. For example
+    files list --dsid=<dataset-id> --query=<query> --format=jsonl --fields=_id |
+        files delete --dsid=<dataset-id> --ids-from=-
 """
 
 
 def delete(params):
-    """Deletes one file identified by the --dsid and --fileid parameters.
-
-    Future work should allow a list of files."""
+    """Deletes one file identified by the --dsid and --fileid parameters,
+    or the files listed by '--ids-from'."""
 
     dsid = params.get("--dsid", "missing_id")
     fileid = params.get("--fileid", "missing_id")
 
+    if params.get("--ids-from") is not None:
+        def deleteOne(fileid, record):
+            server.files.delete(dsid, fileid)
+            return server.rsp_ok()
+
+        cli_utils.runBulk(server, cli_utils.readRecords(params["--ids-from"]), deleteOne,
+                          int(params.get("--workers") or 8), f"Deleted files in dataset '{dsid}'")
+        return
+
     rsp = server.files.delete(dsid, fileid)
     if rsp is None:
         reportApiError(server, f"Failure attempting to delete file id '{fileid}' in dataset '{dsid}'")
@@ -157,7 +247,7 @@ def delete(params):
 list_usage = f"""
 Usage:  files list --dsid=<dataset_id> [--catid=<category_id>] [--parentid=<parent_id>]
              [--query=<query_string>] [--sort=<string>] [--summary]
-             {cli_utils.limit_skip_flags}
+             {cli_utils.limit_skip_flags} {cli_utils.list_format_flags}
 
 Where:
    --dsid    Required parameter that identifies the dataset to which the files
@@ -176,6 +266,7 @@ Where:
              Add " DESC" after a field name to change to a descending sort.
              If adding " DESC", the field list must be enclosed in quotes.
    --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of files matching the input criteria."""
 
@@ -198,6 +289,11 @@ def report(params):
                     '--skip': 'skip'}
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.files.report(dsid, **kwargs),
+                               "Failure attempting to list files", summaryFields)
+        return
+
     rsp = server.files.report(dsid, **kwargs)
 
     if rsp is None:
@@ -428,6 +524,7 @@ Where: {cli_utils.common_cmd_flag_descriptions}
 
    <operation> is required and must be one of:
       upload   -- upload file(s) to a dataset
+      upload-frames -- upload frames sampled from local videos to a dataset
       list     -- report a list of files 
       change   -- change certain metadata attributes of a file
       delete   -- delete one or more files
@@ -444,6 +541,7 @@ Use 'files <operation> --help' for more information on a specific command."""
 usage_stmt = {
     "usage": cmd_usage,
     "upload": upload_usage,
+    "upload-frames": upload_frames_usage,
     "list": list_usage,
     "change": change_usage,
     "delete": delete_usage,
@@ -458,6 +556,7 @@ usage_stmt = {
 # Operation map to map CLI operation name to function implementing that operation
 operation_map = {
     "upload": upload,
+    "upload-frames": upload_frames,
     "list": report,
     "change": update,
     "delete": delete,
@@ -476,7 +575,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--fileid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
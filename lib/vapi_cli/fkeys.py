@@ -21,7 +21,6 @@
 import logging as logger
 import sys
 import json
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -130,7 +129,7 @@ def delete(params):
 #---  List/Report Operation  ----------------------------------------
 list_usage = f"""
 Usage:  fkeys list --dsid=<dataset_id> [--summary]
-             {cli_utils.limit_skip_flags}
+             {cli_utils.limit_skip_flags} {cli_utils.list_format_flags}
 
 Where:
    --dsid    Required parameter that identifies the dataset to which the files
@@ -139,6 +138,7 @@ Where:
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of files matching the input criteria."""
 
@@ -157,6 +157,11 @@ def report(params):
                     '--skip': 'skip'}
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.file_keys.report(dsid, **kwargs),
+                               "Failure attempting to list files", summaryFields)
+        return
+
     rsp = server.file_keys.report(dsid, **kwargs)
 
     if rsp is None:
@@ -230,7 +235,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
@@ -21,7 +21,6 @@
 import logging as logger
 import sys
 import json
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -39,8 +38,10 @@ ds_file_description = """   --dsid     Required parameter identifying the datase
    --fileid | --id   Required parameter identifying the targeted file"""
 
 #---  Create Operation  -----------------------------------
-create_usage = """
-Usage:   fmetadata (create|add) --dsid=<dataset_id>  --fileid=<file_id> (--data=<file_path> | <quoted-json-string>)
+create_usage = f"""
+Usage:   fmetadata (create|add) --dsid=<dataset_id>
+                   (--fileid=<file_id> (--data=<file_path> | <quoted-json-string>) |
+                    {cli_utils.bulk_flags} [<quoted-json-string>])
 
 Where:
    --dsid   Required parameter identifying the dataset containing the target file.
@@ -49,8 +50,14 @@ Where:
             Either the '--data' parameter or the '<quoted-json-string>' parameter must be supplied.
    <quoted-json-string>  -- Optional string containing the JSON key/value information.
             Either the '--data' parameter or the '<quoted-json-string>' parameter must be supplied.
+{cli_utils.bulk_flag_descriptions}
+            With '--ids-from', a JSON line may also carry the key/value pairs
+            for its file in a "metadata" object; the id is then taken from
+            '_id', 'file_id' or 'id'. Other fields of the line (e.g. the file
+            fields written by 'files list --format jsonl') are ignored. The
+            '<quoted-json-string>' pairs are added to every file.
 
-Creates a new user metadata information on the specified file."""
+Creates a new user metadata information on the specified file(s)."""
 
 
 def create(params):
@@ -65,7 +72,23 @@ def create(params):
         logger.error("Reading metadata from a file is not yet implemented.")
         return 1
     else:
-        metadata = json.loads(params.get("<quoted-json-string>", "{}"))
+        metadata = json.loads(params.get("<quoted-json-string>") or "{}")
+
+    if params.get("--ids-from") is not None:
+        idFields = ("_id", "file_id", "id")
+
+        def addOne(fileid, record):
+            pairs = dict(metadata)
+            if record is not None and record.get("metadata") is not None:
+                if not isinstance(record["metadata"], dict):
+                    raise ValueError("the 'metadata' field is not a JSON object")
+                pairs.update(record["metadata"])
+            server.file_metadata.add(dsid, fileid, pairs)
+            return server.rsp_ok()
+
+        cli_utils.runBulk(server, cli_utils.readRecords(params["--ids-from"], idFields), addOne,
+                          int(params.get("--workers") or 8), f"Added user metadata to files in dataset '{dsid}'")
+        return
 
     rsp = server.file_metadata.add(dsid, fileid, metadata)
     if server.rsp_ok():
@@ -138,11 +161,13 @@ def delete(params):
 #---  List/Report Operation  ----------------------------------------
 list_usage = f"""
 Usage:  fmetadata list --dsid=<dataset_id> --fileid=<file_id>
+                       {cli_utils.list_format_flags}
 
 Where:
    --dsid    Required parameter that identifies the dataset to which the file
              belong.
    --fileid  Required parameter identifying the file containing the metadata
+{cli_utils.list_format_flag_descriptions}
 
 Prints all key/value metadata pairs associated with the specified file."""
 
@@ -153,6 +178,11 @@ def report(params):
     dsid = params.get("--dsid", "no_ds_id")
     fileid = params.get("--fileid", "no_file_id")
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.file_metadata.report(dsid, fileid),
+                               f"Failure attempting to list metadata on file {fileid} in dataset {dsid}")
+        return
+
     server.file_metadata.report(dsid, fileid)
 
     if server.rsp_ok():
@@ -164,6 +194,7 @@ def report(params):
 #---  Export Operation  ----------------------------------------------
 export_usage = f"""
 Usage:  fmetadata export --dsid=<dataset_id> [--format=<format_str>]
+             [--keys=<key_list>] [--output=<file_path>]
 
 Where:
    --dsid   Required parameter that identifies the dataset into which the
@@ -171,8 +202,15 @@ Where:
    --format Optional parameter indicating format of output. Only supported
             'comma' (for CSV output) or 'pipe' (for unix style vertical bar 
             separated fields)
+   --keys   Optional comma separated list of metadata keys to export. File id
+            and name columns are always included.
+   --output Optional path of a typed columnar table to write instead of
+            printing the export. The format is chosen by the extension:
+            '.npz' (NumPy), '.parquet' or '.feather' (both need 'pyarrow').
 
-Exports file user metadata from all files in a dataset in CSV format."""
+Exports file user metadata from all files in a dataset in CSV format. With
+'--output', the export is parsed as it streams from the server; numeric and
+timestamp keys get typed columns."""
 
 
 def export(params):
@@ -180,8 +218,13 @@ def export(params):
 
     dsid = params.get("--dsid", "missing_id")
     fmt = params.get("--format", None)
+    keys = params.get("--keys", None)
+
+    if params.get("--output") is not None:
+        export_table(dsid, fmt, keys, params["--output"])
+        return
 
-    server.file_metadata.export(dsid, fmt=fmt)
+    server.file_metadata.export(dsid, fmt=fmt, keys=keys)
     if server.rsp_ok():
         # Must strip the trailing new line.
         reportSuccess(server, server.raw_http_response().text[:-1])
@@ -189,6 +232,102 @@ def export(params):
         reportApiError(server, f"Failure attempting to export all files' user metadata in dataset id '{dsid}'")
 
 
+def export_table(dsid, fmt, keys, path):
+    """Streams the export into a typed columnar table saved to 'path'"""
+
+    from vapi.metadataio import readColumns
+
+    fmt = fmt or "pipe"
+    delimiter = "," if fmt == "comma" else "|"
+    lines = server.file_metadata.export_lines(dsid, fmt=fmt, keys=keys)
+    table = readColumns(lines, delimiter=delimiter, keys=keys.split(",") if keys else None)
+    if not server.rsp_ok():
+        reportApiError(server, f"Failure attempting to export all files' user metadata in dataset id '{dsid}'")
+    try:
+        table.save(path)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        exit(1)
+    types = {name: str(table[name].dtype) for name in table.names()}
+    if cli_utils.json_only:
+        print(json.dumps({"file": path, "rows": len(table), "columns": types}, indent=2))
+    else:
+        print(f"Wrote {len(table)} rows to '{path}'")
+        for name, dtype in types.items():
+            print(f"{name}\t{dtype}")
+
+
+#---  Import Operation  ----------------------------------------------
+import_usage = f"""
+Usage:  fmetadata import --dsid=<dataset_id> (--csv=<file_path> | --pipe=<file_path>)
+             [--workers=<n>] [--failures=<file_path>] [--skipunknown]
+
+Where:
+   --dsid   Required parameter identifying the dataset containing the files.
+   --csv    Path of a comma separated file of metadata. Either '--csv' or '--pipe'
+            is required.
+   --pipe   Path of a vertical bar ('|') separated file of metadata, as produced by
+            'fmetadata export --format=pipe'.
+   --workers  Optional number of concurrent requests. The default is 8.
+   --failures Optional path of a file into which rows that could not be written are
+            saved, with their line number and the error.
+   --skipunknown  Optional flag to ignore columns that are not user metadata keys of
+            the dataset. By default such columns stop the import before anything
+            is written.
+
+Adds user metadata to many files. The first line of the file names the columns.
+One column identifies the file, either by id ('_id', 'file_id' or 'id') or by
+name ('original_file_name' or 'file_name'); every other column is a metadata key.
+Empty values are not written."""
+
+
+def import_metadata(params):
+    """Handles the 'import' operation to bulk add metadata from a CSV or pipe file"""
+
+    from vapi.metadataio import MetadataImporter
+    from vapi.paging import PagingError
+
+    dsid = params.get("--dsid", "missing_id")
+    path = params.get("--csv") or params.get("--pipe")
+    delimiter = "," if params.get("--csv") else "|"
+    failuresFile = params.get("--failures")
+
+    shown = []
+
+    def progress(stats):
+        shown.append(True)
+        print(f"\r{stats['rows']} rows, {stats['failed']} failed, {stats['rows_per_second']} rows/s",
+              end="", file=sys.stderr)
+
+    importer = MetadataImporter(server, dsid, workers=int(params.get("--workers") or 8),
+                                skipUnknownKeys=params.get("--skipunknown"))
+    manifest = None
+    try:
+        with open(path, newline="") as handle:
+            manifest = open(failuresFile, "w", newline="") if failuresFile is not None else None
+            stats = importer.run(handle, delimiter=delimiter, manifest=manifest,
+                                 progress=None if cli_utils.json_only else progress)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: failed to import metadata from '{path}'; {e}", file=sys.stderr)
+        exit(1)
+    except PagingError as e:
+        reportApiError(server, f"Failure attempting to get the keys and files of dataset '{dsid}'; {e}")
+    finally:
+        if manifest is not None:
+            manifest.close()
+
+    if cli_utils.json_only:
+        print(json.dumps(stats, indent=2))
+    else:
+        if shown:
+            print(file=sys.stderr)
+        print(f"Wrote metadata of {stats['written']} of {stats['rows']} rows in {stats['seconds']}s "
+              f"({stats['rows_per_second']} rows/s)")
+    if stats["failed"] > 0:
+        where = f"; see '{failuresFile}'" if failuresFile is not None else ""
+        print(f"ERROR: failed to write {stats['failed']} rows{where}", file=sys.stderr)
+        exit(2)
+
 
 cmd_usage = f"""
 Usage:  fmetadata {cli_utils.common_cmd_flags} <operation> [<args>...]
@@ -202,6 +341,7 @@ Where: {cli_utils.common_cmd_flag_descriptions}
       change   -- change the value associated of user metadata key
       delete   -- delete a list user metadata from a file
       export   -- export all metadata pairs across all files in a dataset
+      import   -- add metadata to many files from a CSV or pipe separated file
 
 Use 'fmetadata <operation> --help' for more information on a specific command."""
 
@@ -213,7 +353,8 @@ usage_stmt = {
     "list": list_usage,
     "change": change_usage,
     "delete": delete_usage,
-    "export": export_usage
+    "export": export_usage,
+    "import": import_usage
 }
 
 # Operation map to map CLI operation name to function implementing that operation
@@ -223,7 +364,8 @@ operation_map = {
     "list": report,
     "change": update,
     "delete": delete,
-    "export": export
+    "export": export,
+    "import": import_metadata
 }
 
 
@@ -233,7 +375,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
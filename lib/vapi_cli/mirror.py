@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+import json
+import logging as logger
+import sys
+import time
+import vapi_cli.cli_utils as cli_utils
+from vapi_cli.cli_utils import reportApiError
+from vapi.mirror import Mirror, QueryError
+from vapi.paging import PagingError
+
+# All of Vision Tools requires python 3.6 due to format string
+# Make the check in a common location
+if sys.hexversion < 0x03060000:
+    sys.exit("Python 3.6 or newer is required to run this program.")
+
+server = None
+
+mirror_flag = "[--db=<mirror_file>]"
+mirror_flag_description = """   --db      Optional path of the mirror database. The default is 'mirror.db'
+             in '$VAPI_CACHE_DIR' or '~/.cache/vision-tools'."""
+
+
+# ---  Sync Operation  -----------------------------------------------
+sync_usage = f"""
+Usage:  mirror sync [--dsid=<dataset_id>...] [--full] [--nolabels] [--nometadata]
+             {mirror_flag}
+
+Where:
+   --dsid    Optional dataset to sync. Can be given more than once. If not given,
+             all datasets are synced and datasets deleted on the server are removed
+             from the mirror.
+   --full    Optional flag to rewrite every mirrored row, even rows whose content
+             did not change since the last sync.
+   --nolabels  Optional flag to skip object labels.
+   --nometadata  Optional flag to skip file user metadata.
+{mirror_flag_description}
+
+Copies datasets, files, categories, object tags, object labels and file user metadata
+into a local SQLite database. Every dataset is listed again on each sync, since
+labels, tags and user metadata can change without the dataset record changing,
+but only changed rows are written."""
+
+
+def sync(params):
+    """Handles the 'sync' operation"""
+
+    start = time.time()
+    with Mirror(params.get("--db")) as mirror:
+        try:
+            results = mirror.sync(server, dsids=params.get("--dsid") or None, full=params.get("--full"),
+                                  labels=not params.get("--nolabels"), metadata=not params.get("--nometadata"))
+        except PagingError as e:
+            reportApiError(server, f"Failure attempting to sync the mirror; {e}")
+
+    if cli_utils.json_only:
+        print(json.dumps(results, indent=2))
+    else:
+        for dsid, counts in results.items():
+            files = counts["files"]
+            print(f"{dsid}: {files['total']} files ({files['changed']} changed, {files['deleted']} deleted)")
+        print(f"Synced {len(results)} datasets in {time.time() - start:.1f}s")
+
+
+# ---  Files Operation  ----------------------------------------------
+files_usage = f"""
+Usage:  mirror files [--dsid=<dataset_id>] [--catid=<category_id>] [--parentid=<parent_id>]
+             [--query=<query_string>] [--sort=<string>] [--summary]
+             {cli_utils.limit_skip_flags} {mirror_flag}
+
+Where:
+   --dsid    Optional parameter that identifies the dataset to which the files
+             belong. If not given, files of all mirrored datasets are searched.
+   --catid, --parentid, --query, --sort, --summary
+             Optional parameters with the same meaning as for 'files list'. Query
+             and sort fields can be file fields or file user metadata keys.
+{cli_utils.limit_skip_flag_descriptions}
+{mirror_flag_description}
+
+Generates a JSON list of mirrored files matching the input criteria, without
+contacting the server. Run 'mirror sync' to refresh the mirror."""
+
+
+def files(params):
+    """Handles the 'files' operation"""
+
+    summaryFields = None
+    if params["--summary"]:
+        summaryFields = ["_id", "original_file_name", "file_type"]
+
+    with Mirror(params.get("--db")) as mirror:
+        try:
+            items = mirror.files(params.get("--dsid"), query=params.get("--query"), sort=params.get("--sort"),
+                                 limit=params.get("--limit"), skip=params.get("--skip"),
+                                 categoryId=params.get("--catid"), parentId=params.get("--parentid"))
+        except QueryError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            exit(1)
+    cli_utils.reportItems(items, summaryFields=summaryFields)
+
+
+# ---  Status Operation  ---------------------------------------------
+status_usage = f"""
+Usage:  mirror status {mirror_flag}
+
+Where:
+{mirror_flag_description}
+
+Shows the mirrored datasets with their file, label and metadata counts and the time
+of their last sync."""
+
+
+def status(params):
+    """Handles the 'status' operation"""
+
+    with Mirror(params.get("--db")) as mirror:
+        datasets = mirror.status()
+    for ds in datasets:
+        if ds["synced_at"] is not None:
+            ds["synced_at"] = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ds["synced_at"]))
+    cli_utils.reportItems(datasets, summaryFields=["id", "name", "files", "object_labels", "synced_at"])
+
+
+cmd_usage = f"""
+Usage:  mirror {cli_utils.common_cmd_flags} <operation> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+
+   <operation> is required and must be one of:
+      sync    -- copy dataset metadata from the server into the local mirror
+      files   -- query mirrored files with 'files list' syntax (no server access)
+      status  -- show the mirrored datasets
+
+Use 'mirror <operation> --help' for more information on a specific command."""
+
+usage_stmt = {
+    "usage": cmd_usage,
+    "sync": sync_usage,
+    "files": files_usage,
+    "status": status_usage
+}
+
+operation_map = {
+    "sync": sync,
+    "files": files,
+    "status": status
+}
+
+
+def main(params, cmd_flags=None):
+    global server
+
+    args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags,
+                                     requireServer=("sync",))
+    if args is not None:
+        # Only 'sync' talks to the server; queries work offline
+        if args.operation is sync:
+            try:
+                server = cli_utils.connect_to_server()
+            except Exception as e:
+                print("Error: Failed to setup server.", file=sys.stderr)
+                logger.debug(e)
+                return 1
+
+        args.operation(args.op_params)
+
+
+if __name__ == "__main__":
+    main(None)
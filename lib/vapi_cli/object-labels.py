@@ -21,7 +21,6 @@
 import logging as logger
 import sys
 import json
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -158,9 +157,10 @@ def update(params):
 # ---  Delete Operation  ---------------------------------------
 delete_usage = f"""
 Usage:  object_labels delete --dsid=<dataset_id>
-                      [--fileids=<file_ids>...] [--tagids=<tag_id>...]
-                      [--modelid=<model_id>] [--gen_type=<gen_type>]
-                      [--min_conf=<float>] [--max_conf=<float>]
+                      ([--fileids=<file_ids>...] [--tagids=<tag_id>...]
+                       [--modelid=<model_id>] [--gen_type=<gen_type>]
+                       [--min_conf=<float>] [--max_conf=<float>] |
+                       {cli_utils.bulk_flags})
 
 Where:
    --dsid   Required parameter that identifies the dataset to which the labels
@@ -176,7 +176,9 @@ Where:
    --max_conf  Floating point number between 0.0 and 1.0 that is the minimum
                confidence value from auto-label generated labels
 {cli_utils.limit_skip_flag_descriptions}
-
+{cli_utils.bulk_flag_descriptions}
+               With '--ids-from', exactly the listed label ids are deleted and
+               the filter flags are not used.
 
 Deletes the indicated object label(s).
 
@@ -206,7 +208,16 @@ def delete(params):
                      }
     kwargs = translate_flags(expected_args, params)
 
-    rsp = server.object_labels.delete(dsid, labelid, None, kwargs)
+    if params.get("--ids-from") is not None:
+        def deleteOne(labelid, record):
+            server.object_labels.delete(dsid, labelid)
+            return server.rsp_ok()
+
+        cli_utils.runBulk(server, cli_utils.readRecords(params["--ids-from"]), deleteOne,
+                          int(params.get("--workers") or 8), f"Deleted object labels in dataset '{dsid}'")
+        return
+
+    rsp = server.object_labels.delete(dsid, labelid, None, **kwargs)
     if rsp is None:
         reportApiError(server, f"Failure attempting to delete label(s) from dataset '{dsid}'")
     else:
@@ -220,7 +231,7 @@ Usage:  object_labels list --dsid=<dataset_id>
                       [--modelid=<model_id>] [--gen_type=<gen_type>]
                       [--min_conf=<float>] [--max_conf=<float>]
                       {cli_utils.limit_skip_flags}
-                      [--summary]
+                      [--summary] {cli_utils.list_format_flags}
 
 
 Where:
@@ -239,6 +250,7 @@ Where:
                confidence value from auto-label generated labels
 {cli_utils.limit_skip_flag_descriptions}
   --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of object labels matching the input criteria.
 """
@@ -265,6 +277,11 @@ def report(params):
                      }
     kwargs = translate_flags(expected_args, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.object_labels.report(dsid, fileid, **kwargs),
+                               "Failure attempting to list tags", summaryFields)
+        return
+
     rsp = server.object_labels.report(dsid, fileid, **kwargs)
 
     if rsp is None:
@@ -297,6 +314,147 @@ def show(params):
         reportSuccess(server)
 
 
+# ---  Import Operation  ---------------------------------------------
+import_usage = """
+Usage:  object-labels import --dsid=<dataset-id> --format=<format> [--classes=<names_file>]
+                      [--imagedir=<dir>] [--workers=<n>] [--checkpoint=<file>]
+                      [--notags] <annotations>
+
+Where:
+   --dsid    Required parameter identifying the dataset whose files are labeled.
+   --format  Required format of the annotations; one of 'coco', 'voc' or 'yolo'.
+   --classes Optional file of class names, one per line, for 'yolo' annotations.
+             Without it, class numbers are used as tag names.
+   --imagedir  Directory holding the images of 'yolo' annotations. Required for
+             'yolo' to match label files to images and to get image sizes.
+   --workers Optional number of files saved concurrently. The default is 8.
+   --checkpoint  Optional file recording the files whose labels were saved. If
+             the import is run again with the same checkpoint file, those files
+             are skipped.
+   --notags  Optional flag to fail files whose tags do not exist in the dataset
+             instead of creating the tags.
+   <annotations>  Required path of the annotations; a COCO JSON file, or a directory
+             of Pascal VOC XML files or YOLO label files.
+
+Imports object labels into the files of a dataset. Files are matched by their
+original file name. All labels of a file are saved with one request, which replaces
+the labels already on the file."""
+
+
+def import_labels(params):
+    """Handles the 'import' operation to bulk load COCO/VOC/YOLO annotations"""
+
+    import vapi.labelimport as labelimport
+    from vapi.paging import PagingError
+
+    dsid = params.get("--dsid", "missing_id")
+    fmt = (params.get("--format") or "").lower()
+    path = params.get("<annotations>")
+    imageDir = params.get("--imagedir")
+
+    if fmt not in labelimport.FORMATS:
+        print(f"ERROR: '--format' must be one of {', '.join(labelimport.FORMATS)}.", file=sys.stderr)
+        exit(1)
+    if fmt == "yolo" and imageDir is None:
+        print("ERROR: '--imagedir' is required for 'yolo' annotations.", file=sys.stderr)
+        exit(1)
+
+    try:
+        if fmt == "coco":
+            labeledFiles = labelimport.readCoco(path)
+        elif fmt == "voc":
+            labeledFiles = labelimport.readVoc(path)
+        else:
+            classesFile = params.get("--classes")
+            classes = labelimport.readClasses(classesFile) if classesFile is not None else None
+            labeledFiles = labelimport.readYolo(path, imageDir, classes)
+
+        importer = labelimport.LabelImporter(server, dsid, workers=int(params.get("--workers") or 8),
+                                             checkpoint=params.get("--checkpoint"),
+                                             createTags=not params.get("--notags"))
+        stats = importer.run(labeledFiles)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"ERROR: failed to read annotations from '{path}'; {e}", file=sys.stderr)
+        exit(1)
+    except PagingError as e:
+        reportApiError(server, f"Failure attempting to get the files and tags of dataset {dsid}; {e}")
+
+    if cli_utils.json_only:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(f"Saved {stats['saved_labels']} labels on {stats['saved_files']} files in dataset {dsid}")
+        if stats["skipped_files"] > 0:
+            print(f"  {stats['skipped_files']} files skipped (already in checkpoint)")
+        if stats["unknown_files"] > 0:
+            print(f"  {stats['unknown_files']} annotated files are not in the dataset")
+    if stats["failed_files"] > 0:
+        print(f"ERROR: failed to save labels of {stats['failed_files']} files", file=sys.stderr)
+        exit(2)
+
+
+# ---  Export Operation  ---------------------------------------------
+export_usage = """
+Usage:  object-labels export --dsid=<dataset-id> --format=<format> --output=<path>
+                      [--imagedir=<dir>] [--workers=<n>]
+
+Where:
+   --dsid    Required parameter identifying the dataset whose labels are exported.
+   --format  Required output format; either 'coco' or 'yolo'.
+   --output  Required output path. For 'coco', the instances JSON file to write.
+             For 'yolo', the directory into which one label file per image and a
+             'classes.txt' file are written.
+   --imagedir  Optional directory into which the dataset images are downloaded
+             while the labels are exported.
+   --workers Optional number of concurrent image downloads. The default is 8.
+
+Exports the object labels of a dataset. Labels are written as they are retrieved, so
+large datasets can be exported without holding all labels in memory. YOLO coordinates
+are normalized with the image sizes from the file listing, or from the downloaded
+images when the listing does not include them. Without '--imagedir', the labels of
+YOLO images of unknown size are skipped, and COCO images of unknown size are written
+without a 'width' and 'height'."""
+
+
+def export_labels(params):
+    """Handles the 'export' operation to write labels as COCO or YOLO"""
+
+    import vapi.labelexport as labelexport
+    from vapi.paging import PagingError
+
+    dsid = params.get("--dsid", "missing_id")
+    fmt = (params.get("--format") or "").lower()
+    output = params.get("--output")
+
+    if fmt not in labelexport.FORMATS:
+        print(f"ERROR: '--format' must be one of {', '.join(labelexport.FORMATS)}.", file=sys.stderr)
+        exit(1)
+
+    try:
+        writer = labelexport.CocoWriter(output) if fmt == "coco" else labelexport.YoloWriter(output)
+        with writer:
+            stats = labelexport.exportLabels(server, dsid, writer, imageDir=params.get("--imagedir"),
+                                             workers=int(params.get("--workers") or 8))
+    except OSError as e:
+        print(f"ERROR: failed to write '{output}'; {e}", file=sys.stderr)
+        exit(1)
+    except PagingError as e:
+        reportApiError(server, f"Failure attempting to get the files and labels of dataset {dsid}; {e}")
+
+    if cli_utils.json_only:
+        print(json.dumps(stats, indent=2))
+    else:
+        print(f"Exported {stats['labels']} labels of {stats['images']} files to '{output}'")
+        if stats["skipped_labels"] > 0:
+            print(f"  {stats['skipped_labels']} labels skipped")
+        if stats["unsized_images"] > 0:
+            print(f"  {stats['unsized_images']} images have no known size; use '--imagedir' to get it")
+        if params.get("--imagedir") is not None:
+            print(f"  {stats['downloaded_images']} images downloaded to '{params['--imagedir']}'")
+    if stats["failed_images"] > 0:
+        print(f"ERROR: failed to download {stats['failed_images']} images", file=sys.stderr)
+        exit(2)
+
+
 cmd_usage = f"""
 Usage:  object_labels {cli_utils.common_cmd_flags} <operation> [<args>...]
 
@@ -308,6 +466,8 @@ Where: {cli_utils.common_cmd_flag_descriptions}
       change   -- change certain metadata attributes of an object label
       delete   -- delete one or more label(s)
       show     -- show a metadata for a specific object label
+      import   -- bulk import labels from COCO, Pascal VOC or YOLO annotations
+      export   -- export labels as COCO or YOLO annotations
 
 Use 'object_labels <operation> --help' for more information on a specific command.
 """
@@ -319,7 +479,9 @@ usage_stmt = {
     "list": list_usage,
     "change": change_usage,
     "delete": delete_usage,
-    "show": show_usage
+    "show": show_usage,
+    "import": import_usage,
+    "export": export_usage
 }
 
 # Operation map mapping operation name to function name
@@ -328,7 +490,9 @@ operation_map = {
     "list": report,
     "change": update,
     "delete": delete,
-    "show": show
+    "show": show,
+    "import": import_labels,
+    "export": export_labels
 }
 
 
@@ -338,7 +502,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
@@ -20,7 +20,6 @@
 
 import logging as logger
 import sys
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -119,6 +118,7 @@ def delete(params):
 # ---  List/Report Operation  ----------------------------------------
 list_usage = f"""
 Usage:  object_tags list --dsid=<dataset_id> [--summary] [--sort=<sort-string>]
+                         {cli_utils.list_format_flags}
 
 Where:
    --dsid   Required parameter that identifies the dataset to which the tags
@@ -127,6 +127,7 @@ Where:
    --sort    Comma separated string of field names on which to sort.
              Add " DESC" after a field name to change to a descending sort.
              If adding " DESC", the field list must be enclosed in quotes.
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of object tags matching the input criteria.
 """
@@ -144,6 +145,11 @@ def report(params):
     expectedArgs = {'--sort': 'sortby'}
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.object_tags.report(dsid, **kwargs),
+                               "Failure attempting to list tags", summaryFields)
+        return
+
     rsp = server.object_tags.report(dsid, **kwargs)
 
     if rsp is None:
@@ -215,7 +221,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--tagid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
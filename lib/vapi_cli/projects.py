@@ -21,7 +21,6 @@
 import json
 import sys
 import logging as logger
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -138,15 +137,17 @@ def delete(params):
 
 
 # ---  List Operation  -----------------------------------------------
-list_usage = """
+list_usage = f"""
 Usage:
   projects list [--sort=<sort-string>] [--summary]
+                {cli_utils.list_format_flags}
 
 Where:
   --sort   Comma separated string of project group field names on which to sort.
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each project group returned.
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of project groups matching the input criteria."""
 
@@ -164,6 +165,11 @@ def report(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.projects.report(**kwargs),
+                               "Failure attempting to list project groups", summaryFields)
+        return
+
     rsp = server.projects.report(**kwargs)
 
     if rsp is None:
@@ -426,7 +432,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--pgid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(dict(e))
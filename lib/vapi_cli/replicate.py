@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+
+import json
+import logging as logger
+import sys
+import vapi_cli.cli_utils as cli_utils
+from vapi.base import Base
+from vapi.replicate import ReplicationError, replicate
+
+# All of Vision Tools requires python 3.6 due to format string
+# Make the check in a common location
+if sys.hexversion < 0x03060000:
+    sys.exit("Python 3.6 or newer is required to run this program.")
+
+
+common_flags = "--from=<source_uri> --to=<target_uri> [--fromtoken=<token>] [--totoken=<token>] [--buffers=<n>]"
+
+common_descriptions = """
+   --from      Required base URI of the server to copy from
+               (e.g. 'https://dev-host/api').
+   --to        Required base URI of the server to copy to.
+   --fromtoken Optional API token for the source server. Defaults to the
+               '--token' flag or the 'VAPI_TOKEN' environment variable.
+   --totoken   Optional API token for the target server. Same default.
+   --buffers   Optional number of 1 MB chunks buffered between the download
+               and the upload. The default is 8."""
+
+copy_description = """
+The export from the source server is streamed directly into an import on the
+target server; nothing is written to local disk. The number of bytes received
+is checked against the source's length, and the imported record on the target
+is compared with the source record."""
+
+
+# ---  Dataset Operation  --------------------------------------------
+dataset_usage = f"""
+Usage:  replicate dataset {common_flags} [--raw] --dsid=<dataset_id>...
+
+Where:
+   --dsid      Required dataset to copy. Can be given more than once.
+   --raw       Optional flag to include raw metadata in the copy.
+{common_descriptions}
+{copy_description}"""
+
+
+def dataset(params):
+    """Handles the 'dataset' operation to copy datasets between servers"""
+
+    replicate_all(params, "dataset", params["--dsid"])
+
+
+# ---  Model Operation  ----------------------------------------------
+model_usage = f"""
+Usage:  replicate model {common_flags} --modelid=<model_id>...
+
+Where:
+   --modelid   Required trained model to copy. Can be given more than once.
+{common_descriptions}
+{copy_description}"""
+
+
+def model(params):
+    """Handles the 'model' operation to copy trained models between servers"""
+
+    replicate_all(params, "model", params["--modelid"])
+
+
+def replicate_all(params, kind, ids):
+    try:
+        source = Base(token=params.get("--fromtoken") or cli_utils.token, base_uri=params["--from"])
+        target = Base(token=params.get("--totoken") or cli_utils.token, base_uri=params["--to"])
+    except Exception as e:
+        print("Error: Failed to setup server.", file=sys.stderr)
+        logger.debug(e)
+        exit(1)
+
+    results = []
+    failed = 0
+    for id in ids:
+        try:
+            result = replicate(source, target, kind, id, progress=progress(f"Copying {kind} {id}"),
+                               bufferChunks=int(params.get("--buffers") or 8), raw=params.get("--raw") or False)
+        except ReplicationError as e:
+            failed += 1
+            result = {"kind": kind, "source_id": id, "error": str(e)}
+        results.append(result)
+        if cli_utils.json_only:
+            continue
+        if "error" in result:
+            print(f"ERROR: {result['error']}", file=sys.stderr)
+            continue
+        print(f"Copied {kind} {id} to {result['target_id']}: {result['bytes'] / 1e6:.1f} MB in "
+              f"{result['seconds']}s; sha256 {result['sha256']}")
+        for mismatch in result["mismatches"]:
+            print(f"   WARNING: '{mismatch['field']}' is {mismatch['target']!r} on the target, "
+                  f"{mismatch['source']!r} on the source")
+
+    if cli_utils.json_only:
+        print(json.dumps(results, indent=2))
+    if failed or any(r.get("mismatches") for r in results):
+        exit(2)
+
+
+def progress(label):
+    """ Returns a progress callback; the percentage is shown when the length is known."""
+
+    show = cli_utils.uploadProgress(label)
+    if show is None:
+        return None
+    shown = [-1]
+
+    def callback(sent, total):
+        if total:
+            show(sent, total)
+        elif sent // 10000000 != shown[0]:
+            shown[0] = sent // 10000000
+            print(f"\r{label}: {sent / 1e6:.0f} MB", end="", file=sys.stderr, flush=True)
+    return callback
+
+
+cmd_usage = f"""
+Usage:  replicate {cli_utils.common_cmd_flags} <operation> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+
+   <operation> is required and must be one of:
+      dataset -- copy datasets from one server to another
+      model   -- copy trained models from one server to another
+
+Use 'replicate <operation> --help' for more information on a specific command."""
+
+usage_stmt = {
+    "usage": cmd_usage,
+    "dataset": dataset_usage,
+    "model": model_usage
+}
+
+operation_map = {
+    "dataset": dataset,
+    "model": model
+}
+
+
+def main(params, cmd_flags=None):
+    # The servers come from '--from' and '--to'; no default server is required
+    args = cli_utils.get_valid_input(usage_stmt, operation_map, argv=params, cmd_flags=cmd_flags,
+                                     requireServer=False)
+    if args is not None:
+        args.operation(args.op_params)
+
+
+if __name__ == "__main__":
+    main(None)
@@ -20,7 +20,6 @@
 
 import logging as logger
 import sys
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -105,7 +104,7 @@ def main(params, cmd_flags=None):
         if args.cmd_params["<operation>"] == "token":
             cli_utils.token = ""
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
@@ -20,7 +20,6 @@
 
 import logging as logger
 import sys
-import vapi
 import vapi_cli.cli_utils as cli_utils
 from vapi_cli.cli_utils import reportSuccess, reportApiError, translate_flags
 
@@ -32,22 +31,30 @@ if sys.hexversion < 0x03060000:
 server = None
 
 # ---  Delete Operation  ---------------------------------------------
-delete_usage = """
+delete_usage = f"""
 Usage:
-  trained-models delete (--modelid=<model-id> | --id=<model-id>)
+  trained-models delete (--modelid=<model-id> | --id=<model-id> | {cli_utils.bulk_flags})
 
 Where:
   --modelid | --id   A required parameter that identifies the model to be
            deleted.
+{cli_utils.bulk_flag_descriptions}
 
-Deletes the indicated model. At this time, only 1 model can be 
-deleted at a time."""
+Deletes the indicated model, or every model listed by '--ids-from'."""
 
 
 def delete(params):
-    """Deletes one model identified by the --modelid parameter.
+    """Deletes one model identified by the --modelid parameter,
+    or the models listed by '--ids-from'."""
 
-    Future work should allow a list of trained-models."""
+    if params.get("--ids-from") is not None:
+        def deleteOne(modelid, record):
+            server.trained_models.delete(modelid)
+            return server.rsp_ok()
+
+        cli_utils.runBulk(server, cli_utils.readRecords(params["--ids-from"]), deleteOne,
+                          int(params.get("--workers") or 8), "Deleted models")
+        return
 
     modelid = params.get("--modelid", "missing_id")
     rsp = server.trained_models.delete(modelid)
@@ -58,11 +65,11 @@ def delete(params):
 
 
 # ---  List Operation  -----------------------------------------------
-list_usage = """
+list_usage = f"""
 Usage:
   trained-models list [--usage=<model-type>] [--pgid=<project-group-id>...]
                      [--production_status=<status>] [--sort=<sort_string>]
-                     [--summary]
+                     [--summary] {cli_utils.list_format_flags}
 
 Where:
   --usage  An optional parameter that identifies the type of model to list.
@@ -85,6 +92,7 @@ Where:
            Add " DESC" after a field name to change to a descending sort.
            If adding " DESC", the field list must be enclosed in quotes.
   --summary Flag requesting only summary output for each dataset returned
+{cli_utils.list_format_flag_descriptions}
 
 Generates a JSON list of trained-models matching the input criteria."""
 
@@ -105,6 +113,11 @@ def report(params):
     }
     kwargs = translate_flags(expectedArgs, params)
 
+    if params.get("--format") is not None:
+        cli_utils.reportStream(server, params, lambda: server.trained_models.report(**kwargs),
+                               "Failure attempting to list trained-models", summaryFields)
+        return
+
     rsp = server.trained_models.report(**kwargs)
 
     if rsp is None:
@@ -227,12 +240,15 @@ def deploy(params):
 # ---  Import Operation  ---------------------------------------------
 import_usage = """
 Usage:
-  trained-models import <file-path>
+  trained-models import [--resumable] <file-path>
 
 Where:
   <file-path> Required parameter identifying the path to the zip file to import.
               The file must be an IBM Visual Insights (PowerAI Vision) Model
               export zip file.
+  --resumable Optional flag to upload in resumable chunks when the server supports
+              it; otherwise the whole file is retried after a failure. The file's
+              SHA-256 digest is verified at the end either way.
 
 Import an exported trained model zip file into the server.."""
 
@@ -242,7 +258,16 @@ def import_model(params):
 
     filename = params.get("<file-path>", None)
 
-    rsp = server.trained_models.import_model(filename)
+    from vapi.resumable import UploadError
+
+    try:
+        rsp = server.trained_models.import_model(filename, progress=cli_utils.uploadProgress("Uploading"),
+                                                 resumable=params.get("--resumable"))
+    except OSError as e:
+        print(f"ERROR: cannot read '{filename}'; {e}", file=sys.stderr)
+        exit(1)
+    except UploadError as e:
+        reportApiError(server, f"Failure while importing a model; {e}")
     if rsp is None:
         reportApiError(server, "Failure while importing a model.")
     else:
@@ -364,7 +389,7 @@ def main(params, cmd_flags=None):
     args = cli_utils.get_valid_input(usage_stmt, operation_map, id="--modelid", argv=params, cmd_flags=cmd_flags)
     if args is not None:
         try:
-            server = vapi.connect_to_server(cli_utils.host_name, cli_utils.token)
+            server = cli_utils.connect_to_server()
         except Exception as e:
             print("Error: Failed to setup server.", file=sys.stderr)
             logger.debug(e)
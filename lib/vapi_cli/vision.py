@@ -0,0 +1,96 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2019,2022 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+"""
+Top level 'vision' command: parses the global flags and dispatches to the
+resource's CLI module. Used by the 'cli/vision' script and the daemon.
+"""
+import sys
+import importlib
+import vapi_cli.cli_utils as cli_utils
+from vapi_cli.docopt import docopt
+
+usage_stmt = f"""
+Usage:  vision {cli_utils.common_cmd_flags} [-?] <resource> [<args>...]
+
+Where:
+{cli_utils.common_cmd_flag_descriptions}
+   -?  displays this help message.
+
+   <resource> is required and must be one of:
+      backup         -- export datasets and trained models with a manifest
+      batch          -- run many commands in one process and session
+      daemon         -- keep a warm 'vision' process to run later commands
+      categories     -- work with categories within a dataset
+      datasets       -- work with datasets
+      files          -- work with dataset files (images and/or videos)
+      fkeys          -- work with user file metadata keys
+      fmetadata      -- work with user file metadata key/value pairs
+      mirror         -- sync and query a local copy of dataset metadata
+      object-tags    -- work with object detection tags 
+      object-labels  -- work with object detection labels (aka annotations)
+      dltasks        -- work with DL training tasks
+      trained-models -- work with trained models
+      deployed-models -- work with deployed models
+      projects       -- work with projects
+      replicate      -- copy datasets and trained models between servers
+      users          -- work with users
+      system         -- server system information
+
+'vision' provides access to Maximo Visual Inspection resources via the ReST API.
+Use 'vision <resource> --help' for more information about operating on a given resource"""
+
+
+def main(argv=None):
+    """ Runs a 'vision' command line.
+
+    :param argv -- arguments after 'vision'; defaults to 'sys.argv[1:]'"""
+
+    args = docopt(usage_stmt, options_first=True, argv=argv)
+    if args is not None:
+        #print(f"@@@ args={args}", file=sys.stderr)
+        if args["<resource>"] in ["help", None]:
+            print(usage_stmt, file=sys.stderr)
+        else:
+            # argv = [args["<resource>"]] + args["<args>"]
+            argv = args["<args>"]
+            if argv is None:
+                argv = ["--help"]
+
+            # handle abbreviated entities
+            resource = args["<resource>"]
+            matches = cli_utils.resolve_resource(resource)
+            if len(matches) != 1:
+                # Generate correct error message and exit (with usage statement)
+                if len(matches) > 1:
+                    print(f"ERROR: resource '{resource}' not unique; matches={matches}")
+                else:
+                    print(f"ERROR: Unknown resource -- {resource}", file=sys.stderr)
+                print(usage_stmt, file=sys.stderr)
+                exit(1)
+
+            resource = matches[0]
+
+            try:
+                pkg = importlib.import_module(f"vapi_cli.{resource}", package=None)
+                pkg.main(argv, cmd_flags=args)
+            except ModuleNotFoundError as err:
+                print(f"ERROR: Unknown resource -- {resource}", file=sys.stderr)
+                print(usage_stmt, file=sys.stderr)
+                raise err
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+VISION = os.path.join(ROOT, "cli", "vision")
+
+HELP_COMMANDS = [["--help"]] + [[r, "--help"] for r in (
+    "datasets", "files", "categories", "object-tags", "object-labels", "fkeys", "fmetadata", "dltasks",
+    "trained-models", "deployed-models", "projects", "system", "users", "mirror", "backup", "replicate", "batch",
+    "daemon")]
+
+LIST_COMMANDS = [["datasets", "list"], ["trained-models", "list"], ["deployed-models", "list"], ["dltasks", "list"]]
+
+
+def main():
+    """ Measures the wall time of short 'vision' commands. Scripted pipelines call
+    'vision' thousands of times, so interpreter start and imports dominate; the
+    benchmark fails (exit code 1) if any command's median exceeds its target.
+    List commands have their own target because they must import 'requests'.
+
+    List commands are sent to a local stub server that answers every GET with an
+    empty list, unless '--uri' names a real server, so only the client is measured."""
+
+    args = getInputs()
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.join(ROOT, "lib"), env.get("PYTHONPATH")]))
+    env.setdefault("VAPI_TOKEN", "benchmark")
+
+    stub = None
+    if args.uri is None:
+        stub = ThreadingHTTPServer(("127.0.0.1", 0), EmptyListHandler)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        args.uri = f"http://127.0.0.1:{stub.server_address[1]}/api"
+    env["VAPI_BASE_URI"] = args.uri
+
+    python = median([sys.executable, "-c", "pass"], env, args.repeat)
+    print(f"{'python -c pass':40s} {python * 1000:8.1f} ms")
+    slow = []
+    commands = [(c, args.target) for c in HELP_COMMANDS]
+    if not args.nolist:
+        commands += [(c, args.listtarget) for c in LIST_COMMANDS]
+    for command, target in commands:
+        elapsed = median([sys.executable, VISION] + command, env, args.repeat)
+        over = elapsed * 1000 > target
+        if over:
+            slow.append(command)
+        print(f"{' '.join(['vision'] + command):40s} {elapsed * 1000:8.1f} ms{'  SLOW' if over else ''}")
+
+    if stub is not None:
+        stub.shutdown()
+    if slow:
+        print(f"{len(slow)} commands over their target")
+        return 1
+    return 0
+
+
+def median(command, env, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+class EmptyListHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps([]).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def getInputs():
+    parser = argparse.ArgumentParser(description="Benchmark of 'vision' CLI startup time")
+    parser.add_argument('--target', action="store", type=float, default=150,
+                        help="Maximum median time of a help command in milliseconds. Default is 150.")
+    parser.add_argument('--listtarget', action="store", type=float, default=300,
+                        help="Maximum median time of a list command in milliseconds. Default is 300.")
+    parser.add_argument('--repeat', action="store", type=int, default=5, help="Runs per command. Default is 5.")
+    parser.add_argument('--uri', action="store", help="Server for the list commands. Default is a local stub.")
+    parser.add_argument('--nolist', action="store_true", help="Only measure the help commands.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,11 +21,9 @@ import argparse
 import json
 import sys
 
-import requests
 import vapi
 import logging as logger
-from concurrent.futures import ThreadPoolExecutor
-from concurrent.futures import as_completed
+from vapi.paging import iterate, PagingError
 
 args = None
 server = None
@@ -36,6 +34,10 @@ def main(params):
 The number of files matching the criteria will be  presented and the
 user will be  prompted to perform the delete.
 A "force" flag is provided to avoid the prompt.
+
+Matching files are read a page at a time and deleted in chunks by a pool of
+workers (see 'Files.delete_many'), so the full list of ids is never held in
+memory and no single request holds the dataset for long.
     """
     global args
     args = getValidInputs()
@@ -44,8 +46,15 @@ A "force" flag is provided to avoid the prompt.
 
     setupLogging(args.log)
     setupServer()
-    listOfFiles = getFileList()
-    deleteFilesInList(listOfFiles)
+    if not args.force:
+        numberOfFiles = countFiles()
+        if numberOfFiles <= 0:
+            print("No files found matching the given query criteria.")
+            logger.info("Query found no files to delete.")
+            return
+        if not okToDeleteFiles(numberOfFiles):
+            return
+    deleteMatchingFiles()
 
 
 def setupLogging(log):
@@ -79,67 +88,72 @@ def setupServer():
         exit(2)
 
 
-def getFileList():
-    """ Query MVI server for the list of files matching the given query."""
-    files = server.files.report(args.dsid, query=args.queryString)
-    if not server.rsp_ok():
-        print(f"Error: Got status code {server.status_code()} from file lookup. Reason = {json.dumps(server.json(), indent=2)}")
-        exit(2)
-    return files
+def countFiles():
+    """ Counts the files matching the query, reading the list a page at a time."""
+    try:
+        return sum(1 for _ in iterate(server.files.report, args.dsid, pageSize=args.pageSize,
+                                      query=args.queryString))
+    except PagingError as e:
+        queryFailed(e)
+
 
+def getFilePage(skip):
+    """ Gets one page of the files matching the query, in a stable (id) order."""
+    files = server.files.report(args.dsid, query=args.queryString, sortby="_id", limit=args.pageSize, skip=skip)
+    if files is None:
+        queryFailed(f"failed to retrieve files {skip} to {skip + args.pageSize}")
+    return files
 
-def deleteFilesInList(fileList):
-    """ Delete all files from the MVI server that are in the provided list of files."""
 
-    numberOfFiles = len(fileList)
-    logger.debug(f"deleting {numberOfFiles} files from dataset id {args.dsid}.")
-    if numberOfFiles <= 0:
+def queryFailed(reason):
+    print(f"Error: Got status code {server.status_code()} from file lookup; {reason}. "
+          f"Reason = {json.dumps(server.json(), indent=2)}", file=sys.stderr)
+    exit(2)
+
+
+def deleteMatchingFiles():
+    """ Deletes the files matching the query a page at a time.
+
+    Files that could not be deleted still match the query. As pages are sorted
+    by id, they are always the first ones of the next query; skipping them keeps
+    the following pages aligned."""
+
+    logger.info(f"Deleting files matching '{args.queryString}' from dataset id {args.dsid}.")
+    deleted = failed = chunks = 0
+    skip = 0
+    while True:
+        page = getFilePage(skip)
+        if len(page) == 0:
+            break
+        idList = [dic['_id'] for dic in page]
+        for result in server.files.delete_many(args.dsid, idList, chunkSize=args.chunkSize,
+                                               workers=args.workers, retries=args.retries):
+            chunks += 1
+            deleted += result["success_count"]
+            failed += result["fail_count"]
+            skip += len(result["ids"]) - result["success_count"]
+            msg = f"chunk {chunks}: deleted {result['success_count']}, failed on {result['fail_count']}"
+            if result["attempts"] > 1:
+                msg += f" after {result['attempts']} attempts"
+            if result["error"] is not None:
+                msg += f"; {result['error']}"
+            print(msg, file=sys.stderr if result["fail_count"] else sys.stdout)
+        if len(page) < args.pageSize:
+            break
+
+    if deleted + failed == 0:
         print("No files found matching the given query criteria.")
-        logger.info("Query found no files to delete.")
-        return
-    if numberOfFiles > 1000:
-        numberOfThreads = 16
-    else:
-        numberOfThreads = 8
-
-    if not okToDeleteFiles(fileList):
         return
-    logger.info(f"Deleting {numberOfFiles} files from dataset id {args.dsid}.")
-
-    # The vision-tools library does not support group/batch delete of files.
-    # So we have to use the requests interface directly.
-    idList = [dic['_id'] for dic in fileList]
-    payload = {
-        "action": "delete",
-        "id_list": idList
-    }
-
-    url = f"{server.server.baseurl}/datasets/{args.dsid}/files/action"
-    headers = {
-        "x-auth-token":  server.server.token
-    }
-    rsp = requests.post(url, headers=headers, verify=False, json=payload)
-
-    rspData = rsp.json()
-    if rsp.ok:
-        if "result" in rspData:
-            print(f"""successfully deleted {rspData["success_count"]}, failed on {rspData["fail_count"]}""")
-            logger.debug(json.dumps(rsp.json(), indent=2))
-        else:
-            print(f"""""", file=sys.stderr)
-            print(json.dumps(rspData, indent=2), file=sys.stderr)
-    else:
-        print(f"delete operation rejected by server with code {rsp.status_code}.", file=sys.stderr)
-        if "success_count" in rspData:
-            print(f"""successfully deleted {rspData["success_count"]}, failed on {rspData["fail_count"]}""", file=sys.stderr)
-        print(json.dumps(rspData, indent=2), file=sys.stderr)
+    print(f"successfully deleted {deleted}, failed on {failed}")
+    if failed > 0:
+        exit(2)
 
 
-def okToDeleteFiles(fileList):
+def okToDeleteFiles(numberOfFiles):
     """ Prompts the user to confirm the delete operation."""
     doDelete = False
     if not args.force:
-        userRsp = input(f"\nDo you want to proceed with deleting {len(fileList)} files from dataset id {args.dsid}? (y/N): ")
+        userRsp = input(f"\nDo you want to proceed with deleting {numberOfFiles} files from dataset id {args.dsid}? (y/N): ")
         print()
         logger.debug(f"User responded with '{userRsp}'")
         lcRsp = userRsp.lower()
@@ -175,6 +189,14 @@ def getValidInputs():
                         help="Log level (debug, info, warn, error). Default is 'warn'.")
     parser.add_argument('--force', action="store", required=False, type=bool, default=False,
                         help="Do not perform the 'Are you sure?' prompt, just do the delete.")
+    parser.add_argument('--pagesize', action="store", dest="pageSize", required=False, type=int, default=5000,
+                        help="Number of file ids read from the server per query. Default is 5000.")
+    parser.add_argument('--chunksize', action="store", dest="chunkSize", required=False, type=int, default=500,
+                        help="Number of files deleted per request. Default is 500.")
+    parser.add_argument('--workers', action="store", required=False, type=int, default=4,
+                        help="Number of concurrent delete requests. Default is 4.")
+    parser.add_argument('--retries', action="store", required=False, type=int, default=3,
+                        help="Attempts for delete requests that fail. Default is 3.")
 
     try:
         results = parser.parse_args()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+import argparse
+import sys
+import time
+
+import numpy as np
+from vapi import rle
+
+
+def main():
+    """ Micro-benchmark comparing the vectorized RLE codec in 'vapi.rle' with a
+    straight forward per-pixel Python implementation."""
+
+    args = getInputs()
+    mask = makeMask(args.height, args.width, args.objects)
+    print(f"mask {args.height}x{args.width}, {args.objects} objects, {int(mask.sum())} foreground pixels")
+
+    encoded = rle.encode(mask)
+    assert loopEncode(mask) == encoded["counts"]
+    assert (rle.decode(encoded) == mask).all()
+    assert (loopDecode(encoded["counts"], mask.shape) == mask).all()
+
+    report("encode", lambda: loopEncode(mask), lambda: rle.encode(mask), args.repeat)
+    report("decode", lambda: loopDecode(encoded["counts"], mask.shape), lambda: rle.decode(encoded), args.repeat)
+    report("area", lambda: int(loopDecode(encoded["counts"], mask.shape).sum()), lambda: rle.area(encoded),
+           args.repeat)
+
+
+def makeMask(height, width, objects):
+    """ Builds a mask with random elliptical objects, similar to segmentation output."""
+
+    rng = np.random.default_rng(1)
+    yy, xx = np.mgrid[0:height, 0:width]
+    mask = np.zeros((height, width), dtype=bool)
+    for _ in range(objects):
+        cy, cx = rng.integers(0, height), rng.integers(0, width)
+        ry, rx = rng.integers(10, height // 4), rng.integers(10, width // 4)
+        mask |= ((yy - cy) / ry) ** 2 + ((xx - cx) / rx) ** 2 <= 1
+    return mask
+
+
+def loopEncode(mask):
+    counts = []
+    current = False
+    run = 0
+    for value in mask.ravel(order="F").tolist():
+        if value != current:
+            counts.append(run)
+            run = 0
+            current = value
+        run += 1
+    counts.append(run)
+    return counts
+
+
+def loopDecode(counts, shape):
+    flat = []
+    value = False
+    for count in counts:
+        flat.extend([value] * count)
+        value = not value
+    return np.array(flat, dtype=bool).reshape(shape, order="F")
+
+
+def report(name, loopFn, vectorFn, repeat):
+    loopTime = timeit(loopFn, repeat)
+    vectorTime = timeit(vectorFn, repeat)
+    print(f"{name:8s} loop={loopTime * 1000:9.2f} ms  vectorized={vectorTime * 1000:8.2f} ms  "
+          f"speedup={loopTime / vectorTime:7.1f}x")
+
+
+def timeit(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def getInputs():
+    parser = argparse.ArgumentParser(description="Benchmark of the vectorized RLE mask codec")
+    parser.add_argument('--height', action="store", type=int, default=2048, help="Mask height. Default is 2048.")
+    parser.add_argument('--width', action="store", type=int, default=2448, help="Mask width. Default is 2448.")
+    parser.add_argument('--objects', action="store", type=int, default=20, help="Number of objects. Default is 20.")
+    parser.add_argument('--repeat', action="store", type=int, default=3, help="Timing repetitions. Default is 3.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
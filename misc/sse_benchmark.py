@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+import argparse
+import json
+import sys
+import time
+
+from vapi.SseMonitor import SseParser
+
+
+def main():
+    """ Micro-benchmark of the incremental SSE parser in 'vapi.SseMonitor' compared
+    with the previous approach of concatenating lines into 'bytes' and decoding
+    every event before filtering."""
+
+    args = getInputs()
+    stream = makeStream(args.events, args.newline.encode("utf-8").decode("unicode_escape").encode("utf-8"))
+    chunks = [stream[i:i + args.chunk] for i in range(0, len(stream), args.chunk)]
+    include = ["dataset-updated"] if args.filter else None
+    print(f"{args.events} events, {len(stream)} bytes in {len(chunks)} chunks of {args.chunk} bytes, "
+          f"include={include}")
+
+    assert len(parseNew(chunks, None)) == args.events
+
+    report("previous", lambda: parseOld(chunks, include), args.events, args.repeat)
+    report("parser", lambda: parseNew(chunks, include), args.events, args.repeat)
+    report("parser+json", lambda: [e.json() for e in parseNew(chunks, include)], args.events, args.repeat)
+
+
+def makeStream(count, newline):
+    """ Builds an event stream resembling MVI notifications; 1 in 10 events is 'dataset-updated'."""
+
+    parts = []
+    for i in range(count):
+        name = "dataset-updated" if i % 10 == 0 else "usage-metric"
+        data = json.dumps({"id": f"{i:08d}", "type": name, "status": "completed", "progress": i % 100})
+        parts.append(f"event:{name}{newline.decode()}data:{data}{newline.decode()}{newline.decode()}")
+    return "".join(parts).encode("utf-8")
+
+
+def parseNew(chunks, include):
+    parser = SseParser(includeEvents=include)
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    return events
+
+
+def parseOld(chunks, include):
+    events = []
+    sse = b''
+    wholeEvents = []
+    for data in chunks:
+        for line in data.splitlines(True):
+            sse += line
+            if sse.endswith((b'\r\r', b'\n\n', b'\r\n\r\n')):
+                wholeEvents.append(sse)
+                sse = b''
+    for sseString in wholeEvents:
+        event = {}
+        for line in sseString.splitlines():
+            line = line.decode("utf-8")
+            if not line.strip() or line.startswith(":"):
+                continue
+            field, value = line.split(":", 1)
+            value = value.strip()
+            if field == "data":
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    pass
+            event[field] = value
+        if include is None or event["event"] in include:
+            events.append(event)
+    return events
+
+
+def report(name, fn, count, repeat):
+    elapsed = timeit(fn, repeat)
+    print(f"{name:12s} {elapsed * 1000:9.2f} ms  {count / elapsed:12,.0f} events/s")
+
+
+def timeit(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def getInputs():
+    parser = argparse.ArgumentParser(description="Benchmark of the incremental SSE parser")
+    parser.add_argument('--events', action="store", type=int, default=100000, help="Number of events. Default is 100000.")
+    parser.add_argument('--chunk', action="store", type=int, default=1500,
+                        help="Network chunk size in bytes. Default is 1500.")
+    parser.add_argument('--newline', action="store", default="\\n", help="Line terminator. Default is '\\n'.")
+    parser.add_argument('--filter', action="store_true", help="Only keep 'dataset-updated' events.")
+    parser.add_argument('--repeat', action="store", type=int, default=3, help="Timing repetitions. Default is 3.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
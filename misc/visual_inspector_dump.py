@@ -24,6 +24,7 @@ import csv
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
@@ -148,6 +149,8 @@ def getInputs():
                       help="Migrate Visual Inspector 1.0 metadata to 1.1 formats. Does not create CSV output. Requires IBM Visual Insights or Maximo Visual Inspection 1.2.0.1 or greater")
   parser.add_argument('--debug', action="store_true", dest="debug", required=False,
                       help="Set Debug logging level")
+  parser.add_argument('--workers', action="store", dest="workers", required=False, default=8, type=int,
+                      help="(Optional) Number of concurrent metadata requests when migrating metadata. Default is 8.")
   parser.add_argument('--newerthan', action="store", dest="newerthan", required=False, default=0,
                       help="(Optional) Output only records newer than this timestamp in YYYYMMDDHHmmss format eg \"20200622134840\" is \"2020 June 22, 13:48:40\"")
 
@@ -232,7 +235,7 @@ def enumeratefiles(dsid=None, url="http://ip/instance-name"):
 # -------------------------------------
 # Parse and save file metadata
 #
-def saveMetadata(dsid=None, url="http://ip/instance-name"):
+def saveMetadata(dsid=None, url="http://ip/instance-name", workers=8):
   
   # get the list of affected files that we're potentially acting upon
   # note that filters or other rules might mean that we may not actually touch ALL of these
@@ -241,6 +244,7 @@ def saveMetadata(dsid=None, url="http://ip/instance-name"):
   # save metadata through visual inspection's user-metadata API
   logging.info("Beginning migration for %d files..." % len(dsFiles))
   successcount = 0
+  jobs = []
   for dsFile in dsFiles:
     if "___" in dsFile['original_file_name']:
       filejson = {}
@@ -287,14 +291,19 @@ def saveMetadata(dsid=None, url="http://ip/instance-name"):
       filejson = dict(zip(keys, visinspectdata))
       logging.debug(filejson)
       #TODO: re-save bounding boxes as inferred label type
-      logging.info("Migrating dataset %s, file %s" % (dsFile['datasetid'], dsFile['_id']))
-      success = postUserMetadata(dsFile['datasetid'], dsFile['_id'], filejson)
-      if success:
-        successcount += 1
+      jobs.append((dsFile['datasetid'], dsFile['_id'], filejson))
+
+  # post the metadata of many files at once; each post is independent
+  def migrate(job):
+    logging.info("Migrating dataset %s, file %s" % (job[0], job[1]))
+    return postUserMetadata(*job)
+
+  with ThreadPoolExecutor(max_workers=workers) as pool:
+    successcount = sum(1 for success in pool.map(migrate, jobs) if success)
 
   logging.info("Migration complete. Migrated %d records" % (successcount))
-  if successcount != len(dsFiles):
-    logging.warning("We failed to migrate data for %d files." % (len(dsFiles) - successcount))
+  if successcount != len(jobs):
+    logging.warning("We failed to migrate data for %d files." % (len(jobs) - successcount))
   return successcount
 
 def getUserMetadata(dsId):
@@ -463,7 +472,7 @@ if __name__ == '__main__':
 
     if args.migrate:
       logging.debug("Starting migration of down-level inspector data to metadata APIs...")
-      numfilesmigrated = saveMetadata(dsid=args.dsid, categoryname=args.categoryname, url=args.url)
+      numfilesmigrated = saveMetadata(dsid=args.dsid, url=args.url, workers=args.workers)
       logging.info("Finished migrating data for %d files." % (numfilesmigrated))
 
     elif args.output:
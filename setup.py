@@ -21,6 +21,7 @@ setup(
     install_requires=[
          "requests",
          "opencv-python", # this is required by 'vision deployed-models infer' #38
+         "numpy",  # used for annotation rendering (already a dependency of opencv-python)
     ],
     classifiers=[
         "Programming Language :: Python :: 3",
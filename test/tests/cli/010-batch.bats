@@ -0,0 +1,125 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_DSID_FILE="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.ids"
+
+# Prints "<line> <exit_code>" for each JSON result line of 'batch run' on STDIN
+batch_codes() {
+    python -c 'import sys,json
+for line in sys.stdin:
+    r = json.loads(line)
+    print(r["line"], r["exit_code"])'
+}
+
+
+@test "Batch run with missing command file" {
+    run vision batch run --file ${VCT_WK_DIR}/no-such-file.txt
+    assert_failure
+    assert_output -p "cannot read"
+}
+
+
+@test "Batch Tests Setup" {
+    run vision dataset create --name "VCT_batch"
+    assert_success
+    dsid=$(extract_uuid $output)
+    printf "dsid: %s\n" ${dsid} >${VCT_DSID_FILE}
+}
+
+
+# Blank and comment lines are skipped; lines are plain or JSON commands
+@test "Batch run from STDIN" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    cat >${VCT_WK_DIR}/batch-cmds.txt <<EOC
+# dataset checks
+
+datasets show --dsid ${dsid}
+{"id": "json-cmd", "args": ["datasets", "show", "--dsid", "${dsid}"]}
+vision files list --dsid ${dsid} --summary
+EOC
+
+    run bash -c "vision batch run <${VCT_WK_DIR}/batch-cmds.txt"
+    assert_success
+    assert_equal ${#lines[@]} 3
+    assert_equal "$(printf '%s\n' "${lines[@]}" | batch_codes | tr '\n' ' ')" "3 0 4 0 5 0 "
+    assert_line -p -n 0 '"name": "VCT_batch"'
+    assert_line -p -n 1 '"id": "json-cmd"'
+    assert_line -p -n 2 '"command": ["files", "list"'
+}
+
+
+@test "Batch run with failing commands" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    printf "datasets show --dsid bad-123\nnot-a-resource list\ndatasets show --dsid %s\n" ${dsid} >${VCT_WK_DIR}/batch-fail.txt
+
+    run vision batch run --file ${VCT_WK_DIR}/batch-fail.txt
+    assert_failure 2
+    assert_equal ${#lines[@]} 3
+    assert_line -p -n 0 '"exit_code": 2'
+    assert_line -p -n 1 "Unknown resource -- not-a-resource"
+    assert_equal "$(printf '%s\n' "${lines[@]}" | batch_codes | tail -1)" "3 0"
+}
+
+
+@test "Batch run stop on error" {
+    run vision batch run --file ${VCT_WK_DIR}/batch-fail.txt --stoponerror
+    assert_failure 2
+    assert_equal ${#lines[@]} 1
+}
+
+
+# Results are printed in input order even when commands run concurrently
+@test "Batch run concurrently" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    for i in 1 2 3 4 5 6
+    do
+        echo "datasets show --dsid ${dsid}"
+    done >${VCT_WK_DIR}/batch-many.txt
+
+    run vision batch run --file ${VCT_WK_DIR}/batch-many.txt --workers 4
+    assert_success
+    assert_equal "$(printf '%s\n' "${lines[@]}" | batch_codes | tr '\n' ' ')" "1 0 2 0 3 0 4 0 5 0 6 0 "
+}
+
+
+@test "Batch Tests Cleanup" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    run vision dataset delete --dsid $dsid
+    assert_success
+}
@@ -0,0 +1,123 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VAPI_DAEMON_SOCKET="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.sock"
+
+
+@test "Daemon status with no daemon running" {
+    run vision daemon status
+    assert_failure
+    assert_output -p "no daemon is running"
+}
+
+
+@test "Daemon stop with no daemon running" {
+    run vision daemon stop
+    assert_failure
+    assert_output -p "no daemon is running"
+}
+
+
+@test "Daemon start" {
+    run vision daemon start --idle=300
+    assert_success
+    assert_output -p "Started daemon"
+    assert_output -p "0 commands run"
+
+    run vision daemon start
+    assert_success
+    assert_output -p "A daemon is already running"
+}
+
+
+# Commands are forwarded to the daemon unless VAPI_NO_DAEMON is set
+@test "Daemon runs forwarded commands" {
+    run vision datasets list --summary
+    assert_success
+
+    run env VAPI_NO_DAEMON=1 vision datasets list --summary
+    assert_success
+
+    run vision datasets show --dsid bad-123
+    assert_failure
+
+    run vision daemon status
+    assert_success
+    assert_output -p "Daemon is running"
+    assert_output -p "2 commands run"
+}
+
+
+# Global option values are not taken for the resource: 'd' would abbreviate 'daemon'
+@test "Daemon routes commands after global option values" {
+    run vision --log d datasets list --summary
+    assert_success
+
+    # 'batch' always runs in the calling process
+    echo "datasets list --summary" >${VCT_WK_DIR}/daemon-batch.txt
+    run vision --log warn batch run --file ${VCT_WK_DIR}/daemon-batch.txt
+    assert_success
+
+    run vision daemon status
+    assert_success
+    assert_output -p "3 commands run"
+}
+
+
+@test "Daemon status in JSON" {
+    run vision --jsonoutput daemon status
+    assert_success
+    assert_output -p '"commands": 3'
+}
+
+
+@test "Daemon stop" {
+    run vision daemon stop
+    assert_success
+    assert_output -p "Stopped daemon"
+
+    # The daemon exits once its listener notices the stop (within a second)
+    for i in $(seq 1 10); do
+        [ -e ${VAPI_DAEMON_SOCKET} ] || break
+        sleep 1
+    done
+    run vision daemon status
+    assert_failure
+    assert_output -p "no daemon is running"
+}
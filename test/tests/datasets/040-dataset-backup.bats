@@ -0,0 +1,154 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_DSID_FILE="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.ids"
+export VCT_BACKUP_DIR="${VCT_WK_DIR}/backup"
+
+@test "Backup export with no Args" {
+    run vision backup export
+    assert_failure
+    assert_output -p "Missing required arguments"
+    assert_output -p "Usage:"
+}
+
+
+@test "Backup export with nothing to export" {
+    run vision backup export --output ${VCT_BACKUP_DIR}
+    assert_failure
+    assert_output -p "no datasets or trained models to export"
+}
+
+
+@test "Backup export with Bad Dataset Id" {
+    run vision backup export --output ${VCT_BACKUP_DIR} --dsid bad-123
+    assert_failure
+    assert_output -p "Failure attempting to get dataset 'bad-123'"
+}
+
+
+@test "Backup verify without a manifest" {
+    run vision backup verify --output ${VCT_WK_DIR}/no-backup
+    assert_failure
+    assert_output -p "does not contain a backup manifest"
+}
+
+
+# The following test only creates a dataset to be used for the remaining
+# backup tests. It should always pass if the server is operating correctly.
+@test "Backup Tests Setup" {
+    run vision dataset import ${VCT_DATA_DIR}/tiny-dataset.zip
+    assert_success
+    dsid=$(extract_uuid $output)
+    printf "dsid: %s\n", ${dsid} >${VCT_DSID_FILE}
+    wait_for_task ${dsid} 3
+}
+
+
+@test "Backup export" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision backup export --output ${VCT_BACKUP_DIR} --dsid ${dsid}
+    assert_success
+    assert_line -p -n 0 "$(printf 'dataset/%s\texported' ${dsid})"
+    assert_output -p "1 exported"
+    assert_output -p "0 unchanged, 0 failed"
+    [ -f ${VCT_BACKUP_DIR}/datasets/${dsid}.zip ]
+
+    # The manifest records the digest of the saved export
+    digest=$(python -c 'import hashlib,sys;print(hashlib.sha256(open(sys.argv[1],"rb").read()).hexdigest())' ${VCT_BACKUP_DIR}/datasets/${dsid}.zip)
+    run python -c 'import json,sys;print(json.load(open(sys.argv[1]))["artifacts"]["dataset/"+sys.argv[2]]["sha256"])' ${VCT_BACKUP_DIR}/manifest.json ${dsid}
+    assert_output "${digest}"
+}
+
+
+@test "Backup export of unchanged Dataset" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision backup export --output ${VCT_BACKUP_DIR} --dsid ${dsid}
+    assert_success
+    assert_output -p "$(printf 'dataset/%s\tunchanged' ${dsid})"
+    assert_output -p "0 exported (0.0 MB), 1 unchanged, 0 failed"
+}
+
+
+@test "Backup export forced" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision backup export --output ${VCT_BACKUP_DIR} --dsid ${dsid} --force
+    assert_success
+    assert_output -p "1 exported"
+}
+
+
+@test "Backup verify" {
+    run vision backup verify --output ${VCT_BACKUP_DIR}
+    assert_success
+    assert_output "1 of 1 artifacts verified"
+}
+
+
+# Verifying a backup does not need a server
+@test "Backup verify without a server" {
+    run env -u VAPI_HOST -u VAPI_INSTANCE -u VAPI_BASE_URI vision backup verify --output ${VCT_BACKUP_DIR}
+    assert_success
+    assert_output "1 of 1 artifacts verified"
+}
+
+
+@test "Backup verify of a damaged export" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    printf "x" >>${VCT_BACKUP_DIR}/datasets/${dsid}.zip
+
+    run vision backup verify --output ${VCT_BACKUP_DIR}
+    assert_failure
+    assert_line -n 0 -p "$(printf 'dataset/%s\tsize' ${dsid})"
+    assert_output -p "0 of 1 artifacts verified"
+
+    rm ${VCT_BACKUP_DIR}/datasets/${dsid}.zip
+    run vision backup verify --output ${VCT_BACKUP_DIR}
+    assert_failure
+    assert_line -n 0 "$(printf 'dataset/%s\tmissing' ${dsid})"
+}
+
+
+@test "Backup Tests Cleanup" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    run vision dataset delete --dsid $dsid
+    assert_success
+}
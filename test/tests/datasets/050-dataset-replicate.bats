@@ -0,0 +1,108 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_DSID_FILE="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.ids"
+# The test server is both the source and the target of the copies
+export VCT_SERVER_URI="https://${VAPI_HOST}/${VAPI_INSTANCE}/api"
+
+@test "Replicate dataset with no Args" {
+    run vision replicate dataset
+    assert_failure
+    assert_output -p "Missing required arguments"
+    assert_output -p "Usage:"
+}
+
+
+@test "Replicate dataset with Bad Dataset Id" {
+    run vision replicate dataset --from ${VCT_SERVER_URI} --to ${VCT_SERVER_URI} --dsid bad-123
+    assert_failure
+    assert_output -p "cannot get dataset 'bad-123' from the source"
+}
+
+
+# The following test only creates a dataset to be used for the remaining
+# replicate tests. It should always pass if the server is operating correctly.
+@test "Replicate Tests Setup" {
+    run vision dataset import ${VCT_DATA_DIR}/tiny-dataset.zip
+    assert_success
+    dsid=$(extract_uuid $output)
+    printf "dsid: %s\n" ${dsid} >${VCT_DSID_FILE}
+    wait_for_task ${dsid} 3
+}
+
+
+@test "Replicate dataset" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision replicate dataset --from ${VCT_SERVER_URI} --to ${VCT_SERVER_URI} --dsid ${dsid}
+    assert_success
+    assert_output -p "Copied dataset ${dsid} to "
+    assert_output -p "sha256 "
+    refute_output -p "WARNING"
+
+    copyid=$(echo "$output" | awk '/^Copied dataset/ {print $5}' | tr -d ':')
+    printf "copyid: %s\n" ${copyid} >>${VCT_DSID_FILE}
+    wait_for_task ${copyid} 3
+
+    run vision file list --dsid ${copyid} --summary
+    assert_success
+    assert_line -n 4 "4 items"
+}
+
+
+@test "Replicate dataset JSON output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision --jsonoutput replicate dataset --from ${VCT_SERVER_URI} --to ${VCT_SERVER_URI} --dsid ${dsid} --buffers 2
+    assert_success
+    assert_equal "$(echo "$output" | python -c 'import sys,json;r=json.load(sys.stdin);print(len(r), r[0]["source_id"], r[0]["mismatches"])')" "1 ${dsid} []"
+
+    copyid=$(echo "$output" | python -c 'import sys,json;print(json.load(sys.stdin)[0]["target_id"])')
+    printf "copyid2: %s\n" ${copyid} >>${VCT_DSID_FILE}
+}
+
+
+@test "Replicate Tests Cleanup" {
+    for key in dsid copyid copyid2
+    do
+        dsid=$(get_key_value ${VCT_DSID_FILE} ${key})
+        run vision dataset delete --dsid $dsid
+        assert_success
+    done
+}
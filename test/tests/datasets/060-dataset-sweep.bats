@@ -0,0 +1,111 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_SWEEP_RESULTS="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.results"
+
+
+@test "Dataset sweep with no Args" {
+    run vision dataset sweep
+    assert_failure
+    assert_output -p "Error: Missing required"
+    assert_output -p "Usage:"
+}
+
+
+@test "Dataset sweep with invalid space JSON" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep --space '{"learningrate": [0.001'
+    assert_failure
+    assert_output -p "invalid sweep parameters"
+}
+
+
+@test "Dataset sweep with missing space file" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep --space @${VCT_WK_DIR}/no-such-space.json
+    assert_failure
+    assert_output -p "invalid sweep parameters"
+}
+
+
+@test "Dataset sweep grid with a range" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep \
+        --space '{"learningrate": {"min": 0.001, "max": 0.01}}'
+    assert_failure
+    assert_output -p "grid search needs a list of values for 'learningrate'"
+}
+
+
+@test "Dataset sweep random with a bad range" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep --random 2 \
+        --space '{"learningrate": "fast"}'
+    assert_failure
+    assert_output -p "'learningrate' must be a list of values"
+}
+
+
+# Trials are submitted, but training a missing dataset fails
+@test "Dataset sweep with Bad Dataset Id" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep --space '{"max_iter": [10, 20]}'
+    assert_success
+    assert_line -p -n 0 "Running 2 trials"
+    assert_output -p "VCT_sweep-001	submit_failed"
+    assert_output -p "VCT_sweep-002	submit_failed"
+    assert_output -p "Leaderboard by accuracy:"
+}
+
+
+# Trials already in the results file are not run again
+@test "Dataset sweep resumed from a results file" {
+    cat >${VCT_SWEEP_RESULTS} <<EOR
+{"name": "VCT_sweep-001", "params": {"max_iter": 10}, "task_id": "t1", "status": "completed", "model_id": "m1", "metrics": {"accuracy": 0.5}, "seconds": 1}
+{"name": "VCT_sweep-002", "params": {"max_iter": 20}, "task_id": "t2", "status": "completed", "model_id": "m2", "metrics": {"accuracy": 0.75}, "seconds": 1}
+EOR
+    run vision --jsonoutput dataset sweep --dsid bad-123 --type cic --name VCT_sweep \
+        --space '{"max_iter": [10, 20]}' --results ${VCT_SWEEP_RESULTS}
+    assert_success
+    assert_equal "$(echo "$output" | python -c 'import sys,json; print(" ".join(r["model_id"] for r in json.load(sys.stdin)))')" "m2 m1"
+    assert_equal "$(wc -l <${VCT_SWEEP_RESULTS})" "2"
+}
+
+
+@test "Dataset sweep with a different space for the results file" {
+    run vision dataset sweep --dsid bad-123 --type cic --name VCT_sweep \
+        --space '{"max_iter": [30, 40]}' --results ${VCT_SWEEP_RESULTS}
+    assert_failure
+    assert_output -p "has different parameters for trial 'VCT_sweep-001'"
+}
@@ -0,0 +1,146 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_DSID_FILE="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.ids"
+
+@test "File list with bad format" {
+    run vision file list --dsid bad-123 --format xml
+    assert_failure
+    assert_output -p "unsupported format 'xml'"
+}
+
+
+@test "File list format with Bad Dataset Id" {
+    run vision file list --dsid bad-123 --format jsonl
+    assert_failure
+    assert_output -p "Failure attempting to list files"
+}
+
+
+# The following test only creates a dataset to be used for the remaining
+# '--format' tests. It should always pass if the server is operating correctly.
+@test "File list format Tests Setup" {
+    run vision dataset import ${VCT_DATA_DIR}/tiny-dataset.zip
+    assert_success
+    dsid=$(extract_uuid $output)
+    printf "dsid: %s\n", ${dsid} >${VCT_DSID_FILE}
+    wait_for_task ${dsid} 3
+}
+
+
+@test "File list jsonl output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision file list --dsid ${dsid} --format jsonl
+    assert_success
+    assert_equal ${#lines[@]} 4
+    # Every line must be a complete JSON object
+    assert_equal $(printf "%s\n" "${lines[@]}" | python -c 'import sys,json;print(sum(1 for l in sys.stdin if json.loads(l)["_id"]))') 4
+    assert_line -p -n 0 '"original_file_name":"image3.jpg"'
+    assert_line -p -n 1 '"original_file_name":"image2.png"'
+    assert_line -p -n 2 '"original_file_name":"image1.jpg"'
+    assert_line -p -n 3 '"original_file_name":"video1.mp4"'
+}
+
+
+@test "File list jsonl output with fields" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision file list --dsid ${dsid} --format jsonl --fields original_file_name,no_such_field
+    assert_success
+    assert_line -n 0 '{"original_file_name":"image3.jpg","no_such_field":null}'
+    assert_line -n 3 '{"original_file_name":"video1.mp4","no_such_field":null}'
+}
+
+
+@test "File list csv output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision file list --dsid ${dsid} --format csv --fields original_file_name,dataset_id
+    assert_success
+    assert_equal ${#lines[@]} 5
+    assert_line -n 0 "original_file_name,dataset_id"
+    assert_line -n 1 "image3.jpg,${dsid}"
+    assert_line -n 2 "image2.png,${dsid}"
+    assert_line -n 3 "image1.jpg,${dsid}"
+    assert_line -n 4 "video1.mp4,${dsid}"
+}
+
+
+# '--summary' selects the summary fields and no item count is written
+@test "File list summary tsv output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision file list --dsid ${dsid} --summary --format tsv
+    assert_success
+    assert_equal ${#lines[@]} 5
+    assert_line -n 0 "$(printf '_id\toriginal_file_name\tfile_type')"
+    assert_line -p -n 1 "$(printf '\timage3.jpg\t')"
+    assert_line -p -n 4 "$(printf '\tvideo1.mp4\t')"
+    refute_output -p "items"
+}
+
+
+@test "File list sorted csv output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision file list --dsid ${dsid} --format csv --fields original_file_name --sort created_at
+    assert_success
+    assert_line -n 0 "original_file_name"
+    assert_line -n 1 "video1.mp4"
+    assert_line -n 4 "image3.jpg"
+}
+
+
+@test "Dataset list csv output" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run vision dataset list --format csv --fields _id,total_file_count
+    assert_success
+    # Other datasets may exist on the server
+    assert_line -n 0 "_id,total_file_count"
+    assert_line "${dsid},4"
+}
+
+
+@test "File list format Tests Cleanup" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    run vision dataset delete --dsid $dsid
+    assert_success
+}
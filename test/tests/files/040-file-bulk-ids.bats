@@ -0,0 +1,138 @@
+#!/usr/bin/env bats
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+#*************************************************************************
+# This file is part of the VAPI tools CLI test bucket. It is a BATS test
+# that expects a specific environment that is setup by the `runtests`
+# script. It can be run directly from BATS if the following env variables
+# are set
+#   - BATS_HOME  - root directory of the BATS install (repo)
+#   - VAPI_HOST  - test server host name
+#   - VAPI_INSTANCE - root URI ("visual-insights" if not set)
+#   - VAPI_TOKEN - test server authentication token
+#   - VCT_DATA_DIR - VAPI Test bucket data dir (for files to use during testing
+#   - VCT_WK_DIR - temp dir to be used as a working directory (must exist)
+# This test uses extensions to the base BATS (see 1st to 'load' statments
+#*************************************************************************
+
+load "${BATS_HOME}/test/libs/bats-support/load.bash"
+load "${BATS_HOME}/test/libs/bats-assert/load.bash"
+load "${VCT_DIR}/helpers/test_helpers.bash"
+
+export BATS_TEST_FILE_BASENAME=$(basename ${BATS_TEST_FILENAME})
+export VCT_DSID_FILE="${VCT_WK_DIR}/${BATS_TEST_FILE_BASENAME}.ids"
+
+@test "File delete ids-from with missing file" {
+    run vision file delete --dsid bad-123 --ids-from ${VCT_WK_DIR}/no-such-file.txt
+    assert_failure
+    assert_output -p "cannot read ids from"
+}
+
+
+@test "File delete ids-from with both file id and ids-from" {
+    run vision file delete --dsid bad-123 --fileid 123-def --ids-from -
+    assert_failure
+    assert_output -p "Usage:"
+}
+
+
+# The following test only creates a dataset to be used for the remaining
+# '--ids-from' tests. It should always pass if the server is operating correctly.
+@test "File bulk ids Tests Setup" {
+    run vision dataset import ${VCT_DATA_DIR}/tiny-dataset.zip
+    assert_success
+    dsid=$(extract_uuid $output)
+    printf "dsid: %s\n", ${dsid} >${VCT_DSID_FILE}
+    wait_for_task ${dsid} 3
+}
+
+
+# Lines can be JSON objects; only the "metadata" object is added to the file
+@test "File metadata add with ids-from file" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    vision file list --dsid ${dsid} --format jsonl --fields _id,original_file_name |
+        python -c 'import sys,json
+for line in sys.stdin:
+    f = json.loads(line)
+    f["metadata"] = {"source": f["original_file_name"]}
+    print(json.dumps(f))' >${VCT_WK_DIR}/bulk-md.jsonl
+
+    run vision fmetadata add --dsid ${dsid} --ids-from ${VCT_WK_DIR}/bulk-md.jsonl --workers 2
+    assert_success
+    assert_output -p "4 of 4 succeeded, 0 failed"
+
+    fileid=$(vision file list --dsid ${dsid} --sum | head -1 | cut -f1)
+    run vision fmetadata list --dsid ${dsid} --fileid ${fileid}
+    assert_success
+    assert_output -e "\"source\": *\"image3.jpg\""
+    refute_output -p "original_file_name"
+}
+
+
+@test "File metadata add with ids-from STDIN" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run bash -c "vision file list --dsid ${dsid} --format jsonl --fields _id | vision fmetadata add --dsid ${dsid} --ids-from - '{\"batch\": \"bulk\"}'"
+    assert_success
+    assert_output -p "4 of 4 succeeded, 0 failed"
+
+    fileid=$(vision file list --dsid ${dsid} --sum | head -1 | cut -f1)
+    run vision fmetadata list --dsid ${dsid} --fileid ${fileid}
+    assert_success
+    assert_output -e "\"batch\": *\"bulk\""
+    assert_output -e "\"source\": *\"image3.jpg\""
+}
+
+
+# One failing id does not stop the others; the exit code reports the failure
+@test "File delete ids-from with a bad File Id" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    vision file list --dsid ${dsid} --sum | head -1 | cut -f1 >${VCT_WK_DIR}/bulk-ids.txt
+    echo "123-def" >>${VCT_WK_DIR}/bulk-ids.txt
+
+    run vision file delete --dsid ${dsid} --ids-from ${VCT_WK_DIR}/bulk-ids.txt
+    assert_failure
+    assert_output -p "ERROR: 123-def:"
+    assert_output -p "1 of 2 succeeded, 1 failed"
+
+    run vision file list --dsid ${dsid} --summary
+    assert_success
+    assert_line -n 3 "3 items"
+}
+
+
+@test "File delete ids-from STDIN" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+
+    run bash -c "vision file list --dsid ${dsid} --format jsonl --fields _id | vision file delete --dsid ${dsid} --ids-from -"
+    assert_success
+    assert_output -p "3 of 3 succeeded, 0 failed"
+
+    run vision file list --dsid ${dsid} --summary
+    assert_success
+    assert_output "0 items"
+}
+
+
+@test "File bulk ids Tests Cleanup" {
+    dsid=$(get_key_value ${VCT_DSID_FILE} dsid)
+    run vision dataset delete --dsid $dsid
+    assert_success
+}
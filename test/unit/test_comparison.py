@@ -0,0 +1,84 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import pytest
+
+from vapi import metrics
+from vapi.comparison import ModelComparison
+from vapi.evaluation import Evaluation
+
+
+def classified(*pairs):
+    return {"classified": [{"label": name, "confidence": confidence} for name, confidence in pairs]}
+
+
+def test_top_prediction_is_the_most_confident():
+    predictions = classified(("dog", 0.2), ("cat", 0.7), ("bird", 0.1))["classified"]
+    assert metrics.topPrediction(predictions)["label"] == "cat"
+    assert metrics.topPrediction(predictions, minConfidence=0.8) is None
+    assert metrics.topPrediction([]) is None
+    assert metrics.topPrediction([{"label": None, "confidence": 0.9}]) is None
+
+
+def test_classification_compares_the_most_confident_classes():
+    comparison = ModelComparison()
+    result = comparison.add("a.jpg", classified(("dog", 0.2), ("cat", 0.7)), classified(("cat", 0.9), ("dog", 0.1)))
+    assert result["agree"]
+    assert result["model_a"] == {"label": "cat", "confidence": 0.7}
+    assert result["confidence_delta"] == pytest.approx(0.2)
+
+    result = comparison.add("b.jpg", classified(("dog", 0.4), ("cat", 0.6)), classified(("dog", 0.8)))
+    assert not result["agree"]
+    assert result["model_a"]["label"] == "cat"
+
+    summary = comparison.summary()
+    assert summary["images"] == 2
+    assert summary["agreeing_images"] == 1
+    assert summary["class_agreement"] == 0.5
+
+
+# Comparison and evaluation read the same inference output the same way
+def test_classification_agrees_with_evaluation():
+    result = classified(("dog", 0.3), ("cat", 0.6))
+    evaluation = Evaluation()
+    evaluation.add("f1", {"category": "cat", "objects": []}, result)
+    assert evaluation.score()["accuracy"] == 1.0
+    assert ModelComparison().add("f1", result, classified(("cat", 0.5)))["agree"]
+
+
+def test_unlabeled_predictions_are_background():
+    comparison = ModelComparison()
+    result = comparison.add("a.jpg", classified((None, 0.9)), classified())
+    assert result["agree"]
+    assert result["model_a"]["label"] is None
+
+
+def test_detections_are_matched_by_iou():
+    box = {"xmin": 0, "ymin": 0, "xmax": 10, "ymax": 10}
+    resultA = {"classified": [dict(box, label="cat", confidence=0.9),
+                              {"label": "dog", "confidence": 0.8, "xmin": 50, "ymin": 50, "xmax": 60, "ymax": 60}]}
+    resultB = {"classified": [dict(box, label="cat", confidence=0.7)]}
+    comparison = ModelComparison()
+    assert not comparison.add("a.jpg", resultA, resultB)["agree"]
+    summary = comparison.summary()
+    assert summary["matched_objects"] == 1
+    assert summary["mean_iou"] == 1.0
+    assert summary["only_model_a"] == 1
+    assert summary["only_model_b"] == 0
+    assert summary["mean_confidence_delta"] == pytest.approx(-0.2)
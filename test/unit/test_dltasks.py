@@ -0,0 +1,130 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import queue
+
+from vapi.Dltasks import DlTasks
+
+T1 = "00000000-0000-0000-0000-000000000001"
+T2 = "00000000-0000-0000-0000-000000000002"
+
+
+class FakeHttp:
+    """ Serves dltasks whose status steps through a list, one step per check."""
+
+    def __init__(self, statuses):
+        self.statuses = {taskId: list(steps) for taskId, steps in statuses.items()}
+        self.requests = []
+        self.ok = True
+        self.code = 200
+
+    def _task(self, taskId):
+        steps = self.statuses[taskId]
+        status = steps.pop(0) if len(steps) > 1 else steps[0]
+        return {"_id": taskId, "status": status}
+
+    def get(self, uri, params=None, **kwargs):
+        self.requests.append(uri)
+        self.ok, self.code = True, 200
+        if uri == "/dltasks/":
+            return [self._task(taskId) for taskId in self.statuses]
+        taskId = uri.rsplit("/", 1)[-1]
+        if taskId not in self.statuses:
+            self.ok, self.code = False, 404
+            return None
+        return self._task(taskId)
+
+    def rsp_ok(self):
+        return self.ok
+
+    def status_code(self):
+        return self.code
+
+
+class PollingDlTasks(DlTasks):
+    """ Records the poll waits instead of sleeping; events are fed from 'events'."""
+
+    def __init__(self, http, events=()):
+        super().__init__(http)
+        self.waits = []
+        self.events = list(events)
+        self.subscribed = False
+
+    def _subscribe(self, pending, wakeups):
+        self.subscribed = True
+
+        class Subscription:
+            def stop(self, timeout=None):
+                pass
+        return Subscription()
+
+    def _nextCheck(self, wakeups, wait, pending):
+        if self.events:
+            woken = self.events.pop(0)
+            if woken is not None:
+                for taskId in woken:
+                    wakeups.put(taskId)
+                return DlTasks._nextCheck(wakeups, 0, pending)
+        self.waits.append(round(wait))
+        return set(pending)
+
+
+# While nothing finishes the poll interval doubles up to the maximum; a finished
+# task brings it back to the start
+def test_wait_poll_backoff():
+    http = FakeHttp({T1: ["running"] * 6 + ["completed"], T2: ["running"] * 8 + ["failed"]})
+    tasks = PollingDlTasks(http)
+    finished = list(tasks.wait([T1, T2], useEvents=False, pollInterval=1.0, maxPollInterval=8.0))
+    assert finished == [(T1, {"_id": T1, "status": "completed"}), (T2, {"_id": T2, "status": "failed"})]
+    assert tasks.waits == [2, 4, 8, 8, 8, 8, 1, 2]
+    assert not tasks.subscribed
+    # Both tasks are polled with one list request; the last one alone by id
+    assert http.requests == ["/dltasks/"] * 7 + [f"/dltasks/{T2}"] * 2
+
+
+# An event checks only the task it names; polling remains the fallback
+def test_wait_event_checks_named_task():
+    http = FakeHttp({T1: ["running", "completed"], T2: ["running", "running", "completed"]})
+    tasks = PollingDlTasks(http, events=[[T1]])
+    finished = [taskId for taskId, _ in tasks.wait([T1, T2], pollInterval=1.0)]
+    assert finished == [T1, T2]
+    assert tasks.subscribed
+    assert http.requests == ["/dltasks/", f"/dltasks/{T1}", f"/dltasks/{T2}", f"/dltasks/{T2}"]
+    assert tasks.waits == [2, 4]
+
+
+def test_wait_reports_deleted_tasks():
+    http = FakeHttp({T1: ["completed"]})
+    finished = list(PollingDlTasks(http).wait([T1, T2], useEvents=False))
+    assert (T2, {"_id": T2, "status": "deleted"}) in finished
+    assert len(finished) == 2
+
+
+def test_wait_timeout_yields_unfinished_tasks():
+    http = FakeHttp({T1: ["running"]})
+    finished = list(DlTasks(http).wait(T1, timeout=0.05, useEvents=False, pollInterval=10.0))
+    assert finished == [(T1, {"_id": T1, "status": "running"})]
+
+
+def test_next_check_gathers_wakeups():
+    wakeups = queue.Queue()
+    for taskId in (T1, T2, "other"):
+        wakeups.put(taskId)
+    assert DlTasks._nextCheck(wakeups, 0, {T1, T2}) == {T1, T2}
+    assert DlTasks._nextCheck(wakeups, 0, {T1, T2}) == {T1, T2}
@@ -0,0 +1,152 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import numpy as np
+import pytest
+
+from vapi import metrics
+from vapi.evaluation import BACKGROUND, Evaluation
+
+
+def label(name, xmin, ymin, xmax, ymax):
+    return {"name": name, "bnd_box": {"xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax}}
+
+
+def detection(name, confidence, xmin, ymin, xmax, ymax):
+    return {"label": name, "confidence": confidence, "xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax}
+
+
+def detectionTruth(*objects):
+    return {"category": None, "objects": list(objects)}
+
+
+def categoryTruth(name):
+    return {"category": name, "objects": []}
+
+
+def confusionCell(score, actual, predicted):
+    names = score["confusion"]["labels"]
+    return score["confusion"]["matrix"][names.index(actual)][names.index(predicted)]
+
+
+def test_perfect_detections_score_map_one():
+    evaluation = Evaluation()
+    evaluation.add("f1", detectionTruth(label("cat", 0, 0, 10, 10), label("dog", 20, 20, 40, 40)),
+                   {"classified": [detection("cat", 0.9, 0, 0, 10, 10), detection("dog", 0.8, 20, 20, 40, 40)]})
+    evaluation.add("f2", detectionTruth(label("dog", 5, 5, 15, 15)),
+                   {"classified": [detection("dog", 0.7, 5, 5, 15, 15)]})
+
+    score = evaluation.score()
+    assert score["type"] == "detection"
+    assert score["mAP"] == pytest.approx(1.0)
+    assert score["classes"]["dog"]["ground_truth"] == 2
+    assert score["classes"]["cat"]["precision"] == 1.0
+    assert score["confusion"]["labels"] == ["cat", "dog", BACKGROUND]
+    assert score["confusion"]["matrix"] == [[1, 0, 0], [0, 2, 0], [0, 0, 0]]
+
+
+def test_false_positive_ranked_above_the_true_positive_halves_ap():
+    evaluation = Evaluation()
+    evaluation.add("f1", detectionTruth(label("cat", 0, 0, 10, 10)),
+                   {"classified": [detection("cat", 0.9, 50, 50, 60, 60), detection("cat", 0.6, 0, 0, 10, 10)]})
+
+    score = evaluation.score(iouThresholds=[0.5])
+    assert score["mAP"] == pytest.approx(0.5)
+    assert score["classes"]["cat"]["precision"] == 0.5
+    assert score["classes"]["cat"]["recall"] == 1.0
+    assert confusionCell(score, BACKGROUND, "cat") == 1
+    assert confusionCell(score, "cat", "cat") == 1
+
+
+def test_ap_depends_on_the_iou_threshold():
+    evaluation = Evaluation()
+    # IoU with the label is 0.68
+    evaluation.add("f1", detectionTruth(label("cat", 0, 0, 10, 10)),
+                   {"classified": [detection("cat", 0.9, 0, 0, 10, 6.8)]})
+
+    score = evaluation.score()
+    assert score["mAP_per_iou"]["0.50"] == pytest.approx(1.0)
+    assert score["mAP_per_iou"]["0.65"] == pytest.approx(1.0)
+    assert score["mAP_per_iou"]["0.75"] == pytest.approx(0.0)
+    assert score["mAP"] == pytest.approx(0.4)
+
+
+def test_min_confidence_drops_detections():
+    evaluation = Evaluation()
+    evaluation.add("f1", detectionTruth(label("cat", 0, 0, 10, 10)),
+                   {"classified": [detection("cat", 0.2, 0, 0, 10, 10)]})
+
+    assert evaluation.score(minConfidence=0.5)["mAP"] == pytest.approx(0.0)
+    assert evaluation.score(minConfidence=0.1)["mAP"] == pytest.approx(1.0)
+
+
+def test_confusion_matrix_pairs_objects_across_classes():
+    evaluation = Evaluation()
+    evaluation.add("f1", detectionTruth(label("dog", 0, 0, 10, 10), label("cat", 30, 30, 40, 40)),
+                   {"classified": [detection("cat", 0.9, 0, 0, 10, 10)]})
+
+    score = evaluation.score(iouThresholds=[0.5])
+    assert confusionCell(score, "dog", "cat") == 1
+    assert confusionCell(score, "cat", BACKGROUND) == 1
+    assert score["classes"]["dog"]["ap"]["0.50"] == 0.0
+
+
+def test_failed_inferences_are_counted_not_scored():
+    evaluation = Evaluation()
+    evaluation.add("f1", detectionTruth(label("cat", 0, 0, 10, 10)),
+                   {"classified": [detection("cat", 0.9, 0, 0, 10, 10)]})
+    evaluation.add("f2", detectionTruth(label("cat", 0, 0, 10, 10)), None)
+
+    score = evaluation.score()
+    assert score["images"] == 1
+    assert score["failed_images"] == 1
+
+
+def test_classification_uses_the_most_confident_prediction():
+    evaluation = Evaluation()
+    evaluation.add("f1", categoryTruth("cat"),
+                   {"classified": [{"label": "dog", "confidence": 0.3}, {"label": "cat", "confidence": 0.6}]})
+    evaluation.add("f2", categoryTruth("dog"), {"classified": [{"label": "cat", "confidence": 0.9}]})
+    evaluation.add("f3", categoryTruth("dog"), {"classified": []})
+
+    score = evaluation.score()
+    assert score["type"] == "classification"
+    assert score["accuracy"] == pytest.approx(1 / 3)
+    assert score["confusion"]["labels"] == ["cat", "dog", BACKGROUND]
+    assert score["confusion"]["matrix"] == [[1, 0, 0], [1, 0, 1], [0, 0, 0]]
+    assert score["classes"]["cat"]["precision"] == 0.5
+    assert score["classes"]["dog"]["precision"] is None
+
+
+def test_classification_unlabeled_or_unconfident_predictions_are_background():
+    evaluation = Evaluation()
+    evaluation.add("f1", categoryTruth("cat"), {"classified": [{"label": None, "confidence": 0.9}]})
+    evaluation.add("f2", categoryTruth("cat"), {"classified": [{"label": "cat", "confidence": 0.1}]})
+
+    score = evaluation.score(minConfidence=0.5)
+    assert score["accuracy"] == 0.0
+    assert confusionCell(score, "cat", BACKGROUND) == 2
+
+
+def test_average_precision_interpolates_over_recall():
+    # Ranked TP, FP, TP of 2 ground truths: precision 1 up to recall 0.5, 2/3 up to 1
+    ap, precision, recall = metrics.averagePrecision([0.9, 0.8, 0.7], [True, False, True], 2)
+    np.testing.assert_allclose(recall[0], [0.5, 0.5, 1.0])
+    np.testing.assert_allclose(precision[0], [1.0, 0.5, 2 / 3])
+    assert ap[0] == pytest.approx((51 * 1.0 + 50 * 2 / 3) / 101)
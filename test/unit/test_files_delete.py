@@ -0,0 +1,132 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import importlib.util
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from vapi.Files import Files
+
+
+class FakeHttp:
+    """ Keeps the files of one dataset. 'failIds' can never be deleted, and 'statuses'
+    scripts the first delete requests: None is no response, a number an HTTP error."""
+
+    def __init__(self, count, failIds=(), statuses=()):
+        self.ids = [f"f{i:03d}" for i in range(count)]
+        self.failIds = set(failIds)
+        self.statuses = list(statuses)
+        self.posts = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.last_failure = None
+
+    def get(self, uri, params=None):
+        assert params["sortby"] == "_id"
+        self._set(200, None)
+        return [{"_id": i} for i in self.ids[params["skip"]:params["skip"] + params["limit"]]]
+
+    def post(self, uri, json=None):
+        with self.lock:
+            self.posts.append(len(json["id_list"]))
+            status = self.statuses.pop(0) if self.statuses else 200
+            if status != 200:
+                self._set(status, "Could not connect to server." if status is None else None)
+                return None
+            deleted = [i for i in json["id_list"] if i not in self.failIds]
+            self.ids = [i for i in self.ids if i not in deleted]
+        self._set(200, None)
+        return {"success_count": len(deleted), "fail_count": len(json["id_list"]) - len(deleted)}
+
+    def _set(self, status, failure):
+        self.local.status = status
+        self.last_failure = failure
+
+    def rsp_ok(self):
+        return self.local.status == 200
+
+    def status_code(self):
+        return self.local.status
+
+    def json(self):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def noSleep(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+
+def test_delete_many_in_chunks():
+    http = FakeHttp(1200, failIds={"f007"})
+    results = list(Files(http).delete_many("ds", (f"f{i:03d}" for i in range(1200)), chunkSize=500, workers=2))
+    assert sorted(len(r["ids"]) for r in results) == [200, 500, 500]
+    assert sum(r["success_count"] for r in results) == 1199
+    assert sum(r["fail_count"] for r in results) == 1
+    assert http.ids == ["f007"]
+
+
+def test_delete_many_retries_failed_requests():
+    http = FakeHttp(10, statuses=[503, None])
+    [result] = Files(http).delete_many("ds", list(http.ids), workers=1, retries=3)
+    assert result["attempts"] == 3
+    assert result["success_count"] == 10
+    assert result["error"] is None
+
+
+def test_delete_many_gives_up():
+    http = FakeHttp(10, statuses=[None] * 3)
+    [result] = Files(http).delete_many("ds", list(http.ids), workers=1, retries=2)
+    assert result == {"ids": result["ids"], "success_count": 0, "fail_count": 10, "attempts": 3,
+                      "error": "Could not connect to server."}
+
+
+def test_delete_many_does_not_retry_rejected_requests():
+    http = FakeHttp(10, statuses=[400])
+    [result] = Files(http).delete_many("ds", list(http.ids), workers=1)
+    assert result["attempts"] == 1
+    assert result["fail_count"] == 10
+    assert result["error"].startswith("status=400")
+    assert len(http.ids) == 10
+
+
+def loadScript():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "misc", "deleteFilesByQuery.py")
+    spec = importlib.util.spec_from_file_location("deleteFilesByQuery", path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+# Files that cannot be deleted still match the query; they are skipped so the
+# following pages line up, and every other file is deleted
+def test_delete_by_query_skips_failed_files(capsys):
+    script = loadScript()
+    http = FakeHttp(25, failIds={"f003", "f012", "f024"})
+    script.server = SimpleNamespace(files=Files(http))
+    script.args = SimpleNamespace(dsid="ds", queryString="x", pageSize=10, chunkSize=4, workers=2, retries=0)
+    with pytest.raises(SystemExit) as exit:
+        script.deleteMatchingFiles()
+    assert exit.value.code == 2
+    assert http.ids == ["f003", "f012", "f024"]
+    assert "successfully deleted 22, failed on 3" in capsys.readouterr().out
@@ -0,0 +1,103 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import base64
+
+import cv2 as cv
+import numpy as np
+import pytest
+
+from vapi import heatmaps
+from vapi.heatmaps import HeatmapOverlay
+
+
+def pngPayload(image, dataUri=False):
+    ok, data = cv.imencode(".png", image)
+    assert ok
+    text = base64.b64encode(data.tobytes()).decode("ascii")
+    return "data:image/png;base64," + text if dataUri else text
+
+
+def test_decode_list_in_unit_range():
+    heat = heatmaps.decode([[0.0, 0.5], [1.0, 0.25]])
+    assert heat.dtype == np.uint8
+    assert heat.tolist() == [[0, 128], [255, 64]]
+
+
+def test_decode_list_is_stretched():
+    assert heatmaps.decode([[-1, 1], [3, 3]]).tolist() == [[0, 128], [255, 255]]
+    assert heatmaps.decode([[7, 7]]).tolist() == [[0, 0]]
+
+
+def test_decode_bad_payloads():
+    assert heatmaps.decode(None) is None
+    assert heatmaps.decode([1, 2, 3]) is None
+    assert heatmaps.decode("not base64!") is None
+    assert heatmaps.decode(base64.b64encode(b"not an image").decode()) is None
+
+
+def test_decode_png_gray_stored_as_color():
+    gray = np.arange(12, dtype=np.uint8).reshape(3, 4) * 20
+    heat = heatmaps.decode(pngPayload(cv.cvtColor(gray, cv.COLOR_GRAY2BGR), dataUri=True))
+    assert heat.shape == (3, 4)
+    np.testing.assert_array_equal(heat, gray)
+
+
+def test_decode_png_color_is_kept():
+    color = np.zeros((2, 2, 3), dtype=np.uint8)
+    color[0, 0] = (255, 0, 0)
+    heat = heatmaps.decode(pngPayload(color))
+    assert heat.shape == (2, 2, 3)
+    np.testing.assert_array_equal(heat, color)
+
+
+# The lookup table gives the same colors as applying the colormap directly
+def test_colormap_lut_matches_opencv():
+    heat = np.arange(256, dtype=np.uint8).reshape(16, 16)
+    expected = cv.applyColorMap(heat, cv.COLORMAP_INFERNO)
+    np.testing.assert_array_equal(np.take(heatmaps.colormapLut("inferno"), heat, axis=0), expected)
+    assert heatmaps.colormapLut("Inferno") is heatmaps.colormapLut("inferno")
+    with pytest.raises(ValueError):
+        heatmaps.colormapLut("no-such-map")
+
+
+def test_overlay_blends_with_alpha():
+    image = np.full((4, 6, 3), 200, dtype=np.uint8)
+    heat = np.zeros((2, 3), dtype=np.uint8)
+    overlay = HeatmapOverlay(colormap="jet", alpha=0.25)
+    blended = overlay.overlay(image, heat)
+
+    color = heatmaps.colormapLut("jet")[0].astype(np.float64)
+    expected = np.rint(0.75 * 200 + 0.25 * color)
+    assert blended.shape == image.shape
+    np.testing.assert_allclose(blended.reshape(-1, 3), np.tile(expected, (24, 1)), atol=1)
+    assert (image == 200).all()
+
+
+def test_overlay_reuses_buffers_for_same_size():
+    overlay = HeatmapOverlay(alpha=2.0)
+    assert overlay.alpha == 1.0
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+    first = overlay.overlay(image, np.zeros((2, 2), dtype=np.uint8))
+    second = overlay.overlay(image, np.full((2, 2), 255, dtype=np.uint8))
+    assert first is second
+    third = overlay.overlay(np.zeros((5, 4, 3), dtype=np.uint8), np.zeros((2, 2), dtype=np.uint8))
+    assert third is not second
+    out = np.empty((5, 4, 3), dtype=np.uint8)
+    assert overlay.overlay(np.zeros((5, 4, 3), dtype=np.uint8), np.zeros((2, 2), dtype=np.uint8), out=out) is out
@@ -0,0 +1,92 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import json
+
+import pytest
+
+from vapi.jsonstream import JsonStreamError, iterItems
+
+BODY = ('﻿ [ {"name": "café", "tags": ["a", "b"], "box": {"x": 1.5e-3}},\n'
+        '  -12.75, 0, 3E+2, "s\\"]", true, false, null, [], {} ]\n').encode("utf-8")
+ITEMS = json.loads(BODY.decode("utf-8-sig"))
+
+
+def chunked(body, *splits):
+    points = [0, *splits, len(body)]
+    return [body[a:b] for a, b in zip(points, points[1:])]
+
+
+def test_whole_body():
+    assert list(iterItems([BODY])) == ITEMS
+
+
+def test_one_byte_chunks():
+    assert list(iterItems(BODY[i:i + 1] for i in range(len(BODY)))) == ITEMS
+
+
+@pytest.mark.parametrize("split", range(1, len(BODY)))
+def test_every_split_point(split):
+    assert list(iterItems(chunked(BODY, split))) == ITEMS
+
+
+@pytest.mark.parametrize("chunks, items", [
+    ([b"[0.", b"5]"], [0.5]),
+    ([b"[1", b"2]"], [12]),
+    ([b"[1e", b"3]"], [1000.0]),
+    ([b"[-", b"1]"], [-1]),
+    ([b"[2", b".5e", b"-1, 7", b"]"], [0.25, 7]),
+    ([b"[tr", b"ue, nu", b"ll]"], [True, None]),
+])
+def test_numbers_and_literals_split_across_chunks(chunks, items):
+    assert list(iterItems(chunks)) == items
+
+
+def test_multi_byte_character_split_across_chunks():
+    assert list(iterItems([b'["\xc3', b'\xa9"]'])) == ["é"]
+
+
+def test_items_are_yielded_before_the_body_ends():
+    def chunks():
+        yield b'[{"a": 1}, {"b"'
+        raise AssertionError("read past the first complete item")
+
+    assert next(iterItems(chunks())) == {"a": 1}
+
+
+def test_non_array_body_is_one_item():
+    assert list(iterItems([b'{"err', b'or": "x"}'])) == [{"error": "x"}]
+    assert list(iterItems([b"4", b"2"])) == [42]
+
+
+def test_empty_array():
+    assert list(iterItems([b" [", b" ] "])) == []
+
+
+@pytest.mark.parametrize("chunks", [
+    [b""],
+    [b"[1, 2"],
+    [b"[1, {"],
+    [b"[0.]"],
+    [b"[1, x]"],
+    [b'{"a": 1} junk'],
+])
+def test_invalid_or_truncated_bodies_raise(chunks):
+    with pytest.raises(JsonStreamError):
+        list(iterItems(chunks))
@@ -0,0 +1,76 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import json
+import os
+
+from vapi.labelexport import CocoWriter, YoloWriter, exportLabels
+
+
+class Reporter:
+    def __init__(self, items):
+        self.items = items
+
+    def report(self, dsid, *args, limit=1000, skip=0, **kwargs):
+        return self.items[skip:skip + limit]
+
+
+class FakeServer:
+    def __init__(self, files, labels):
+        self.files = Reporter(files)
+        self.object_labels = Reporter(labels)
+
+
+def box(fileId, name, xmin, ymin, xmax, ymax):
+    return {"file_id": fileId, "name": name, "bnd_box": {"xmin": xmin, "ymin": ymin, "xmax": xmax, "ymax": ymax}}
+
+
+SERVER = FakeServer(
+    [{"_id": "f1", "original_file_name": "a.jpg", "width": 100, "height": 50},
+     {"_id": "f2", "original_file_name": "b.jpg"}],
+    [box("f1", "cat", 10, 10, 30, 20), box("f2", "dog", 0, 0, 5, 5), box("f9", "cat", 0, 0, 1, 1)])
+
+
+def test_coco_export(tmp_path):
+    path = str(tmp_path / "instances.json")
+    stats = exportLabels(SERVER, "ds", CocoWriter(path), pageSize=2)
+    with open(path) as handle:
+        coco = json.load(handle)
+
+    assert stats["labels"] == 2
+    assert stats["skipped_labels"] == 1
+    assert stats["unsized_images"] == 1
+    assert coco["images"] == [{"id": 1, "file_name": "a.jpg", "width": 100, "height": 50},
+                              {"id": 2, "file_name": "b.jpg"}]
+    assert coco["annotations"][0]["bbox"] == [10, 10, 20, 10]
+    assert [c["name"] for c in coco["categories"]] == ["cat", "dog"]
+
+
+# YOLO coordinates need the image size; labels of unsized images are skipped
+def test_yolo_export(tmp_path):
+    stats = exportLabels(SERVER, "ds", YoloWriter(str(tmp_path)), pageSize=2)
+
+    assert stats["labels"] == 1
+    assert stats["skipped_labels"] == 2
+    assert stats["unsized_images"] == 1
+    with open(tmp_path / "a.txt") as handle:
+        assert handle.read() == "0 0.200000 0.300000 0.200000 0.200000\n"
+    assert not os.path.exists(tmp_path / "b.txt")
+    with open(tmp_path / "classes.txt") as handle:
+        assert handle.read() == "cat\n"
@@ -0,0 +1,107 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import numpy as np
+import pytest
+
+from vapi.metadataio import MetadataTable, _combine, _convert, _kind, readColumns
+
+
+def strings(*values):
+    return np.array(values, dtype=np.str_)
+
+
+@pytest.mark.parametrize("values, kind", [
+    (("1", "-20", ""), "int"),
+    (("1", "2.5"), "float"),
+    (("1e3",), "float"),
+    (("99999999999999999999",), "float"),
+    (("20260131235959", "19991231000000"), "timestamp14"),
+    (("20261331000000",), "int"),
+    (("2026-01-31T10:00:00Z", "2026-02-01"), "iso"),
+    (("line-1",), "str"),
+    (("x", "1"), "str"),
+    (("", ""), None),
+])
+def test_kind(values, kind):
+    assert _kind(strings(*values)) == kind
+
+
+def test_combine():
+    assert _combine(None, "int") == "int"
+    assert _combine("iso", None) == "iso"
+    assert _combine("int", "float") == "float"
+    assert _combine("timestamp14", "int") == "int"
+    assert _combine("timestamp14", "float") == "float"
+    assert _combine("iso", "iso") == "iso"
+    assert _combine("iso", "int") == "str"
+
+
+def test_convert_int_with_missing_values_is_float_nan():
+    assert _convert(strings("1", "2"), "int").dtype == np.int64
+    out = _convert(strings("1", "", "3"), "int")
+    assert out.dtype == np.float64
+    assert out[0] == 1 and np.isnan(out[1]) and out[2] == 3
+
+
+def test_convert_times_with_missing_values_are_nat():
+    out = _convert(strings("20260131235959", ""), "timestamp14")
+    assert out[0] == np.datetime64("2026-01-31T23:59:59")
+    assert np.isnat(out[1])
+    out = _convert(strings("", "2026-01-31T10:00:00.250Z"), "iso")
+    assert np.isnat(out[0])
+    assert out[1] == np.datetime64("2026-01-31T10:00:00.250")
+
+
+def test_convert_str_is_unchanged():
+    values = strings("a", "")
+    assert _convert(values, "str") is values
+    assert _convert(values, None) is values
+
+
+# Types are inferred per chunk and combined, so a column that starts with
+# timestamps and continues with small numbers ends up as integers
+def test_read_columns_combines_chunk_kinds():
+    lines = ["_id|when|score|note|empty",
+             "f1|20260131235959|1|a|",
+             "f2|20260201000000||b|",
+             "f3|7|2.5||"]
+    table = readColumns(lines, chunkRows=2)
+    assert isinstance(table, MetadataTable)
+    assert len(table) == 3
+    assert table.names() == ["_id", "when", "score", "note", "empty"]
+    assert table["when"].tolist() == [20260131235959, 20260201000000, 7]
+    assert table["score"].dtype == np.float64
+    assert np.isnan(table["score"][1]) and table["score"][2] == 2.5
+    assert table["note"].tolist() == ["a", "b", ""]
+    assert table["empty"].tolist() == ["", "", ""]
+
+
+def test_read_columns_keeps_selected_keys():
+    lines = ["_id|original_file_name|a|b", "f1|x.jpg|1|2"]
+    assert readColumns(lines, keys=["b"]).names() == ["_id", "original_file_name", "b"]
+
+
+def test_save_npz(tmp_path):
+    table = readColumns(["_id|when", "f1|20260131235959", "f2|"])
+    path = table.save(str(tmp_path / "meta.npz"))
+    with np.load(path) as data:
+        assert np.isnat(data["when"][1])
+    with pytest.raises(ValueError):
+        table.save(str(tmp_path / "meta.csv"))
@@ -0,0 +1,129 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import pytest
+
+from vapi.mirror import Mirror, QueryError, metadataRows, parseQuery, parseSort
+
+
+class Listing:
+    def __init__(self, items):
+        self.items = items
+
+    def report(self, dsid=None, *args, limit=None, skip=0, **kwargs):
+        items = [item for item in self.items if item.get("dataset_id", dsid) == dsid]
+        return items[skip:skip + limit] if limit is not None else items
+
+
+class Metadata:
+    def __init__(self):
+        self.text = "_id|line|score\n"
+
+    def export(self, dsid, fmt=None):
+        return self.text
+
+
+class FakeServer:
+    def __init__(self):
+        self.datasets = Listing([{"_id": "ds1", "name": "parts"}])
+        self.files = Listing([
+            {"_id": "f1", "dataset_id": "ds1", "original_file_name": "b.jpg", "category_name": "ok", "width": 10},
+            {"_id": "f2", "dataset_id": "ds1", "original_file_name": "a.jpg", "category_name": "scratch", "width": 30},
+            {"_id": "f3", "dataset_id": "ds1", "original_file_name": "c.jpg", "category_name": "scratch", "width": 20}])
+        self.categories = Listing([{"_id": "c1", "name": "scratch"}])
+        self.object_tags = Listing([])
+        self.object_labels = Listing([{"_id": "l1", "file_id": "f1", "name": "dent"}])
+        self.file_metadata = Metadata()
+        self.file_metadata.text += "f1|L1|0.5\nf2|L2|2\n"
+
+    def rsp_ok(self):
+        return True
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    with Mirror(str(tmp_path / "mirror.db")) as mirror:
+        yield mirror
+
+
+def test_parse_query():
+    assert parseQuery("category_name == 'scratch', width>=10,name != \"a, b\"") == [
+        ("category_name", "==", "scratch"), ("width", ">=", 10), ("name", "!=", "a, b")]
+    assert parseQuery("score < 0.5") == [("score", "<", 0.5)]
+    assert parseQuery("") == []
+
+
+def test_parse_query_errors():
+    with pytest.raises(QueryError):
+        parseQuery("width = 10")
+    with pytest.raises(QueryError):
+        parseQuery("(width) == 10")
+
+
+def test_parse_sort():
+    assert parseSort("original_file_name DESC, width") == [("original_file_name", True), ("width", False)]
+    with pytest.raises(QueryError):
+        parseSort("width DOWN")
+    with pytest.raises(QueryError):
+        parseSort("width; DROP TABLE files")
+
+
+def test_metadata_rows():
+    rows = list(metadataRows("name,file_id,score\nx,f1,3\ny,f2,\n", delimiter=","))
+    assert rows == [("f1", "name", "x"), ("f1", "score", 3), ("f2", "name", "y")]
+
+
+# Later syncs only rewrite rows whose content changed, and delete rows gone from the server
+def test_incremental_sync(mirror):
+    server = FakeServer()
+    counts = mirror.sync(server)["ds1"]
+    assert counts["files"] == {"changed": 3, "deleted": 0, "total": 3}
+    assert counts["user_metadata"] == {"total": 4}
+
+    assert mirror.sync(server)["ds1"]["files"] == {"changed": 0, "deleted": 0, "total": 3}
+
+    server.files.items[0] = dict(server.files.items[0], category_name="scratch")
+    del server.files.items[2]
+    server.object_labels.items.append({"_id": "l2", "file_id": "f2", "name": "dent"})
+    counts = mirror.sync(server)["ds1"]
+    assert counts["files"] == {"changed": 1, "deleted": 1, "total": 2}
+    assert counts["object_labels"] == {"changed": 1, "deleted": 0, "total": 2}
+
+    assert mirror.sync(server, full=True)["ds1"]["files"]["changed"] == 2
+
+
+def test_sync_removes_deleted_datasets(mirror):
+    server = FakeServer()
+    mirror.sync(server)
+    server.datasets.items = []
+    mirror.sync(server)
+    assert mirror.status() == []
+    assert mirror.files() == []
+
+
+def test_files_query_and_sort(mirror):
+    mirror.sync(FakeServer())
+    names = lambda files: [f["original_file_name"] for f in files]
+    assert names(mirror.files("ds1", sort="original_file_name")) == ["a.jpg", "b.jpg", "c.jpg"]
+    assert names(mirror.files("ds1", query="category_name == 'scratch'", sort="width DESC")) == ["a.jpg", "c.jpg"]
+    # Fields that are not columns are read from the file JSON, then from user metadata
+    assert names(mirror.files("ds1", query="width < 25", sort="width")) == ["b.jpg", "c.jpg"]
+    assert names(mirror.files("ds1", query="score > 1")) == ["a.jpg"]
+    assert names(mirror.files("ds1", query="line == 'L1'")) == ["b.jpg"]
+    assert names(mirror.files("ds1", sort="original_file_name", limit=1, skip=1)) == ["b.jpg"]
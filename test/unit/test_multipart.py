@@ -0,0 +1,124 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import email.parser
+import email.policy
+import hashlib
+import io
+
+import pytest
+
+from vapi.multipart import MultipartEncoder
+
+
+@pytest.fixture
+def bigFile(tmp_path):
+    path = tmp_path / "big.bin"
+    path.write_bytes(bytes(range(256)) * 40 + b"tail")
+    return path
+
+
+def readAll(encoder, size):
+    body = bytearray()
+    while True:
+        chunk = encoder.read(size)
+        if not chunk:
+            return bytes(body)
+        assert len(chunk) <= size
+        body += chunk
+
+
+def parts(encoder, body):
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {encoder.content_type}\r\n\r\n".encode("ascii") + body)
+    return [(part.get_param("name", header="content-disposition"), part.get_filename(),
+             part.get_content_type(), part.get_payload(decode=True)) for part in message.iter_parts()]
+
+
+def test_exact_framing_of_a_field_and_a_file():
+    encoder = MultipartEncoder(fields={"a": "1"}, files={"f": ("x.txt", b"hi")})
+    b = encoder.boundary
+    expected = (f'--{b}\r\nContent-Disposition: form-data; name="a"\r\n\r\n1\r\n'
+                f'--{b}\r\nContent-Disposition: form-data; name="f"; filename="x.txt"\r\n'
+                f'Content-Type: text/plain\r\n\r\nhi\r\n'
+                f'--{b}--\r\n').encode("ascii")
+    assert encoder.read() == expected
+    assert len(encoder) == len(expected)
+
+
+@pytest.mark.parametrize("readSize", [1, 7, 100, 4096, 1 << 20])
+def test_body_is_the_same_for_any_read_size(bigFile, readSize):
+    fields = [("name", "données"), ("count", 3)]
+    with MultipartEncoder(fields=fields, files=[("data", str(bigFile)), ("extra", ("e.bin", b"\r\n--x"))],
+                          chunkSize=333) as encoder:
+        body = readAll(encoder, readSize)
+    assert len(body) == len(encoder)
+    assert parts(encoder, body) == [
+        ("name", None, "text/plain", "données".encode("utf-8")),
+        ("count", None, "text/plain", b"3"),
+        ("data", "big.bin", "application/octet-stream", bigFile.read_bytes()),
+        ("extra", "e.bin", "application/octet-stream", b"\r\n--x"),
+    ]
+
+
+def test_open_file_is_read_from_its_current_position(bigFile):
+    with open(bigFile, "rb") as handle:
+        handle.seek(10)
+        encoder = MultipartEncoder(files={"f": handle}, chunkSize=64)
+        body = encoder.read()
+    assert len(body) == len(encoder)
+    assert parts(encoder, body)[0][3] == bigFile.read_bytes()[10:]
+
+
+def test_file_object_without_fileno():
+    encoder = MultipartEncoder(files={"f": ("mem.json", io.BytesIO(b'{"a": 1}'), "application/json")})
+    body = encoder.read()
+    assert parts(encoder, body) == [("f", "mem.json", "application/json", b'{"a": 1}')]
+
+
+def test_progress_and_digests(bigFile):
+    calls = []
+    encoder = MultipartEncoder(files={"f": str(bigFile), "g": ("g.txt", b"abc")}, chunkSize=1000,
+                               progress=lambda sent, total: calls.append((sent, total)), hashAlgorithm="sha256")
+    readAll(encoder, 512)
+    assert calls[-1] == (len(encoder), len(encoder))
+    assert [sent for sent, _ in calls] == sorted(sent for sent, _ in calls)
+    assert encoder.digests == {"big.bin": hashlib.sha256(bigFile.read_bytes()).hexdigest(),
+                               "g.txt": hashlib.sha256(b"abc").hexdigest()}
+    encoder.close()
+
+
+def test_files_opened_by_path_are_closed(bigFile):
+    with MultipartEncoder(files={"f": str(bigFile)}) as encoder:
+        handle = encoder._opened[0]
+    assert handle.closed
+
+
+def test_quotes_in_names_are_escaped():
+    encoder = MultipartEncoder(files={'a"b': ('x"y\n.txt', b"")})
+    assert b'name="a\\"b"; filename="x\\"y .txt"' in encoder.read()
+
+
+def test_file_that_shrinks_while_sending_fails():
+    content = io.BytesIO(b"x" * 100)
+    encoder = MultipartEncoder(files={"f": ("f.bin", content)}, chunkSize=10)
+    encoder.read(len(encoder) - 50)
+    content.truncate(60)
+    with pytest.raises(IOError):
+        readAll(encoder, 50)
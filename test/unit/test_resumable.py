@@ -0,0 +1,198 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import os
+
+import pytest
+
+from vapi import resumable
+from vapi.resumable import ResumableUpload, UploadError
+
+CHUNK = 1000
+# Larger than the read buffer, so that a change to the file is seen by the upload
+DATA = bytes(range(256)) * 80
+
+
+class Rsp:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.ok = status_code < 400
+
+
+class FakeServer:
+    """ A tus server keeping one upload. 'failPatches' holds the numbers (from 1) of
+    PATCH requests that get no response; 'storeFailed' makes such a PATCH store its
+    chunk anyway, and 'lose' is the number of bytes the server loses when one fails."""
+
+    baseurl = "https://host/api"
+
+    def __init__(self, tus=True, failPatches=(), storeFailed=False, lose=0, postStatuses=()):
+        self.tus = tus
+        self.failPatches = set(failPatches)
+        self.storeFailed = storeFailed
+        self.lose = lose
+        self.postStatuses = list(postStatuses)
+        self.data = bytearray()
+        self.length = None
+        self.requests = []
+        self.rsp = None
+        self.result = None
+        self.last_failure = None
+        self.onPatch = None
+
+    def request(self, method, uri, headers=None, data=None, **kwargs):
+        self.requests.append(method)
+        self.last_failure = None
+        self.result = None
+        if method == "OPTIONS":
+            self.rsp = Rsp(200, {"Tus-Version": "1.0.0", "Tus-Extension": "creation,checksum"}) if self.tus \
+                else Rsp(404)
+        elif method == "POST":
+            self.length = int(headers["Upload-Length"])
+            self.rsp = Rsp(201, {"Location": "/api/uploads/1"})
+        elif method == "HEAD":
+            self.rsp = Rsp(200, {"Upload-Offset": str(len(self.data))})
+        elif method == "PATCH":
+            assert uri == "https://host/api/uploads/1"
+            patches = self.requests.count("PATCH")
+            if int(headers["Upload-Offset"]) != len(self.data):
+                self.rsp = Rsp(409)
+            elif patches in self.failPatches:
+                if self.storeFailed:
+                    self.data += data
+                del self.data[max(0, len(self.data) - self.lose):]
+                self.rsp = None
+                self.last_failure = "Could not connect to server (https://host/api)."
+            else:
+                self.data += data
+                if self.onPatch is not None:
+                    self.onPatch(patches)
+                self.rsp = Rsp(204, {"Upload-Offset": str(len(self.data))})
+                if len(self.data) == self.length:
+                    self.result = {"imported": True}
+        return self.result
+
+    def post(self, uri, headers=None, data=None):
+        self.requests.append("POST")
+        body = b"".join(iter(lambda: data.read(7), b""))
+        status = self.postStatuses.pop(0) if self.postStatuses else 200
+        self.rsp = Rsp(status)
+        self.result = {"imported": True, "size": len(body)} if status == 200 else {"error": status}
+        return self.result
+
+    def raw_rsp(self):
+        return self.rsp
+
+    def rsp_ok(self):
+        return self.rsp is not None and self.rsp.ok
+
+    def status_code(self):
+        return self.rsp.status_code if self.rsp is not None else None
+
+    def json(self):
+        return self.result
+
+
+@pytest.fixture
+def upload(tmp_path, monkeypatch):
+    monkeypatch.setattr(resumable.time, "sleep", lambda seconds: None)
+    path = str(tmp_path / "data.zip")
+    with open(path, "wb") as handle:
+        handle.write(DATA)
+
+    def run(server, retries=3):
+        uploader = ResumableUpload(server, "/datasets/import", chunkSize=CHUNK, retries=retries,
+                                   stateDir=str(tmp_path / "uploads"))
+        return uploader, uploader.run(path)
+    run.path = path
+    run.stateDir = str(tmp_path / "uploads")
+    return run
+
+
+def test_tus_upload_in_chunks(upload):
+    server = FakeServer()
+    uploader, result = upload(server)
+    assert uploader.mode == "resumable"
+    assert result == {"imported": True}
+    assert bytes(server.data) == DATA
+    assert server.requests.count("PATCH") == -(-len(DATA) // CHUNK)
+    assert os.listdir(upload.stateDir) == []
+
+
+# The chunk was stored but its response lost; HEAD tells the client to go on
+def test_tus_patch_retry_continues_from_server_offset(upload):
+    server = FakeServer(failPatches={3}, storeFailed=True)
+    _, result = upload(server)
+    assert result == {"imported": True}
+    assert bytes(server.data) == DATA
+    assert server.requests.count("HEAD") == 1
+
+
+# The server lost acknowledged data; the upload and its digest restart from its offset
+def test_tus_backwards_offset_is_resent(upload):
+    server = FakeServer(failPatches={5}, lose=2 * CHUNK + 3)
+    _, result = upload(server)
+    assert result == {"imported": True}
+    assert bytes(server.data) == DATA
+
+
+def test_tus_upload_resumes_in_a_new_run(upload):
+    server = FakeServer(failPatches={4})
+    with pytest.raises(UploadError):
+        upload(server, retries=0)
+    assert len(server.data) == 3 * CHUNK
+    assert len(os.listdir(upload.stateDir)) == 1
+
+    server.failPatches.clear()
+    server.requests.clear()
+    _, result = upload(server)
+    assert result == {"imported": True}
+    assert bytes(server.data) == DATA
+    assert "POST" not in server.requests
+    assert os.listdir(upload.stateDir) == []
+
+
+def test_tus_file_changed_during_upload(upload):
+    server = FakeServer()
+
+    def change(patches):
+        if patches == 2:
+            with open(upload.path, "r+b") as handle:
+                handle.seek(15 * CHUNK)
+                handle.write(b"changed")
+    server.onPatch = change
+    with pytest.raises(UploadError, match="changed during the upload"):
+        upload(server)
+
+
+def test_whole_file_upload_is_retried(upload):
+    server = FakeServer(tus=False, postStatuses=[503, 200])
+    uploader, result = upload(server)
+    assert uploader.mode == "whole-file"
+    assert result["imported"]
+    assert result["size"] > len(DATA)
+    assert server.requests == ["OPTIONS", "POST", "POST"]
+
+
+def test_whole_file_upload_rejected_is_not_retried(upload):
+    server = FakeServer(tus=False, postStatuses=[400])
+    with pytest.raises(UploadError, match="status=400"):
+        upload(server)
+    assert server.requests == ["OPTIONS", "POST"]
@@ -0,0 +1,94 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import numpy as np
+import pytest
+
+from vapi import rle
+
+
+def randomMask(shape, seed):
+    return np.random.default_rng(seed).random(shape) > 0.6
+
+
+def test_encode_is_column_major_and_starts_with_background():
+    mask = np.zeros((3, 4), dtype=bool)
+    mask[1:3, 1] = True
+    mask[0, 2] = True
+    assert rle.encode(mask) == {"size": [3, 4], "counts": [4, 3, 5]}
+
+
+def test_encode_foreground_first_pixel_has_leading_zero_run():
+    mask = np.ones((2, 2), dtype=bool)
+    assert rle.encode(mask)["counts"] == [0, 4]
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (5, 7), (64, 48), (1, 300)])
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(shape, compress):
+    mask = randomMask(shape, seed=shape[0] * 1000 + shape[1])
+    encoded = rle.encode(mask, compress=compress)
+    assert isinstance(encoded["counts"], str) == compress
+    np.testing.assert_array_equal(rle.decode(encoded), mask)
+
+
+def test_round_trip_empty_and_full():
+    for mask in (np.zeros((4, 6), dtype=bool), np.ones((4, 6), dtype=bool)):
+        np.testing.assert_array_equal(rle.decode(rle.encode(mask)), mask)
+        np.testing.assert_array_equal(rle.decode(rle.encode(mask, compress=True)), mask)
+
+
+def test_decode_bare_counts_needs_shape():
+    with pytest.raises(ValueError):
+        rle.decode([4, 3, 5])
+    assert rle.decode([4, 3, 5], shape=(3, 4)).sum() == 3
+
+
+def test_decode_rejects_counts_not_covering_the_mask():
+    with pytest.raises(ValueError):
+        rle.decode({"size": [3, 4], "counts": [4, 3]})
+
+
+@pytest.mark.parametrize("counts, string", [
+    ([0, 4], "04"),
+    ([1, 2, 3, 4], "1232"),
+    ([5, 1, 5, 1, 2], "5150M"),
+    ([100], "T3"),
+])
+def test_compressed_counts_match_coco_strings(counts, string):
+    assert rle.countsToString(counts) == string
+    assert rle.stringToCounts(string) == counts
+
+
+def test_area_and_bbox_without_decoding():
+    mask = np.zeros((10, 8), dtype=bool)
+    mask[2:5, 3:7] = True
+    encoded = rle.encode(mask, compress=True)
+    assert rle.area(encoded) == 12
+    assert rle.bbox(encoded) == (3, 2, 6, 4)
+    assert rle.bbox(rle.encode(np.zeros((3, 3), dtype=bool))) is None
+
+
+def test_iou():
+    a = np.zeros((4, 4), dtype=bool)
+    b = np.zeros((4, 4), dtype=bool)
+    a[:2] = True
+    b[1:3] = True
+    assert rle.iou(a, b) == pytest.approx(4 / 12)
+    np.testing.assert_allclose(rle.iouMatrix([a, b], [b]), [[4 / 12], [1.0]])
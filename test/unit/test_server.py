@@ -0,0 +1,45 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+from vapi.server import Server
+
+
+def poolMaxsize(session):
+    return session.get_adapter("https://host/api")._pool_maxsize
+
+
+def test_pool_size_before_first_request():
+    server = Server("https://host/api", "token")
+    server.poolSize = 32
+    assert poolMaxsize(server.session()) == 32
+
+
+# A bulk command may have sent requests before it sizes the pool for its workers
+def test_pool_grows_after_first_request():
+    server = Server("https://host/api", "token")
+    session = server.session()
+    assert poolMaxsize(session) == 16
+    server.poolSize = 40
+    assert server.session() is session
+    assert poolMaxsize(session) == 40
+    assert session.get_adapter("http://host/api") is session.get_adapter("https://host/api")
+
+    adapter = session.get_adapter("https://host/api")
+    server.poolSize = 8
+    assert session.get_adapter("https://host/api") is adapter
@@ -0,0 +1,105 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from vapi.SseMonitor import SseParser
+
+STREAM = (b"\xef\xbb\xbf: comment\r\n"
+          b"event: status\r\n"
+          b"id: 7\r\n"
+          b"data: {\"state\": \"running\",\r\n"
+          b"data:  \"pct\": 50}\r\n"
+          b"\r\n"
+          b"retry: 3000\r"
+          b"data: plain\r"
+          b"\r"
+          b"event: done\n"
+          b"data: caf\xc3\xa9\n"
+          b"\n"
+          b"data: incomplete\n")
+
+
+def parse(chunks, **kwargs):
+    parser = SseParser(**kwargs)
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    parser.close()
+    return parser, [(e.event, e.id, e.retry, e.json()) for e in events]
+
+
+EXPECTED = [
+    ("status", "7", None, {"state": "running", "pct": 50}),
+    ("message", "7", 3000, "plain"),
+    ("done", "7", 3000, "café"),
+]
+
+
+def test_whole_stream():
+    parser, events = parse([STREAM])
+    assert events == EXPECTED
+    assert parser.lastEventId == "7"
+
+
+def test_one_byte_chunks():
+    _, events = parse([STREAM[i:i + 1] for i in range(len(STREAM))])
+    assert events == EXPECTED
+
+
+@pytest.mark.parametrize("split", range(1, len(STREAM)))
+def test_every_split_point(split):
+    _, events = parse([STREAM[:split], STREAM[split:]])
+    assert events == EXPECTED
+
+
+def test_crlf_split_between_cr_and_lf_is_one_line_break():
+    _, events = parse([b"data: a\r", b"\n\r", b"\n"])
+    assert events == [("message", None, None, "a")]
+
+
+def test_events_without_data_are_not_dispatched():
+    _, events = parse([b"event: ping\n\nid: 3\n\n"])
+    assert events == []
+
+
+def test_include_and_exclude_filters():
+    parser, events = parse([STREAM], includeEvents=["done"])
+    assert [e[0] for e in events] == ["done"]
+    assert parser.skipped == 2
+
+    _, events = parse([STREAM], excludeEvents=["status"])
+    assert [e[0] for e in events] == ["message", "done"]
+
+
+def test_id_with_nul_is_ignored_and_bad_retry_is_ignored():
+    parser, events = parse([b"id: 1\ndata: x\n\nid: a\0b\nretry: soon\ndata: y\n\n"])
+    assert [(e[1], e[2]) for e in events] == [("1", None), ("1", None)]
+
+
+# 'requests' is imported on first use, so importing the event modules stays cheap
+def test_import_does_not_load_requests():
+    lib = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "lib")
+    code = "import sys, vapi.ssesubscription, vapi.SseMonitor; print('requests' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=lib, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
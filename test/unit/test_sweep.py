@@ -0,0 +1,185 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import json
+import queue
+
+from vapi.Dltasks import DlTasks
+from vapi.sweep import SweepScheduler, gridTrials, randomTrials, leaderboard
+
+
+class FakeHttp:
+    """ Answers the dltasks requests of a sweep. A created task completes at once, and
+    an event naming it is queued (as the '/events' stream would deliver it)."""
+
+    def __init__(self):
+        self.tasks = {}
+        self.wakeups = None
+        self.rsp = None
+        self.ok = True
+
+    def get(self, uri, params=None, **kwargs):
+        self.ok = True
+        if uri == "/dltasks/":
+            self.rsp = list(self.tasks.values())
+        else:
+            self.rsp = self.tasks.get(uri.rsplit("/", 1)[-1])
+            self.ok = self.rsp is not None
+        return self.rsp
+
+    def post(self, uri, json=None, **kwargs):
+        taskId = f"00000000-0000-0000-0000-{len(self.tasks):012d}"
+        self.tasks[taskId] = {"_id": taskId, "name": json["name"], "status": "completed",
+                              "trained_model_id": f"model-{json['name']}",
+                              "strategy": json["strategy"]}
+        if self.wakeups is not None:
+            self.wakeups.put(taskId)
+        self.ok = True
+        self.rsp = {"task_id": taskId}
+        return self.rsp
+
+    def rsp_ok(self):
+        return self.ok
+
+    def status_code(self):
+        return 200 if self.ok else 404
+
+    def json(self):
+        return self.rsp
+
+
+class FakeSubscription:
+    def __init__(self):
+        self.stopped = False
+
+    def stop(self, timeout=None):
+        self.stopped = True
+
+
+class FakeDltasks(DlTasks):
+    def __init__(self, http):
+        super().__init__(http)
+        self.subscriptions = []
+        self.checked = []
+
+    def _check(self, task_ids, pending, latest):
+        self.checked.extend(task_ids & pending)
+        return super()._check(task_ids, pending, latest)
+
+    def _subscribe(self, pending, wakeups):
+        self.server.wakeups = wakeups
+        self.subscriptions.append(FakeSubscription())
+        return self.subscriptions[-1]
+
+
+class FakeTrainedModels:
+    def __init__(self, http):
+        self.http = http
+
+    def show(self, modelId):
+        self.http.ok = True
+        return {"_id": modelId, "accuracy": int(modelId.rsplit("-", 1)[-1]) / 10}
+
+
+class FakeSystem:
+    def __init__(self, http, gpus):
+        self.http = http
+        self.gpus = gpus
+
+    def info(self):
+        self.http.ok = True
+        return {"gpus": list(range(self.gpus))}
+
+
+class FakeVapi:
+    def __init__(self, gpus=2):
+        self.server = FakeHttp()
+        self.dl_tasks = FakeDltasks(self.server)
+        self.trained_models = FakeTrainedModels(self.server)
+        self.system = FakeSystem(self.server, gpus)
+
+    def rsp_ok(self):
+        return self.server.rsp_ok()
+
+    def status_code(self):
+        return self.server.status_code()
+
+    def json(self):
+        return self.server.json()
+
+
+def test_grid_trials():
+    assert gridTrials({"a": [1, 2], "b": ["x"]}) == [{"a": 1, "b": "x"}, {"a": 2, "b": "x"}]
+
+
+def test_random_trials_repeatable():
+    space = {"lr": {"min": 0.001, "max": 0.1, "log": True}, "n": {"min": 1, "max": 9, "type": "int"}}
+    trials = randomTrials(space, 5, seed=3)
+    assert trials == randomTrials(space, 5, seed=3)
+    assert all(0.001 <= t["lr"] <= 0.1 and isinstance(t["n"], int) for t in trials)
+
+
+def test_leaderboard_order():
+    results = [{"name": "a", "metrics": {"loss": 0.5}}, {"name": "b", "metrics": {}},
+               {"name": "c", "metrics": {"loss": 0.2}}]
+    assert [r["name"] for r in leaderboard(results, "loss")] == ["c", "a", "b"]
+
+
+# The whole sweep shares one event subscription. Tasks started later are found
+# through their events, so each task is checked once rather than at every poll.
+# (Polls are an hour apart here, so the sweep only ends if events drive it.)
+def test_sweep_keeps_one_wait():
+    vapi = FakeVapi(gpus=2)
+    scheduler = SweepScheduler(vapi, "ds1", "cic", "trial", pollInterval=3600.0)
+    results = sorted(scheduler.run(gridTrials({"max_iter": [1, 2, 3, 4, 5, 6]})), key=lambda r: r["name"])
+
+    assert [r["name"] for r in results] == [f"trial-{i:03d}" for i in range(1, 7)]
+    assert all(r["status"] == "completed" for r in results)
+    assert [r["metrics"]["accuracy"] for r in results] == [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
+    assert len(vapi.dl_tasks.subscriptions) == 1
+    assert vapi.dl_tasks.subscriptions[0].stopped
+    assert sorted(vapi.dl_tasks.checked) == sorted(vapi.server.tasks)
+
+
+def test_sweep_results_file(tmp_path):
+    resultsFile = str(tmp_path / "results.jsonl")
+    vapi = FakeVapi(gpus=1)
+    SweepScheduler(vapi, "ds1", "cic", "trial", resultsFile=resultsFile,
+                   pollInterval=3600.0).run(gridTrials({"max_iter": [1, 2]}))
+    with open(resultsFile) as handle:
+        statuses = [json.loads(line)["status"] for line in handle]
+    assert statuses == ["submitted", "completed", "submitted", "completed"]
+
+    # A resumed sweep submits nothing
+    again = FakeVapi(gpus=1)
+    results = SweepScheduler(again, "ds1", "cic", "trial", resultsFile=resultsFile,
+                             pollInterval=3600.0).run(gridTrials({"max_iter": [1, 2]}))
+    assert len(results) == 2
+    assert again.server.tasks == {}
+
+
+def test_wait_polls_on_reconnect():
+    pending = {"a", "b", "c"}
+    wakeups = queue.Queue()
+    wakeups.put("b")
+    assert DlTasks._nextCheck(wakeups, 0, pending) == {"b"}
+    wakeups.put("b")
+    wakeups.put(None)
+    assert DlTasks._nextCheck(wakeups, 0, pending) == pending
+    assert DlTasks._nextCheck(wakeups, 0, pending) == pending
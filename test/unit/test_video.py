@@ -0,0 +1,126 @@
+# IBM_PROLOG_BEGIN_TAG
+#
+# Copyright 2026 IBM International Business Machines Corp.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#           http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+#  implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#  IBM_PROLOG_END_TAG
+
+import threading
+
+import cv2 as cv
+import numpy as np
+import pytest
+
+from vapi.video import Frame, FramePipeline, FrameSampler, VideoError, uploadFrames
+
+
+def writeVideo(path, levels, fps=10):
+    """ Writes a small video with one gray frame per entry of 'levels'."""
+
+    writer = cv.VideoWriter(str(path), cv.VideoWriter_fourcc(*"MJPG"), fps, (32, 24))
+    assert writer.isOpened()
+    for level in levels:
+        writer.write(np.full((24, 32, 3), level, dtype=np.uint8))
+    writer.release()
+    return str(path)
+
+
+class ListSampler:
+    """ Sampler yielding 'count' fake frames per video, optionally failing on one video."""
+
+    def __init__(self, count, failOn=None):
+        self.count = count
+        self.failOn = failOn
+
+    def frames(self, video):
+        for index in range(self.count):
+            if video == self.failOn and index == 2:
+                raise cv.error("bad frame")
+            yield Frame(video, index, None, f"{video}_{index}.jpg", b"")
+
+
+def test_sampler_stride_and_names(tmp_path):
+    video = writeVideo(tmp_path / "line1.avi", [0] * 10)
+    frames = list(FrameSampler(stride=3).frames(video))
+    assert [f.index for f in frames] == [0, 3, 6, 9]
+    assert frames[1].name == "line1_f0000003.jpg"
+    assert frames[1].timestamp == pytest.approx(0.3)
+    assert cv.imdecode(np.frombuffer(frames[0].data, dtype=np.uint8), cv.IMREAD_COLOR).shape == (24, 32, 3)
+
+
+def test_sampler_interval_and_max_frames(tmp_path):
+    video = writeVideo(tmp_path / "v.avi", [0] * 20)
+    assert [f.index for f in FrameSampler(interval=0.5).frames(video)] == [0, 5, 10, 15]
+    assert [f.index for f in FrameSampler(interval=0.5, maxFrames=2).frames(video)] == [0, 5]
+
+
+# Only frames that differ enough from the last kept frame are kept
+def test_sampler_scene_threshold(tmp_path):
+    video = writeVideo(tmp_path / "v.avi", [0, 2, 4, 100, 102, 200, 200])
+    assert [f.index for f in FrameSampler(sceneThreshold=20).frames(video)] == [0, 3, 5]
+
+
+def test_sampler_missing_video(tmp_path):
+    assert list(FrameSampler().frames(str(tmp_path / "missing.avi"))) == []
+
+
+def test_pipeline_keeps_frame_order_per_video():
+    videos = ["a", "b", "c"]
+    frames = list(FramePipeline(videos, ListSampler(50), workers=2, queueSize=4))
+    assert len(frames) == 150
+    for video in videos:
+        assert [f.index for f in frames if f.video == video] == list(range(50))
+
+
+def test_pipeline_stops_decoders_when_consumer_stops():
+    before = threading.active_count()
+    pipeline = iter(FramePipeline(["a", "b"], ListSampler(1000), workers=2, queueSize=2))
+    assert next(pipeline).index == 0
+    pipeline.close()
+    assert threading.active_count() == before
+
+
+def test_pipeline_raises_decoder_errors():
+    frames = []
+    with pytest.raises(VideoError, match="failed to decode 'b'; bad frame"):
+        for frame in FramePipeline(["a", "b"], ListSampler(5, failOn="b"), workers=1):
+            frames.append(frame)
+    assert [(f.video, f.index) for f in frames] == [("a", i) for i in range(5)] + [("b", 0), ("b", 1)]
+
+
+class FakeServer:
+    def __init__(self):
+        self.files = self
+        self.batches = []
+        self.results = None
+
+    def upload(self, dsid, batch):
+        self.batches.append(len(batch))
+        self.results = {"resultList": [{"result": "success" if name != "bad.jpg" else "fail"}
+                                       for name, _ in batch]}
+        return self.results
+
+    def json(self):
+        return self.results
+
+    def status_code(self):
+        return 200
+
+
+def test_upload_frames_in_batches():
+    frames = [Frame("v", i, None, "bad.jpg" if i == 4 else f"{i}.jpg", b"") for i in range(7)]
+    server = FakeServer()
+    assert uploadFrames(server, "ds", frames, batchSize=3) == (6, 1)
+    assert server.batches == [3, 3, 1]